@@ -0,0 +1,89 @@
+"""
+Benchmark of the `Connect All Saved` button (see `Bulk_Connect`) against the fake `adb` of `Fake_Bin`.
+
+A wall of devices is saved (the Wi-Fi IP of each fake device, with a few more that cannot be reached),
+then they are connected one at a time like the `Connect` button does (`adb tcpip` then `adb connect`),
+and all at once by `connect_saved_endpoints`. The fake devices have loopback IPs (`127.1.x.x`), half of
+them listen on their port (already in TCP mode), so `adb tcpip` is only sent to the other half.
+
+Usage
+-----
+python Benchmarks/Benchmark_Connect_All.py [--latency 0.1] [--devices 40] [--unreachable 4]
+"""
+import sys
+import socket
+from os import environ, pathsep
+from pathlib import Path
+from time import perf_counter
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# forces the `adb` fallback, before `Adb_Client` reads the port ↓
+environ["ANDROID_ADB_SERVER_PORT"] = str(unused_port())
+environ["PATH"] = str(ROOT / "Benchmarks" / "Fake_Bin") + pathsep + environ["PATH"]
+sys.path.insert(0, str(ROOT))
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Bulk_Connect import CONNECT_WORKERS, connect_saved_endpoints
+
+FAKE_SUBNET = "127.1"
+
+def fake_ip(num: int) -> str:
+    return f"{FAKE_SUBNET}.{num // 250}.{num % 250 + 2}" # see `Fake_Bin/adb`
+
+def listen(ip: str, port: int) -> socket.socket:
+    sock = socket.socket()
+    sock.bind((ip, port))
+    sock.listen()
+    return sock
+
+def connect_one_by_one(saved_endpoints: dict) -> int:
+    runner = CommandRunner()
+    connected = 0
+    for ip, port in saved_endpoints.values():
+        runner.run(["adb", "tcpip", port])
+        connected += "connected to" in runner.run(["adb", "connect", f"{ip}:{port}"]).stdout
+    return connected
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="time (in seconds) of each adb command")
+    parser.add_argument("--devices", type=int, default=40)
+    parser.add_argument("--unreachable", type=int, default=4, help="saved devices that cannot be reached")
+    args = parser.parse_args()
+    environ["FAKE_ADB_LATENCY"] = str(args.latency)
+    environ["FAKE_ADB_DEVICES"] = str(args.devices)
+    environ["FAKE_ADB_SUBNET"] = FAKE_SUBNET
+
+    ips = [fake_ip(num) for num in range(args.devices + args.unreachable)]
+    environ["FAKE_ADB_UNREACHABLE"] = ",".join(ips[args.devices:])
+    saved_endpoints = {f"{ip}:5555": [ip, "5555"] for ip in ips}
+    listening = [listen(ip, 5555) for ip in ips[:args.devices:2]]
+
+    start = perf_counter()
+    serial_connected = connect_one_by_one(saved_endpoints)
+    serial_time = perf_counter() - start
+
+    start = perf_counter()
+    results = list(connect_saved_endpoints(saved_endpoints))
+    bulk_time = perf_counter() - start
+    bulk_connected = sum(result.ok for result in results)
+    assert bulk_connected == args.devices, f"only {bulk_connected} of {args.devices} devices were connected"
+
+    print(f"latency per adb command: {args.latency}s, workers: {CONNECT_WORKERS}")
+    print(f"saved endpoints: {len(saved_endpoints)} ({args.unreachable} unreachable)")
+    print(f"one by one: {serial_time:>6.2f}s, {serial_connected} connected")
+    for sock in listening:
+        sock.close()
+
+    print(f"all at once: {bulk_time:>5.2f}s, {bulk_connected} connected, "
+          f"tcpip sent to {sum(result.tcpip for result in results)} ({serial_time / bulk_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
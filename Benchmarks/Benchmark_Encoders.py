@@ -0,0 +1,71 @@
+"""
+Run of the encoder benchmark (see `Encoder_Benchmark`) against the fake `adb` and `scrcpy` of `Fake_Bin`.
+
+Every video encoder of the fake device is tried for each maximum size, the trials are printed with their
+frame rate, then the encoder chosen by `Auto (fastest measured)` is resolved for each size. The user data
+are written to a temporary folder, so the data of the app are not changed.
+
+Usage
+-----
+python Benchmarks/Benchmark_Encoders.py [--time-limit 5] [--second 0.01] [--max-sizes 1920 1280]
+"""
+import sys
+import socket
+from os import environ, pathsep
+from pathlib import Path
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# forces the `adb` fallback, before `Adb_Client` reads the port ↓
+environ["ANDROID_ADB_SERVER_PORT"] = str(unused_port())
+environ["PATH"] = str(ROOT / "Benchmarks" / "Fake_Bin") + pathsep + environ["PATH"]
+sys.path.insert(0, str(ROOT))
+
+from PyQt5.QtCore import QCoreApplication
+
+from Script.Utilities.Settings_Store import settings_store
+from Script.Utilities.Static_Datas import AUTO_ENCODER_ARG
+from Script.Utilities.Encoder_Benchmark import (
+    BENCHMARK_MAX_SIZES,
+    BENCHMARK_TIME_LIMIT,
+    run_benchmark,
+    resolve_auto_encoder,
+)
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--time-limit", type=int, default=BENCHMARK_TIME_LIMIT, help="duration (in seconds) of each trial")
+    parser.add_argument("--second", type=float, default=0.01, help="real time (in seconds) of a second of the fake scrcpy")
+    parser.add_argument("--max-sizes", type=int, nargs="+", default=list(BENCHMARK_MAX_SIZES))
+    args = parser.parse_args()
+    environ["FAKE_SCRCPY_SECOND"] = str(args.second)
+
+    with TemporaryDirectory() as data_dir:
+        settings_store.path = str(Path(data_dir) / "UserData.json")
+        settings_store.load()
+
+        start = perf_counter()
+        trials = run_benchmark("FAKE0000", max_sizes=tuple(args.max_sizes), time_limit=args.time_limit)
+        duration = perf_counter() - start
+        assert trials, "the fake device was not measured"
+
+        print(f"{'codec':<6} | {'encoder':<24} | {'max size':>8} | {'fps':>6} | samples")
+        for trial in trials:
+            print(f"{trial.codec:<6} | {trial.encoder:<24} | {trial.max_size:>8} | {trial.fps:>6.1f} | {trial.samples}")
+        print(f"{len(trials)} trials in {duration:.2f}s")
+
+        for max_size in args.max_sizes:
+            resolved = resolve_auto_encoder("FAKE0000", [AUTO_ENCODER_ARG, f"--max-size={max_size}"])
+            print(f"auto encoder at {max_size}: {' '.join(resolved[:-1]) or 'encoder of scrcpy'}")
+
+if __name__ == "__main__":
+    app = QCoreApplication(sys.argv[:1]) # for the timer of the store
+    main()
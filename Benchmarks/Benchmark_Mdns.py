@@ -0,0 +1,105 @@
+"""
+Benchmark of the mDNS browser (see `Thread_Mdns_Browser` and `Mdns_Services`) with packets injected on loopback.
+
+Stand-ins of devices announce their wireless debugging services on the mDNS group through the loopback
+interface (on a free port, not to disturb the real responders): a connect endpoint, then a pairing endpoint
+split in two packets (`PTR`/`SRV` then `A`), the same pairing dialog opened again (new port), and finally a
+goodbye (TTL `0`). The time each change takes to reach the table is measured.
+
+Usage
+-----
+python Benchmarks/Benchmark_Mdns.py [--devices 20]
+"""
+import sys
+import socket
+import struct
+from pathlib import Path
+from time import perf_counter, sleep
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from Script.Thread_Mdns_Browser import MdnsBrowser_Thread
+from Script.Utilities.Mdns_Services import (
+    mdns_services,
+    encode_name,
+    CLASS_IN,
+    CONNECT_SERVICE,
+    MDNS_GROUP,
+    PAIRING_SERVICE,
+    TYPE_A,
+    TYPE_PTR,
+    TYPE_SRV,
+)
+
+def unused_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def record(name: str, rtype: int, ttl: int, data: bytes) -> bytes:
+    return encode_name(name) + struct.pack("!HHIH", rtype, CLASS_IN, ttl, len(data)) + data
+
+def announcement(records: list) -> bytes:
+    return struct.pack("!6H", 0, 0x8400, 0, len(records), 0, 0) + b"".join(records)
+
+def service_records(serial: str, service: str, ip: str, port: int, ttl: int = 120) -> list:
+    instance = f"adb-{serial}-Xy12Ab.{service}"
+    host = f"Android_{serial}.local"
+    return [
+        record(service, TYPE_PTR, ttl, encode_name(instance)),
+        record(instance, TYPE_SRV, ttl, struct.pack("!HHH", 0, 0, port) + encode_name(host)),
+        record(host, TYPE_A, ttl, socket.inet_aton(ip)),
+    ]
+
+def wait_for(check, timeout: float = 5.0) -> float:
+    """Returns the time (in seconds) `check` took to be `True`."""
+    start = perf_counter()
+    while not check():
+        if perf_counter() - start > timeout:
+            raise TimeoutError("the change did not reach the table")
+        sleep(0.001)
+    return perf_counter() - start
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=20)
+    args = parser.parse_args()
+
+    port = unused_port()
+    browser = MdnsBrowser_Thread(interfaces=("127.0.0.1",), port=port)
+    browser.start()
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton("127.0.0.1"))
+    sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    send = lambda records: sender.sendto(announcement(records), (MDNS_GROUP, port))
+    sleep(0.3) # the group is joined ↓
+
+    timings = {"connect": [], "pairing": [], "new port": [], "goodbye": []}
+    for num in range(args.devices):
+        serial, ip = f"FAKE{num:04d}", f"127.5.0.{num + 2}"
+        send(service_records(serial, CONNECT_SERVICE, ip, 37000 + num))
+        timings["connect"].append(wait_for(lambda: mdns_services.endpoint("connect", ip)))
+
+        ptr, srv, address = service_records(serial, PAIRING_SERVICE, ip, 41000 + num)
+        send([ptr, srv])
+        send([address])
+        timings["pairing"].append(wait_for(lambda: mdns_services.endpoint("pairing", ip) == (ip, str(41000 + num))))
+
+        send(service_records(serial, PAIRING_SERVICE, ip, 42000 + num))
+        timings["new port"].append(wait_for(lambda: mdns_services.endpoint("pairing", ip) == (ip, str(42000 + num))))
+
+        send(service_records(serial, PAIRING_SERVICE, ip, 42000 + num, ttl=0)[:1])
+        timings["goodbye"].append(wait_for(lambda: mdns_services.endpoint("pairing", ip) is None))
+
+    connect_serials = {service["serial"] for service in mdns_services.services("connect")}
+    assert len(connect_serials) == args.devices, f"{len(connect_serials)} connect endpoints of {args.devices}"
+    browser.stop()
+
+    print(f"{args.devices} devices announced on loopback (port {port})")
+    for change, values in timings.items():
+        print(f"{change:>9}: {1000 * sum(values) / len(values):.2f}ms on average, {1000 * max(values):.2f}ms at most")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of the `Pair From File` button (see `Batch_Pairing`) against the fake `adb` of `Fake_Bin`.
+
+A batch file of devices is written (a few with a wrong code, a few that cannot be reached and a few without
+connect port), then the devices are paired one at a time like `Wifi Debug` does (`adb tcpip` then `adb pair`),
+and all at once by `pair_entries` (pairing and connection), and the report is written.
+
+Usage
+-----
+python Benchmarks/Benchmark_Pairing.py [--latency 0.1] [--pair-latency 0.5] [--devices 24]
+"""
+import sys
+import socket
+from os import environ, pathsep
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# forces the `adb` fallback, before `Adb_Client` reads the port ↓
+environ["ANDROID_ADB_SERVER_PORT"] = str(unused_port())
+environ["PATH"] = str(ROOT / "Benchmarks" / "Fake_Bin") + pathsep + environ["PATH"]
+sys.path.insert(0, str(ROOT))
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Batch_Pairing import PAIR_WORKERS, load_pairing_entries, pair_entries, report_path, write_report
+
+def write_batch(path: Path, devices: int) -> dict:
+    """Writes the batch file and returns the expected status of each IP."""
+    expected = {}
+    lines = ["ip,pairing_port,code,connect_port", "# the rack of the second floor"]
+    for num in range(devices):
+        ip = f"10.0.{num // 250}.{num % 250 + 2}"
+        code, connect_port = f"{123456 + num}", str(40000 + num)
+        if num % 8 == 3:
+            code, expected[ip] = "000000", "failed"
+        elif num % 8 == 5:
+            expected[ip] = "failed"
+        elif num % 8 == 7:
+            connect_port, expected[ip] = "", "paired"
+        else:
+            expected[ip] = "connected"
+        lines.append(f"{ip},{37000 + num},{code},{connect_port}")
+    path.write_text("\n".join(lines) + "\n")
+    environ["FAKE_ADB_UNREACHABLE"] = ",".join(ip for num, ip in enumerate(expected) if num % 8 == 5)
+    return expected
+
+def pair_one_by_one(entries: list) -> int:
+    runner = CommandRunner()
+    paired = 0
+    for entry in entries:
+        runner.run(["adb", "tcpip", "5555"])
+        paired += "successfully paired" in runner.run(["adb", "pair", f"{entry.ip}:{entry.pairing_port}", entry.code]).stdout.lower()
+    return paired
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="time (in seconds) of each adb command")
+    parser.add_argument("--pair-latency", type=float, default=0.5, help="time (in seconds) of each adb pair")
+    parser.add_argument("--devices", type=int, default=24)
+    args = parser.parse_args()
+    environ["FAKE_ADB_LATENCY"] = str(args.latency)
+    environ["FAKE_ADB_PAIR_LATENCY"] = str(args.pair_latency)
+
+    with TemporaryDirectory() as folder:
+        batch_path = Path(folder) / "rack.csv"
+        expected = write_batch(batch_path, args.devices)
+        entries = load_pairing_entries(str(batch_path))
+
+        start = perf_counter()
+        serial_paired = pair_one_by_one(entries)
+        serial_time = perf_counter() - start
+
+        start = perf_counter()
+        results = list(pair_entries(entries))
+        batch_time = perf_counter() - start
+        write_report(results, report_path(str(batch_path)))
+        report_lines = Path(report_path(str(batch_path))).read_text().splitlines()
+
+    statuses = {result.entry.ip: result.status for result in results}
+    assert statuses == expected, f"unexpected statuses: {set(statuses.items()) ^ set(expected.items())}"
+    assert len(report_lines) == len(entries) + 1
+
+    connected = sum(result.status == "connected" for result in results)
+    print(f"latency per adb command: {args.latency}s, per adb pair: {args.pair_latency}s, workers: {PAIR_WORKERS}")
+    print(f"batch entries: {len(entries)}")
+    print(f"one by one (pair only): {serial_time:>6.2f}s, {serial_paired} paired")
+    print(f"all at once (pair + connect): {batch_time:>5.2f}s, {connected} connected "
+          f"({serial_time / batch_time:.1f}x), report of {len(report_lines) - 1} lines")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of the device probing used by the `Detect Devices` button (see `Device_Probe`).
+
+The devices are served by the fake `adb` in `Fake_Bin` (the `ADB` server is made unreachable, so
+every call goes through the executable, like when the server is not running). The sequential probe
+(one worker) is compared with the parallel probe for 1, 10 and 50 devices, and the detection is then
+repeated with the facts already cached (see `Device_Probe.device_facts_cache`).
+
+Usage
+-----
+python Benchmarks/Benchmark_Probe.py [--latency SECONDS] [--devices 1 10 50]
+"""
+import sys
+import socket
+from os import environ, pathsep
+from pathlib import Path
+from time import perf_counter
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# forces the `adb` fallback, before `Adb_Client` reads the port ↓
+environ["ANDROID_ADB_SERVER_PORT"] = str(unused_port())
+environ["PATH"] = str(ROOT / "Benchmarks" / "Fake_Bin") + pathsep + environ["PATH"]
+sys.path.insert(0, str(ROOT))
+
+from Script.Utilities.Device_Probe import PROBE_WORKERS, device_facts_cache, probe_devices
+
+def run(devices: int, workers: int, cached: bool = False) -> tuple:
+    environ["FAKE_ADB_DEVICES"] = str(devices)
+    if not cached:
+        device_facts_cache.clear()
+    serials = [f"FAKE{num:04d}" for num in range(devices)]
+
+    start = perf_counter()
+    first = None
+    found = 0
+    for _ in probe_devices(serials, workers=workers):
+        first = first or perf_counter() - start
+        found += 1
+    return perf_counter() - start, first or 0.0, found
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="time (in seconds) of each adb command")
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+    environ["FAKE_ADB_LATENCY"] = str(args.latency)
+
+    print(f"latency per adb command: {args.latency}s, parallel workers: {PROBE_WORKERS}")
+    print(f"{'devices':>8} | {'sequential':>11} | {'parallel':>9} | {'first board':>11} | {'speedup':>7} | {'cached':>7}")
+    for devices in args.devices:
+        sequential, _, _ = run(devices, 1)
+        parallel, first, found = run(devices, PROBE_WORKERS)
+        assert found == devices, f"only {found} of {devices} devices were probed"
+        cached, _, _ = run(devices, PROBE_WORKERS, cached=True)
+        print(
+            f"{devices:>8} | {sequential:>10.2f}s | {parallel:>8.2f}s | {first:>10.2f}s | "
+            f"{sequential / parallel:>6.1f}x | {cached:>6.3f}s"
+        )
+
+if __name__ == "__main__":
+    main()
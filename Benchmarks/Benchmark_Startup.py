@@ -0,0 +1,70 @@
+"""
+Benchmark of the startup of the app (`start.py`).
+
+Each run starts a new interpreter (offscreen, so no display is needed) which imports the modules
+of `start.py`, builds the `Client` window and quits right after its first paint. The time of the
+imports, the time until the window is painted and the resident memory (max RSS) are measured,
+and the median of the runs is printed.
+
+Usage
+-----
+python Benchmarks/Benchmark_Startup.py [--runs 5]
+"""
+import sys
+import json
+import subprocess
+from os import environ
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# runs in the new interpreter, with a temporary data folder ↓
+STARTUP_CODE = """
+import sys, json, resource
+from time import perf_counter
+start = perf_counter()
+sys.path.insert(0, sys.argv[1])
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+import Script.Utilities.Static_Datas as Static_Datas
+Static_Datas.PATH_DATA_DIR = sys.argv[2]
+import Script.Utilities.Settings_Store as Settings_Store
+Settings_Store.settings_store.path = sys.argv[2] + "/UserData.json"
+from UI.ClientUI import Client
+imports = perf_counter() - start
+
+app = QApplication(sys.argv[:1])
+client = Client(Settings_Store.settings_store.load())
+def painted():
+    window = perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"imports": imports, "window": window, "rss": rss}))
+    app.quit()
+QTimer.singleShot(0, painted)
+app.exec_()
+"""
+
+def run() -> dict:
+    with TemporaryDirectory() as data_dir:
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_CODE, str(ROOT), data_dir],
+            capture_output=True,
+            text=True,
+            env={**environ, "QT_QPA_PLATFORM": "offscreen"},
+            timeout=60,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    options = parser.parse_args()
+
+    results = [run() for _ in range(options.runs)]
+    print(f"startup of the app, median of {options.runs} runs")
+    print(f"  imports:       {median(result['imports'] for result in results) * 1000:7.0f} ms")
+    print(f"  window shown:  {median(result['window'] for result in results) * 1000:7.0f} ms")
+    print(f"  max RSS:       {median(result['rss'] for result in results):7.1f} MB")
@@ -0,0 +1,96 @@
+"""
+Benchmark of the `Sweep Network` button (see `Network_Sweep`) against stand-ins of devices on loopback aliases.
+
+A few hosts of a loopback network (`127.2.0.0/24` by default, every `127.x.x.x` is local on Linux) listen
+like devices in TCP mode: they answer `CNXN` with their banner (or `AUTH`, like a device that does not know
+the key of the computer yet). Other hosts listen on the same port without speaking `ADB` (they must not be
+listed), and the rest of the network is closed.
+
+Usage
+-----
+python Benchmarks/Benchmark_Sweep.py [--network 127.2.0.0/24] [--devices 12] [--others 4] [--ports 5555 5556]
+"""
+import sys
+import asyncio
+import ipaddress
+from pathlib import Path
+from threading import Thread
+from time import perf_counter
+from argparse import ArgumentParser
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from Script.Utilities.Network_Sweep import (
+    A_AUTH,
+    A_CNXN,
+    HEADER,
+    SWEEP_CONCURRENCY,
+    SWEEP_RATE,
+    adb_message,
+    sweep_network,
+)
+
+def device_handler(num: int):
+    """Answers the `CNXN` of the host like a device (one of three is not authorized yet)."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        command, *_ = HEADER.unpack(await reader.readexactly(HEADER.size))
+        if command == A_CNXN:
+            if num % 3 == 2:
+                writer.write(adb_message(A_AUTH, 1, 0, b"\0" * 20))
+            else:
+                banner = f"device::ro.product.name=fake;ro.product.model=Fake_{num};ro.product.device=fake;\0"
+                writer.write(adb_message(A_CNXN, 0x01000001, 256 * 1024, banner.encode()))
+            await writer.drain()
+        writer.close()
+    return handle
+
+async def other_handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answers like a service that is not `ADB`."""
+    writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+    await writer.drain()
+    writer.close()
+
+def start_stand_ins(device_hosts: list, other_hosts: list, ports: list) -> None:
+    """Starts the stand-ins in their own loop (in a daemon thread)."""
+    async def start_servers() -> list:
+        return await asyncio.gather(*servers)
+
+    loop = asyncio.new_event_loop()
+    servers = [
+        *(asyncio.start_server(device_handler(num), host, port)
+          for num, host in enumerate(device_hosts) for port in ports),
+        *(asyncio.start_server(other_handler, host, port) for host in other_hosts for port in ports),
+    ]
+    loop.run_until_complete(start_servers())
+    Thread(target=loop.run_forever, daemon=True).start()
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--network", default="127.2.0.0/24")
+    parser.add_argument("--devices", type=int, default=12, help="hosts that answer like a device")
+    parser.add_argument("--others", type=int, default=4, help="hosts that listen without speaking ADB")
+    parser.add_argument("--ports", nargs="+", type=int, default=[5555])
+    args = parser.parse_args()
+
+    hosts = [str(host) for host in ipaddress.ip_network(args.network).hosts()]
+    step = max(1, len(hosts) // (args.devices + args.others))
+    spread = hosts[::step][:args.devices + args.others]
+    device_hosts, other_hosts = spread[:args.devices], spread[args.devices:]
+    start_stand_ins(device_hosts, other_hosts, args.ports)
+
+    start = perf_counter()
+    hits = sweep_network(args.network, args.ports)
+    sweep_time = perf_counter() - start
+
+    found = {hit.host for hit in hits}
+    assert found == set(device_hosts), f"found {sorted(found)}, expected {device_hosts}"
+    print(f"concurrency: {SWEEP_CONCURRENCY}, rate: {SWEEP_RATE}/s")
+    print(f"swept {len(hosts)} hosts x {len(args.ports)} port(s) of {args.network} in {sweep_time:.2f}s")
+    print(f"found {len(hits)} devices ({sum(hit.command == 'AUTH' for hit in hits)} not authorized), "
+          f"{len(other_hosts)} other services ignored")
+    for hit in hits[:5]:
+        print(f"  {hit}")
+
+if __name__ == "__main__":
+    main()
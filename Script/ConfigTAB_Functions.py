@@ -1,4 +1,4 @@
-from os.path import join, exists
+from os.path import exists
 from functools import partial
 from platform import system
 import webbrowser
@@ -9,12 +9,13 @@ from PyQt5.QtWidgets import QLineEdit, QComboBox, QFileDialog, QWidget
 from UI.DeviceSelection import DeviceSelectionUI
 from Script.Thread_Config_Tab import ConfigTAB_Thread
 from Script.Utilities.Create_Alerts import create_alert
-from Script.Utilities.Static_Datas import USERDATA, PATH_DATA_DIR
+from Script.Utilities.Static_Datas import USERDATA
+from Script.Utilities.Settings_Store import settings_store
+from Script.Utilities.Scrcpy_Version import binary_identity, cached_scrcpy_version
 from Script.Utilities.Utils import (
     toggle_button_state,
     verify_scrcpy_path, 
     update_data_file,
-    open_or_save_data_json
 )
 
 running_on_windows = system() == "Windows"
@@ -428,7 +429,7 @@ class ConfigTAB():
 
         Notes
         -----
-        - The function opens and overwrites the `UserData.json` file with default data (`USERDATA`).
+        - The function overwrites the user data and the `UserData.json` file with default data (`USERDATA`).
         - After resetting the data, the client widget is closed to apply the changes.
         - The reset is irreversible, so it is important that the user explicitly confirms the action.
         """
@@ -438,7 +439,7 @@ class ConfigTAB():
             "do you want to continue?"), 
             "confirm",
         ):  
-            open_or_save_data_json(join(PATH_DATA_DIR, "UserData.json"), "w", USERDATA)
+            settings_store.reset(USERDATA)
             create_alert(
                 "Closing",
                 "The client will CLOSE to APPLY the CHANGES",
@@ -544,6 +545,9 @@ class ConfigTAB():
         in the `data` dictionary, and sets the path in the specified line edit widget. It then saves the updated version 
         information in the configuration file under both `Selected_Version` and `Saved_Versions`.
 
+        If the binary of the version was probed again since it was saved (see `Scrcpy_Version`), the cached version 
+        is used, without running `scrcpy -v`.
+
         Parameters
         ----------
         - combo_box (`QComboBox`): The combo box widget from which the currently selected version is retrieved.
@@ -552,6 +556,8 @@ class ConfigTAB():
         """
         if (current_version_name := combo_box.currentText()) in data["Saved_Versions"].keys():
             current_version = data["Saved_Versions"][current_version_name]
+            if (cached_version := cached_scrcpy_version(binary_identity(current_version["Path"]))) is not None:
+                current_version["Version"] = cached_version
             line_edit_target.setText(current_version["Path"])
             data["Selected_Version"] = current_version
             
@@ -1,12 +1,16 @@
 from functools import partial
 from platform import system
 
-from PyQt5.QtWidgets import QComboBox, QLineEdit, QScrollArea
+from PyQt5.QtWidgets import QCheckBox, QComboBox, QFileDialog, QLineEdit, QScrollArea
 
 from UI.DeviceSelection import DeviceSelectionUI 
 from Script.Thread_Connect_Tab import ConnectTAB_Thread 
 from Script.Thread_FindDevice import FindDeviceW_Thread 
 from Script.Utilities.Create_Alerts import create_alert
+from Script.Utilities.Network_Sweep import SWEEP_PORTS, sweep_hosts
+from Script.Utilities.Mdns_Services import mdns_services
+from Script.Utilities.Batch_Pairing import load_pairing_entries, report_path
+from Script.Utilities.Settings_Store import settings_store, SWEEP_NETWORK_KEYS, SWEEP_PORTS_KEYS
 from Script.Utilities.Utils import (
     toggle_button_state,
     verify_scrcpy_path,
@@ -103,6 +107,137 @@ class ConnectTAB():
                 "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
             )        
         
+    def connect_all_saved(self, buttons: list, data: dict) -> None:
+        """
+        Connects all the saved devices at once, and shows a single summary (see `Bulk_Connect`).
+
+        Parameters
+        ----------
+        - buttons (`list`): A list of button widgets (`QPushButton`) to toggle during the connection process.
+        - data (`dict`): A dictionary with the application’s configuration data, including:
+          - `Versions` (`dict`): Contains information about available `scrcpy` versions, including the selected one.
+          - `Connect` (`dict`): Stores the saved device IPs and ports.
+        """
+        if path := data["Versions"]["Selected_Version"]["Path"] or not running_on_windows:
+            if verify_scrcpy_path(path):
+                if saved_endpoints := dict(data["Connect"]["Custom_Ip_Saved"]):
+                    original_texts = toggle_button_state(
+                        buttons, 
+                        False,
+                    )
+                    self.terminal = ConnectTAB_Thread(
+                        "connect_all_saved",
+                        path,
+                        saved_endpoints,
+                    )
+                    self.terminal.start()
+                    self.terminal.connect_all_output.connect(self.terminal.check_emits_connect_all)
+                    self.terminal.finished.connect(
+                        partial(
+                            toggle_button_state,
+                            buttons,
+                            True,
+                            original_texts,
+                        )
+                    )
+                else:
+                    create_alert(
+                        "Nothing Saved",
+                        "No IP has been saved, save one with the 'Save' button first",
+                    ) 
+            else:
+                create_alert(
+                    "Error in finding scrcpy",
+                    ("the scrcpy/adb was not found in the version folder, " 
+                    "check the folder and try again"),
+                )
+        else:
+            create_alert(
+                "Nothing Selected",
+                ("No version has been selected -> "
+                "<a href='https://github.com/Genymobile/scrcpy/releases'>Scrcpy Releases</a> or "
+                "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
+            )        
+        
+    def pair_from_file(self, buttons: list, combo_box: QComboBox, data: dict) -> None:
+        """
+        Pairs and connects all the devices of a batch file at once, and shows a single summary (see `Batch_Pairing`).
+
+        The batch file (CSV or JSON) lists the IP, the pairing port, the pairing code and the connect port of each 
+        device. The connected devices are added to the saved connections and a report is written next to the file.
+
+        Parameters
+        ----------
+        - buttons (`list`): A list of button widgets (`QPushButton`) to toggle during the pairing process.
+        - combo_box (`QComboBox`): The combo box of the saved connections, the new ones are added to it.
+        - data (`dict`): A dictionary with the application’s configuration data, including:
+          - `Versions` (`dict`): Contains information about available `scrcpy` versions, including the selected one.
+        """
+        if path := data["Versions"]["Selected_Version"]["Path"] or not running_on_windows:
+            if verify_scrcpy_path(path):
+                batch_path, _ = QFileDialog.getOpenFileName(
+                    None,
+                    "Select Pairing Batch",
+                    "",
+                    "Pairing batch (*.csv *.json);;All files (*)",
+                )
+                if not batch_path:
+                    return
+                try:
+                    entries = load_pairing_entries(batch_path)
+                except ValueError as error:
+                    create_alert(
+                        "Invalid Batch File",
+                        f"{error}\nEach line needs: ip, pairing_port, code, connect_port",
+                    )
+                    return
+                
+                if not entries:
+                    create_alert(
+                        "Nothing To Pair",
+                        "The batch file has no device",
+                    )
+                elif create_alert(
+                    "Pair From File",
+                    (f"{len(entries)} devices will be paired and connected, "
+                    "keep their pairing dialogs open until the end"),
+                    "confirm",
+                ):
+                    original_texts = toggle_button_state(
+                        buttons, 
+                        False,
+                    )
+                    self.terminal = ConnectTAB_Thread(
+                        "pair_batch",
+                        path,
+                        entries,
+                        report_path(batch_path),
+                        combo_box,
+                    )
+                    self.terminal.start()
+                    self.terminal.pair_batch_output.connect(self.terminal.check_emits_pair_batch)
+                    self.terminal.finished.connect(
+                        partial(
+                            toggle_button_state,
+                            buttons,
+                            True,
+                            original_texts,
+                        )
+                    )
+            else:
+                create_alert(
+                    "Error in finding scrcpy",
+                    ("the scrcpy/adb was not found in the version folder, " 
+                    "check the folder and try again"),
+                )
+        else:
+            create_alert(
+                "Nothing Selected",
+                ("No version has been selected -> "
+                "<a href='https://github.com/Genymobile/scrcpy/releases'>Scrcpy Releases</a> or "
+                "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
+            )
+    
     def connect_to_line_edit(self, buttons: list, line_edits: list, data: dict, return_connect_infos: bool = False) -> None | list:
         """
         Connects to a device using IP and port specified in line edit widgets.
@@ -178,13 +313,16 @@ class ConnectTAB():
         -----
         - The function first calls `connect_to_line_edit` to validate and retrieve the `ip` and `port` from the 
         line edits. If the fields are invalid or empty, appropriate alerts are displayed.
+        - The fields are filled first from the pairing endpoint advertised over mDNS, if any (see `prefill_wifi_debug`).
         """
+        prefilled = self.prefill_wifi_debug(line_edits)
         connect_infos = self.connect_to_line_edit(non_concurrent_buttons, line_edits, data, True)
         if connect_infos is not None:
             path = data["Versions"]["Selected_Version"]["Path"]
             accept_confirm = create_alert(
                 "Check The Filled Fields",
-                "Check if the IP and Port match Wifi Debug before proceeding",
+                ("The IP and Port were filled from the pairing dialog open on the device, check them before proceeding"
+                if prefilled else "Check if the IP and Port match Wifi Debug before proceeding"),
                 "confirm",
             )
             if accept_confirm:
@@ -226,6 +364,28 @@ class ConnectTAB():
                         )
                     )                      
     
+    def prefill_wifi_debug(self, line_edits: list) -> bool:
+        """
+        Fills the `ip` and `port` fields with the pairing endpoint advertised over mDNS (see `Mdns_Services`).
+
+        The pairing port changes every time the pairing dialog is opened on the device, so the port is replaced
+        when the IP in the field is the one of an advertised endpoint (the last advertised one if the IP is empty).
+
+        Parameters
+        ----------
+        - line_edits (`list`): The `QLineEdit` widgets of the `ip` and `port`.
+
+        Returns
+        -------
+        - `bool`: `True` if the fields were filled.
+        """
+        ip = line_edits[0].text().strip()
+        if endpoint := mdns_services.endpoint("pairing", ip or None):
+            for line_edit, text in zip(line_edits, endpoint):
+                line_edit.setText(text)
+            return True
+        return False
+    
     def save_custom_connection(self, combo_box_target: QComboBox, list_edits: list, data: dict) -> None:
         """
         Saves a custom IP connection to the configuration data.
@@ -358,6 +518,17 @@ class ConnectTAB():
             ["Last_Session_Config", "ConnectTAB", "Ip_Index"],
         )
 
+    def save_check_state(self, check_box: QCheckBox, keys: tuple) -> None:
+        """
+        Saves the state of a check box of the Connect tab (e.g. `Auto Reconnect`, see `Reconnect_Watchdog`).
+
+        Parameters
+        ----------
+        - check_box (`QCheckBox`): The check box.
+        - keys (`tuple`): The path of the value in the user data (e.g. `AUTO_RECONNECT_KEYS`).
+        """
+        settings_store.set(check_box.isChecked(), keys)
+
     def last_text_infos(self, line_edit: QLineEdit, index: int) -> None:
         """
         Updates the last session configuration with the text from a line edit widget.
@@ -410,6 +581,9 @@ class DeviceList():
                     original_texts,
                     DeviceListUi,
                 )
+                self.terminal.device_info_output.connect(
+                    self.terminal.add_device,
+                )
                 self.terminal.start()
                 self.terminal.get_device_output.connect(
                     partial(
@@ -430,6 +604,70 @@ class DeviceList():
                 "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
             )
       
+    def sweep_network(self, buttons: list, DeviceListUi: QScrollArea, line_network: QLineEdit) -> None:
+        """
+        Sweeps a network for the devices that listen for `ADB` over TCP, using a background thread.
+
+        Every host of the network is tried on the ports of `Connect.Sweep_Ports` (and the auto connection port if
+        it is set), the endpoints that answer the `ADB` handshake are listed in the `DeviceListUi` (see `Network_Sweep`).
+        No `adb` process is started, so the sweep does not need a `scrcpy` version.
+
+        Parameters
+        ----------
+        - buttons (`list`): A list of non-concurrent buttons (`QPushButton`) to toggle during the sweep.
+        - DeviceListUi (`QScrollArea`): The user interface component where the devices found will be displayed.
+        - line_network (`QLineEdit`): The `QLineEdit` with the network to sweep (its placeholder if it is empty).
+        """
+        network = line_network.text().strip() or line_network.placeholderText()
+        ports = [*settings_store.get(SWEEP_PORTS_KEYS, list(SWEEP_PORTS)), settings_store.auto_port]
+        try:
+            sweep_hosts(network)
+        except ValueError as error:
+            create_alert(
+                "Invalid Network",
+                f"Cannot sweep '{network}', enter a network like 192.168.1.0/24 ({error})",
+            )
+            return
+        try:
+            ports = sorted({int(port) for port in ports if str(port).strip()})
+            if not ports or not all(0 < port < 65536 for port in ports):
+                raise ValueError(f"the ports {ports} are not valid")
+        except ValueError as error:
+            create_alert(
+                "Invalid Port",
+                f"Cannot sweep '{network}', make sure the sweep ports and the auto connection port are valid ({error})",
+            )
+            return
+        
+        original_texts = toggle_button_state(
+            buttons,
+            False,
+        )
+        self.terminal = FindDeviceW_Thread(
+            "sweep_network",
+            settings_store.scrcpy_path,
+            buttons,
+            original_texts,
+            DeviceListUi,
+            network,
+            ports,
+        )
+        self.terminal.device_info_output.connect(
+            self.terminal.add_device,
+        )
+        self.terminal.get_device_output.connect(
+            self.terminal.add_devices,
+        )
+        self.terminal.finished.connect(
+            partial(
+                toggle_button_state,
+                buttons,
+                True,
+                original_texts,
+            )
+        )
+        self.terminal.start()
+    
     def connect_device(
         self,
         device_ip: str,
@@ -454,8 +692,7 @@ class DeviceList():
         - buttons (`list`): A list of non-concurrent buttons (`QPushButton`) to toggle during the connection process.
         - data (`dict`): The configuration data, including the `PORT` to use and the path to the selected `scrcpy` version.
         """
-        device_port = data["Connect"]["Port_Auto"]
-        if (device_port := device_port.rstrip().lstrip() if device_port else None):
+        if device_port := settings_store.auto_port.strip():
             path = data["Versions"]["Selected_Version"]["Path"]
             if verify_scrcpy_path(path) or not running_on_windows:
                 self.terminal = FindDeviceW_Thread(
@@ -487,7 +724,7 @@ class DeviceList():
         Saves the port value entered in the UI.
 
         This function saves the port value entered in the `line_port` field into the `data` dictionary, 
-        specifically under the key `Port_Auto`. It then updates the configuration file with the new port value.
+        specifically under the key `Port_Auto` (see `settings_store.auto_port`), the file is written by the store.
         The port is expected to be a string, and it is stored to ensure the next time the application is run, 
         the same port value is retained.
 
@@ -497,8 +734,14 @@ class DeviceList():
         - data (`dict`): The dictionary containing the connection configuration data, where the port value will 
         be saved.
         """
-        data["Port_Auto"] = line_port.text()
-        update_data_file(
-            line_port.text(),
-            ["Connect", "Port_Auto"],
-        )
\ No newline at end of file
+        settings_store.auto_port = line_port.text()
+    
+    def save_sweep_network(self, line_network: QLineEdit) -> None:
+        """
+        Saves the network to sweep entered in the UI (`Connect.Sweep_Network`).
+
+        Parameters
+        ----------
+        - line_network (`QLineEdit`): The `QLineEdit` widget where the user inputs the network.
+        """
+        settings_store.set(line_network.text().strip(), SWEEP_NETWORK_KEYS)
\ No newline at end of file
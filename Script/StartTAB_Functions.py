@@ -6,18 +6,17 @@ from Script.Thread_Start_Tab import StartTAB_Thread
 from UI.DeviceSelection import DeviceSelectionUI 
 from Script.Utilities.Static_Datas import USERDATA
 from Script.Utilities.Create_Alerts import create_alert
+from Script.Utilities.Settings_Store import settings_store
+from Script.Utilities.Args_Validator import args_validator
+from Script.Utilities.Command_Runner import split_arg_line
+from Script.Utilities.Option_Schema import command_builder
 from Script.Utilities.Utils import (
     verify_scrcpy_path,
     valid_maxsize_value,
     get_file_name,
     update_data_file,
 )
-from Script.Utilities.Auxiliary_Funcs import (
-    get_sliders_start,
-    get_line_edit_start,
-    get_combo_box_start,
-    get_checkBox_start,
-)
+from Script.Utilities.Auxiliary_Funcs import alert_error
 running_on_windows = system() == "Windows"
 class StartTAB():
     """This class is used to handle the start tab functions"""
@@ -189,6 +188,9 @@ class StartTAB():
         It validates the arguments, ensures the required scrcpy path exists, and manages the execution 
         through a separate thread. Alerts are displayed for any validation or path-related errors.
 
+        The combinations of arguments that scrcpy refuses are rejected before anything is started (see 
+        `Args_Validator`), with the same alert as the error printed by scrcpy.
+
         Parameters
         ----------
         - data (`dict`): A dictionary containing saved configurations, including the selected scrcpy version and paths.
@@ -202,13 +204,20 @@ class StartTAB():
         - `FileNotFoundError`: If the scrcpy or adb executables are missing in the selected version folder.
         """
         arg_line = manual_arg_line.text() if manual_arg_line else ui_arg_line
-        if valid_maxsize_value(arg_line):
+        try:
+            args = split_arg_line(arg_line)
+        except ValueError: # e.g. a quote that is not closed, reported by scrcpy
+            args = arg_line.split()
+
+        if preflight_error := args_validator.first_error(args):
+            alert_error(preflight_error)
+        elif valid_maxsize_value(arg_line):
             if path := data["Versions"]["Selected_Version"]["Path"] or not running_on_windows:
                 if verify_scrcpy_path(path):
                     self.terminal = StartTAB_Thread(
-                        "get_connect_devices", 
+                        "prepare_scrcpy_start", 
                         path,
-                        data["File_Path_Config"]["Path_selected"],
+                        settings_store.record_path,
                         arg_line,
                         get_file_name(arg_line)[1],
                         data["File_Path_Config"]["Path_Mode_Radio"][0] == True,
@@ -270,7 +279,8 @@ class StartTAB():
 
         This function constructs a command line from various UI elements, including sliders, checkboxes, 
         combo boxes, and line edits. It then passes the constructed arguments to the `run_scrcpy` function 
-        to start scrcpy with the specified configuration. If the selected scrcpy version is below 2.0, 
+        to start scrcpy with the specified configuration. The arguments are declared in `OPTION_SCHEMA` and built
+        by `command_builder` (see `Option_Schema`). If the selected scrcpy version is below 2.0, 
         an alert is displayed indicating that some features may not work.
 
         Parameters
@@ -284,33 +294,17 @@ class StartTAB():
         """
 
         #Get all args ↓ ------------------
-        args_w_required_values = [
-            "display buffer",
-            "crop",
-            "record",
-            "video buffer",
-            "audio buffer",
-            "time limit",
-            "Mouse",
-            "Keyboard",
-            "Mouse + Keyboard",
-            "AoA",
-            "uHid",
-            "SDK",
-            "Mouse Binding",
-            "Virtual Display",
-            "Screen Off TO",
-        ] 
-        
-        command_line = ""
         active_checks = [box.text().lower() for box in check_boxes if box.isChecked()]
         scrcpy_version = data["Versions"]["Selected_Version"]["Version"]
         scrcpy_version = float(scrcpy_version) if scrcpy_version else 0.0
-        command_line += get_sliders_start(sliders, active_checks, scrcpy_version) 
-        command_line += get_line_edit_start(line_edits, active_checks, combo_boxs[0], scrcpy_version)
-        command_line += get_combo_box_start(combo_boxs, scrcpy_version)
-        args_line, hide_client = get_checkBox_start(active_checks, args_w_required_values, scrcpy_version)
-        command_line += args_line
+        command_line = command_builder.build(
+            scrcpy_version,
+            [slider.value() for slider in sliders],
+            active_checks,
+            [combo_box.currentText() for combo_box in combo_boxs],
+            [line_edit.text() for line_edit in line_edits],
+        )
+        hide_client = "hide client" in active_checks
         
         if scrcpy_version < 2.0:
             create_alert(
@@ -499,3 +493,38 @@ class StartTAB():
                 "<a href='https://github.com/Genymobile/scrcpy/releases'>Scrcpy Releases</a> or "
                 "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
             )
+
+    def benchmark_encoders(self, data: dict) -> None:
+        """
+        Measures the video encoders of a device, chosen in the device selection (see `Encoder_Benchmark`).
+
+        The fastest encoder measured is then offered as `Auto (fastest measured)` in the encoders of the Start tab.
+
+        Parameters
+        ----------
+        - data (`dict`): A dictionary containing the saved configuration data, including the selected scrcpy version.
+        """
+        if path := data["Versions"]["Selected_Version"]["Path"] or not running_on_windows:
+            if verify_scrcpy_path(path):
+                self.terminal = StartTAB_Thread(
+                    "get_connect_devices",
+                    path,
+                    DeviceSelectionUI,
+                )
+                self.terminal.start()
+                self.terminal.get_devices_output.connect(
+                    self.terminal.start_benchmark_ui,
+                )
+            else:
+                create_alert(
+                    "Error in finding scrcpy",
+                    ("the scrcpy/adb was not found in the version folder, " 
+                    "check the folder and try again"),
+                )
+        else:
+            create_alert(
+                "Nothing Selected",
+                ("No version has been selected -> "
+                "<a href='https://github.com/Genymobile/scrcpy/releases'>Scrcpy Releases</a> or "
+                "<a href='https://github.com/Genymobile/scrcpy/blob/master/doc/linux.md#latest-version'>Scrcpy for Linux</a>"),
+            )
@@ -1,21 +1,25 @@
-from curses.ascii import isdigit
-import subprocess
 from platform import system
 
 from PyQt5.Qt import pyqtSlot
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
 
 from Script.Utilities.Create_Alerts import create_alert
+from Script.Utilities.Device_Registry import get_devices
+from Script.Utilities.Device_Probe import prefetch_device_facts
+from Script.Utilities.Task_Pool import PoolTask
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Scrcpy_Version import get_scrcpy_version
+from Script.Utilities.Scrcpy_Capabilities import get_scrcpy_capabilities
 from Script.Utilities.Utils import toggle_button_state, update_data_file
 
 running_on_windows = system() == "Windows"
-class ConfigTAB_Thread(QThread):
+class ConfigTAB_Thread(PoolTask):
     """
     This class runs the specified command in a separate thread to prevent blocking the main UI thread.
 
     The `ConfigTAB_Thread` class is designed to handle background operations, such as executing commands 
-    related to the `scrcpy`, while allowing the UI to remain responsive. The class uses PyQt's threading 
-    mechanisms and signals to communicate the results of the operations back to the main thread.
+    related to the `scrcpy`, while allowing the UI to remain responsive. The class runs in the shared `task_pool` 
+    (see `Task_Pool`) and uses signals to communicate the results of the operations back to the main thread.
 
     Parameters
     ----------
@@ -28,16 +32,19 @@ class ConfigTAB_Thread(QThread):
     - `charge_resolution_output` (`pyqtSignal(str)`): Emitted when resolution data is updated.
     - `get_device_output` (`pyqtSignal(list)`): Emitted with the list of devices found by the command.
     - `reset_server_output` (`pyqtSignal(list)`): Emitted to reset the server after executing the command.
+    - `scrcpy_version_error` (`pyqtSignal()`): Emitted when the version of scrcpy could not be read.
     """
     charge_resolution_output = pyqtSignal(str)
     get_device_output = pyqtSignal(list)
     reset_server_output = pyqtSignal(list)
+    scrcpy_version_error = pyqtSignal()
     
     def __init__(self, command_name: str, path: str, *func_args: tuple) -> None:
         super().__init__(None)
         self.command = command_name.lower()
         self.path = path if running_on_windows == "Windows" else path
         self.func_args = list(func_args)
+        self.runner = CommandRunner(self.path)
     
     def run(self):
         methods_dict = {
@@ -55,27 +62,21 @@ class ConfigTAB_Thread(QThread):
 
     def get_connect_devices(self) -> list:
         """
-        Runs the `adb devices` command in a separate thread to retrieve the list of connected devices.
+        Retrieves the list of connected devices in a separate thread.
 
-        This function uses `subprocess` to execute the `adb devices` command and parse the output into a 
-        list of connected devices. The list of devices is then emitted to the main UI thread through the 
-        `get_device_output` signal.
+        This function reads the connected devices from the live `device_registry` (or asks the ADB server 
+        when the registry is not being tracked) and builds a list of their identifiers. The facts of the devices are 
+        cached for the picker labels (see `Device_Probe.prefetch_device_facts`), and the list of devices is then 
+        emitted to the main UI thread through the `get_device_output` signal.
 
         Emits
         -----
         - `get_device_output` (`list`): A list of devices currently connected via ADB.
         """
-        list_devices = subprocess.run(
-            args="adb devices",
-            shell=True, 
-            cwd=self.path,
-            stdout=subprocess.PIPE, 
-        ).stdout.decode("utf-8").splitlines()
+        devices = get_devices(self.path)
+        prefetch_device_facts(devices, self.path)
         
-        devices_list = [] 
-        list_devices.remove("")
-        for device in list_devices[1:]:
-            devices_list.append(device.split("\t")[0])
+        devices_list = [device["serial"] for device in devices]
 
         self.get_device_output.emit(devices_list)
 
@@ -99,18 +100,11 @@ class ConfigTAB_Thread(QThread):
         """
         device = self.func_args[0]    
         resolution = self.func_args[1]
-        arg_line = f"adb -s {device} shell wm size {resolution}" if resolution \
-        else f"adb -s {device} shell wm size reset" 
+        args = ["adb", "-s", device, "shell", "wm", "size", resolution or "reset"]
         
-        size_out = subprocess.run(
-            args=arg_line,
-            shell=True,
-            stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            cwd=self.path,
-        )       
-        err = size_out.stderr.decode("utf-8").lower().rstrip()
-        out = size_out.stdout.decode("utf-8").lower().rstrip()
+        size_out = self.runner.run(args)
+        err = size_out.stderr.lower().rstrip()
+        out = size_out.stdout.lower().rstrip()
         
         if err:
             self.charge_resolution_output.emit(err)
@@ -130,35 +124,25 @@ class ConfigTAB_Thread(QThread):
         - `reset_server_output` (`list`): A list containing any errors or warnings that occurred during the execution 
         of the `adb kill-server` and `adb start-server` commands.
         """
-        end = subprocess.run(
-            args="adb kill-server",
-            shell=True,
-            stderr=subprocess.PIPE,
-            cwd=self.path,
-        )
-        start = subprocess.run(
-            args="adb start-server",
-            shell=True,
-            stderr=subprocess.PIPE,
-            cwd=self.path,
-        )
+        end = self.runner.run(["adb", "kill-server"])
+        start = self.runner.run(["adb", "start-server"])
         
-        end_err = end.stderr.decode("latin1").rstrip().lower()
-        start_err = start.stderr.decode("latin1").rstrip().lower()
+        end_err = end.stderr.rstrip().lower()
+        start_err = start.stderr.rstrip().lower()
         
         self.reset_server_output.emit([start_err, end_err])
     
     def get_scrcpy_version_and_save(self):
         """
-        This function retrieves the version of scrcpy by executing the `scrcpy -v` command in a separate thread.
+        This function retrieves the version of scrcpy in a separate thread (see `Scrcpy_Version.get_scrcpy_version`).
 
-        It runs the scrcpy command to fetch its version, processes the output, and extracts the version number. The version 
-        is then stored in the provided data dictionary and updated in the configuration file. If there is an error retrieving 
-        the version, an alert is shown and the client window is closed if applicable.
+        The version is read from the cache of the binary, the `scrcpy -v` command is only executed if the binary is new 
+        or changed. The version is then stored in the provided data dictionary and updated in the configuration file 
+        (only if it changed), and the options of the binary are cached for the next start (see `Scrcpy_Capabilities`).
 
         Emits
         -----
-        - This function does not emit any signals but updates the configuration data.
+        - `scrcpy_version_error`: If the version could not be read (the alert is shown by the main thread).
 
         Parameters (self.func_args[n])
         ----------
@@ -166,45 +150,26 @@ class ConfigTAB_Thread(QThread):
         - data (`dict`) `[1]`: A dictionary where the selected scrcpy version information is stored.
         - client (`QDialog`) `[2]`: The client window.
         """
-        scrcpy_version = subprocess.run(
-            args="scrcpy -v",
-            shell=True,
-            cwd=self.path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        ).stdout.decode("utf-8").lower().rstrip().lstrip().split()
+        scrcpy_version = get_scrcpy_version(self.path, self.runner)
         
-        if not scrcpy_version and not running_on_windows:
-            create_alert(
-                "Error",
-                "Error getting scrcpy version.",
-            )
-            self.func_args[2].close() #client
+        if scrcpy_version is None:
+            if not running_on_windows:
+                self.scrcpy_version_error.emit()
         
         else:
-            find_version_point = False
-            version = ""
-            for char in scrcpy_version[1]:
-                if char == "." and find_version_point is False:
-                    find_version_point = True
-                    version += char
-                elif char != "." and isdigit(char):
-                    version += char
-            
-            scrcpy_version = float(version)        
-            
             scrcpy_info = {
                 "Path": self.path,
                 "Version": scrcpy_version,
             }
+            get_scrcpy_capabilities(self.path, self.runner)
             version_name = self.func_args[0]
             data = self.func_args[1]
-            data["Selected_Version"] = scrcpy_info
-            
-            update_data_file(
-                scrcpy_info,
-                ["Versions", "Selected_Version"],
-            )
+            if data["Selected_Version"] != scrcpy_info:
+                data["Selected_Version"] = scrcpy_info
+                update_data_file(
+                    scrcpy_info,
+                    ["Versions", "Selected_Version"],
+                )
             
             if running_on_windows:
                 data["Saved_Versions"][version_name] = scrcpy_info
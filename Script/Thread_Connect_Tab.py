@@ -1,22 +1,29 @@
-import subprocess
 from contextlib import suppress
 
 from platform import system
 
 from PyQt5.Qt import pyqtSlot
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
 
 from Script.Utilities.Create_Alerts import create_alert
+from Script.Utilities.Device_Registry import get_devices
+from Script.Utilities.Device_Probe import prefetch_device_facts
+from Script.Utilities.Task_Pool import PoolTask
+from Script.Utilities.Command_Runner import CommandRunner, PAIR_TIMEOUT
+from Script.Utilities.Bulk_Connect import connect_saved_endpoints
+from Script.Utilities.Batch_Pairing import pair_entries, write_report
+from Script.Utilities.Settings_Store import settings_store, SAVED_ENDPOINTS_KEYS
 from Script.Utilities.Utils import check_is_ip, toggle_button_state
 from Script.Utilities.Auxiliary_Funcs import connection_errors
  
-class ConnectTAB_Thread(QThread):
+class ConnectTAB_Thread(PoolTask):
     """
     This class runs the specified `Connect` commands in a separate thread to prevent blocking the main UI thread.
 
     The `ConnectTAB_Thread` class is designed to handle background operations related to device connectivity 
     (such as connecting or disconnecting devices) without affecting the responsiveness of the UI. The class 
-    uses PyQt's threading mechanisms and signals to communicate the results of the operations back to the main thread.
+    runs in the shared `task_pool` (see `Task_Pool`) and uses signals to communicate the results of the operations 
+    back to the main thread.
 
     Parameters
     ----------
@@ -30,21 +37,29 @@ class ConnectTAB_Thread(QThread):
     - `get_device_output` (`pyqtSignal(list)`): Emitted with the list of connected devices.
     - `disconnect_output` (`pyqtSignal(str)`): Emitted with the result of the disconnect command.
     - `wifi_connect_output` (`pyqtSignal(str)`): Emitted with the result of the Wi-Fi connection attempt.
+    - `connect_all_output` (`pyqtSignal(list)`): Emitted with the result of each saved endpoint.
+    - `pair_batch_output` (`pyqtSignal(list, str, str)`): Emitted with the result of each entry of a batch file, the
+    report path and the error of the report.
     """
     connect_output = pyqtSignal(list)
     get_device_output = pyqtSignal(list)
     disconnect_output = pyqtSignal(str)
     wifi_connect_output = pyqtSignal(str)
+    connect_all_output = pyqtSignal(list)
+    pair_batch_output = pyqtSignal(list, str, str)
     
     def __init__(self, command: str, path: str, *func_args: tuple):
         super().__init__()
         self.command = command.lower()
         self.path = "." if system() != "Windows" else path
         self.func_args = func_args
+        self.runner = CommandRunner(self.path)
     
     def run(self):
         methods_dict = {
             "connect_device": self.connect_device,
+            "connect_all_saved": self.connect_all_saved,
+            "pair_batch": self.pair_batch,
             "wifi_connect_device": self.wifi_connect_device,
             "get_connect_devices": self.get_connect_devices,
             "disconnect_device": self.disconnect_device,
@@ -71,30 +86,61 @@ class ConnectTAB_Thread(QThread):
         
         Parameters (self.func_args[n])
         ----------
-        - port (`str`) `[0]`: The port number to use for the connection.
-        - ip (`str`) `[1]`:  The IP address of the device to connect to.
+        - ip (`str`) `[0]`:  The IP address of the device to connect to.
+        - port (`str`) `[1]`: The port number to use for the connection.
         """
-        out_tcp = subprocess.run(
-            args=f"adb tcpip {self.func_args[1]}", #ip
-            shell=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            cwd=self.path
-        )
-        out_connect = subprocess.run(
-            args=f"adb connect {self.func_args[0]}", #port
-            shell=True,
-            stdout=subprocess.PIPE,
-            cwd=self.path,
-        )
+        out_tcp = self.runner.run(["adb", "tcpip", self.func_args[1]]) #port
+        out_connect = self.runner.run(["adb", "connect", self.func_args[0]]) #ip
         
-        out_tcpip = out_tcp.stdout.decode("utf-8").lower().rstrip()
-        err_tcpip = out_tcp.stderr.decode("utf-8").lower().rstrip()
-        out_connect = out_connect.stdout.decode("utf-8").lower().rstrip()
+        out_tcpip = out_tcp.stdout.lower().rstrip()
+        err_tcpip = out_tcp.stderr.lower().rstrip()
+        out_connect = (out_connect.stdout or out_connect.stderr).lower().rstrip()
         
         results = [err_tcpip, out_connect] if err_tcpip else [out_tcpip, out_connect]
         self.connect_output.emit(results)   
    
+    def connect_all_saved(self) -> None:
+        """
+        Connects all the saved endpoints at the same time (see `Bulk_Connect`).
+
+        `adb tcpip` is only sent to the devices whose port does not answer yet, and each endpoint has its own 
+        timeout, so the endpoints that are off do not delay the others.
+
+        Emits
+        ------
+        - connect_all_output (`list`): The `ConnectResult` of each endpoint, in the order they finished.
+        
+        Parameters (self.func_args[n])
+        ----------
+        - saved_endpoints (`dict`) `[0]`: The saved endpoints, `[ip, port]` by name.
+        """
+        results = list(connect_saved_endpoints(self.func_args[0], self.path, self.runner))
+        self.connect_all_output.emit(results)
+
+    def pair_batch(self) -> None:
+        """
+        Pairs and connects all the devices of a batch file at the same time (see `Batch_Pairing`).
+
+        The report is written next to the batch file once every entry is done.
+
+        Emits
+        ------
+        - pair_batch_output (`list`, `str`, `str`): The `PairingResult` of each entry, in the order they finished, the
+        path of the report (empty if it could not be written) and the reason it could not be written (or empty).
+        
+        Parameters (self.func_args[n])
+        ----------
+        - entries (`list`) `[0]`: The entries of the batch file (`PairingEntry`).
+        - report_path (`str`) `[1]`: The path of the report.
+        """
+        results = list(pair_entries(self.func_args[0], self.path, self.runner))
+        report_path, report_error = self.func_args[1], ""
+        try:
+            write_report(results, report_path)
+        except OSError as error:
+            report_path, report_error = "", str(error)
+        self.pair_batch_output.emit(results, report_path, report_error)
+
     def wifi_connect_device(self):
         """
         Connects to a device over Wi-Fi by pairing it using the `adb pair` command after enabling TCP/IP mode.
@@ -114,21 +160,14 @@ class ConnectTAB_Thread(QThread):
         - port (`str`) `[1]`: The port number to use for the connection.
         - code (`str`) `[2]`: The pairing code to use for the connection.
         """
-        subprocess.run(
-            args=f"adb tcpip 5555",
-            shell=True,
-            cwd=self.path,
-        )
-        device = subprocess.run(
-            args=f"adb pair {self.func_args[0]}:{self.func_args[1]} {self.func_args[2]}",
-            shell=True,
-            cwd=self.path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+        self.runner.run(["adb", "tcpip", "5555"])
+        device = self.runner.run(
+            ["adb", "pair", f"{self.func_args[0]}:{self.func_args[1]}", self.func_args[2]],
+            timeout=PAIR_TIMEOUT,
         )
         
-        out = device.stdout.decode("utf-8").lower().rstrip()
-        err = device.stderr.decode("utf-8").lower().rstrip()
+        out = device.stdout.lower().rstrip()
+        err = device.stderr.lower().rstrip()
         if err:
             self.wifi_connect_output.emit(err)
         else:
@@ -136,28 +175,21 @@ class ConnectTAB_Thread(QThread):
         
     def get_connect_devices(self) -> list:
         """
-        Retrieves a list of connected devices by running the `adb devices` command in a separate thread.
+        Retrieves a list of connected devices from the ADB server in a separate thread.
 
-        This function executes the `adb devices` command to get the list of devices currently connected via ADB. It processes
-        the output to extract the device identifiers and filters for devices with valid IP addresses. The resulting list of 
+        This function reads the devices from the live `device_registry` (or asks the ADB server when the registry is not 
+        being tracked) and filters for devices with valid IP addresses. The facts of the devices are cached 
+        (see `Device_Probe.prefetch_device_facts`) so the picker can label them, and the resulting list of 
         device identifiers is then emitted to the caller.
 
         Emits
         ------
         - get_devices_output (`list`): A list of connected device identifiers (IPs) obtained from the output of the `adb devices` command.
         """
-        list_devices = subprocess.run(
-            args="adb devices", 
-            shell=True, 
-            cwd=self.path,
-            stdout=subprocess.PIPE, 
-        ).stdout.decode("utf-8").splitlines()
-
-        devices_list = [] 
-        list_devices.remove("")
-        for device in list_devices[1:]:
-            if check_is_ip(device):
-                devices_list.append(device.split("\t")[0])
+        devices = [device for device in get_devices(self.path) if check_is_ip(device["serial"])]
+        prefetch_device_facts(devices, self.path)
+        
+        devices_list = [device["serial"] for device in devices]
         self.get_device_output.emit(devices_list)
     
     def disconnect_device(self) -> str:
@@ -176,18 +208,12 @@ class ConnectTAB_Thread(QThread):
         ----------
         - device (`str`) `[0]`: The device identifier (usually `adb` device ID).
         """
-        out = subprocess.run(
-            args=f"adb disconnect {self.func_args[0]}", #device
-            shell=True,
-            cwd=self.path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        out = self.runner.run(["adb", "disconnect", self.func_args[0]]) #device
         
-        if error:= out.stderr.decode("utf-8").lower().rstrip():
+        if error:= out.stderr.lower().rstrip():
             self.disconnect_output.emit(error)
         else:
-            output = out.stdout.decode("utf-8").lower().rstrip()
+            output = out.stdout.lower().rstrip()
             self.disconnect_output.emit(output)
     
     @pyqtSlot(list)
@@ -239,6 +265,63 @@ class ConnectTAB_Thread(QThread):
                 "Successfully connected",
             )            
 
+    @pyqtSlot(list)
+    def check_emits_connect_all(self, results: list) -> None:
+        """
+        Shows a single summary of the endpoints connected by `connect_all_saved`.
+        
+        Parameters
+        ----------
+        - results (`list`): The `ConnectResult` of each endpoint.
+        """
+        failed = [result for result in results if not result.ok]
+        lines = [f"{result.name}: {result.message}" for result in sorted(failed, key=lambda result: result.name)]
+        create_alert(
+            "Connect All Saved" if not failed else "Some Devices Failed",
+            (f"{len(results) - len(failed)}/{len(results)} saved devices are connected"
+            + (":\n" + "\n".join(lines) if lines else "")),
+        )
+
+    @pyqtSlot(list, str, str)
+    def check_emits_pair_batch(self, results: list, report_path: str, report_error: str) -> None:
+        """
+        Saves the connected devices of `pair_batch` and shows a single summary.
+
+        The connected endpoints that are not saved yet are added to the saved connections in a single write.
+        
+        Parameters
+        ----------
+        - results (`list`): The `PairingResult` of each entry.
+        - report_path (`str`): The path of the report, empty if it could not be written.
+        - report_error (`str`): The reason the report could not be written, empty if it was written.
+        - self.func_args[n]:
+            - combo_box (`QComboBox`) `[2]`: The combo box of the saved connections.
+        """
+        saved_endpoints = settings_store.get(SAVED_ENDPOINTS_KEYS, {})
+        new_endpoints = {
+            result.endpoint: [result.entry.ip, result.connect_port]
+            for result in sorted(results, key=lambda result: result.entry.line)
+            if result.endpoint and result.endpoint not in saved_endpoints
+        }
+        if new_endpoints:
+            # changed in place, the tab keeps a reference to the saved connections ↓
+            saved_endpoints.update(new_endpoints)
+            settings_store.set(saved_endpoints, SAVED_ENDPOINTS_KEYS)
+            with suppress(RuntimeError):
+                self.func_args[2].addItems(list(new_endpoints)) #combo_box
+        
+        failed = sorted((result for result in results if not result.endpoint), key=lambda result: result.entry.line)
+        lines = [f"{result.entry.ip}: {result.message}" for result in failed[:10]]
+        if len(failed) > len(lines):
+            lines.append(f"... and {len(failed) - len(lines)} more")
+        create_alert(
+            "Batch Pairing" if not failed else "Some Devices Failed",
+            (f"{len(results) - len(failed)}/{len(results)} devices are paired and connected, "
+            f"{len(new_endpoints)} new saved connections"
+            + (":\n" + "\n".join(lines) if lines else "")
+            + (f"\n\nReport: {report_path}" if report_path else f"\n\nThe report could not be written ({report_error})")),
+        )
+
     @pyqtSlot(str)
     def check_emits_wifi_debug(self, emit_output: str) -> None:
         """
@@ -0,0 +1,60 @@
+import socket
+from contextlib import suppress
+
+from PyQt5.QtCore import QThread
+
+from Script.Utilities.Adb_Client import AdbClient, AdbServerError
+from Script.Utilities.Device_Registry import device_registry
+
+class DeviceTracker_Thread(QThread):
+    """
+    This class keeps a `host:track-devices-l` stream open with the `ADB` server in a separate thread.
+
+    Every list of devices sent by the server is given to the `device_registry`, which keeps the devices
+    in memory and emits the `device_added`, `device_removed` and `device_state_changed` signals. If the
+    server is not running (or is restarted), the thread waits and tries again, doubling the wait up to
+    `max_retry_delay`.
+
+    Parameters
+    ----------
+    - client (`AdbClient`, optional): The client used to reach the `ADB` server. Defaults to a new `AdbClient`.
+    - max_retry_delay (`float`, optional): The maximum wait (in seconds) between two connection attempts. Defaults to `8.0`.
+    """
+    def __init__(self, client: AdbClient = None, max_retry_delay: float = 8.0):
+        super().__init__()
+        self.client = client or AdbClient()
+        self.max_retry_delay = max_retry_delay
+        self.conn = None
+
+    def run(self):
+        retry_delay = 0.5
+        while not self.isInterruptionRequested():
+            try:
+                with self.client.connect() as self.conn:
+                    for devices in self.client.track_devices(self.conn):
+                        device_registry.update(devices)
+                        retry_delay = 0.5
+            except (OSError, AdbServerError):
+                pass
+            finally:
+                self.conn = None
+                device_registry.stop_tracking()
+
+            # waits in small steps, so `stop` does not have to wait for the whole delay ↓
+            for _ in range(int(retry_delay / 0.1)):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+            retry_delay = min(retry_delay * 2, self.max_retry_delay)
+
+    def stop(self) -> None:
+        """
+        Stops the tracking and waits for the thread to finish.
+
+        The stream is shut down from here, which wakes up the blocked read in `run`.
+        """
+        self.requestInterruption()
+        if conn := self.conn:
+            with suppress(OSError):
+                conn.shutdown(socket.SHUT_RDWR)
+        self.wait()
@@ -1,19 +1,24 @@
-import subprocess
 from platform import system
 
 from PyQt5.Qt import pyqtSlot
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
  
 from Script.Utilities.Create_Alerts import create_alert
+from Script.Utilities.Device_Probe import probe_devices
+from Script.Utilities.Task_Pool import PoolTask
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Device_Registry import get_devices
+from Script.Utilities.Network_Sweep import sweep_network
 from Script.Utilities.Utils import toggle_button_state
 from Script.Utilities.Auxiliary_Funcs import connection_errors
  
-class FindDeviceW_Thread(QThread):
+class FindDeviceW_Thread(PoolTask):
     """
     This class is used to run the `FindDevice` commands in a separate thread.
 
     It allows executing commands related to device discovery and handling in the background, 
-    without blocking the main UI thread. The output of the command can be emitted via custom signals.
+    without blocking the main UI thread (in the shared `task_pool`, see `Task_Pool`). The output of the command 
+    can be emitted via custom signals.
 
     Parameters
     ----------
@@ -23,11 +28,13 @@ class FindDeviceW_Thread(QThread):
 
     Signals
     -------
+    - `device_info_output` (`pyqtSignal(list)`): Emitted with the infos of each device as soon as it is probed.
     - `get_device_output` (`pyqtSignal(dict)`): Emitted with a dictionary containing the output of the device discovery process.
     - `output_connect` (`pyqtSignal(list)`): Emitted with a list of outputs to be processed further.
     - `disconnect_output` (`pyqtSignal(str)`): Emitted with a message indicating the result of the disconnection attempt.
     """
     # signals
+    device_info_output = pyqtSignal(list)
     get_device_output = pyqtSignal(dict)
     output_connect = pyqtSignal(list)
     
@@ -36,10 +43,12 @@ class FindDeviceW_Thread(QThread):
         self.command = command
         self.path = "." if system() != "Windows" else path
         self.func_args = func_args
+        self.runner = CommandRunner(self.path)
             
     def run(self):
         methods_dict = {
             "get_devices_infos": self.get_devices_infos,
+            "sweep_network": self.sweep_network,
             "connect_device": self.connect_device,
         }
         
@@ -53,63 +62,60 @@ class FindDeviceW_Thread(QThread):
         """
         Runs commands to retrieve the list of connected devices and their information (IP address, model, and brand).
 
-        This function uses `adb` commands to gather information about each connected device. It retrieves the device 
-        serial numbers, their IP addresses, and the device brand and model. The information is then compiled into a dictionary 
-        and emitted via a signal.
+        This function talks to the ADB server (see `Adb_Client`) to gather information about each connected device. It retrieves 
+        the device serial numbers, their IP addresses, and the device brand and model. The devices are probed in parallel 
+        (see `Device_Probe.probe_devices`), each device is emitted as soon as it answers and the information is then compiled 
+        into a dictionary and emitted via a signal.
 
         Returns
         -------
         - `dict`: A dictionary where each key is a device index (device number), and the value is a list containing:
             - IP address (`str`): The IP address of the device.
             - Model and brand (`str`): The model and brand of the device in the format "Brand (Model)".
+            - Serial (`str`): The serial of the device (used to remove its board when it is unplugged).
 
         Emits
         ------
+        - `device_info_output` (`pyqtSignal(list)`): Emitted with the infos of each device as soon as it is probed.
         - `get_device_output` (`pyqtSignal(dict)`): Emitted with a dictionary containing device information.
         """
         #get device serials ↓
-        lists_serials = subprocess.run(
-            args="adb devices",
-            shell=True,
-            stdout=subprocess.PIPE,
-            cwd=self.path
-        ).stdout.decode("utf-8").splitlines()
-        
-        devices_serials = []
-        for serial in lists_serials[1:-1]:
-            devices_serials.append(serial.split("\t")[0])
+        devices_serials = [
+            device["serial"] for device in get_devices(self.path) if device["state"] == "device"
+        ]
         
         #get devices infos ↓
         devices_infos = {} 
-        for device_num, device in enumerate(devices_serials):
-            ip_out = subprocess.run(
-                args=f"adb -s {device} shell ip addr show wlan0", 
-                shell=True, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                cwd=self.path,
-            )
-            
-            brand = subprocess.run(
-                args=f"adb -s {device} shell getprop ro.product.brand",
-                shell=True, 
-                stdout=subprocess.PIPE, 
-                cwd=self.path,
-            ).stdout.decode("utf-8").title().rstrip()
-            
-            model = subprocess.run(
-                args=f"adb -s {device} shell getprop ro.product.model", 
-                shell=True, 
-                stdout=subprocess.PIPE, 
-                cwd=self.path,
-            ).stdout.decode("utf-8").title().rstrip()
-            
-            if not ip_out.stderr.decode("utf-8").lower().rstrip():
-                ip = ip_out.stdout.decode("utf-8").lower().rstrip()
-                ip = ip.split("inet ")[1].split("/")[0]
-                devices_infos[device_num] = [ip, f"{brand} ({model})"]
+        for device_num, device_infos in enumerate(probe_devices(devices_serials, self.path)):
+            devices_infos[device_num] = device_infos
+            self.device_info_output.emit(device_infos)
         
         self.get_device_output.emit(devices_infos)     
+    
+    def sweep_network(self) -> dict:
+        """
+        Sweeps a network for the devices that listen for `ADB` over TCP (see `Network_Sweep.sweep_network`).
+
+        Each endpoint is emitted as soon as it answers the `ADB` handshake, with the endpoint as IP and serial
+        (it is the serial of a Wi-Fi device), so its board connects it directly.
+
+        Emits
+        ------
+        - `device_info_output` (`pyqtSignal(list)`): Emitted with `[endpoint, name, endpoint]` for each device found.
+        - `get_device_output` (`pyqtSignal(dict)`): Emitted with all the devices found once the sweep is over.
+        
+        Parameters (self.func_args[n])
+        ----------
+        - network (`str`) `[3]`: The network to sweep (e.g. `192.168.1.0/24`).
+        - ports (`list`) `[4]`: The ports to try on each host.
+        """
+        devices_infos = {}
+        def add_hit(hit) -> None:
+            devices_infos[len(devices_infos)] = [hit.endpoint, hit.name, hit.endpoint]
+            self.device_info_output.emit(devices_infos[len(devices_infos) - 1])
+        
+        sweep_network(self.func_args[3], self.func_args[4], add_hit)
+        self.get_device_output.emit(devices_infos)
                 
     def connect_device(self) -> list:
         """
@@ -117,7 +123,7 @@ class FindDeviceW_Thread(QThread):
 
         This function initiates a connection to a device over TCP/IP by first using `adb tcpip <device_port>` to enable 
         TCP/IP mode, followed by `adb connect <device_ip>` to establish the connection. The results of these commands 
-        are then captured and emitted.
+        are then captured and emitted. A device found by the network sweep (`ip:port`) is only connected.
 
         Emits
         ------
@@ -130,49 +136,60 @@ class FindDeviceW_Thread(QThread):
             False,
         )
         
-        out_tcp = subprocess.run(
-            args=f"adb tcpip {self.func_args[0]}", #device_port
-            shell=True,  
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            cwd=self.path
-        )
-        out_connect = subprocess.run(
-            args=f"adb connect {self.func_args[1]}", #device_ip
-            shell=True,
-            stdout=subprocess.PIPE,
-            cwd=self.path
-        )
+        out_tcpip = err_tcpip = ""
+        if ":" not in self.func_args[1]: #a swept endpoint (`ip:port`) already listens, no `adb tcpip` ↓
+            out_tcp = self.runner.run(["adb", "tcpip", self.func_args[0]]) #device_port
+            out_tcpip = out_tcp.stdout.lower().rstrip()
+            err_tcpip = out_tcp.stderr.lower().rstrip()
+        out_connect = self.runner.run(["adb", "connect", self.func_args[1]]) #device_ip
         
-        out_tcpip = out_tcp.stdout.decode("utf-8").lower().rstrip()
-        err_tcpip = out_tcp.stderr.decode("utf-8").lower().rstrip()
-        out_connect = out_connect.stdout.decode("utf-8").lower().rstrip()
+        out_connect = (out_connect.stdout or out_connect.stderr).lower().rstrip()
         
         results = [err_tcpip, out_connect] if err_tcpip else [out_tcpip, out_connect]
         self.output_connect.emit(results)         
 
+    @pyqtSlot(list)
+    def add_device(self, device: list) -> None:
+        """
+        This function adds a single `device` to the `DeviceListUi`, if it is not listed yet.
+        
+        Parameters
+        ----------
+        - device (`list`): The `device infos` (`[ip, "Brand (Model)", serial]`) provided by `get_devices_infos` function.
+        """
+        device_ip = device[0]
+        device_name = device[1]
+        DeviceListUi = self.func_args[2]
+        if device_ip not in DeviceListUi.detected_devices:
+            DeviceListUi.add_board(device_name, device_ip, device[2])
+            DeviceListUi.detected_devices.append(device_ip)
+
     @pyqtSlot(dict)
     def add_devices(self, emits_devices: dict) -> None:
         """
         This function adds the `emits_devices` to the `DeviceListUi` using device infos.
+
+        The devices are usually already listed by `add_device` (as soon as each one is probed), 
+        so this function only adds the missing ones and shows the result.
         
         Parameters
         ----------
-        - emits_devices (`dict`): dictionary of `devices infos` provided by `get_devices_infos` function.
+        - emits_devices (`dict`): dictionary of `devices infos` provided by `get_devices_infos` (or `sweep_network`) function.
         """
         if emits_devices:
             for device in emits_devices.values():
-                device_ip = device[0]
-                device_name = device[1]
-                DeviceListUi = self.func_args[2]
-                if device_ip not in DeviceListUi.detected_devices:
-                    DeviceListUi.add_board(device_name, device_ip)
-                    DeviceListUi.detected_devices.append(device_ip)
+                self.add_device(device)
                 
             create_alert(
                 "Devices Detected",
                 "Compatible devices have been detected.",
             )
+        elif self.command == "sweep_network":
+            create_alert(
+                "Nothing Detected",
+                (f"No device answered on {self.func_args[3]}, make sure\n"
+                "the device is in TCP mode and on the same network"),
+            )
         else:
             create_alert(
                 "Nothing Detected",
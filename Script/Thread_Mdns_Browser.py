@@ -0,0 +1,95 @@
+import socket
+from contextlib import suppress
+from time import monotonic
+
+from PyQt5.QtCore import QThread
+
+from Script.Utilities.Mdns_Services import mdns_services, build_query, MDNS_GROUP, MDNS_PORT
+
+class MdnsBrowser_Thread(QThread):
+    """
+    This class listens for the wireless debugging services advertised over mDNS in a separate thread.
+
+    Every packet received on the mDNS group is given to the `mdns_services`, which keeps the pairing and connect
+    endpoints in memory and emits the `service_added` and `service_removed` signals. The services are also asked
+    for (a `PTR` query), again and again with a doubled interval up to `max_query_interval`, since a device does not
+    always announce itself. If the socket cannot be opened (e.g. no network), the thread waits and tries again.
+
+    Parameters
+    ----------
+    - interfaces (`tuple`, optional): The IPs of the interfaces to join the mDNS group on, besides the default one
+    (e.g. `("127.0.0.1",)` to inject packets on loopback). Defaults to `()`.
+    - group (`str`, optional): The mDNS group. Defaults to `MDNS_GROUP`.
+    - port (`int`, optional): The mDNS port. Defaults to `MDNS_PORT`.
+    - max_query_interval (`float`, optional): The maximum time (in seconds) between two queries. Defaults to `60.0`.
+    """
+    def __init__(
+        self,
+        interfaces: tuple = (),
+        group: str = MDNS_GROUP,
+        port: int = MDNS_PORT,
+        max_query_interval: float = 60.0,
+    ):
+        super().__init__()
+        self.interfaces = interfaces
+        self.group = group
+        self.port = port
+        self.max_query_interval = max_query_interval
+
+    def open_socket(self) -> socket.socket:
+        """Opens the UDP socket on the mDNS port (shared with the other responders, e.g. the `ADB` server)."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            with suppress(OSError):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(("", self.port))
+        for interface in ("0.0.0.0", *self.interfaces):
+            with suppress(OSError): # already joined on this interface ↓
+                sock.setsockopt(
+                    socket.IPPROTO_IP,
+                    socket.IP_ADD_MEMBERSHIP,
+                    socket.inet_aton(self.group) + socket.inet_aton(interface),
+                )
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 255)
+        sock.settimeout(0.5)
+        return sock
+
+    def run(self):
+        retry_delay = 0.5
+        while not self.isInterruptionRequested():
+            with suppress(OSError): # e.g. no network, tried again after the delay ↓
+                with self.open_socket() as sock:
+                    self.listen(sock)
+
+            # waits in small steps, so `stop` does not have to wait for the whole delay ↓
+            for _ in range(int(retry_delay / 0.1)):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(100)
+            retry_delay = min(retry_delay * 2, self.max_query_interval)
+
+    def listen(self, sock: socket.socket) -> None:
+        """Receives the packets until the thread is stopped, and sends the queries when they are due."""
+        query = build_query()
+        query_interval = 1.0
+        next_query = next_expire = monotonic()
+        while not self.isInterruptionRequested():
+            if (now := monotonic()) >= next_query:
+                with suppress(OSError): # e.g. no route to the group yet ↓
+                    sock.sendto(query, (self.group, self.port))
+                next_query = now + query_interval
+                query_interval = min(query_interval * 2, self.max_query_interval)
+            if now >= next_expire:
+                mdns_services.expire()
+                next_expire = now + 1.0
+            with suppress(socket.timeout):
+                packet, _ = sock.recvfrom(9000)
+                mdns_services.update(packet)
+
+    def stop(self) -> None:
+        """
+        Stops the browser and waits for the thread to finish (the socket wakes up every `0.5` seconds).
+        """
+        self.requestInterruption()
+        self.wait()
@@ -1,23 +1,27 @@
 import subprocess
+from os import listdir
+from contextlib import suppress
+from shlex import quote
 from platform import system
 
 from PyQt5.Qt import pyqtSlot
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import pyqtSignal
 
 from Script.Utilities.Create_Alerts import create_alert 
-from Script.Utilities.Utils import toggle_button_state, get_file_name
-from Script.Utilities.Auxiliary_Funcs import (
-    device_errors,
-    args_combination_errors,
-    arguments_errors,
-    move_record_file
-)
-class StartTAB_Thread(QThread):
+from Script.Utilities.Device_Registry import get_devices
+from Script.Utilities.Device_Probe import prefetch_device_facts
+from Script.Utilities.Task_Pool import PoolTask
+from Script.Utilities.Command_Runner import CommandRunner, join_arg_line, split_arg_line
+from Script.Utilities.Scrcpy_Capabilities import get_scrcpy_capabilities
+from Script.Utilities.Encoder_Benchmark import run_benchmark
+from Script.Utilities.Utils import toggle_button_state
+class StartTAB_Thread(PoolTask):
     """
     This class is used to run the `start` commands in a separate thread.
 
     It allows executing commands related to starting processes or handling tasks in the background, 
-    without blocking the main UI thread. The results of the operations can be emitted via custom signals.
+    without blocking the main UI thread (in the shared `task_pool`, see `Task_Pool`). The results of the operations 
+    can be emitted via custom signals. The `scrcpy` sessions themselves are started by `Scrcpy_Sessions`.
 
     Parameters
     ----------
@@ -27,24 +31,28 @@ class StartTAB_Thread(QThread):
 
     Signals
     -------
-    - `start_scrcpy_output` (`pyqtSignal(str)`): Emitted with a string containing the output of the `start` process.
     - `get_devices_output` (`pyqtSignal(list)`): Emitted with a list of detected devices or related outputs.
+    - `benchmark_output` (`pyqtSignal(list)`): Emitted with the trials of the encoder benchmark.
     """
     # signals
-    start_scrcpy_output = pyqtSignal(str)
     get_devices_output = pyqtSignal(list)
+    benchmark_output = pyqtSignal(list)
     
     def __init__(self, command: str, path: str, *func_args: tuple):
         super().__init__()
         self.command = command.lower()
         self.path = "." if system() != "Windows" else path
         self.func_args = list(func_args)
+        self.runner = CommandRunner(self.path)
+        self.unsupported_args = []
+        self.invalid_args = []
 
     def run(self):
         methods_dict = {
-            "start_scrcpy": self.start_scrcpy,
             "get_connect_devices": self.get_connect_devices,
+            "prepare_scrcpy_start": self.prepare_scrcpy_start,
             "open_shell": self.open_shell,
+            "benchmark_encoders": self.benchmark_encoders,
         }
         
         try:
@@ -53,62 +61,41 @@ class StartTAB_Thread(QThread):
         except KeyError:
             raise ValueError(f"the command '{self.command}' is not valid.")
         
-    def start_scrcpy(self) -> str:
+    def get_connect_devices(self) -> list:
         """
-        Runs the `scrcpy` command in a separate thread.
+        Retrieves the list of connected devices from the ADB server.
 
-        This function executes the scrcpy command line with the provided arguments in the background. 
-        It uses a subprocess to handle the execution and captures any error messages that occur during the process.
+        This function reads the connected devices from the live `device_registry` (or asks the ADB server when the 
+        registry is not being tracked), caches their facts for the picker labels (see `Device_Probe.prefetch_device_facts`) 
+        and emits the resulting list of device identifiers.
 
         Emits
         -----
-        - `start_scrcpy_output` (`str`): An error message emitted if the scrcpy process encounters an issue.
+        - `get_devices_output` (`list`): A list containing the identifiers of connected devices.
         """
-        arg_line = self.func_args[1]
-        arg_line, file_name = get_file_name(self.func_args[1], self.path)
+        devices = get_devices(self.path)
+        prefetch_device_facts(devices, self.path)
         
-        scrcpy_err = subprocess.run(
-            args=arg_line, #arg_line
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self.path,
-        ).stderr.decode("utf-8").rstrip().lower()
-        if file_name:
-            self.func_args[2] = file_name
-    
-        toggle_button_state(
-            self.func_args[4], #button
-            True,
-            charge_text=False,
-        )
+        devices_list = [device["serial"] for device in devices]
+        self.get_devices_output.emit(devices_list)
 
-        self.start_scrcpy_output.emit(str(scrcpy_err))
-    
-    def get_connect_devices(self) -> list:
+    def prepare_scrcpy_start(self) -> None:
         """
-        Retrieves the list of connected devices using the `adb devices` command.
+        Checks the arguments of `scrcpy` against the options of the selected binary, then retrieves the devices.
 
-        This function executes the `adb devices` command in a separate thread to fetch a list of connected devices.
-        It processes the command output to extract the device identifiers and emits the resulting list.
+        The options the binary does not support are removed from the argument line, and the values it does not 
+        accept are kept in `invalid_args`, so `start_scrcpy_ui` can report them before any session is started 
+        (see `Scrcpy_Capabilities`). The options of a binary are read from `scrcpy --help` only once.
 
-        Emits
-        -----
-        - `get_devices_output` (`list`): A list containing the identifiers of connected devices.
+        Parameters (self.func_args[n])
+        ----------
+        - arg_line (`str`) `[1]`: The arguments of `scrcpy`, replaced by the checked arguments.
         """
-        list_devices = subprocess.run(
-            args="adb devices", 
-            shell=True, 
-            cwd=self.path,
-            stdout=subprocess.PIPE, 
-        ).stdout.decode("utf-8").splitlines()
-        
-        devices_list = [] 
-        list_devices.remove("")
-        for device in list_devices[1:]:
-            devices_list.append(device.split("\t")[0])
-        
-        self.get_devices_output.emit(devices_list)
+        if capabilities := get_scrcpy_capabilities(self.path, self.runner):
+            args, self.unsupported_args, self.invalid_args = capabilities.check_args(split_arg_line(self.func_args[1]))
+            if self.unsupported_args:
+                self.func_args[1] = join_arg_line(args)
+        self.get_connect_devices()
     
     def open_shell(self) -> None:
         """
@@ -119,32 +106,44 @@ class StartTAB_Thread(QThread):
 
         Behavior
         --------
-        - On Windows: Executes the command in `cmd.exe` using `start cmd.exe /k`.
-        - On Linux: Detects the terminal emulator and runs the command in it.
-        """
-        if system() == "Windows":
-            cmd = f"start cmd.exe /k adb -s {self.func_args[0]} shell"
-        else: #Linux
-            terminal = subprocess.run(
-                args=f"ls /usr/bin | grep terminal",
-                shell=True,
-                stdout=subprocess.PIPE,
-                cwd=self.path,
-            ).stdout.decode("utf-8").rstrip()
-            terminal = terminal.split()[0]
-            cmd = f"{terminal} -- bash -c 'adb -s {self.func_args[0]} shell; exec bash'"
-            
-        subprocess.run(
-            args=cmd,
-            shell=True,
-            stderr=subprocess.PIPE,
-            cwd=self.path,
-        )
+        - On Windows: Executes the command in a new `cmd.exe /k` console.
+        - On Linux: Detects the terminal emulator (in `/usr/bin`) and runs the command in it.
+        - The terminal is started without waiting for it, only the button is restored.
+        """
+        adb = self.runner.resolve(["adb"])[0]
+        with suppress(OSError): # e.g. the terminal could not be started, only the button is restored ↓
+            if system() == "Windows":
+                self.runner.start(
+                    ["cmd.exe", "/k", adb, "-s", self.func_args[0], "shell"],
+                    creationflags=subprocess.CREATE_NEW_CONSOLE,
+                )
+            elif terminals := sorted(name for name in listdir("/usr/bin") if "terminal" in name): #Linux
+                self.runner.start(
+                    [terminals[0], "--", "bash", "-c", f"{quote(adb)} -s {quote(self.func_args[0])} shell; exec bash"],
+                    stderr=subprocess.DEVNULL,
+                )
         toggle_button_state(
             self.func_args[1], #button
             True,
         )
     
+    def benchmark_encoders(self) -> None:
+        """
+        Measures the frame rate of every video encoder of a device (see `Encoder_Benchmark`).
+
+        The trials are run one after the other, each one is a short `scrcpy` run without window, and the 
+        results are saved by fingerprint of the device.
+
+        Parameters (self.func_args[n])
+        ----------
+        - serial (`str`) `[0]`: The serial of the device.
+
+        Emits
+        -----
+        - `benchmark_output` (`list`): The `BenchmarkTrial` of each encoder and size.
+        """
+        self.benchmark_output.emit(run_benchmark(self.func_args[0], self.path, self.runner))
+
     @pyqtSlot(list)
     def start_shell_ui(self, device_list: list) -> None:
         """
@@ -167,13 +166,65 @@ class StartTAB_Thread(QThread):
                 "No device found, make sure it is connected via Wi-Fi or USB"
             )
     
+    @pyqtSlot(list)
+    def start_benchmark_ui(self, device_list: list) -> None:
+        """
+        Displays a UI for selecting a device to benchmark its encoders.
+
+        Parameters
+        ----------
+        - device_list (`list`): A list of connected devices available for selection.
+        """
+        DeviceSelectionUI = self.func_args[0]
+        if device_list:
+            DeviceSelectionUI(device_list, self.path, "Benchmark Encoders")
+        else:
+            create_alert(
+                "Nothing Found",
+                "No device found, make sure it is connected via Wi-Fi or USB"
+            )
+
+    @pyqtSlot(list)
+    def check_emit_benchmark(self, trials: list) -> None:
+        """
+        Shows the frame rate of each encoder measured by `benchmark_encoders`, the fastest first.
+
+        Parameters
+        ----------
+        - trials (`list`): The `BenchmarkTrial` of each encoder and size.
+        - self.func_args[n]:
+            - button (`QPushButton`) `[1]`: The select button of the device, enabled again.
+        """
+        toggle_button_state(
+            self.func_args[1], #button
+            True,
+            charge_text=False,
+        )
+        if not any(trial.samples for trial in trials):
+            create_alert(
+                "Nothing Measured",
+                ("No encoder could be measured, make sure the device is unlocked and the scrcpy "
+                f"version supports '--print-fps'\n{trials[0].error if trials else 'no encoder listed'}"),
+            )
+            return
+        lines = [
+            f"{trial.codec} {trial.encoder} (-m {trial.max_size}): {trial.fps:.1f} fps"
+            for trial in sorted(trials, key=lambda trial: trial.fps, reverse=True) if trial.samples
+        ]
+        create_alert(
+            "Benchmark Finished",
+            ("The encoders were measured, 'Auto (fastest measured)' now uses the fastest one:\n"
+            + "\n".join(lines)),
+        )
+
     @pyqtSlot(list)
     def start_scrcpy_ui(self, device_list: list) -> None:
         """
         Displays a UI for selecting a device to start `scrcpy`.
 
         This function initializes the device selection user interface, allowing the user to choose a device 
-        from the provided list for starting a `scrcpy` session.
+        from the provided list for starting a `scrcpy` session. The arguments rejected by `prepare_scrcpy_start` 
+        are reported first, a value that is not accepted cancels the start.
 
         Parameters
         ----------
@@ -181,7 +232,19 @@ class StartTAB_Thread(QThread):
         """
         client = self.func_args[4]
         DeviceSelectionUI = self.func_args[5]
-        if device_list:
+        if self.invalid_args:
+            create_alert(
+                "Invalid Value",
+                ("The selected scrcpy version does not accept these values:\n"
+                f"{', '.join(self.invalid_args)}"),
+            )
+        elif device_list:
+            if self.unsupported_args:
+                create_alert(
+                    "Unsupported Options",
+                    ("The selected scrcpy version does not support these options, they were removed:\n"
+                    f"{', '.join(self.unsupported_args)}"),
+                )
             DeviceSelectionUI(
                 device_list,
                 self.path,
@@ -198,29 +261,3 @@ class StartTAB_Thread(QThread):
             )
         if client:
             client.show()
-
-    @pyqtSlot(str)
-    def check_output_start_scrcpy(self, err_out: str) -> None:
-        """
-        This function checks for `errors` in the `err_out`
-        using the `args_errors`, `device_errors` and `args_combination_errors` functions.
-        
-        Parameters
-        ----------
-        - err_out (`str`): str of error provided by `start_scrcpy` function.
-        """
-        arg_error = arguments_errors(err_out)
-        device_error = device_errors(err_out)      
-        args_combo_error = args_combination_errors(err_out)  
-
-        detect_error_list = [args_combo_error, device_error, arg_error]
-        if (record_file := self.func_args[2]) and not any(detect_error_list):
-            move_record_file(
-                record_file,
-                self.path,
-                self.func_args[0], #target_file_path
-                self.func_args[3], #custom_dir_enabled
-            )
-        
-            
-        
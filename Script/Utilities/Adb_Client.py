@@ -0,0 +1,290 @@
+"""
+This module contains a small client for the `ADB` host protocol (smart socket protocol).
+
+Instead of spawning `adb devices` (and a shell before it) every time a list of devices is needed,
+the client talks directly to the local `ADB` server (port `5037` by default). Every request is sent
+as a 4 hex digits length prefix followed by the request itself, and the server answers with `OKAY`
+or `FAIL` (followed by a length prefixed message).
+
+Supported requests:
+
+- `host:version`: Returns the internal version of the running `ADB` server.
+- `host:devices-l`: Returns the list of devices and their details (model, transport id...).
+- `host:track-devices-l`: Keeps the connection open and sends the list of devices on every change.
+- `host:transport:<serial>` + `shell:<command>`: Runs a short shell command on a device.
+
+When the server cannot be reached, `list_devices` and `adb_shell` fall back to the `adb` executable,
+which also starts the server for the next calls.
+"""
+import socket
+from os import environ
+
+from Script.Utilities.Command_Runner import run_command
+
+ADB_SERVER_HOST = "127.0.0.1"
+ADB_SERVER_PORT = int(environ.get("ANDROID_ADB_SERVER_PORT", 5037))
+
+class AdbServerError(Exception):
+    """Raised when the `ADB` server answers a request with `FAIL`."""
+
+class AdbClient():
+    """
+    This class is a client for the `ADB` host protocol.
+
+    Each request opens a new connection to the server, the server closes the connection
+    after answering host requests, so no connection is kept between calls.
+
+    Parameters
+    ----------
+    - host (`str`, optional): The address of the `ADB` server. Defaults to `ADB_SERVER_HOST`.
+    - port (`int`, optional): The port of the `ADB` server. Defaults to `ADB_SERVER_PORT`.
+    - timeout (`float`, optional): The timeout (in seconds) for connecting and reading. Defaults to `2.0`.
+    """
+    def __init__(self, host: str = ADB_SERVER_HOST, port: int = ADB_SERVER_PORT, timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def connect(self) -> socket.socket:
+        """
+        Opens a new connection to the `ADB` server.
+
+        Returns
+        -------
+        - `socket.socket`: The connected socket.
+
+        Raises
+        ------
+        - `OSError`: If the server cannot be reached (e.g. `ConnectionRefusedError` if it is not running).
+        """
+        return socket.create_connection((self.host, self.port), self.timeout)
+
+    def send_request(self, conn: socket.socket, request: str) -> None:
+        """
+        Sends a request to the server and checks the `OKAY`/`FAIL` status.
+
+        Parameters
+        ----------
+        - conn (`socket.socket`): The connection to the server.
+        - request (`str`): The request to send (e.g. `host:version`).
+
+        Raises
+        ------
+        - `AdbServerError`: If the server answers with `FAIL`, the message sent by the server is used as the error.
+        """
+        request = request.encode("utf-8")
+        conn.sendall(b"%04x%s" % (len(request), request))
+
+        status = self.read_exactly(conn, 4)
+        if status == b"FAIL":
+            raise AdbServerError(self.read_length_prefixed(conn).decode("utf-8", "replace"))
+        elif status != b"OKAY":
+            raise AdbServerError(f"unexpected status from the adb server: {status!r}")
+
+    def read_exactly(self, conn: socket.socket, size: int) -> bytes:
+        """
+        Reads exactly `size` bytes from the connection.
+
+        Raises
+        ------
+        - `AdbServerError`: If the connection is closed before all bytes are received.
+        """
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise AdbServerError("the adb server closed the connection")
+            data += chunk
+        return data
+
+    def read_length_prefixed(self, conn: socket.socket) -> bytes:
+        """Reads a payload prefixed by its length (4 hex digits)."""
+        length = int(self.read_exactly(conn, 4), 16)
+        return self.read_exactly(conn, length)
+
+    def read_until_close(self, conn: socket.socket) -> bytes:
+        """Reads everything sent by the server until it closes the connection."""
+        chunks = []
+        while chunk := conn.recv(65536):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def host_query(self, request: str) -> bytes:
+        """
+        Sends a `host:` request and returns its length prefixed answer.
+
+        Parameters
+        ----------
+        - request (`str`): The host request (e.g. `host:devices-l`).
+
+        Returns
+        -------
+        - `bytes`: The payload returned by the server.
+        """
+        with self.connect() as conn:
+            self.send_request(conn, request)
+            return self.read_length_prefixed(conn)
+
+    def version(self) -> int:
+        """
+        Returns the internal version of the `ADB` server (`host:version`).
+        """
+        return int(self.host_query("host:version"), 16)
+
+    def devices(self) -> list:
+        """
+        Returns the devices known by the `ADB` server (`host:devices-l`).
+
+        Returns
+        -------
+        - `list`: A list of dictionaries, see `parse_devices_l` for the keys.
+        """
+        return parse_devices_l(self.host_query("host:devices-l").decode("utf-8", "replace"))
+
+    def track_devices(self, conn: socket.socket):
+        """
+        Starts a `host:track-devices-l` stream and yields the list of devices every time it changes.
+
+        The server sends the full list of devices right after the request is accepted and then once
+        more every time a device is added, removed or changes its state. The stream only ends when
+        the connection is closed (by the server or by shutting down `conn` from another thread).
+
+        Parameters
+        ----------
+        - conn (`socket.socket`): A connection opened with `connect`, owned by the caller.
+
+        Yields
+        ------
+        - `list`: A list of dictionaries, see `parse_devices_l` for the keys.
+
+        Raises
+        ------
+        - `OSError`: If the server cannot be reached or the connection is lost.
+        - `AdbServerError`: If the server refuses the request or closes the stream.
+        """
+        self.send_request(conn, "host:track-devices-l")
+        conn.settimeout(None)
+        while True:
+            yield parse_devices_l(self.read_length_prefixed(conn).decode("utf-8", "replace"))
+
+    def shell(self, serial: str, command: str) -> str:
+        """
+        Runs a shell command on a device (`host:transport:<serial>` followed by `shell:<command>`).
+
+        Parameters
+        ----------
+        - serial (`str`): The serial of the target device.
+        - command (`str`): The shell command to run on the device.
+
+        Returns
+        -------
+        - `str`: The output of the command (`stdout` and `stderr` are merged by the shell service).
+
+        Raises
+        ------
+        - `AdbServerError`: If the device is not found or the shell service is refused.
+        """
+        with self.connect() as conn:
+            self.send_request(conn, f"host:transport:{serial}")
+            self.send_request(conn, f"shell:{command}")
+            return self.read_until_close(conn).decode("utf-8", "replace")
+
+def parse_devices_l(output: str) -> list:
+    """
+    Parses the output of `host:devices-l` (or `adb devices -l`) into a list of devices.
+
+    Parameters
+    ----------
+    - output (`str`): The text returned by the server or printed by `adb devices -l`.
+    The `List of devices attached` header and empty lines are ignored.
+
+    Returns
+    -------
+    - `list`: A list of dictionaries with the keys:
+      - `serial` (`str`): The serial of the device (e.g. `192.168.0.10:5555`).
+      - `state` (`str`): The state of the device (`device`, `offline`, `unauthorized`...).
+      - `model` (`str`): The model of the device (empty if unknown).
+      - `transport_id` (`str`): The transport id of the device (empty if unknown).
+    """
+    devices = []
+    for line in output.splitlines():
+        if not line.strip() or line.startswith(("List of devices", "*")):
+            continue
+
+        serial, _, details = line.replace("\t", " ").partition(" ")
+        details = details.split()
+        infos = dict(detail.split(":", 1) for detail in details if ":" in detail)
+        state = " ".join(detail for detail in details if ":" not in detail)
+        devices.append({
+            "serial": serial,
+            "state": state,
+            "model": infos.get("model", ""),
+            "transport_id": infos.get("transport_id", ""),
+        })
+    return devices
+
+def list_devices(path: str = ".", client: AdbClient = None) -> list:
+    """
+    Returns the devices known by `ADB`, using the `ADB` server directly when possible.
+
+    Parameters
+    ----------
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder, used by the fallback. Defaults to `"."`.
+    - client (`AdbClient`, optional): The client used to reach the server. Defaults to a new `AdbClient`.
+
+    Returns
+    -------
+    - `list`: A list of dictionaries, see `parse_devices_l` for the keys.
+
+    Notes
+    -----
+    - If the server is not reachable, `adb devices -l` is executed instead (which also starts the server).
+    """
+    client = client or AdbClient()
+    try:
+        return client.devices()
+    except (OSError, AdbServerError):
+        return parse_devices_l(run_command(["adb", "devices", "-l"], path).stdout)
+
+def adb_shell(
+    serial: str,
+    command: str,
+    path: str = ".",
+    client: AdbClient = None,
+    timeout: float = 2.0,
+) -> tuple:
+    """
+    Runs a short shell command on a device, using the `ADB` server directly when possible.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the target device.
+    - command (`str`): The shell command to run on the device.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder, used by the fallback. Defaults to `"."`.
+    - client (`AdbClient`, optional): The client used to reach the server. Defaults to a new `AdbClient`.
+    - timeout (`float`, optional): The timeout (in seconds) of the command, used for the new `AdbClient` 
+    and for the fallback. Defaults to `2.0`.
+
+    Returns
+    -------
+    - `tuple`: A tuple `(output, error)`, where `error` is the error message (empty if the command was executed).
+
+    Notes
+    -----
+    - The shell service of the server merges `stdout` and `stderr`, so errors printed by the command
+    itself are part of `output`.
+    - If the server is not reachable, `adb -s <serial> shell <command>` is executed instead (see `Command_Runner`),
+    the command is given as a single argument, so `;` and pipes run on the device.
+    """
+    client = client or AdbClient(timeout=timeout)
+    try:
+        return client.shell(serial, command), ""
+    except AdbServerError as error:
+        return "", str(error)
+    except socket.timeout:
+        return "", f"timed out waiting for '{serial}'"
+    except OSError:
+        out = run_command(["adb", "-s", serial, "shell", command], path, timeout)
+        if out.timed_out:
+            return "", f"timed out waiting for '{serial}'"
+        return out.stdout, out.stderr
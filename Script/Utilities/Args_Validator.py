@@ -0,0 +1,167 @@
+"""
+This module contains the validator of the arguments of `scrcpy`, used before `scrcpy` is started.
+
+The combinations that `scrcpy` refuses (e.g. `--prefer-text` with `--raw-key-events`, or `--no-control` in
+OTG mode) are declared in `Static_Datas.ARGS_RULES` and compiled once. An argument line is parsed into the
+value of each option (the defaults of `scrcpy` are used for the options that are not given) and checked
+against every rule in a few microseconds, so an invalid command is rejected before any process is started,
+instead of after `scrcpy` connected to the device and pushed its server.
+
+A rejected command gives the same `ErrorMatch` as the error printed by `scrcpy` (see `Error_Classifier`),
+so the same alert is shown (see `Auxiliary_Funcs.alert_error`).
+"""
+from Script.Utilities.Static_Datas import ARGS_RULES, ERROR_CATALOGUE
+from Script.Utilities.Error_Classifier import ErrorMatch
+
+# short option: (long option, value), `None` when the value depends on the OTG mode (uhid, or aoa with --otg) ↓
+SHORT_OPTIONS = {
+    "-b": ("--video-bit-rate", ""),
+    "-m": ("--max-size", ""),
+    "-f": ("--fullscreen", ""),
+    "-n": ("--no-control", ""),
+    "-N": ("--no-playback", ""),
+    "-r": ("--record", ""),
+    "-s": ("--serial", ""),
+    "-S": ("--turn-screen-off", ""),
+    "-t": ("--show-touches", ""),
+    "-w": ("--stay-awake", ""),
+    "-K": ("--keyboard", None),
+    "-M": ("--mouse", None),
+    "-G": ("--gamepad", None),
+}
+# old options, kept with their own name and given the value of the new option ↓
+OLD_OPTIONS = {
+    "--hid-keyboard": ("--keyboard", "aoa"),
+    "--hid-mouse": ("--mouse", "aoa"),
+}
+# short options followed by a value, attached (e.g. "-b8M") or in the next word ↓
+SHORT_VALUE_OPTIONS = ("-b", "-m", "-r", "-s")
+NO_PLAYBACK_OPTIONS = ("--no-playback", "--no-video-playback", "--no-video")
+
+def parse_scrcpy_args(args: list) -> dict:
+    """
+    Returns the options of a `scrcpy` command with their values (`""` for an option without value).
+
+    The defaults of `scrcpy` are added for the input modes and the sources (e.g. `--keyboard` is `aoa`
+    in OTG mode, `sdk` otherwise), so a rule can check a value that was not given.
+
+    Parameters
+    ----------
+    - args (`list`): The arguments, without the executable (e.g. `["--otg", "-K"]`).
+    """
+    options = {}
+    auto_options = []
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        index += 1
+        if not arg.startswith("-") or arg == "-":
+            continue
+
+        name, has_value, value = arg.partition("=")
+        if not name.startswith("--") and len(name) > 2: # e.g. "-Sw", "-b8M" or "-Sm1024"
+            for position, char in enumerate(arg[1:], 1):
+                short_name = f"-{char}"
+                option, implied_value = SHORT_OPTIONS.get(short_name, (short_name, ""))
+                if short_name in SHORT_VALUE_OPTIONS:
+                    # the rest of the word is the value, or the next word if it is the last letter ↓
+                    value = arg[position + 1:].removeprefix("=")
+                    if not value and index < len(args) and not args[index].startswith("-"):
+                        value = args[index]
+                        index += 1
+                    options[option] = value
+                    break
+                if implied_value is None:
+                    auto_options.append(option)
+                else:
+                    options[option] = implied_value
+            continue
+
+        option, implied_value = SHORT_OPTIONS.get(name, OLD_OPTIONS.get(name, (name, "")))
+        # scrcpy has no positional arguments, so a word after an option is its value ↓
+        if not has_value and index < len(args) and not args[index].startswith("-"):
+            value = args[index]
+            index += 1
+        if name in OLD_OPTIONS:
+            options[name] = value
+        if implied_value is None:
+            auto_options.append(option)
+        else:
+            options[option] = implied_value or value
+
+    otg = "--otg" in options
+    for option in auto_options:
+        options[option] = "aoa" if otg else "uhid"
+    options.setdefault("--keyboard", "aoa" if otg else "sdk")
+    no_playback = any(option in options for option in NO_PLAYBACK_OPTIONS)
+    options.setdefault("--mouse", "aoa" if otg else "disabled" if no_playback else "sdk")
+    options.setdefault("--video-source", "display")
+    options.setdefault("--audio-source", "output")
+    return options
+
+def compile_condition(condition):
+    """
+    Returns a function `(options) -> bool` checking a condition of `ARGS_RULES`.
+    """
+    if isinstance(condition, tuple):
+        checks = [compile_condition(part) for part in condition]
+        return lambda options: any(check(options) for check in checks)
+    if condition.startswith("!"):
+        check = compile_condition(condition[1:])
+        return lambda options: not check(options)
+
+    option, has_value, value = condition.partition("=")
+    if has_value:
+        return lambda options: (options.get(option) or "").lower() == value
+    return lambda options: option in options
+
+class ArgsValidator():
+    """
+    This class checks the arguments of `scrcpy` against the rules of `ARGS_RULES`.
+
+    Parameters
+    ----------
+    - rules (`list`, optional): A list of tuples `(code, conditions)`. Defaults to `ARGS_RULES`.
+    - catalogue (`list`, optional): The catalogue of the errors, which gives the group, the severity and the
+    priority of each code. Defaults to `ERROR_CATALOGUE`.
+    """
+    def __init__(self, rules: list = ARGS_RULES, catalogue: list = ERROR_CATALOGUE):
+        entries = {}
+        for priority, (group, code, severity, _patterns) in enumerate(catalogue):
+            entries.setdefault(code, (group, severity, priority))
+
+        self.rules = []
+        for code, conditions in rules:
+            group, severity, priority = entries[code]
+            checks = [compile_condition(condition) for condition in conditions]
+            self.rules.append((priority, group, code, severity, checks))
+        self.rules.sort(key=lambda rule: rule[0])
+
+    def validate(self, args: list) -> list:
+        """
+        Returns the errors of the arguments of a `scrcpy` command.
+
+        Parameters
+        ----------
+        - args (`list`): The arguments, without the executable.
+
+        Returns
+        -------
+        - `list`: A list of `ErrorMatch` (their `text` is `"preflight"`), sorted by priority.
+        """
+        options = parse_scrcpy_args(args)
+        return [
+            ErrorMatch(group, code, severity, "preflight", priority)
+            for priority, group, code, severity, checks in self.rules
+            if all(check(options) for check in checks)
+        ]
+
+    def first_error(self, args: list) -> ErrorMatch:
+        """
+        Returns the most important error of the arguments (see `validate`), or `None`.
+        """
+        if errors := self.validate(args):
+            return errors[0]
+        return None
+
+args_validator = ArgsValidator()
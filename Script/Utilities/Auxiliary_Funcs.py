@@ -3,206 +3,13 @@ from shutil import move
 from os import rename, listdir
 from os.path import join
 
-from PyQt5.QtWidgets import QComboBox, QGridLayout
+from PyQt5.QtWidgets import QGridLayout
 
 from Script.Utilities.Utils import add_widget_set
 from Script.Utilities.Create_Alerts import create_alert
-from Script.Utilities.Static_Datas import (ERRORS_LIST, EXTRA_ARGS_LIST, 
-                                           ARGS_LIST, LAYOUT_POSITIONS)
+from Script.Utilities.Error_Classifier import ErrorMatch, error_classifier
+from Script.Utilities.Static_Datas import LAYOUT_POSITIONS
 
-#get elements for start semi-auto mode
-def get_sliders_start(sliders: list, active_checks: list, scrcpy_version: float) -> str:
-    """
-    Generates the argument line for configuring `sliders` based on their values and associated conditions.
-
-    This function builds a command-line argument string (`arg_line`) for the `sliders`, which can be 
-    used in the context of configuring settings for a `scrcpy` application. The function takes the 
-    values of the sliders and optionally includes different settings based on the version of `scrcpy` 
-    and the active checks.
-
-    Parameters
-    ----------
-    - sliders (`List[QSlider]`): A list of `QSlider` objects representing various configuration options.
-    - active_checks (`List[str]`): A list of active checks, which are conditions that influence the 
-      command-line arguments (e.g., "video buffer", "audio buffer", "time limit").
-    - scrcpy_version (`float`): The version of `scrcpy` being used. The argument format may vary depending 
-      on the version (e.g., bitrate or video buffer options).
-
-    Returns
-    -------
-    - `str`: The generated command-line argument string (`arg_line`) based on the slider values and active checks.
-    """
-    args_line = ""
-    for index, slider in enumerate(sliders):
-        args_line += f" --max-fps {slider.value()}" if index == 0 else ""
-        args_line += f" -m {slider.value()}" if index == 1 else ""
-        
-        if index == 2:
-            bitrate_cmd = "--video-bit-rate" if scrcpy_version >= 2.0 else "--bit-rate"
-            args_line += f" {bitrate_cmd} {slider.value()}M"
-        
-        if "video buffer" in active_checks and index == 3:
-            video_buffer_cmd = "--video-buffer" if scrcpy_version >= 3.0 else "--display-buffer"
-            args_line += f" {video_buffer_cmd} {slider.value()}"
-        
-        if "audio buffer" in active_checks and index == 4 and scrcpy_version >= 2.0:
-            args_line += f" --audio-buffer {slider.value()}"
-        
-        if "angle" in active_checks and index == 5 and scrcpy_version >= 3.0:
-            args_line += f" --angle {slider.value()}"
-        
-        if "time limit" in active_checks and index == 6 and scrcpy_version >= 2.1:
-            args_line += f" --time-limit {slider.value()}"
-        
-        if "screen off to" in active_checks and index == 7 and scrcpy_version >= 3.0:
-            args_line += f" --screen-off-timeout {slider.value()}"
-
-    return args_line
-
-def get_line_edit_start(line_edits: list, active_checks: list, record_combox: QComboBox, scrcpy_version: float) -> str:
-    """
-    Generates the argument line for configuring `lineEdits` based on their values and associated conditions.
-
-    This function builds a command-line argument string (`arg_line`) for the `lineEdits`, which can be 
-    used in the context of configuring settings for a `scrcpy` application. The function checks the values 
-    of the `lineEdits` and optionally includes different settings based on the active checks and the version of 
-    `scrcpy`.
-
-    Parameters
-    ----------
-    - line_edits (`List[QLineEdit]`): A list of `QLineEdit` objects representing various configuration options.
-    - active_checks (`List[str]`): A list of active checks that influence the command-line arguments (e.g., "record", "crop").
-    - record_combox (`QComboBox`): A `QComboBox` object used to select the recording file format (e.g., "mp4", "opus", "aac").
-    - scrcpy_version (`float`): The version of `scrcpy` being used. The argument format may vary depending on the version (e.g., audio codec options, recording format).
-
-    Returns
-    -------
-    - `str`: The generated command-line argument string (`arg_line`) based on the `lineEdits` and active checks.
-    """
-    args_line = ""
-    for index, lineedit in enumerate(line_edits):
-        if "record" in active_checks and index == 0:
-            extension_file = record_combox.currentText()
-            extension_file = "mp4" if extension_file in ["opus", "aac"] \
-                and scrcpy_version < 2.1 else extension_file
-
-            if extension_file  in ["opus", "aac"] and scrcpy_version >= 2.1:
-                args_line += f" --audio-codec={extension_file}"
-            args_line += f" --record {lineedit.text() or 'video'}.{extension_file}"
-        
-        if "mouse binding" in active_checks and index == 1 and scrcpy_version >= 2.5:
-            args_line += f" --mouse-bind={lineedit.text()}"
-
-        if "virtual display" in active_checks and index in [2, 3, 4] and scrcpy_version >= 3.0:
-            virtual_display_args = {
-                2: f" --new-display={lineedit.text()}",
-                3: f"/{lineedit.text()}" if lineedit.text() else "",
-                4: f" --start-app={lineedit.text()}",
-            }
-            args_line += virtual_display_args[index]
-        
-        if "crop" in active_checks and index == 5:
-            args_line += f" --crop {lineedit.text()}"
-        
-    return args_line
-
-def get_combo_box_start(combo_boxs: list, scrcpy_version: float) -> str:
-    """
-    Generates the argument line for the selections in the `comboBoxs`.
-
-    This function constructs a command-line argument string (`arg_line`) based on the selected values in the 
-    provided `QComboBox` objects. It uses predefined arguments stored in `EXTRA_ARGS_LIST` to adjust the command 
-    according to the selected options and the version of `scrcpy`.
-
-    Parameters
-    ----------
-    - combo_boxs (`List[QComboBox]`): A list of `QComboBox` objects representing different configuration options.
-    - scrcpy_version (`float`): The version of `scrcpy`. The argument format may vary depending on the version.
-
-    Returns
-    -------
-    - `str`: The generated command-line argument string (`arg_line`) based on the selections in the `comboBoxs`.
-
-    Notes
-    -----
-    - The function collects the selected texts from all `QComboBox` objects, except for the first one.
-    - The selected values are then matched against predefined arguments stored in `EXTRA_ARGS_LIST`.
-    - The `EXTRA_ARGS_LIST` is assumed to contain version-specific argument mappings, which may vary depending on the `scrcpy_version` and the selected values from the combo boxes.
-    - If `scrcpy_version` is lower than certain specified limits, deprecated or older arguments may be included.
-    - The function combines multiple selections in the last two combo boxes into a single key for argument construction.
-    - The generated argument line will include different settings for specific `scrcpy_version` values.
-    """
-    args_line = ""
-    combo_boxs_texts = [combo_box.currentText() for combo_box in combo_boxs[1:]]
-    key_otg = " ".join(combo_boxs_texts[-2:])
-
-    for dict_name in EXTRA_ARGS_LIST:
-        version_dict = EXTRA_ARGS_LIST[dict_name]
-        if dict_name == "all_version":
-            args_line += "".join(
-                version_dict.get(combo_text, "") for combo_text in combo_boxs_texts
-            )
-            args_line += "".join(
-                version_dict.get(key_otg, "")
-            )
-        elif dict_name == "deprecated_args":
-            for limits in version_dict.keys():
-                if scrcpy_version <= (limit_dict := version_dict[limits])["Version"]:
-                    args_line += "".join(
-                        limit_dict.get(combo_text, "") for combo_text in combo_boxs_texts 
-                    )
-        elif scrcpy_version >= version_dict["Version"]:
-            args_line += "".join(
-                version_dict.get(combo_text, "") for combo_text in combo_boxs_texts
-            )
-            
-    return args_line
-
-def get_checkBox_start(active_checks: list, args_w_required_values: list, scrcpy_version: float) -> tuple:
-    """
-    Generates the argument line for the selected checkboxes.
-
-    This function constructs a command-line argument string (`arg_line`) based on the active checks in the 
-    provided list. It checks the selected options against predefined arguments stored in `ARGS_LIST` and 
-    adjusts the generated arguments according to the version of `scrcpy`.
-
-    Parameters
-    ----------
-    - active_checks (`list`): A list of active checks (strings) representing the options selected by the user.
-    - args_w_required_values (`list`): A list of argument names that require additional values. These will be excluded from `active_checks`.
-    - scrcpy_version (`float`): The version of `scrcpy`. The argument format may vary depending on the version.
-
-    Returns
-    -------
-    - `tuple`: A tuple containing:
-      - `arg_line` (`str`): The generated command-line argument string based on the active checkboxes.
-      - `hide_client` (`bool`): A flag indicating whether the "hide client" option is selected.
-
-    Notes
-    -----
-    - The function filters out `active_checks` that match entries in `args_w_required_values`, ensuring only the options
-    that don't require additional values are included.
-    - The function uses the predefined `ARGS_LIST` to generate the argument string. The `ARGS_LIST` is assumed to contain 
-    version-specific argument mappings for different `scrcpy_version` values.
-    - If `scrcpy_version` is greater than or equal to the version specified in `ARGS_LIST`, the corresponding arguments 
-    are included in the `arg_line`.
-    - The function also checks if the "hide client" option is selected, and returns a `True` or `False` value for that.
-    """
-    args_line = ""
-    active_checks = [check for check in active_checks if check not in args_w_required_values]
-    for dict_name in ARGS_LIST.keys():
-        version_dict = ARGS_LIST[dict_name]
-        if dict_name == "all_version":
-            args_line += "".join(
-                version_dict.get(active_check, "") for active_check in active_checks
-            )
-        else:
-            if scrcpy_version >= version_dict["Version"]:
-                args_line += "".join(
-                    version_dict.get(active_check, "") for active_check in active_checks
-                )
-    return args_line, "hide client" in active_checks 
-    
 #move saved video from --record (-r)
 def move_record_file(record_file: str, path: str, target_path: str, custom_dir_enabled: bool) -> None:
     """
@@ -268,305 +75,70 @@ def move_record_file(record_file: str, path: str, target_path: str, custom_dir_e
             )
 
 #Errors for start_scrcpy
-def arguments_errors(err_out: list) -> bool:
+def alert_error(error: ErrorMatch) -> None:
+    """
+    Shows the alert of an error found by the `error_classifier`.
+
+    Parameters
+    ----------
+    - error (`ErrorMatch`): The error, its `message_key` gives the title and the message of the alert (see `ERROR_MESSAGES`).
+    """
+    create_alert(*error.message)
+
+def alert_first_error(err_out: str, groups) -> bool:
+    """
+    Shows the alert of the most important error of `err_out` in `groups` (see `Error_Classifier`).
+
+    Returns
+    -------
+    - `bool`: Returns `True` if an error was found (and its alert shown), `False` otherwise.
+    """
+    if error := error_classifier.first_error(err_out, groups):
+        alert_error(error)
+    return error is not None
+
+def arguments_errors(err_out: str) -> bool:
     """
     Checks for argument errors and creates alerts for specific error conditions.
 
-    This function examines the provided list of errors (`err_out`) and checks for specific conditions 
-    related to argument errors. Depending on the type of error, it will show an appropriate alert 
-    message to the user. The function handles various types of errors, including unexpected arguments, 
-    value errors, and issues related to specific scrcpy options.
+    This function checks the output (`err_out`) of `scrcpy` for the errors of the `arguments` group 
+    of `ERROR_CATALOGUE`, such as unexpected arguments, value errors, and issues related to specific 
+    scrcpy options, and shows the alert of the most important one.
 
     Parameters
     ----------
-    - err_out (`list`): A list of error messages or strings returned from a command execution. 
-    This list is checked against predefined sets of known errors to identify any issues.
+    - err_out (`str`): The errors (`stderr`) returned from a command execution.
 
     Returns
     -------
-    - `bool`: Returns `True` if no errors are found (meaning the arguments are valid). 
-    Returns `False` if any recognized error is detected and an alert is triggered.
+    - `bool`: Returns `True` if an error was found (and an alert shown), `False` otherwise.
     """
-    error_detect = True
-    if any(error in err_out for error in ERRORS_LIST["args_unexpected"]):
-        create_alert(
-            "Arguments Unexpected",
-            ("You provided an invalid arg, check that the arg used is\n" 
-            "compatible with the version of scrcpy used, and try again"),
-        )
-    elif any(error in err_out for error in ERRORS_LIST["value_error"]):
-        create_alert(
-            "Values Error",
-            ("Not all values for the required arguments were " 
-            "provided or invalid values were provided\n"
-            "\t\t Check the commands (like --crop) and try again.")
-        )
-    elif "nothing to do" in err_out:
-        create_alert(
-            "Values Error",
-            ("Nothing is being used <Video | Audio | OTG> "
-            "in other words nothing to do\ncheck everything "
-            "is correct and try again"),
-        )
-    elif "no format specified" in err_out:
-        create_alert(
-            "Nothing To Do",
-            ("The format chosen for '--record' is not valid or "
-            "has not been set\nchoose a valid one (.mp4 | .mkv) "
-            "and try again"),
-        )
-    elif "only work in otg mode" in err_out:
-        create_alert(
-            "OTG Arg",
-            ("to use arg (--hid-keyboard | '--hid-mouse')\n" 
-            "you need to use the argument (--otg)"),
-        )
-    elif "audio container does not support video stream" in err_out:
-        create_alert(
-            "Audio Container",
-            ("The selected audio container does not support the video stream\n"
-            "use --no-video and try again"),
-        )
-        
-    elif "camera options are only available with --video-source=camera" in err_out:
-        create_alert(
-            "Camera Options",
-            ("Camera options are only available with --video-source=camera"
-            "\n(This can also be caused by the '--crop' argument)")
-        )
-    elif "could not specify both --camera-size and -m/--max-size" in err_out:
-        create_alert(
-            "Camera Size",
-            "Cannot specify --camera-size and -m/--max-size at the same time.",
-        )
-    elif "could not specify both --camera-id and --camera-facing" in err_out:
-        create_alert(
-            "Camera ID",
-            "Cannot specify --camera-id and --camera-facing at the same time.",
-        )
-    elif "otg mode (--otg) is not supported on this platform" in err_out:
-        create_alert(
-            "Not Supported",
-            ("The otg mode (--otg) is not supported on this platform, this version only allows it on Linux"
-            "try updating the version of Scrcpy "),
-        )
-    elif "otg mode (--otg) is disabled" in err_out:
-        create_alert(
-            "Otg Mode Disabled",
-            "OTG mode (--otg) has been disabled, to fix this problem try updating the version of scrcpy" 
-        )
-    elif "invalid mouse bindings" in err_out:
-        create_alert(
-            "Mouse Bindings",
-            ("Mouse bindings are invalid, mouse binding can have a maximum of 4 characters"
-            "\nand using any of these characters: '+', '-', 'b', 'h', 's', 'n'.")           
-        )
-    elif "could not retrieve device information" in err_out:
-        create_alert(
-            "Args Error",
-            "Could not retrieve device information, try changing the arguments",
-        )
-    elif "--no-mouse-over is specific to --mouse=sdk" in err_out:
-        create_alert(
-            "No Mouse Over",
-            "The --no-mouse-over option is specific to --mouse=sdk",
-        )
-    elif "--no-key-repeat is specific to --keyboard=sdk" in err_out:
-        create_alert(
-            "No Key Repeat",
-            "The --no-key-repeat option is specific to --keyboard=sdk",
-        )
-    elif "--prefer-text is specific to --keyboard=sdk" in err_out:
-        create_alert(
-            "Prefer Text",
-            "The --prefer-text option is specific to --keyboard=sdk",
-        )
-    elif "--raw-key-events is specific to --keyboard=sdk" in err_out:
-        create_alert(
-            "Raw Key Events",
-            "The --raw-key-events option is specific to --keyboard=sdk",
-        )
-    elif "--audio-dup is specific to --audio-source=playback" in err_out:
-        create_alert(
-        "Audio Dup",
-        "The --audio-dup option is specific to --audio-source=playback",
-    )
-    elif "unsupported audio source:" in err_out:
-        create_alert(
-            "Unsupported Audio Source",
-            ("This audio source is not supported (expected output or mic)"
-            "\nor playback if scrcpy version is greater or equal than 2.6"),
-        )
-    elif "--no-control is not allowed in otg mode" in err_out:
-        create_alert(
-            "No Control",
-            "The --no-control option is not allowed in otg mode",
-        )
-    elif "otg mode: could not turn screen off" in err_out:
-        create_alert(
-            "Screen Off",
-            "Could not turn screen off using otg mode",
-        )
-    elif "otg mode: could not stay awake" in err_out:
-        create_alert(
-            "Stay Awake",
-            "Could not stay awake using otg mode",
-        )
-    elif "otg mode: could not request to show touches" in err_out:
-        create_alert(
-            "Show Touches",
-            "Could not request to show touches using otg mode",
-        )
-    elif "sdk mouse mode requires video playback. try --mouse=uhid" in err_out:
-        create_alert(
-            "Mouse Mode",
-            "SDK mouse mode requires video playback. try --mouse=uhid",
-        )
-    elif "in otg mode, --keyboard only supports aoa or disabled" in err_out:
-        create_alert(
-            "Keyboard",
-            "In otg mode, --keyboard only supports aoa or disabled",
-        )
-    elif "in otg mode, --mouse only supports aoa or disabled" in err_out:
-        create_alert(
-            "Mouse",
-            "In otg mode, --mouse only supports aoa or disabled",
-        )
-    elif "numberformatexception" in err_out:
-        create_alert(
-            "Unexpected Value",
-            "An unexpected value was received, try changing the arguments",
-        )
-    elif "otg mode: cannot record" in err_out:
-        create_alert(
-            "Record",
-            "Cannot record using otg mode, try changing the arguments",
-        )
-    elif "video and audio disabled, nothing to record" in err_out:
-        create_alert(
-            "Record",
-            "Cannot record with video and audio disabled, try changing the arguments",
-        )
-    elif "--new-display is incompatible with --no-video" in err_out:
-        create_alert(
-            "New Display",
-            "The --new-display option is incompatible with --no-video or --no-playback",
-        )
-    elif "cannot start an android app if control is disabled" in err_out:
-        create_alert(
-            "Control",
-            "Cannot start an android app if control is disabled",
-        )
-    elif "decoder 'video': could not send video packet" in err_out:
-        create_alert(
-            "Video Packet",
-            "Could not send video packet, try changing the arguments (probably an encoding error)",
-        )
-    elif "encoder type for" and "does not match codec type" in err_out:
-        create_alert(
-            "Encoder Type",
-            "Encoder type does not match codec type, try changing the arguments",
-        )
-    elif "unsupported audio codec" in err_out:
-        create_alert(
-            "Unsupported Audio Codec",
-            "This audio codec is not supported, try changing the arguments",
-        )
-    elif "error: demuxer error" in err_out:
-        create_alert(
-            "Demuxer Error",
-            "Demuxer error, try changing the arguments",
-        )
-    else: 
-        error_detect = False
-    return error_detect
+    return alert_first_error(err_out, "arguments")
     
-def device_errors(err_out: list) -> bool:
+def device_errors(err_out: str) -> bool:
     """
     Checks for device errors and creates alerts for specific error conditions.
 
-    This function checks the provided list of error messages (`err_out`) for specific errors 
-    related to device connectivity and configuration issues. If any recognized error is found, 
-    it triggers an alert to inform the user about the problem. The function handles errors such as 
-    device not being detected, connection issues, encoding errors, and more.
+    This function checks the output (`err_out`) for the errors of the `device` group of `ERROR_CATALOGUE`, 
+    such as device not being detected, connection issues, encoding errors, and more, and shows the alert 
+    of the most important one.
 
     Parameters
     ----------
-    - err_out (`list`): A list of error messages returned from a command execution or device operation. 
-    This list is checked against known device-related error conditions to determine if any specific errors have occurred.
+    - err_out (`str`): The errors (`stderr`) returned from a command execution or device operation.
 
     Returns
     -------
-    - `bool`: Returns `True` if no errors are found (indicating that the device is functioning correctly). 
-    Returns `False` if any recognized device-related error is found, triggering an alert to the user.
+    - `bool`: Returns `True` if an error was found (and an alert shown), `False` otherwise.
     """
-    error_detect = True
-    if any(error in err_out for error in ERRORS_LIST["device_not_found"]):
-        create_alert(
-            "Nothing Detected",
-            ("No device was detected connect a device (Wi-Fi | USB)\n" 
-            "and try again"),
-        )
-    elif "not find any usb device" in err_out:
-        create_alert(
-            "USB Device",
-            ("You need to connect the device via USB to use OTG " 
-            "via Wi-Fi will not work"),
-        )
-    elif "state=offline" in err_out:
-        create_alert(
-            "Offline Device",
-            ("The selected device is offline try, disconnecting and connecting it "
-            "and try again"),
-        )
-    elif "Encoding Error" in err_out:
-        create_alert(
-            "Encoding Error",
-            ("An encoding error occurred, check that the arguments " 
-            "and their values are correct\ncheck that the device "
-            "is correctly configured and try again")
-        )
-    elif "0xfffffff4" in err_out:
-        create_alert(
-            "Encoding Error",
-            ("An 'Encoding' error was detected try changing the video-rate (--video-rate)\n"
-            "or the maximum size (-m | --max-size) and try again."),
-        ) 
-    elif "connection reset by peersab" in err_out:
-        create_alert(
-            "Connection Reset",
-            ("The adb connection has been restarted by Peersab\n" 
-            "make sure everything is set up correctly."),
-        )
-    elif "turn screen off if control is disabled" in err_out:
-        create_alert(
-            "No Control",
-            "Cannot use turn screen off without device control.",
-        )
-    elif "unauthorized" in err_out:
-        create_alert(
-            "Unauthorized",
-            ("The device has not yet authorized this computer\n"
-             "to establish an adb connection."),
-        )
-    elif "no matching camera found" in err_out:
-        create_alert(
-            "No Camera Was Found",
-            "Make sure the camera is properly connected.",
-        )
-    else: 
-        error_detect = False
-    print(err_out)
-    return error_detect
+    return alert_first_error(err_out, "device")
 
-def args_combination_errors(err_out: list) -> bool:
+def args_combination_errors(err_out: str) -> bool:
     """
     Checks for argument combination errors and creates alerts for specific incompatible arguments.
 
-    This function checks the provided output (`err_out`) of an adb command for known argument 
-    combination errors, specifically when two or more arguments are incompatible with each other. 
-    If such errors are found, it triggers an alert to inform the user about the conflicting arguments. 
-    The function helps ensure that incompatible argument combinations are not used simultaneously.
+    This function checks the output (`err_out`) for the errors of the `combination` group of `ERROR_CATALOGUE`, 
+    when two or more arguments are incompatible with each other, and shows the alert of the most important one.
 
     Parameters
     ----------
@@ -574,41 +146,18 @@ def args_combination_errors(err_out: list) -> bool:
 
     Returns
     -------
-    - `bool`: Returns `True` if no errors are detected (indicating that all argument combinations are valid). 
-    Returns `False` if any incompatible argument combinations are found, triggering an alert to the user.
+    - `bool`: Returns `True` if incompatible arguments were found (and an alert shown), `False` otherwise.
     """
-    error_detect = True
-    if "--prefer-text is incompatible with --raw-key-events" in err_out:
-        create_alert(
-            "Incompatible Args",
-            ("The args '--prefer-text' and '--raw-key-events' are not compatible\n"
-            "remove one of them and try again."),
-        )
-    elif "not request to show touches if control is disabled" in err_out:
-        create_alert(
-            "Incompatible Args",
-            ("The args '--show-touches' and '--no-control' (or camera) are not compatible\n" 
-            "remove one of them and try again"),
-        )
-    elif "not request to stay awake if control is disabled" in err_out:
-        create_alert(
-            "Incompatible Args",
-            ("The args '--stay-awake' and '--no-control' (or camera) are not compatible\n" 
-            "remove one of them and try again"),
-        )
-    else: 
-        error_detect = False
-    print(err_out)
-    return error_detect
+    return alert_first_error(err_out, "combination")
 
 #Errors for connection
 def connection_errors(emit_tcpip: str = "", emit_connect: str = "") -> bool:
     """
     Checks for connection errors and creates alerts based on specific issues.
 
-    This function checks the provided output (`emit_tcpip` and `emit_connect`) for known connection errors.
-    If any connection-related issues are detected, it triggers an alert to inform the user about the problem.
-    The function is designed to help identify issues related to establishing a connection with a device or server.
+    This function checks the output of `adb tcpip` for the errors of the `tcpip` group of `ERROR_CATALOGUE`, 
+    and the output of `adb connect` for the errors of the `connect` group, and shows the alert of the most 
+    important one.
 
     Parameters
     ----------
@@ -617,64 +166,16 @@ def connection_errors(emit_tcpip: str = "", emit_connect: str = "") -> bool:
 
     Returns
     -------
-    - `bool`: Returns `True` if no connection errors are detected, allowing the process to proceed.
-    Returns `False` if any connection errors are found, triggering an alert to the user.
+    - `bool`: Returns `True` if a connection error was found (and an alert shown), `False` otherwise.
     """
-    error_detect = True
-    if "already connected to" in emit_connect:
-        create_alert(
-            "Already Connected",
-            "This IP is already connected",
-        )
-    elif "no devices/emulators found" in emit_tcpip:
-        create_alert(
-            "Device Not Found",
-            "No device found, check if it is properly connected (USB)",
-        )
-    elif "invalid port" in emit_tcpip:
-        create_alert(
-            "Invalid Port",
-            "Invalid PORT, make sure the PORT you entered is valid",
-        )
-    elif "(11001)" in emit_connect:
-        create_alert(
-            "Not Recognized",
-            ("The IP and Port was not recognized check the Port Ip\n" 
-            "are correct and try again (11001)"),
-        )
-    elif "(10060)" in emit_connect:
-        create_alert(
-            "No Response",
-            ("Did not get a response from the connected device to the host\n"
-            "check the IP and try again (10060)"),
-        )
-    elif "(10061)" in emit_connect:
-        create_alert(
-            "Connection Refused",
-            ("The connection was refused by the destination device, "
-            "check if it is not already connected to some host\n"
-            "\t\tand make sure that the IP and Port are valid (10061)"),
-        )
-    elif "bad port number" in emit_connect:
-        create_alert(
-            "Bad Port",
-            "One poorly chosen door, please choose another",
-        )
-    elif "server connection failed" in emit_connect:
-        create_alert(
-            "Connection Failed",
-            ("The connection was refused by the destination device,\n"
-             "or the device is offline")
-        )
-    elif "protocol fault" in emit_connect:
-        create_alert(
-            "Protocol Fault",
-            "The protocol faulted, make sure the IP/PORT is valid",
-        )
-    else:
-        error_detect = False
+    errors = [
+        *error_classifier.classify(emit_tcpip, "tcpip"),
+        *error_classifier.classify(emit_connect, "connect"),
+    ]
+    if errors:
+        alert_error(min(errors, key=lambda error: error.priority))
     print(f"connect: {emit_connect}\n tcpip: {emit_tcpip}")
-    return error_detect
+    return bool(errors)
         
 def assemble_grid_layout(tab_name: str, locate: str, *elements: tuple) -> QGridLayout:
     """
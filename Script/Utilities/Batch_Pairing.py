@@ -0,0 +1,228 @@
+"""
+This module contains the pairing of many devices at once over Wi-Fi (wireless debugging, Android 11+).
+
+Instead of pairing each device with `Wifi Debug` (a dialog for every code), the devices are listed in a batch
+file, one entry per device with its IP, the port and the code of its pairing dialog, and the port to connect
+to once paired (see `load_pairing_entries`):
+
+- CSV: `ip, pairing_port, code, connect_port` (a header line with these names is optional).
+- JSON: a list of objects with these keys (or of lists in this order).
+
+The entries are paired (`adb pair`) then connected (`adb connect`) in parallel by a bounded pool of workers
+(`PAIR_WORKERS`), each `adb` call with its own timeout. When an entry has no connect port, the one advertised
+over mDNS by the device is used (see `Mdns_Services`). `adb tcpip` is not sent, it targets whichever device is
+plugged and is not needed by wireless debugging.
+
+The results (see `PairingResult`) are returned together and written in a report next to the batch file.
+"""
+import csv
+import json
+from os.path import splitext
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from Script.Utilities.Command_Runner import CommandRunner, PAIR_TIMEOUT
+from Script.Utilities.Bulk_Connect import connect_endpoint, CONNECT_TIMEOUT
+from Script.Utilities.Mdns_Services import mdns_services
+
+PAIR_WORKERS = 8
+ENTRY_FIELDS = ("ip", "pairing_port", "code", "connect_port")
+REPORT_FIELDS = ("ip", "pairing_port", "connect_port", "status", "message", "duration")
+
+class PairingEntry():
+    """
+    This class holds a device of a batch file.
+
+    Parameters
+    ----------
+    - ip (`str`): The IP of the device.
+    - pairing_port (`str`): The port of its pairing dialog.
+    - code (`str`): The pairing code of its dialog.
+    - connect_port (`str`, optional): The port to connect to once paired (from mDNS if empty). Defaults to `""`.
+    - line (`int`, optional): The line (or the index) of the entry in the batch file. Defaults to `0`.
+    """
+    def __init__(self, ip: str, pairing_port: str, code: str, connect_port: str = "", line: int = 0):
+        self.ip = ip
+        self.pairing_port = pairing_port
+        self.code = code
+        self.connect_port = connect_port
+        self.line = line
+
+    def __repr__(self) -> str:
+        return f"PairingEntry({self.ip!r}, {self.pairing_port!r}, connect_port={self.connect_port!r})"
+
+class PairingResult():
+    """
+    This class holds the result of the pairing of an entry.
+
+    Parameters
+    ----------
+    - entry (`PairingEntry`): The entry.
+    - status (`str`): `"connected"`, `"paired"` (the connection failed or no connect port is known) or `"failed"`.
+    - message (`str`): The output of the last `adb` call (or the reason it failed).
+    - duration (`float`): The time (in seconds) the pairing and the connection took.
+    - connect_port (`str`, optional): The port the device was connected to. Defaults to `""`.
+    """
+    def __init__(self, entry: PairingEntry, status: str, message: str, duration: float, connect_port: str = ""):
+        self.entry = entry
+        self.status = status
+        self.message = message
+        self.duration = duration
+        self.connect_port = connect_port
+
+    @property
+    def endpoint(self) -> str:
+        """The connected endpoint (e.g. `192.168.0.10:40123`), empty if the device is not connected."""
+        return f"{self.entry.ip}:{self.connect_port}" if self.status == "connected" else ""
+
+    def __repr__(self) -> str:
+        return f"PairingResult({self.entry.ip!r}, {self.status!r}, {self.duration:.2f}s)"
+
+def parse_entry(values: dict, line: int) -> PairingEntry:
+    """
+    Returns the entry of a line of a batch file.
+
+    Raises
+    ------
+    - `ValueError`: If a field is missing or a port is not a number.
+    """
+    fields = {field: str(values.get(field) if values.get(field) is not None else "").strip() for field in ENTRY_FIELDS}
+    if isinstance(values.get("code"), int): # a JSON number loses the leading zeros of the code ↓
+        fields["code"] = fields["code"].zfill(6)
+    if not (fields["ip"] and fields["pairing_port"] and fields["code"]):
+        raise ValueError(f"line {line}: the ip, the pairing port and the code are needed")
+    if not fields["pairing_port"].isdigit() or not (fields["connect_port"] or "0").isdigit():
+        raise ValueError(f"line {line}: the ports must be numbers")
+    return PairingEntry(**fields, line=line)
+
+def load_pairing_entries(path: str) -> list:
+    """
+    Reads the entries of a batch file (CSV or JSON, see the module docstring).
+
+    Parameters
+    ----------
+    - path (`str`): The path to the batch file.
+
+    Returns
+    -------
+    - `list`: The entries (`PairingEntry`), without the duplicates of an IP and pairing port.
+
+    Raises
+    ------
+    - `ValueError`: If the file cannot be read or an entry is not valid.
+    """
+    try:
+        with open(path, "r", encoding="utf-8-sig", newline="") as batch_file:
+            if splitext(path)[1].lower() == ".json":
+                rows = json.load(batch_file)
+                rows = rows.get("devices", []) if isinstance(rows, dict) else rows
+                if not isinstance(rows, list):
+                    raise ValueError(f"cannot read {path}: the devices must be a list")
+                lines = [(num, row) for num, row in enumerate(rows, 1)]
+            else:
+                lines = [
+                    (num, row) for num, row in enumerate(csv.reader(batch_file), 1)
+                    if row and any(row) and not row[0].lstrip().startswith("#")
+                ]
+                if lines and lines[0][1][0].strip().lower() == "ip": # header ↓
+                    header = [name.strip().lower() for name in lines.pop(0)[1]]
+                    lines = [(num, dict(zip(header, row))) for num, row in lines]
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"cannot read {path}: {error}")
+
+    entries = {}
+    for num, row in lines:
+        if isinstance(row, list):
+            row = dict(zip(ENTRY_FIELDS, row))
+        if not isinstance(row, dict):
+            raise ValueError(f"line {num}: an entry must be a list or an object")
+        entry = parse_entry(row, num)
+        entries.setdefault((entry.ip, entry.pairing_port), entry)
+    return list(entries.values())
+
+def pair_entry(entry: PairingEntry, runner: CommandRunner, timeout: float = PAIR_TIMEOUT) -> PairingResult:
+    """
+    Pairs an entry, then connects it (see the module docstring).
+
+    Parameters
+    ----------
+    - entry (`PairingEntry`): The entry.
+    - runner (`CommandRunner`): The runner of the commands.
+    - timeout (`float`, optional): The time (in seconds) `adb pair` can take. Defaults to `PAIR_TIMEOUT`.
+
+    Returns
+    -------
+    - `PairingResult`: The result of the entry.
+    """
+    start_time = monotonic()
+    result = runner.run(["adb", "pair", f"{entry.ip}:{entry.pairing_port}", entry.code], timeout=timeout)
+    message = (result.stdout or result.stderr).strip() or "no answer"
+    if "successfully paired" not in message.lower():
+        return PairingResult(entry, "failed", message, monotonic() - start_time)
+
+    connect_port = entry.connect_port
+    if not connect_port and (advertised := mdns_services.endpoint("connect", entry.ip)):
+        connect_port = advertised[1]
+    if not connect_port:
+        return PairingResult(entry, "paired", "paired, but no connect port is known", monotonic() - start_time)
+
+    connected = connect_endpoint(f"{entry.ip}:{connect_port}", entry.ip, connect_port, runner, timeout=CONNECT_TIMEOUT)
+    status = "connected" if connected.ok else "paired"
+    return PairingResult(entry, status, connected.message, monotonic() - start_time, connect_port)
+
+def pair_entries(
+    entries: list,
+    path: str = ".",
+    runner: CommandRunner = None,
+    workers: int = PAIR_WORKERS,
+    timeout: float = PAIR_TIMEOUT,
+):
+    """
+    Pairs and connects every entry in parallel and yields the results as each entry finishes.
+
+    Parameters
+    ----------
+    - entries (`list`): The entries (`PairingEntry`, see `load_pairing_entries`).
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - runner (`CommandRunner`, optional): The runner of the commands. Defaults to a new runner in `path`.
+    - workers (`int`, optional): The maximum number of entries paired at the same time. Defaults to `PAIR_WORKERS`.
+    - timeout (`float`, optional): The time (in seconds) each `adb pair` can take. Defaults to `PAIR_TIMEOUT`.
+
+    Yields
+    ------
+    - `PairingResult`: The result of each entry.
+    """
+    if not entries:
+        return
+    runner = runner or CommandRunner(path)
+    # the server is started once, not by each `adb pair` at the same time ↓
+    runner.run(["adb", "start-server"])
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(entries)))) as pool:
+        futures = [pool.submit(pair_entry, entry, runner, timeout) for entry in entries]
+        for future in as_completed(futures):
+            yield future.result()
+
+def report_path(batch_path: str) -> str:
+    """Returns the path of the report of a batch file (e.g. `rack.csv` -> `rack_report.csv`)."""
+    return f"{splitext(batch_path)[0]}_report.csv"
+
+def write_report(results: list, path: str) -> None:
+    """
+    Writes the results of a batch in a CSV report, in the order of the batch file.
+
+    Raises
+    ------
+    - `OSError`: If the report cannot be written.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(REPORT_FIELDS)
+        for result in sorted(results, key=lambda result: result.entry.line):
+            writer.writerow([
+                result.entry.ip,
+                result.entry.pairing_port,
+                result.connect_port,
+                result.status,
+                " ".join(result.message.split()),
+                f"{result.duration:.2f}",
+            ])
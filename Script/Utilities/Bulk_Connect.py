@@ -0,0 +1,165 @@
+"""
+This module contains the connection of all the saved endpoints (`Connect.Custom_Ip_Saved`) at once.
+
+The endpoints are connected in parallel by a bounded pool of workers (`CONNECT_WORKERS`, the `adb` processes
+are also limited by `Command_Runner.ADB_CONCURRENCY`) and every `adb connect` has its own timeout, so a
+device that is off cannot stall the others.
+
+`adb tcpip` is only needed when the device does not listen on its port yet (e.g. after a reboot). The port
+of each endpoint is tried first with a plain TCP connection, `adb tcpip` is skipped when it answers. Otherwise
+it is sent to the USB device whose Wi-Fi IP is the one of the endpoint (see `Device_Probe`, the USB devices are
+only probed when a port did not answer), since `adb tcpip` without a serial fails as soon as more than one
+device is plugged.
+
+The results are returned together (see `ConnectResult`), so a single summary is shown for all the endpoints.
+"""
+import socket
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Device_Registry import get_devices
+from Script.Utilities.Device_Probe import collect_device_facts
+from Script.Utilities.Utils import check_is_ip
+
+CONNECT_WORKERS = 16
+CONNECT_TIMEOUT = 8.0
+PORT_PROBE_TIMEOUT = 1.0
+DEFAULT_ADB_PORT = "5555"
+
+class ConnectResult():
+    """
+    This class holds the result of the connection of a saved endpoint.
+
+    Parameters
+    ----------
+    - name (`str`): The name of the saved endpoint (e.g. `192.168.0.10:5555`).
+    - endpoint (`str`): The address given to `adb connect`.
+    - status (`str`): `"connected"`, `"already connected"` or `"failed"`.
+    - message (`str`): The output of `adb connect` (or the reason it failed).
+    - duration (`float`): The time (in seconds) the connection took.
+    - tcpip (`bool`, optional): If `True`, `adb tcpip` was sent before connecting. Defaults to `False`.
+    """
+    def __init__(self, name: str, endpoint: str, status: str, message: str, duration: float, tcpip: bool = False):
+        self.name = name
+        self.endpoint = endpoint
+        self.status = status
+        self.message = message
+        self.duration = duration
+        self.tcpip = tcpip
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the endpoint is connected."""
+        return self.status != "failed"
+
+    def __repr__(self) -> str:
+        return f"ConnectResult({self.endpoint!r}, {self.status!r}, {self.duration:.2f}s, tcpip={self.tcpip})"
+
+def split_endpoint(ip: str, port: str) -> tuple:
+    """
+    Returns the host and the port of a saved endpoint, the IP field can already hold a port (e.g. `"192.168.0.10:5555"`).
+    """
+    ip = ip.strip()
+    if ip.count(":") == 1: # an IPv6 has several
+        host, ip_port = ip.split(":")
+        return host, ip_port
+    return ip, str(port).strip() or DEFAULT_ADB_PORT
+
+def endpoint_answers(host: str, port: str, timeout: float = PORT_PROBE_TIMEOUT) -> bool:
+    """
+    Returns `True` if something listens on the port of the endpoint (the device is already in TCP mode).
+    """
+    try:
+        with socket.create_connection((host, int(port)), timeout):
+            return True
+    except (OSError, ValueError):
+        return False
+
+def usb_serials_by_ip(path: str = ".") -> dict:
+    """
+    Returns the serial of each ready USB device by its Wi-Fi IP (from the cached facts, probed if missing).
+    """
+    serials = [
+        device["serial"] for device in get_devices(path)
+        if device["state"] == "device" and not check_is_ip(device["serial"])
+    ]
+    return {facts.wifi_ip: facts.serial for facts in collect_device_facts(serials, path) if facts.wifi_ip}
+
+def connect_endpoint(
+    name: str,
+    host: str,
+    port: str,
+    runner: CommandRunner,
+    usb_serial: str = None,
+    timeout: float = CONNECT_TIMEOUT,
+) -> ConnectResult:
+    """
+    Connects a saved endpoint, with `adb tcpip` first if the device is also plugged via USB.
+
+    Parameters
+    ----------
+    - name (`str`): The name of the saved endpoint.
+    - host (`str`): The IP of the device.
+    - port (`str`): The port of the device.
+    - runner (`CommandRunner`): The runner of the commands.
+    - usb_serial (`str`, optional): The USB serial of the device, only given if its port did not answer. Defaults to `None`.
+    - timeout (`float`, optional): The time (in seconds) each `adb` call can take. Defaults to `CONNECT_TIMEOUT`.
+
+    Returns
+    -------
+    - `ConnectResult`: The result of the connection.
+    """
+    start_time = monotonic()
+    endpoint = f"{host}:{port}"
+    if usb_serial:
+        runner.run(["adb", "-s", usb_serial, "tcpip", port], timeout=timeout)
+
+    result = runner.run(["adb", "connect", endpoint], timeout=timeout)
+    message = (result.stdout or result.stderr).strip()
+    if message.lower().startswith("already connected"):
+        status = "already connected"
+    elif message.lower().startswith("connected to"):
+        status = "connected"
+    else:
+        status = "failed"
+    return ConnectResult(name, endpoint, status, message or "no answer", monotonic() - start_time, bool(usb_serial))
+
+def connect_saved_endpoints(
+    saved_endpoints: dict,
+    path: str = ".",
+    runner: CommandRunner = None,
+    workers: int = CONNECT_WORKERS,
+    timeout: float = CONNECT_TIMEOUT,
+):
+    """
+    Connects every saved endpoint in parallel and yields the results as each endpoint finishes.
+
+    Parameters
+    ----------
+    - saved_endpoints (`dict`): The saved endpoints, `[ip, port]` by name (see `Connect.Custom_Ip_Saved`).
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - runner (`CommandRunner`, optional): The runner of the commands. Defaults to a new runner in `path`.
+    - workers (`int`, optional): The maximum number of endpoints connected at the same time. Defaults to `CONNECT_WORKERS`.
+    - timeout (`float`, optional): The time (in seconds) each `adb` call can take. Defaults to `CONNECT_TIMEOUT`.
+
+    Yields
+    ------
+    - `ConnectResult`: The result of each endpoint.
+    """
+    if not saved_endpoints:
+        return
+    runner = runner or CommandRunner(path)
+    # the server is started once, not by each `adb connect` at the same time (e.g. after an `adb kill-server`) ↓
+    runner.run(["adb", "start-server"])
+    endpoints = [(name, *split_endpoint(ip, port)) for name, (ip, port) in saved_endpoints.items()]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(endpoints)))) as pool:
+        answers = list(pool.map(lambda endpoint: endpoint_answers(*endpoint[1:]), endpoints))
+        usb_serials = usb_serials_by_ip(path) if not all(answers) else {}
+        futures = [
+            pool.submit(connect_endpoint, name, host, port, runner, None if answer else usb_serials.get(host), timeout)
+            for (name, host, port), answer in zip(endpoints, answers)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
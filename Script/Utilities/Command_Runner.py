@@ -0,0 +1,283 @@
+"""
+This module contains the `CommandRunner`, used to run every `adb`/`scrcpy` command of the app.
+
+The commands are executed as argument lists (without a shell), so IPs, serials and file names are
+never parsed by `cmd.exe`/`sh`. The `adb` and `scrcpy` executables are looked up once per folder
+(the selected scrcpy version on Windows, the `PATH` elsewhere) and every call has a timeout, after
+which the process is killed. A runner can also be cancelled from another thread (e.g. when the window
+is closed), which kills the processes it is waiting for. At most `ADB_CONCURRENCY` `adb` processes
+run at the same time across the whole app, the next calls wait for a free slot.
+
+Every call returns a `CommandResult` with the exit code, the output, the errors and the duration.
+"""
+import subprocess
+from shlex import join, split
+from contextlib import suppress
+from weakref import WeakSet
+from threading import BoundedSemaphore, Event, Lock
+from time import monotonic
+from platform import system
+from shutil import which
+from os.path import abspath, basename, isabs, splitext
+
+running_on_windows = system() == "Windows"
+
+ADB_TIMEOUT = 15.0
+ADB_CONCURRENCY = 8
+PAIR_TIMEOUT = 30.0
+RESOLVED_BINARIES = {}
+RESOLVED_BINARIES_LOCK = Lock()
+RUNNERS = WeakSet()
+adb_slots = BoundedSemaphore(ADB_CONCURRENCY)
+
+class CommandResult():
+    """
+    This class holds the result of a command executed by the `CommandRunner`.
+
+    Parameters
+    ----------
+    - args (`list`): The arguments of the command (the first one is the resolved executable).
+    - exit_code (`int`): The exit code of the process, `None` if it could not be started.
+    - stdout (`str`): The output of the command.
+    - stderr (`str`): The errors of the command (or the reason it failed, timed out or was cancelled).
+    - duration (`float`): The time (in seconds) the command took.
+    - timed_out (`bool`, optional): If `True`, the command was killed after its timeout. Defaults to `False`.
+    - cancelled (`bool`, optional): If `True`, the command was killed by `CommandRunner.cancel`. Defaults to `False`.
+    """
+    def __init__(
+        self,
+        args: list,
+        exit_code: int,
+        stdout: str,
+        stderr: str,
+        duration: float,
+        timed_out: bool = False,
+        cancelled: bool = False,
+    ):
+        self.args = args
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the command exited with code `0`."""
+        return self.exit_code == 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CommandResult({self.args!r}, exit_code={self.exit_code}, "
+            f"duration={self.duration:.2f}, timed_out={self.timed_out}, cancelled={self.cancelled})"
+        )
+
+def resolve_binary(name: str, path: str = ".") -> str:
+    """
+    Returns the full path of the `name` executable, looked up only once for each folder.
+
+    Parameters
+    ----------
+    - name (`str`): The name of the executable (e.g. `adb`, `scrcpy`).
+    - path (`str`, optional): The folder searched before the `PATH` on Windows (the selected scrcpy version), elsewhere
+    only the `PATH` is searched, like the shell does. Defaults to `"."`.
+
+    Returns
+    -------
+    - `str`: The full path of the executable, or `name` itself if it was not found (starting it will then fail
+    with a clear error instead of running something else).
+    """
+    # an `adb` of the working directory is not run instead of the one of the `PATH` ↓
+    folder = abspath(path) if running_on_windows and path else ""
+    with RESOLVED_BINARIES_LOCK:
+        if (key := (name, folder)) in RESOLVED_BINARIES:
+            return RESOLVED_BINARIES[key]
+
+    binary = (folder and which(name, path=folder)) or which(name) or name
+    with RESOLVED_BINARIES_LOCK:
+        RESOLVED_BINARIES[key] = binary
+    return binary
+
+def split_arg_line(arg_line: str) -> list:
+    """
+    Splits a command line typed by the user (e.g. `scrcpy -s 192.168.0.10:5555 --record "my file.mp4"`)
+    into a list of arguments.
+
+    Parameters
+    ----------
+    - arg_line (`str`): The command line.
+
+    Returns
+    -------
+    - `list`: The arguments, with the quotes removed.
+    """
+    if not running_on_windows:
+        return split(arg_line)
+    return [arg.strip('"') for arg in split(arg_line, posix=False)]
+
+def join_arg_line(args: list) -> str:
+    """
+    Joins a list of arguments into a command line, quoted so `split_arg_line` gives the same arguments back.
+    """
+    if not running_on_windows:
+        return join(args)
+    return subprocess.list2cmdline(args)
+
+class CommandRunner():
+    """
+    This class runs `adb`/`scrcpy` commands with a timeout, and can be cancelled from another thread.
+
+    Parameters
+    ----------
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder, where the executables are looked up first
+    and the commands are executed. Defaults to `"."`.
+    - timeout (`float`, optional): The default timeout (in seconds) of each call. Defaults to `ADB_TIMEOUT`.
+    """
+    def __init__(self, path: str = ".", timeout: float = ADB_TIMEOUT):
+        self.path = path or "."
+        self.timeout = timeout
+        self.cancelled = Event()
+        self.lock = Lock()
+        self.processes = set()
+        RUNNERS.add(self)
+
+    def resolve(self, args: list) -> list:
+        """Returns `args` with the executable (first argument) replaced by its full path (see `resolve_binary`)."""
+        if not args or isabs(args[0]):
+            return list(args)
+        return [resolve_binary(args[0], self.path), *args[1:]]
+
+    def run(self, args: list, timeout: float = -1, cwd: str = None) -> CommandResult:
+        """
+        Runs a command and waits for it to finish.
+
+        Parameters
+        ----------
+        - args (`list`): The arguments of the command, e.g. `["adb", "connect", "192.168.0.10:5555"]`.
+        - timeout (`float`, optional): The timeout (in seconds) of this call, `None` to wait forever (still cancellable).
+        Defaults to the timeout of the runner.
+        - cwd (`str`, optional): The folder the command is executed in. Defaults to the path of the runner.
+
+        Returns
+        -------
+        - `CommandResult`: The result of the command. If the command could not be started, timed out or was cancelled,
+        the reason is in `stderr` and `exit_code` is `None` (or the code of the killed process).
+        """
+        args = self.resolve(args)
+        timeout = self.timeout if timeout == -1 else timeout
+        if splitext(basename(args[0]))[0].lower() != "adb":
+            return self.execute(args, timeout, cwd)
+
+        # waits for a free `adb` slot (without counting it in the timeout) ↓
+        while not adb_slots.acquire(timeout=0.1):
+            if self.cancelled.is_set():
+                return CommandResult(args, None, "", "cancelled", 0.0, cancelled=True)
+        try:
+            return self.execute(args, timeout, cwd)
+        finally:
+            adb_slots.release()
+
+    def execute(self, args: list, timeout: float, cwd: str) -> CommandResult:
+        """
+        Starts the (resolved) command and waits for it, see `run`.
+        """
+        start_time = monotonic()
+        if self.cancelled.is_set():
+            return CommandResult(args, None, "", "cancelled", 0.0, cancelled=True)
+
+        try:
+            process = subprocess.Popen(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                cwd=cwd or self.path,
+                creationflags=subprocess.CREATE_NO_WINDOW if running_on_windows else 0,
+            )
+        except OSError as error:
+            return CommandResult(args, None, "", str(error), monotonic() - start_time)
+
+        with self.lock:
+            self.processes.add(process)
+        try:
+            stdout, stderr, timed_out = self.wait(process, timeout, start_time)
+        finally:
+            with self.lock:
+                self.processes.discard(process)
+
+        duration = monotonic() - start_time
+        stdout = stdout.decode("utf-8", "replace")
+        stderr = stderr.decode("utf-8", "replace")
+        if timed_out:
+            stderr = f"{stderr}timed out after {timeout:g}s: {' '.join(args)}"
+        elif self.cancelled.is_set() and process.returncode != 0:
+            return CommandResult(args, process.returncode, stdout, f"{stderr}cancelled", duration, cancelled=True)
+        return CommandResult(args, None if timed_out else process.returncode, stdout, stderr, duration, timed_out)
+
+    def wait(self, process: subprocess.Popen, timeout: float, start_time: float) -> tuple:
+        """
+        Waits for `process`, checking the cancellation every `100ms`, and kills it after `timeout` seconds.
+
+        Returns
+        -------
+        - `tuple`: A tuple `(stdout, stderr, timed_out)`.
+        """
+        while True:
+            wait_time = 0.1 if timeout is None else min(0.1, max(timeout - (monotonic() - start_time), 0))
+            try:
+                stdout, stderr = process.communicate(timeout=wait_time)
+                return stdout, stderr, False
+            except subprocess.TimeoutExpired:
+                timed_out = timeout is not None and monotonic() - start_time >= timeout
+                if timed_out or self.cancelled.is_set():
+                    process.kill()
+                    try:
+                        stdout, stderr = process.communicate(timeout=1)
+                    except subprocess.TimeoutExpired: # a child process (e.g. the adb server) keeps the pipes open
+                        stdout, stderr = b"", b""
+                    return stdout, stderr, timed_out
+
+    def start(self, args: list, cwd: str = None, **popen_kwargs) -> subprocess.Popen:
+        """
+        Starts a command without waiting for it (e.g. a terminal with `adb shell`).
+
+        Parameters
+        ----------
+        - args (`list`): The arguments of the command.
+        - cwd (`str`, optional): The folder the command is executed in. Defaults to the path of the runner.
+        - **popen_kwargs: Extra arguments for `subprocess.Popen`.
+
+        Returns
+        -------
+        - `subprocess.Popen`: The started process.
+
+        Raises
+        ------
+        - `OSError`: If the command could not be started.
+        """
+        return subprocess.Popen(self.resolve(args), cwd=cwd or self.path, **popen_kwargs)
+
+    def cancel(self) -> None:
+        """
+        Cancels the runner: the running commands are killed and the next calls return right away.
+        """
+        self.cancelled.set()
+        with self.lock:
+            processes = list(self.processes)
+        for process in processes:
+            with suppress(OSError): # already finished
+                process.kill()
+
+def cancel_all_runners() -> None:
+    """
+    Cancels every live `CommandRunner` (used when the app is closed, so no thread is left waiting for a command).
+    """
+    for runner in list(RUNNERS):
+        runner.cancel()
+
+def run_command(args: list, path: str = ".", timeout: float = ADB_TIMEOUT) -> CommandResult:
+    """
+    Runs a single command with a new `CommandRunner` (see `CommandRunner.run`).
+    """
+    return CommandRunner(path, timeout).run(args)
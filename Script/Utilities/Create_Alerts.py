@@ -1,12 +1,10 @@
 from typing import Union
-from os.path import join
 
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QDialog, QGridLayout
 
 from Script.Utilities import Create_Elements as Create
 from Script.Utilities.Utils import get_current_alert_theme
-from Theme.icon_alert import *
+from Script.Utilities.Resources import resource_icon
 
 def create_alert(
     title: str = "", 
@@ -54,7 +52,7 @@ def create_alert(
         )
     
     alert = QDialog(None)
-    alert.setWindowIcon(QIcon(join(":", "icon_alert.ico")))
+    alert.setWindowIcon(resource_icon("icon_alert.ico"))
     alert.setMinimumWidth(300)
     alert.setWindowTitle(title)
     alert.setStyleSheet(get_current_alert_theme())
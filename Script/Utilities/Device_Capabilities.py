@@ -0,0 +1,309 @@
+"""
+This module contains the capabilities of each device: its encoders, displays, cameras and apps.
+
+The lists are read once for each device (by serial) with a single `scrcpy` launch asking for every list the
+binary supports (`--list-encoders`, `--list-displays`, `--list-camera-sizes` or `--list-cameras` and `--list-apps`,
+see `Scrcpy_Capabilities`), in the shared `task_pool` as soon as the device is ready. They are cached in the user
+data (`Connect.Device_Cache`) with the build fingerprint of the device (`ro.build.fingerprint`, see `Device_Probe`),
+so the device is only asked again after a system update (or when a newer `scrcpy` can list more).
+
+The Start tab offers the choices of the cache (see `DeviceCapabilitiesManager.choices`), so an encoder or a
+camera the device does not have is never offered, and nothing is asked to the device when `scrcpy` is started.
+"""
+from re import compile as compile_pattern
+from platform import system
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Device_Probe import get_device_facts
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Scrcpy_Capabilities import get_scrcpy_capabilities
+from Script.Utilities.Settings_Store import settings_store, DEVICE_CACHE_KEYS
+from Script.Utilities.Task_Pool import task_pool, single_flight
+
+LIST_TIMEOUT = 30.0
+# the lists asked to the device, the first option supported by the binary is used for each one ↓
+LIST_OPTIONS = (
+    ("encoders", ("--list-encoders",)),
+    ("displays", ("--list-displays",)),
+    ("cameras", ("--list-camera-sizes", "--list-cameras")),
+    ("apps", ("--list-apps",)),
+)
+CAMERA_FACINGS = {
+    "back": "Back Camera",
+    "front": "Front Camera",
+    "external": "External Camera",
+}
+
+# e.g. "    --video-codec=h264 --video-encoder=c2.qti.avc.encoder    (hw) [vendor]" ↓
+ENCODER_LINE = compile_pattern(r"^\s+--(video|audio)-codec=(\w+)\s+--\1-encoder='?([^'\s]+)'?(.*)$")
+# e.g. "    --display-id=0    (1080x2340)" ↓
+DISPLAY_LINE = compile_pattern(r"^\s+--display-id=(\d+)\s+\(([^)]*)\)")
+# e.g. "    --camera-id=0    (back, 4032x3024, fps=[15, 30])" and its sizes "        - 1920x1080" ↓
+CAMERA_LINE = compile_pattern(r"^\s+--camera-id=(\S+)\s+\((\w+), (\d+x\d+)")
+CAMERA_SIZE_LINE = compile_pattern(r"^\s+- (\d+x\d+)")
+# e.g. " * Camera                com.android.camera2" (system app) or " - VLC    org.videolan.vlc" ↓
+APP_LINE = compile_pattern(r"^\s?[*-] (.*\S)\s+([\w.]+)$")
+
+class DeviceCapabilities():
+    """
+    This class holds the lists read from a device.
+
+    Parameters
+    ----------
+    - fingerprint (`str`): The build fingerprint of the device when the lists were read.
+    - listed (`list`): The lists that were asked (e.g. `["encoders", "displays"]`), a list that was not asked is empty.
+    - video_encoders (`list`): A list of `[codec, encoder]` (e.g. `["h264", "c2.qti.avc.encoder"]`).
+    - audio_encoders (`list`): A list of `[codec, encoder]` (e.g. `["opus", "c2.android.opus.encoder"]`).
+    - displays (`list`): A list of `[display_id, size]` (e.g. `["0", "1080x2340"]`).
+    - cameras (`list`): A list of `[camera_id, facing, size, sizes]` (e.g. `["0", "back", "4032x3024", ["1920x1080"]]`).
+    - apps (`list`): A list of `[name, package]` (e.g. `["VLC", "org.videolan.vlc"]`).
+    """
+    def __init__(
+        self,
+        fingerprint: str,
+        listed: list,
+        video_encoders: list = None,
+        audio_encoders: list = None,
+        displays: list = None,
+        cameras: list = None,
+        apps: list = None,
+    ):
+        self.fingerprint = fingerprint
+        self.listed = listed
+        self.video_encoders = video_encoders or []
+        self.audio_encoders = audio_encoders or []
+        self.displays = displays or []
+        self.cameras = cameras or []
+        self.apps = apps or []
+
+    @property
+    def encoder_texts(self) -> list:
+        """The encoders in the format of the combo box of the Start tab, e.g. `"(h264) c2.qti.avc.encoder"`."""
+        return [f"({codec}) {encoder}" for codec, encoder in self.video_encoders + self.audio_encoders]
+
+    def to_json(self) -> dict:
+        """Returns the capabilities as a `JSON` dictionary (see `from_json`)."""
+        return {
+            "Fingerprint": self.fingerprint,
+            "Listed": self.listed,
+            "Video_Encoders": self.video_encoders,
+            "Audio_Encoders": self.audio_encoders,
+            "Displays": self.displays,
+            "Cameras": self.cameras,
+            "Apps": self.apps,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "DeviceCapabilities":
+        """Returns the capabilities saved by `to_json`."""
+        return cls(
+            data.get("Fingerprint", ""),
+            data.get("Listed", []),
+            data.get("Video_Encoders"),
+            data.get("Audio_Encoders"),
+            data.get("Displays"),
+            data.get("Cameras"),
+            data.get("Apps"),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DeviceCapabilities({len(self.video_encoders) + len(self.audio_encoders)} encoders, "
+            f"{len(self.displays)} displays, {len(self.cameras)} cameras, {len(self.apps)} apps)"
+        )
+
+def parse_device_lists(output: str, fingerprint: str = "", listed: list = ()) -> DeviceCapabilities:
+    """
+    Parses the lists printed by `scrcpy --list-encoders --list-displays --list-cameras --list-apps` (any of them).
+
+    Parameters
+    ----------
+    - output (`str`): The output of `scrcpy`.
+    - fingerprint (`str`, optional): The build fingerprint of the device. Defaults to `""`.
+    - listed (`list`, optional): The lists that were asked. Defaults to `()`.
+
+    Returns
+    -------
+    - `DeviceCapabilities`: The lists found, the aliases of the encoders (e.g. `OMX.google.h264.encoder`) are skipped.
+    """
+    capabilities = DeviceCapabilities(fingerprint, list(listed))
+    camera = None
+    for line in output.splitlines():
+        if found := ENCODER_LINE.match(line):
+            if "alias for" not in found[4]:
+                encoders = capabilities.video_encoders if found[1] == "video" else capabilities.audio_encoders
+                encoders.append([found[2].lower(), found[3]])
+        elif found := DISPLAY_LINE.match(line):
+            capabilities.displays.append([found[1], found[2]])
+        elif found := CAMERA_LINE.match(line):
+            camera = [found[1], found[2].lower(), found[3], []]
+            capabilities.cameras.append(camera)
+        elif "high speed" in line.lower(): # the sizes of the high speed capture are not listed
+            camera = None
+        elif camera and (found := CAMERA_SIZE_LINE.match(line)):
+            if found[1] not in camera[3]:
+                camera[3].append(found[1])
+        elif found := APP_LINE.match(line):
+            capabilities.apps.append([found[1], found[2]])
+    return capabilities
+
+def list_options(path: str, runner: CommandRunner = None) -> dict:
+    """
+    Returns the option of each list supported by the `scrcpy` binary used from `path`, e.g. `{"encoders": "--list-encoders"}`.
+    """
+    if not (binary_capabilities := get_scrcpy_capabilities(path, runner)):
+        return {}
+    return {
+        name: next(option for option in options if binary_capabilities.supports(option))
+        for name, options in LIST_OPTIONS
+        if any(binary_capabilities.supports(option) for option in options)
+    }
+
+def cached_device_capabilities(serial: str) -> DeviceCapabilities:
+    """
+    Returns the capabilities cached for the device `serial` (whatever its fingerprint), or `None`.
+    """
+    if entry := (settings_store.get(DEVICE_CACHE_KEYS) or {}).get(serial):
+        return DeviceCapabilities.from_json(entry)
+    return None
+
+def get_device_capabilities(serial: str, path: str = ".", runner: CommandRunner = None) -> DeviceCapabilities:
+    """
+    Returns the capabilities of a device, launching `scrcpy` only if the device is not in the cache, its build
+    fingerprint changed, or the binary can list more than what was cached.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - runner (`CommandRunner`, optional): The runner of the commands. Defaults to a new runner in `path`.
+
+    Returns
+    -------
+    - `DeviceCapabilities`: The capabilities of the device.
+    - `None`: If the device did not answer, or the binary cannot list anything (before scrcpy 2.0).
+    """
+    if not (facts := get_device_facts(serial, path)):
+        return None
+
+    runner = runner or CommandRunner(path)
+    options = list_options(path, runner)
+    cached = cached_device_capabilities(serial)
+    if cached and cached.fingerprint == facts.fingerprint and set(options) <= set(cached.listed):
+        return cached
+    if not options:
+        return None
+
+    return single_flight(("device_capabilities", serial), read_device_capabilities, serial, facts.fingerprint, options, runner)
+
+def read_device_capabilities(serial: str, fingerprint: str, options: dict, runner: CommandRunner) -> DeviceCapabilities:
+    """
+    Reads the lists of a device with a single `scrcpy` launch and stores them in the cache (see `get_device_capabilities`).
+    """
+    result = runner.run(["scrcpy", "-s", serial, *options.values()], timeout=LIST_TIMEOUT)
+    capabilities = parse_device_lists(f"{result.stdout}\n{result.stderr}", fingerprint, list(options))
+    if not result.ok and not (capabilities.video_encoders or capabilities.displays):
+        return None
+
+    cache = dict(settings_store.get(DEVICE_CACHE_KEYS) or {})
+    cache[serial] = capabilities.to_json()
+    settings_store.set(cache, DEVICE_CACHE_KEYS)
+    return capabilities
+
+def probe_device_capabilities(serial: str, path: str) -> tuple:
+    """Returns a tuple `(serial, capabilities)`, see `get_device_capabilities` (run in the `task_pool`)."""
+    return serial, get_device_capabilities(serial, path)
+
+class DeviceCapabilitiesManager(QObject):
+    """
+    This class reads the capabilities of the devices in the background, as soon as they are ready.
+
+    Signals
+    -------
+    - `capabilities_changed` (`pyqtSignal(str)`): Emitted with the serial of a device whose capabilities were read.
+    """
+    capabilities_changed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.probing = {}
+        device_registry.device_added.connect(self.device_added)
+        device_registry.device_state_changed.connect(self.probe_device)
+
+    @pyqtSlot(dict)
+    def device_added(self, device: dict) -> None:
+        """Reads the capabilities of a new device (slot of `device_registry.device_added`)."""
+        self.probe_device(device["serial"], device["state"])
+
+    @pyqtSlot(str, str)
+    def probe_device(self, serial: str, state: str = "device") -> None:
+        """
+        Reads the capabilities of a ready device in the `task_pool`, unless they are already being read.
+
+        Parameters
+        ----------
+        - serial (`str`): The serial of the device.
+        - state (`str`, optional): The state of the device, only a `device` is probed. Defaults to `"device"`.
+        """
+        path = settings_store.scrcpy_path if system() == "Windows" else "."
+        if state != "device" or serial in self.probing or not path:
+            return
+
+        task = task_pool.submit(probe_device_capabilities, serial, path, name=f"device_capabilities {serial}")
+        self.probing[serial] = task
+        # both slots are methods of this object, so they are called in the main thread ↓
+        task.result_ready.connect(self.probe_finished)
+        task.finished.connect(self.probe_task_finished)
+
+    def probe_devices(self, devices: list) -> None:
+        """Reads the capabilities of several devices (dictionaries, see `Device_Registry`)."""
+        for device in devices:
+            self.probe_device(device["serial"], device["state"])
+
+    @pyqtSlot(object)
+    def probe_finished(self, result: tuple) -> None:
+        """Announces the capabilities read for a device (slot of the `result_ready` signal of the task)."""
+        serial, capabilities = result
+        if capabilities is not None:
+            self.capabilities_changed.emit(serial)
+
+    @pyqtSlot()
+    def probe_task_finished(self) -> None:
+        """Forgets a finished task, so the device can be probed again (e.g. after a failed read)."""
+        task = self.sender()
+        self.probing = {serial: probing for serial, probing in self.probing.items() if probing is not task}
+
+    def choices(self) -> dict:
+        """
+        Returns the choices to offer in the Start tab, from the cached capabilities of the ready devices (or of every
+        cached device when none of the ready devices is cached).
+
+        Returns
+        -------
+        - `dict`: A dictionary with the keys `encoders` (see `DeviceCapabilities.encoder_texts`), `video_sources`
+        (`"Screen"` and the facing of each camera, e.g. `"Back Camera"`) and `apps` (the packages). A key is missing
+        when no cached device listed it, so the default choices are kept.
+        """
+        cache = settings_store.get(DEVICE_CACHE_KEYS) or {}
+        serials = [device["serial"] for device in device_registry.devices("device") if device["serial"] in cache]
+        entries = [DeviceCapabilities.from_json(cache[serial]) for serial in serials or cache]
+
+        choices = {}
+        if listed := [entry for entry in entries if "encoders" in entry.listed]:
+            choices["encoders"] = unique(text for entry in listed for text in entry.encoder_texts)
+        if listed := [entry for entry in entries if "cameras" in entry.listed]:
+            facings = {camera[1] for entry in listed for camera in entry.cameras}
+            choices["video_sources"] = ["Screen"] + [
+                source for facing, source in CAMERA_FACINGS.items() if facing in facings
+            ]
+        if listed := [entry for entry in entries if "apps" in entry.listed]:
+            choices["apps"] = sorted({app[1] for entry in listed for app in entry.apps})
+        return choices
+
+def unique(items) -> list:
+    """Returns the items without the duplicates, in their first order."""
+    return list(dict.fromkeys(items))
+
+device_capabilities = DeviceCapabilitiesManager()
@@ -0,0 +1,278 @@
+"""
+This module contains the functions used to collect the facts (brand, model, Wi-Fi IP...) of the devices.
+
+Every device is asked for its facts with a single shell call (the full `getprop` dump followed by
+`ip -o addr`), parsed into a `DeviceFacts` record. The records are kept by `device_facts_cache`
+for `FACTS_TTL` seconds, and dropped as soon as the device is unplugged, disconnected or reconnected
+(see `Device_Registry`), so detecting known devices again costs no shell call at all.
+
+The devices are probed in parallel by a bounded pool of workers and every device has its own
+deadline, so a wedged device cannot stall the whole detection. The results are yielded as soon
+as each device finishes.
+"""
+from re import compile as compile_pattern
+from threading import Lock
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt5.QtCore import Qt
+
+from Script.Utilities.Adb_Client import adb_shell
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Task_Pool import single_flight
+
+PROBE_WORKERS = 8
+PROBE_TIMEOUT = 10.0
+PREFETCH_TIMEOUT = 3.0
+FACTS_TTL = 600.0
+FACTS_COMMAND = "getprop; ip -o addr"
+
+GETPROP_LINE = compile_pattern(r"^\[([^\]]+)\]: \[(.*)\]$")
+IP_ADDR_LINE = compile_pattern(r"^\d+:\s+(\S+)\s+inet\s+([\d.]+)/")
+
+class DeviceFacts():
+    """
+    This class holds the facts of a device, parsed from a single `getprop; ip -o addr` call.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - properties (`dict`): The system properties of the device (`getprop`).
+    - addresses (`dict`): The IPv4 address of each network interface (`ip -o addr`), e.g. `{"wlan0": "192.168.0.10"}`.
+    - transport_id (`str`, optional): The transport id of the device when the facts were collected. Defaults to `""`.
+    """
+    def __init__(self, serial: str, properties: dict, addresses: dict, transport_id: str = ""):
+        self.serial = serial
+        self.properties = properties
+        self.addresses = addresses
+        self.transport_id = transport_id
+        self.brand = properties.get("ro.product.brand", "")
+        self.model = properties.get("ro.product.model", "")
+        self.manufacturer = properties.get("ro.product.manufacturer", "")
+        self.android_version = properties.get("ro.build.version.release", "")
+        self.sdk = int(sdk) if (sdk := properties.get("ro.build.version.sdk", "")).isdigit() else 0
+        self.abi = properties.get("ro.product.cpu.abi", "")
+        self.fingerprint = properties.get("ro.build.fingerprint", "")
+        self.wifi_ip = addresses.get("wlan0", "")
+
+    @property
+    def name(self) -> str:
+        """The name shown to the user, in the format `"Brand (Model)"`."""
+        return f"{self.brand.title()} ({self.model.title()})"
+
+    def __repr__(self) -> str:
+        return f"DeviceFacts({self.serial!r}, {self.name!r}, wifi_ip={self.wifi_ip!r})"
+
+def parse_device_facts(serial: str, output: str, transport_id: str = "") -> DeviceFacts:
+    """
+    Parses the output of `getprop; ip -o addr` into a `DeviceFacts` record.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - output (`str`): The output of the shell call.
+    - transport_id (`str`, optional): The transport id of the device. Defaults to `""`.
+
+    Returns
+    -------
+    - `DeviceFacts`: The parsed facts, the lines that are not a property or an IPv4 address are ignored.
+    """
+    properties = {}
+    addresses = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if match := GETPROP_LINE.match(line):
+            properties[match[1]] = match[2]
+        elif match := IP_ADDR_LINE.match(line):
+            addresses.setdefault(match[1], match[2])
+    return DeviceFacts(serial, properties, addresses, transport_id)
+
+class DeviceFactsCache():
+    """
+    This class keeps the `DeviceFacts` of each device in memory for `ttl` seconds.
+
+    A record is only returned while the device keeps the transport id it had when the facts were collected,
+    a new transport id means the device was reconnected (and may even be a different device behind the same IP).
+
+    Parameters
+    ----------
+    - ttl (`float`, optional): The time (in seconds) a record is kept. Defaults to `FACTS_TTL`.
+    """
+    def __init__(self, ttl: float = FACTS_TTL):
+        self.ttl = ttl
+        self.lock = Lock()
+        self.records = {}
+
+    def get(self, serial: str) -> DeviceFacts:
+        """
+        Returns the cached facts of the device `serial`, or `None` if they are missing or stale.
+        """
+        with self.lock:
+            facts, expires_at = self.records.get(serial, (None, 0))
+        if facts is None or monotonic() > expires_at:
+            return None
+
+        device = device_registry.get(serial)
+        if device and device["transport_id"] != facts.transport_id:
+            self.invalidate(serial)
+            return None
+        return facts
+
+    def put(self, facts: DeviceFacts) -> None:
+        """Stores the facts of a device."""
+        with self.lock:
+            self.records[facts.serial] = (facts, monotonic() + self.ttl)
+
+    def invalidate(self, serial: str, *_) -> None:
+        """
+        Drops the facts of the device `serial`.
+
+        The extra arguments are ignored, so this function can be connected to `device_state_changed`.
+        """
+        with self.lock:
+            self.records.pop(serial, None)
+
+    def clear(self) -> None:
+        """Drops the facts of every device."""
+        with self.lock:
+            self.records.clear()
+
+device_facts_cache = DeviceFactsCache()
+device_registry.device_removed.connect(device_facts_cache.invalidate, Qt.DirectConnection)
+device_registry.device_state_changed.connect(device_facts_cache.invalidate, Qt.DirectConnection)
+
+def get_device_facts(
+    serial: str,
+    path: str = ".",
+    timeout: float = PROBE_TIMEOUT,
+    refresh: bool = False,
+) -> DeviceFacts:
+    """
+    Returns the facts of a device, from the cache when possible.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - timeout (`float`, optional): The time (in seconds) the shell call can take. Defaults to `PROBE_TIMEOUT`.
+    - refresh (`bool`, optional): If `True`, the cache is ignored and the facts are collected again. Defaults to `False`.
+    A device asked by several callers at the same time is only probed once.
+
+    Returns
+    -------
+    - `DeviceFacts`: The facts of the device.
+    - `None`: If the device did not answer in time (or is not available).
+    """
+    if not refresh and (facts := device_facts_cache.get(serial)):
+        return facts
+
+    return single_flight(("device_facts", serial), fetch_device_facts, serial, path, timeout)
+
+def fetch_device_facts(serial: str, path: str = ".", timeout: float = PROBE_TIMEOUT) -> DeviceFacts:
+    """
+    Collects the facts of a device with a single shell call and stores them in the cache (see `get_device_facts`).
+    """
+    device = device_registry.get(serial)
+    output, error = adb_shell(serial, FACTS_COMMAND, path, timeout=timeout)
+    if error or not output.strip():
+        return None
+
+    facts = parse_device_facts(serial, output, device["transport_id"] if device else "")
+    if facts.properties:
+        device_facts_cache.put(facts)
+    return facts
+
+def collect_device_facts(
+    serials: list,
+    path: str = ".",
+    workers: int = PROBE_WORKERS,
+    timeout: float = PROBE_TIMEOUT,
+):
+    """
+    Collects the facts of several devices in parallel and yields them as each device finishes.
+
+    The devices already in the cache are yielded first, without using the pool.
+
+    Parameters
+    ----------
+    - serials (`list`): The serials of the devices.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - workers (`int`, optional): The maximum number of devices probed at the same time. Defaults to `PROBE_WORKERS`.
+    - timeout (`float`, optional): The time (in seconds) each device can take. Defaults to `PROBE_TIMEOUT`.
+
+    Yields
+    ------
+    - `DeviceFacts`: The facts of each device that answered in time.
+    """
+    missing_serials = []
+    for serial in serials:
+        if facts := device_facts_cache.get(serial):
+            yield facts
+        else:
+            missing_serials.append(serial)
+
+    if not missing_serials:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missing_serials)))) as pool:
+        futures = [
+            pool.submit(get_device_facts, serial, path, timeout, True) for serial in missing_serials
+        ]
+        for future in as_completed(futures):
+            if facts := future.result():
+                yield facts
+
+def probe_devices(
+    serials: list,
+    path: str = ".",
+    workers: int = PROBE_WORKERS,
+    timeout: float = PROBE_TIMEOUT,
+):
+    """
+    Probes several devices in parallel and yields the ones with a Wi-Fi IP address as each device finishes.
+
+    Parameters
+    ----------
+    - serials (`list`): The serials of the devices to probe.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - workers (`int`, optional): The maximum number of devices probed at the same time. Defaults to `PROBE_WORKERS`.
+    - timeout (`float`, optional): The time (in seconds) each device can take. Defaults to `PROBE_TIMEOUT`.
+
+    Yields
+    ------
+    - `list`: A list `[ip, "Brand (Model)", serial]` for each device with a Wi-Fi IP address.
+    """
+    for facts in collect_device_facts(serials, path, workers, timeout):
+        if facts.wifi_ip:
+            yield [facts.wifi_ip, facts.name, facts.serial]
+
+def prefetch_device_facts(devices: list, path: str = ".", timeout: float = PREFETCH_TIMEOUT) -> None:
+    """
+    Fills the cache with the facts of the ready devices, so the pickers can label them (see `device_label`).
+
+    Parameters
+    ----------
+    - devices (`list`): The devices (dictionaries, see `Device_Registry`), only the ones in the `device` state are probed.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - timeout (`float`, optional): The time (in seconds) each device can take, kept short because
+    the picker waits for it. Defaults to `PREFETCH_TIMEOUT`.
+    """
+    serials = [device["serial"] for device in devices if device["state"] == "device"]
+    for _ in collect_device_facts(serials, path, timeout=timeout):
+        pass
+
+def device_label(serial: str) -> str:
+    """
+    Returns the label of a device for the pickers, using only the cache (no shell call).
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+
+    Returns
+    -------
+    - `str`: `"Brand (Model)"` if the facts of the device are cached, otherwise the serial.
+    """
+    if facts := device_facts_cache.get(serial):
+        return facts.name
+    return serial
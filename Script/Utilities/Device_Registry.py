@@ -0,0 +1,113 @@
+"""
+This module contains the live registry of the devices known by `ADB`.
+
+The registry is fed by the `DeviceTracker_Thread` (a `host:track-devices-l` stream kept open with
+the `ADB` server), so threads and dialogs can read the current devices from memory instead of
+asking the server (or spawning `adb devices`) every time.
+
+Every change is also announced through Qt signals:
+
+- `device_added` (`pyqtSignal(dict)`): Emitted with the infos of a new device.
+- `device_removed` (`pyqtSignal(str)`): Emitted with the serial of a device that is gone.
+- `device_state_changed` (`pyqtSignal(str, str)`): Emitted with the serial and the new state of a device
+(e.g. `device` -> `offline`).
+"""
+from threading import Lock
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from Script.Utilities.Adb_Client import list_devices
+from Script.Utilities.Task_Pool import single_flight
+
+class DeviceRegistry(QObject):
+    """
+    This class keeps the devices known by `ADB` in memory and announces every change.
+
+    The devices are stored by serial, each one as a dictionary with the keys `serial`, `state`,
+    `model` and `transport_id` (see `Adb_Client.parse_devices_l`).
+    """
+    device_added = pyqtSignal(dict)
+    device_removed = pyqtSignal(str)
+    device_state_changed = pyqtSignal(str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.lock = Lock()
+        self.known_devices = {}
+        self.tracking = False
+
+    def update(self, devices: list) -> None:
+        """
+        Replaces the known devices and emits the signals for everything that changed.
+
+        Parameters
+        ----------
+        - devices (`list`): The full list of devices sent by the `ADB` server.
+        """
+        new_devices = {device["serial"]: device for device in devices}
+        with self.lock:
+            old_devices = self.known_devices
+            self.known_devices = new_devices
+            self.tracking = True
+
+        for serial, device in new_devices.items():
+            if serial not in old_devices:
+                self.device_added.emit(device)
+            elif old_devices[serial]["state"] != device["state"]:
+                self.device_state_changed.emit(serial, device["state"])
+
+        for serial in old_devices.keys() - new_devices.keys():
+            self.device_removed.emit(serial)
+
+    def stop_tracking(self) -> None:
+        """
+        Marks the registry as not live (the tracker lost the `ADB` server).
+
+        The known devices are kept, but `get_devices` goes back to asking the server until
+        the tracker feeds the registry again.
+        """
+        with self.lock:
+            self.tracking = False
+
+    def devices(self, state: str = None) -> list:
+        """
+        Returns the known devices.
+
+        Parameters
+        ----------
+        - state (`str`, optional): If given, only the devices in this state are returned (e.g. `device`).
+
+        Returns
+        -------
+        - `list`: A list of dictionaries with the infos of each device.
+        """
+        with self.lock:
+            devices = list(self.known_devices.values())
+        return [device for device in devices if state is None or device["state"] == state]
+
+    def get(self, serial: str) -> dict:
+        """Returns the infos of the device `serial`, or `None` if it is not known."""
+        with self.lock:
+            return self.known_devices.get(serial)
+
+device_registry = DeviceRegistry()
+
+def get_devices(path: str = ".") -> list:
+    """
+    Returns the devices known by `ADB`.
+
+    If the `DeviceTracker_Thread` is feeding the registry, the devices are read from memory,
+    otherwise the `ADB` server is asked directly (see `Adb_Client.list_devices`), once for all
+    the callers asking at the same time (see `Task_Pool.single_flight`).
+
+    Parameters
+    ----------
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder, used by the fallback. Defaults to `"."`.
+
+    Returns
+    -------
+    - `list`: A list of dictionaries with the infos of each device.
+    """
+    if device_registry.tracking:
+        return device_registry.devices()
+    return single_flight(("list_devices", path), list_devices, path)
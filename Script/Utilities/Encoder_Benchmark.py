@@ -0,0 +1,236 @@
+"""
+This module contains the benchmark of the video encoders of a device, and the choice of the fastest one.
+
+Every video encoder listed by the device (see `Device_Capabilities`) is tried for each maximum size of
+`BENCHMARK_MAX_SIZES`, with a short `scrcpy` run that does not show anything (`BENCHMARK_ARGS`, the options the
+binary does not support are left out) and stops after `BENCHMARK_TIME_LIMIT` seconds. The frame rates printed
+by `--print-fps` (e.g. `INFO: 58 fps`) are averaged, the first one is skipped (the encoder is still starting).
+
+The results are saved in the user data (`Connect.Encoder_Benchmarks`) by build fingerprint of the device, so
+they are kept when the device changes of serial (e.g. USB and Wi-Fi) and dropped with a system update.
+
+The Start tab offers `AUTO_ENCODER_TEXT` in the encoders once a device was measured, the command then has the
+`AUTO_ENCODER_ARG` placeholder, replaced by the fastest measured encoder of the device when the session is started
+(see `resolve_auto_encoder`).
+"""
+from re import compile as compile_pattern
+from datetime import datetime
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Device_Probe import device_facts_cache, get_device_facts
+from Script.Utilities.Device_Capabilities import get_device_capabilities
+from Script.Utilities.Scrcpy_Capabilities import get_scrcpy_capabilities
+from Script.Utilities.Settings_Store import settings_store, ENCODER_BENCHMARK_KEYS
+from Script.Utilities.Static_Datas import AUTO_ENCODER_ARG
+
+BENCHMARK_TIME_LIMIT = 5
+BENCHMARK_MAX_SIZES = (1920, 1280)
+BENCHMARK_ARGS = ("--no-playback", "--no-window", "--no-audio", "--print-fps")
+# the time (in seconds) a trial can take after its time limit (start of scrcpy, push of the server) ↓
+TRIAL_GRACE_TIME = 20.0
+
+FPS_LINE = compile_pattern(r"\b(\d+) fps\b")
+MAX_SIZE_ARGS = ("-m", "--max-size")
+
+class BenchmarkTrial():
+    """
+    This class holds the result of a trial of an encoder.
+
+    Parameters
+    ----------
+    - codec (`str`): The codec (e.g. `h264`).
+    - encoder (`str`): The name of the encoder (e.g. `c2.qti.avc.encoder`).
+    - max_size (`int`): The maximum size of the video.
+    - samples (`list`): The frame rates printed by `scrcpy`, one by second.
+    - error (`str`, optional): The last line of `scrcpy` if the trial failed. Defaults to `""`.
+    """
+    def __init__(self, codec: str, encoder: str, max_size: int, samples: list, error: str = ""):
+        self.codec = codec
+        self.encoder = encoder
+        self.max_size = max_size
+        self.samples = samples
+        self.error = error
+
+    @property
+    def fps(self) -> float:
+        """The average frame rate, without the first second (`0.0` if nothing was measured)."""
+        samples = self.samples[1:] or self.samples
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def to_json(self) -> list:
+        """Returns the trial as a `JSON` list `[codec, encoder, max_size, fps, samples, error]` (see `from_json`)."""
+        return [self.codec, self.encoder, self.max_size, round(self.fps, 2), self.samples, self.error]
+
+    @classmethod
+    def from_json(cls, data: list) -> "BenchmarkTrial":
+        """Returns the trial saved by `to_json`."""
+        codec, encoder, max_size, _fps, samples, error = data
+        return cls(codec, encoder, max_size, samples, error)
+
+    def __repr__(self) -> str:
+        return f"BenchmarkTrial({self.codec} {self.encoder} -m {self.max_size}: {self.fps:.1f} fps)"
+
+def parse_fps(output: str) -> list:
+    """
+    Returns the frame rates printed by `scrcpy --print-fps` (e.g. `INFO: 58 fps` or `INFO: 58 fps (+2 frames skipped)`).
+    """
+    return [int(found[1]) for line in output.splitlines() if (found := FPS_LINE.search(line))]
+
+def benchmark_args(path: str, runner: CommandRunner = None) -> list:
+    """
+    Returns the options of `BENCHMARK_ARGS` supported by the `scrcpy` binary used from `path` (all of them if unknown).
+    """
+    if not (capabilities := get_scrcpy_capabilities(path, runner)):
+        return list(BENCHMARK_ARGS)
+    return [arg for arg in BENCHMARK_ARGS if capabilities.supports(arg)]
+
+def run_trial(
+    serial: str,
+    codec: str,
+    encoder: str,
+    max_size: int,
+    runner: CommandRunner,
+    time_limit: int = BENCHMARK_TIME_LIMIT,
+    args: list = BENCHMARK_ARGS,
+) -> BenchmarkTrial:
+    """
+    Measures the frame rate of an encoder of a device with a short `scrcpy` run.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - codec (`str`): The codec of the encoder (e.g. `h264`).
+    - encoder (`str`): The name of the encoder.
+    - max_size (`int`): The maximum size of the video.
+    - runner (`CommandRunner`): The runner of the command (it can be cancelled from another thread).
+    - time_limit (`int`, optional): The duration (in seconds) of the trial. Defaults to `BENCHMARK_TIME_LIMIT`.
+    - args (`list`, optional): The options of the trial (see `benchmark_args`). Defaults to `BENCHMARK_ARGS`.
+
+    Returns
+    -------
+    - `BenchmarkTrial`: The frame rates measured, with the error of `scrcpy` if nothing was measured.
+    """
+    result = runner.run(
+        [
+            "scrcpy", "-s", serial, *args, f"--time-limit={time_limit}",
+            f"--video-codec={codec}", f"--video-encoder={encoder}", f"--max-size={max_size}",
+        ],
+        timeout=time_limit + TRIAL_GRACE_TIME,
+    )
+    output = f"{result.stdout}\n{result.stderr}"
+    samples = parse_fps(output)
+    error = "" if samples else (output.strip().splitlines() or ["no frame rate printed"])[-1]
+    return BenchmarkTrial(codec, encoder, max_size, samples, error)
+
+def run_benchmark(
+    serial: str,
+    path: str = ".",
+    runner: CommandRunner = None,
+    max_sizes: tuple = BENCHMARK_MAX_SIZES,
+    time_limit: int = BENCHMARK_TIME_LIMIT,
+    progress = None,
+) -> list:
+    """
+    Measures every video encoder of a device for each maximum size, one trial at a time, and saves the results.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - path (`str`, optional): The path to the `scrcpy`/`adb` folder. Defaults to `"."`.
+    - runner (`CommandRunner`, optional): The runner of the commands. Defaults to a new runner in `path`.
+    - max_sizes (`tuple`, optional): The maximum sizes tried. Defaults to `BENCHMARK_MAX_SIZES`.
+    - time_limit (`int`, optional): The duration (in seconds) of each trial. Defaults to `BENCHMARK_TIME_LIMIT`.
+    - progress (`callable`, optional): Called with `(done, total, trial)` after each trial. Defaults to `None`.
+
+    Returns
+    -------
+    - `list`: The `BenchmarkTrial` of each encoder and size, an empty list if the device has no listed encoder.
+    """
+    runner = runner or CommandRunner(path)
+    facts = get_device_facts(serial, path)
+    capabilities = get_device_capabilities(serial, path, runner)
+    if not facts or not capabilities or not capabilities.video_encoders:
+        return []
+
+    args = benchmark_args(path, runner)
+    combinations = [
+        (codec, encoder, max_size) for codec, encoder in capabilities.video_encoders for max_size in max_sizes
+    ]
+    trials = []
+    for codec, encoder, max_size in combinations:
+        if runner.cancelled.is_set():
+            break
+        trials.append(run_trial(serial, codec, encoder, max_size, runner, time_limit, args))
+        if progress:
+            progress(len(trials), len(combinations), trials[-1])
+
+    if any(trial.samples for trial in trials):
+        save_benchmark(serial, facts.fingerprint, trials, time_limit)
+    return trials
+
+def save_benchmark(serial: str, fingerprint: str, trials: list, time_limit: int) -> None:
+    """Saves the trials of a device by fingerprint, in place of its previous benchmark."""
+    benchmarks = dict(settings_store.get(ENCODER_BENCHMARK_KEYS) or {})
+    benchmarks[fingerprint] = {
+        "Serial": serial,
+        "Date": datetime.now().isoformat(timespec="seconds"),
+        "Time_Limit": time_limit,
+        "Trials": [trial.to_json() for trial in trials],
+    }
+    settings_store.set(benchmarks, ENCODER_BENCHMARK_KEYS)
+
+def benchmark_trials(serial: str) -> list:
+    """
+    Returns the trials saved for a device (by the fingerprint of its cached facts, or else by its serial), or an empty list.
+    """
+    benchmarks = settings_store.get(ENCODER_BENCHMARK_KEYS) or {}
+    if facts := device_facts_cache.get(serial):
+        benchmark = benchmarks.get(facts.fingerprint)
+    else:
+        benchmark = next((entry for entry in benchmarks.values() if entry.get("Serial") == serial), None)
+    return [BenchmarkTrial.from_json(trial) for trial in (benchmark or {}).get("Trials", [])]
+
+def fastest_trial(trials: list, max_size: int = None) -> BenchmarkTrial:
+    """
+    Returns the trial with the highest frame rate, at the maximum size the closest to `max_size` (if given), or `None`.
+    """
+    measured = [trial for trial in trials if trial.samples]
+    if not measured:
+        return None
+    if max_size:
+        closest_size = min({trial.max_size for trial in measured}, key=lambda size: abs(size - max_size))
+        measured = [trial for trial in measured if trial.max_size == closest_size]
+    return max(measured, key=lambda trial: trial.fps)
+
+def has_benchmarks() -> bool:
+    """Returns `True` if a device was measured (the Start tab then offers `AUTO_ENCODER_TEXT`)."""
+    return bool(settings_store.get(ENCODER_BENCHMARK_KEYS))
+
+def resolve_auto_encoder(serial: str, args: list) -> list:
+    """
+    Replaces `AUTO_ENCODER_ARG` in the arguments of `scrcpy` by the fastest encoder measured for the device.
+
+    Parameters
+    ----------
+    - serial (`str`): The serial of the device.
+    - args (`list`): The arguments of the command (the maximum size, `-m` or `--max-size`, chooses the trials compared).
+
+    Returns
+    -------
+    - `list`: The arguments, without the placeholder (the encoder of `scrcpy` is used) if the device was not measured.
+    """
+    if AUTO_ENCODER_ARG not in args:
+        return args
+
+    max_size = None
+    for index, arg in enumerate(args):
+        name, _, value = arg.partition("=")
+        if name in MAX_SIZE_ARGS:
+            value = value or (args[index + 1] if index + 1 < len(args) else "")
+            max_size = int(value) if value.isdigit() else None
+
+    resolved = []
+    if trial := fastest_trial(benchmark_trials(serial), max_size):
+        resolved = [f"--video-codec={trial.codec}", f"--video-encoder={trial.encoder}"]
+    index = args.index(AUTO_ENCODER_ARG)
+    return args[:index] + resolved + args[index + 1:]
@@ -0,0 +1,161 @@
+"""
+This module contains the classifier of the errors printed by `scrcpy` and `adb`.
+
+The known errors are declared in `Static_Datas.ERROR_CATALOGUE` (group, code, severity and patterns)
+and compiled once into a single regular expression, so an output is scanned in one pass whatever
+the number of known errors. The classifier only returns `ErrorMatch` records, showing them to the
+user is done separately (see `Auxiliary_Funcs.alert_error`), so it can also be used without a UI.
+
+Groups of errors:
+
+- `arguments`: Invalid arguments or values given to `scrcpy`.
+- `device`: Errors of the device (not found, offline, unauthorized...).
+- `combination`: Arguments of `scrcpy` that cannot be used together.
+- `connect` and `tcpip`: Errors printed by `adb connect` and `adb tcpip`.
+"""
+from re import compile as compile_pattern, escape
+
+from Script.Utilities.Static_Datas import ERROR_CATALOGUE, ERROR_MESSAGES
+
+class ErrorMatch():
+    """
+    This class holds an error found in an output.
+
+    Parameters
+    ----------
+    - group (`str`): The group of the error (e.g. `arguments`, `device`).
+    - code (`str`): The code of the error, also the key of its alert in `ERROR_MESSAGES`.
+    - severity (`str`): The severity of the error (`error`, `warning` or `info`).
+    - text (`str`): The text that matched.
+    - priority (`int`): The position of the error in the catalogue (the lower, the more important).
+    """
+    def __init__(self, group: str, code: str, severity: str, text: str, priority: int):
+        self.group = group
+        self.code = code
+        self.severity = severity
+        self.text = text
+        self.priority = priority
+
+    @property
+    def message_key(self) -> str:
+        """The key of the alert (title and message) of the error in `ERROR_MESSAGES`."""
+        return self.code
+
+    @property
+    def message(self) -> tuple:
+        """The alert of the error, a tuple `(title, message)`."""
+        return ERROR_MESSAGES[self.message_key]
+
+    def __repr__(self) -> str:
+        return f"ErrorMatch({self.group!r}, {self.code!r}, {self.severity!r}, {self.text!r})"
+
+def trie_pattern(texts: list) -> str:
+    """
+    Returns a regular expression matching any of `texts`, with the common prefixes merged
+    (e.g. `could not (?:find any adb|parse)`), so each position of the output is checked once
+    instead of once for each text.
+
+    Parameters
+    ----------
+    - texts (`list`): The texts to match.
+    """
+    trie = {}
+    for text in texts:
+        node = trie
+        for char in text:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def node_pattern(node: dict) -> str:
+        branches = [escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node: # a text ends here, the longer ones are optional
+            pattern = f"(?:{pattern})?"
+        return pattern
+
+    return node_pattern(trie)
+
+class ErrorClassifier():
+    """
+    This class finds the known errors of an output in a single pass.
+
+    Parameters
+    ----------
+    - catalogue (`list`, optional): A list of tuples `(group, code, severity, patterns)`, in order of priority,
+    a pattern is a text or a tuple of texts found in this order on the same line. Defaults to `ERROR_CATALOGUE`.
+    """
+    def __init__(self, catalogue: list = ERROR_CATALOGUE):
+        self.entries = []
+        self.texts = {}
+        self.sequences = {}
+        for priority, (group, code, severity, patterns) in enumerate(catalogue):
+            self.entries.append((group, code, severity))
+            for pattern in patterns:
+                # the same pattern can be used by several groups (e.g. "timed out") ↓
+                if isinstance(pattern, str):
+                    self.texts.setdefault(pattern.lower(), []).append(priority)
+                else:
+                    pattern = tuple(part.lower() for part in pattern)
+                    self.sequences.setdefault(pattern, []).append(priority)
+
+        self.sequence_patterns = {
+            sequence: compile_pattern(r"[^\n]*?".join(escape(part) for part in sequence))
+            for sequence in self.sequences
+        }
+        alternatives = [trie_pattern(self.texts), *(pattern.pattern for pattern in self.sequence_patterns.values())]
+        # a lookahead, so a match does not hide another one that starts inside it ↓
+        self.pattern = compile_pattern(f"(?=({'|'.join(alternatives)}))")
+
+    def classify(self, text: str, groups=None) -> list:
+        """
+        Returns every known error found in `text` (the case is ignored).
+
+        Parameters
+        ----------
+        - text (`str`): The output to check (e.g. the `stderr` of `scrcpy`).
+        - groups (`str` | `tuple`, optional): The groups of errors to look for. Defaults to all the groups.
+
+        Returns
+        -------
+        - `list`: A list of `ErrorMatch` (each code only once), sorted by priority.
+        """
+        if isinstance(groups, str):
+            groups = (groups,)
+
+        text = text.lower()
+        matches = {}
+        for found in self.pattern.finditer(text):
+            for matched_text, priorities in self.found_patterns(text, found.start(), found[1]):
+                for priority in priorities:
+                    group, code, severity = self.entries[priority]
+                    if priority not in matches and (groups is None or group in groups):
+                        matches[priority] = ErrorMatch(group, code, severity, matched_text, priority)
+        return [matches[priority] for priority in sorted(matches)]
+
+    def found_patterns(self, text: str, position: int, matched_text: str):
+        """
+        Yields the patterns that match at `position` (the longest text hides the shorter ones starting with it).
+
+        Yields
+        ------
+        - `tuple`: A tuple `(matched_text, priorities)` for each pattern.
+        """
+        for end in range(1, len(matched_text) + 1):
+            if (prefix := matched_text[:end]) in self.texts:
+                yield prefix, self.texts[prefix]
+
+        for sequence, pattern in self.sequence_patterns.items():
+            if text.startswith(sequence[0], position) and (found := pattern.match(text, position)):
+                yield found[0], self.sequences[sequence]
+
+    def first_error(self, text: str, groups=None) -> ErrorMatch:
+        """
+        Returns the most important known error found in `text` (see `classify`), or `None`.
+        """
+        if matches := self.classify(text, groups):
+            return matches[0]
+        return None
+
+error_classifier = ErrorClassifier()
@@ -0,0 +1,257 @@
+"""
+This module contains the live table of the wireless debugging services advertised over mDNS (Android 11+).
+
+When wireless debugging is on, a device advertises its connect endpoint (`_adb-tls-connect._tcp`), and while
+its "Pair device with pairing code" dialog is open, its pairing endpoint (`_adb-tls-pairing._tcp`, on a new
+port every time). The table is fed by the `MdnsBrowser_Thread` (the mDNS packets seen on the network), so the
+Wi-Fi debug form can be filled at once, without running `adb mdns services` in a loop.
+
+The records of a service (DNS-SD) can come in several packets:
+
+- `PTR` `<type>.local` -> `<instance>.<type>.local`: the service exists.
+- `SRV` `<instance>.<type>.local` -> the port and the host name of the device.
+- `A` `<host>.local` -> the IP of the device.
+
+A service is listed once its 3 records are known, and removed when a record is withdrawn (TTL `0`) or expires.
+Every change is announced through Qt signals:
+
+- `service_added` (`pyqtSignal(dict)`): Emitted with a new (or moved, e.g. new port) service.
+- `service_removed` (`pyqtSignal(str)`): Emitted with the name of a service that is gone.
+"""
+import socket
+import struct
+from threading import Lock
+from time import monotonic
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+MDNS_GROUP = "224.0.0.251"
+MDNS_PORT = 5353
+PAIRING_SERVICE = "_adb-tls-pairing._tcp.local"
+CONNECT_SERVICE = "_adb-tls-connect._tcp.local"
+SERVICE_KINDS = {PAIRING_SERVICE: "pairing", CONNECT_SERVICE: "connect"}
+
+TYPE_A = 1
+TYPE_PTR = 12
+TYPE_SRV = 33
+CLASS_IN = 1
+MAX_POINTERS = 32
+
+class DnsRecord():
+    """
+    This class holds a resource record of a DNS packet (only the types used by DNS-SD are decoded).
+
+    Parameters
+    ----------
+    - name (`str`): The name of the record (without the final dot).
+    - rtype (`int`): The type of the record (`TYPE_A`, `TYPE_PTR`, `TYPE_SRV`...).
+    - ttl (`int`): The time (in seconds) the record is valid, `0` if it is withdrawn.
+    - data (`any`): The IP (`A`), the target name (`PTR`), `(port, target)` (`SRV`) or `None`.
+    """
+    def __init__(self, name: str, rtype: int, ttl: int, data = None):
+        self.name = name
+        self.rtype = rtype
+        self.ttl = ttl
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"DnsRecord({self.name!r}, {self.rtype}, {self.ttl}, {self.data!r})"
+
+def read_name(packet: bytes, offset: int) -> tuple:
+    """
+    Reads a (maybe compressed) name of a DNS packet.
+
+    Returns
+    -------
+    - `tuple`: `(name, offset)`, the offset being the one after the name where it started.
+
+    Raises
+    ------
+    - `ValueError`: If the name goes out of the packet or loops.
+    """
+    labels = []
+    end = None
+    for _ in range(MAX_POINTERS):
+        length = packet[offset]
+        if length & 0xC0 == 0xC0: # pointer to a name written before ↓
+            end = offset + 2 if end is None else end
+            offset = struct.unpack_from("!H", packet, offset)[0] & 0x3FFF
+            continue
+        offset += 1
+        if length == 0:
+            return ".".join(labels), end if end is not None else offset
+        if offset + length > len(packet):
+            raise ValueError("label out of the packet")
+        labels.append(packet[offset:offset + length].decode("utf-8", "replace"))
+        offset += length
+    raise ValueError("too many pointers in a name")
+
+def parse_dns_packet(packet: bytes) -> list:
+    """
+    Returns the resource records (answers, authority and additional) of a DNS packet.
+
+    Raises
+    ------
+    - `ValueError`: If the packet is malformed.
+    """
+    try:
+        _, _, questions, *counts = struct.unpack_from("!6H", packet)
+        offset = 12
+        for _ in range(questions):
+            offset = read_name(packet, offset)[1] + 4
+
+        records = []
+        for _ in range(sum(counts)):
+            name, offset = read_name(packet, offset)
+            rtype, rclass, ttl, length = struct.unpack_from("!HHIH", packet, offset)
+            offset += 10
+            if offset + length > len(packet):
+                raise ValueError("record out of the packet")
+            data = None
+            if rtype == TYPE_A and length == 4:
+                data = socket.inet_ntoa(packet[offset:offset + 4])
+            elif rtype == TYPE_PTR:
+                data = read_name(packet, offset)[0]
+            elif rtype == TYPE_SRV:
+                port = struct.unpack_from("!H", packet, offset + 4)[0]
+                data = (port, read_name(packet, offset + 6)[0])
+            records.append(DnsRecord(name, rtype, ttl, data))
+            offset += length
+        return records
+    except (IndexError, struct.error) as error:
+        raise ValueError(f"malformed packet: {error}")
+
+def encode_name(name: str) -> bytes:
+    """Returns a name encoded for a DNS packet (without compression)."""
+    return b"".join(bytes([len(label)]) + label for label in (part.encode() for part in name.split("."))) + b"\0"
+
+def build_query(service_types: tuple = (PAIRING_SERVICE, CONNECT_SERVICE)) -> bytes:
+    """Returns an mDNS query for the `PTR` records of the services."""
+    header = struct.pack("!6H", 0, 0, len(service_types), 0, 0, 0)
+    return header + b"".join(encode_name(name) + struct.pack("!HH", TYPE_PTR, CLASS_IN) for name in service_types)
+
+def service_serial(instance: str) -> str:
+    """Returns the serial in the name of a service instance (e.g. `adb-R5CT3-AbCdEf` -> `R5CT3`), if any."""
+    if instance.startswith("adb-") and instance.count("-") >= 2:
+        return instance[4:].rpartition("-")[0]
+    return ""
+
+class MdnsServices(QObject):
+    """
+    This class keeps the wireless debugging services seen over mDNS in memory and announces every change.
+
+    The services are stored by name (e.g. `adb-r5ct3-abcdef._adb-tls-pairing._tcp.local`), each one as a dictionary
+    with the keys `name`, `kind` (`"pairing"` or `"connect"`), `serial`, `ip`, `port` and `seen` (the time it was
+    first announced at this address, see `time.monotonic`).
+    """
+    service_added = pyqtSignal(dict)
+    service_removed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.lock = Lock()
+        self.pointers = {}
+        self.targets = {}
+        self.addresses = {}
+        self.known_services = {}
+
+    def update(self, packet: bytes) -> None:
+        """
+        Applies the records of an mDNS packet and emits the signals for every service that changed.
+
+        Parameters
+        ----------
+        - packet (`bytes`): The packet received on the mDNS group (the queries and the packets that are not DNS are ignored).
+        """
+        if len(packet) < 12 or not packet[2] & 0x80: # not a response ↓
+            return
+        try:
+            records = parse_dns_packet(packet)
+        except ValueError:
+            return
+        now = monotonic()
+        with self.lock:
+            for record in records:
+                # the names are compared without case (DNS), but kept as sent (the serial is in the instance name) ↓
+                if record.rtype == TYPE_PTR and record.name.lower() in SERVICE_KINDS:
+                    self.store(self.pointers, record.data, record, now, record.name.lower())
+                elif record.rtype == TYPE_SRV and record.name.lower().endswith(tuple(SERVICE_KINDS)):
+                    self.store(self.targets, record.name, record, now, record.data)
+                elif record.rtype == TYPE_A:
+                    self.store(self.addresses, record.name, record, now, record.data)
+        self.refresh(now)
+
+    @staticmethod
+    def store(table: dict, key: str, record: DnsRecord, now: float, value) -> None:
+        """Keeps a value until its record expires, or forgets it if the record is withdrawn."""
+        if record.ttl == 0:
+            table.pop(key, None)
+        else:
+            table[key] = (value, now + record.ttl)
+
+    def expire(self) -> None:
+        """Forgets the records whose TTL is over (called regularly by the browser)."""
+        now = monotonic()
+        with self.lock:
+            for table in (self.pointers, self.targets, self.addresses):
+                for key in [key for key, (_, expires) in table.items() if expires <= now]:
+                    del table[key]
+        self.refresh(now)
+
+    def refresh(self, now: float) -> None:
+        """Rebuilds the complete services from the records and emits the changes."""
+        with self.lock:
+            new_services = {}
+            for name, (service_type, _) in self.pointers.items():
+                (port, target), _ = self.targets.get(name, ((None, None), 0))
+                ip, _ = self.addresses.get(target, (None, 0))
+                if port and ip:
+                    instance = name[:-len(service_type) - 1]
+                    new_services[name] = {
+                        "name": name,
+                        "kind": SERVICE_KINDS[service_type],
+                        "serial": service_serial(instance),
+                        "ip": ip,
+                        "port": str(port),
+                        "seen": now,
+                    }
+            old_services = self.known_services
+            for name, service in new_services.items():
+                if (old := old_services.get(name)) and (old["ip"], old["port"]) == (service["ip"], service["port"]):
+                    service["seen"] = old["seen"]
+            self.known_services = new_services
+
+        for name, service in new_services.items():
+            if name not in old_services or old_services[name]["seen"] != service["seen"]:
+                self.service_added.emit(service)
+        for name in old_services.keys() - new_services.keys():
+            self.service_removed.emit(name)
+
+    def services(self, kind: str = None) -> list:
+        """
+        Returns the known services, the last one announced (e.g. the pairing dialog opened last) first.
+
+        Parameters
+        ----------
+        - kind (`str`, optional): If given, only the services of this kind are returned (`"pairing"` or `"connect"`).
+        """
+        with self.lock:
+            services = [dict(service) for service in self.known_services.values()]
+        return sorted(
+            (service for service in services if kind is None or service["kind"] == kind),
+            key=lambda service: service["seen"],
+            reverse=True,
+        )
+
+    def endpoint(self, kind: str, ip: str = None) -> tuple:
+        """
+        Returns `(ip, port)` of the last announced service of a kind (of the device with this IP if given).
+
+        Returns `None` if no such service is known.
+        """
+        for service in self.services(kind):
+            if ip is None or service["ip"] == ip:
+                return service["ip"], service["port"]
+        return None
+
+mdns_services = MdnsServices()
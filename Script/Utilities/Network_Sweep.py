@@ -0,0 +1,240 @@
+"""
+This module contains the sweep of a network for the devices that listen for `ADB` over TCP.
+
+`Detect Devices` only finds the devices plugged via USB, the sweep finds the ones that are already in TCP
+mode (e.g. after `adb tcpip`, or a device of a wall that is never plugged). Every host of the network
+(e.g. `192.168.1.0/24`) is tried on each port to sweep (`Connect.Sweep_Ports`, `5555` by default) with a
+non-blocking connection (`asyncio`), at most `SWEEP_CONCURRENCY` connections at the same time and
+`SWEEP_RATE` new connections per second, each one with its own timeout.
+
+A port that answers is not enough (any service can listen on it), so each hit is confirmed with the first
+message of the `ADB` transport protocol: the host sends `CNXN` and a device answers with `CNXN` (its banner
+holds its model), `AUTH` (the key of the computer must be accepted first) or `STLS` (wireless debugging,
+TLS must be set up first). Only the confirmed endpoints are listed (see `SweepHit`).
+
+Message header (6 little-endian `uint32`):
+
+- command, arg0, arg1, length of the payload, checksum of the payload, magic (`command ^ 0xFFFFFFFF`)
+"""
+import socket
+import struct
+import asyncio
+import ipaddress
+from time import monotonic
+
+SWEEP_PORTS = ("5555",)
+SWEEP_CONCURRENCY = 512
+SWEEP_RATE = 4000
+SWEEP_CONNECT_TIMEOUT = 0.5
+HANDSHAKE_TIMEOUT = 1.0
+MAX_SWEEP_HOSTS = 4096
+
+A_CNXN = 0x4E584E43
+A_AUTH = 0x48545541
+A_STLS = 0x534C5453
+A_VERSION = 0x01000001
+MAX_PAYLOAD = 256 * 1024
+MAX_BANNER = 4096
+HEADER = struct.Struct("<6I")
+ADB_COMMANDS = {A_CNXN: "CNXN", A_AUTH: "AUTH", A_STLS: "STLS"}
+
+class SweepHit():
+    """
+    This class holds an endpoint that answered the `ADB` handshake.
+
+    Parameters
+    ----------
+    - host (`str`): The IP of the device.
+    - port (`int`): The port of the device.
+    - command (`str`): The first answer of the device (`"CNXN"`, `"AUTH"` or `"STLS"`).
+    - banner (`str`, optional): The banner of the device (payload of `CNXN`). Defaults to `""`.
+    """
+    def __init__(self, host: str, port: int, command: str, banner: str = ""):
+        self.host = host
+        self.port = port
+        self.command = command
+        self.banner = banner
+
+    @property
+    def endpoint(self) -> str:
+        """The address given to `adb connect` (e.g. `192.168.1.20:5555`)."""
+        return f"{self.host}:{self.port}"
+
+    @property
+    def properties(self) -> dict:
+        """The properties of the banner (e.g. `{"ro.product.model": "Pixel 7", ...}`)."""
+        _, _, props = self.banner.partition("::")
+        return dict(prop.split("=", 1) for prop in props.split(";") if "=" in prop)
+
+    @property
+    def name(self) -> str:
+        """The name shown in the device list (the model if the device sent it)."""
+        if model := self.properties.get("ro.product.model"):
+            return model
+        return {"AUTH": "ADB Device (Not Authorized)", "STLS": "ADB Device (Wireless Debugging)"}.get(
+            self.command, "ADB Device",
+        )
+
+    def __repr__(self) -> str:
+        return f"SweepHit({self.endpoint!r}, {self.command!r}, {self.name!r})"
+
+def adb_message(command: int, arg0: int, arg1: int, payload: bytes = b"") -> bytes:
+    """
+    Returns a message of the `ADB` transport protocol (header + payload).
+    """
+    # the checksum is only checked by the devices older than `A_VERSION`, it is sent for them ↓
+    checksum = sum(payload) & 0xFFFFFFFF
+    return HEADER.pack(command, arg0, arg1, len(payload), checksum, command ^ 0xFFFFFFFF) + payload
+
+CONNECT_MESSAGE = adb_message(A_CNXN, A_VERSION, MAX_PAYLOAD, b"host::\0")
+
+def sweep_hosts(network: str) -> list:
+    """
+    Returns the hosts of a network (e.g. `"192.168.1.0/24"`, a single IP is also accepted).
+
+    Raises
+    ------
+    - `ValueError`: If the network is not valid or has more than `MAX_SWEEP_HOSTS` hosts.
+    """
+    net = ipaddress.ip_network(network.strip(), strict=False)
+    if net.num_addresses > MAX_SWEEP_HOSTS + 2:
+        raise ValueError(f"the network {net} has more than {MAX_SWEEP_HOSTS} hosts")
+    return [str(host) for host in net.hosts()] or [str(net.network_address)]
+
+def local_network(prefix: int = 24) -> str:
+    """
+    Returns the network of the computer (e.g. `"192.168.1.0/24"`), from the address used to reach the outside.
+
+    Nothing is sent, a UDP socket only picks its route when it is connected.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            sock.connect(("10.254.254.254", 1))
+            address = sock.getsockname()[0]
+        except OSError:
+            address = "127.0.0.1"
+    return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+class RateLimiter():
+    """
+    This class spaces the new connections of a sweep, `rate` per second at most.
+
+    Parameters
+    ----------
+    - rate (`float`): The number of connections per second.
+    """
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self.next_slot = monotonic()
+
+    async def wait(self) -> None:
+        """Waits for the next free slot (the slots are taken in order, no lock is needed in a single loop)."""
+        now = monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def adb_handshake(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, port: int):
+    """
+    Sends `CNXN` to an open endpoint and returns a `SweepHit` if it answers like a device, `None` otherwise.
+    """
+    writer.write(CONNECT_MESSAGE)
+    await writer.drain()
+    command, arg0, arg1, length, checksum, magic = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if command not in ADB_COMMANDS or magic != command ^ 0xFFFFFFFF:
+        return None
+    banner = ""
+    if command == A_CNXN and 0 < length <= MAX_BANNER:
+        banner = (await reader.readexactly(length)).decode("utf-8", "replace").rstrip("\0")
+    return SweepHit(host, port, ADB_COMMANDS[command], banner)
+
+async def probe_endpoint(
+    host: str,
+    port: int,
+    connect_timeout: float = SWEEP_CONNECT_TIMEOUT,
+    handshake_timeout: float = HANDSHAKE_TIMEOUT,
+):
+    """
+    Tries an endpoint: a TCP connection, then the `ADB` handshake if it is open.
+
+    Returns
+    -------
+    - `SweepHit` or `None`: The confirmed endpoint, `None` if it is closed or is not a device.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), connect_timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    try:
+        return await asyncio.wait_for(adb_handshake(reader, writer, host, port), handshake_timeout)
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, struct.error):
+        return None
+    finally:
+        writer.close()
+
+async def sweep_async(
+    hosts: list,
+    ports: list,
+    on_hit = None,
+    concurrency: int = SWEEP_CONCURRENCY,
+    rate: float = SWEEP_RATE,
+    connect_timeout: float = SWEEP_CONNECT_TIMEOUT,
+    handshake_timeout: float = HANDSHAKE_TIMEOUT,
+) -> list:
+    """
+    Sweeps every host on every port in the running loop (see `sweep_network`).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+    hits = []
+
+    async def sweep_endpoint(host: str, port: int) -> None:
+        async with semaphore:
+            await limiter.wait()
+            if hit := await probe_endpoint(host, port, connect_timeout, handshake_timeout):
+                hits.append(hit)
+                if on_hit:
+                    on_hit(hit)
+
+    await asyncio.gather(*(sweep_endpoint(host, port) for host in hosts for port in ports))
+    return hits
+
+def sweep_network(
+    network: str,
+    ports = SWEEP_PORTS,
+    on_hit = None,
+    concurrency: int = SWEEP_CONCURRENCY,
+    rate: float = SWEEP_RATE,
+    connect_timeout: float = SWEEP_CONNECT_TIMEOUT,
+    handshake_timeout: float = HANDSHAKE_TIMEOUT,
+) -> list:
+    """
+    Sweeps a network for the devices that listen for `ADB` over TCP (run in a worker thread, it has its own loop).
+
+    Parameters
+    ----------
+    - network (`str`): The network to sweep (e.g. `"192.168.1.0/24"`).
+    - ports (`list`, optional): The ports to try on each host. Defaults to `SWEEP_PORTS`.
+    - on_hit (`callable`, optional): Called with each `SweepHit` as soon as it is confirmed. Defaults to `None`.
+    - concurrency (`int`, optional): The maximum number of open connections. Defaults to `SWEEP_CONCURRENCY`.
+    - rate (`float`, optional): The maximum number of new connections per second. Defaults to `SWEEP_RATE`.
+    - connect_timeout (`float`, optional): The time (in seconds) a connection can take. Defaults to `SWEEP_CONNECT_TIMEOUT`.
+    - handshake_timeout (`float`, optional): The time (in seconds) the handshake can take. Defaults to `HANDSHAKE_TIMEOUT`.
+
+    Returns
+    -------
+    - `list`: The confirmed endpoints (`SweepHit`), sorted by address.
+
+    Raises
+    ------
+    - `ValueError`: If the network or a port is not valid.
+    """
+    hosts = sweep_hosts(network)
+    ports = sorted({int(port) for port in ports if str(port).strip()})
+    if not ports or not all(0 < port < 65536 for port in ports):
+        raise ValueError(f"the ports {ports} are not valid")
+    hits = asyncio.run(
+        sweep_async(hosts, ports, on_hit, concurrency, rate, connect_timeout, handshake_timeout)
+    )
+    return sorted(hits, key=lambda hit: (ipaddress.ip_address(hit.host), hit.port))
@@ -0,0 +1,198 @@
+"""
+This module contains the builder of the command line of `scrcpy` from the widgets of the Start tab.
+
+The options are declared once in `Static_Datas.OPTION_SCHEMA` (option id, widget, template and the versions
+that support it). When a version of `scrcpy` is selected, the schema is compiled into flat lookup tables for
+that version (see `CompiledOptions`), kept for the next time the same version is selected, so building a
+command never looks at the versions again.
+
+The command is built from the state of the widgets (see `CommandBuilder.build`), each group of widgets
+gives a part of the command that is only built again when its widgets changed, and the whole command
+is returned as is while nothing changed.
+"""
+from re import compile as compile_pattern
+
+from Script.Utilities.Static_Datas import OPTION_SCHEMA
+from Script.Utilities.Settings_Store import settings_store, SCRCPY_VERSION_KEYS
+
+# an encoder listed by the device, e.g. "(h264) c2.qti.avc.encoder" (see `Device_Capabilities`) ↓
+ENCODER_TEXT = compile_pattern(r"^\((\w+)\) (\S+)$")
+
+def supported(since: float, before: float, version: float) -> bool:
+    """Returns `True` if `version` is between `since` (included) and `before` (excluded), `None` meaning no limit."""
+    return (since is None or version >= since) and (before is None or version < before)
+
+class CompiledOptions():
+    """
+    This class holds the options of `OPTION_SCHEMA` supported by a version of `scrcpy`, as flat lookup tables.
+
+    Parameters
+    ----------
+    - version (`float`): The version of `scrcpy` (e.g. `2.4`).
+    - schema (`list`, optional): The options, see `OPTION_SCHEMA`. Defaults to `OPTION_SCHEMA`.
+
+    Attributes
+    ----------
+    - sliders (`dict`): The templates of each slider, a list of tuples `(check, template)` by position.
+    - texts (`dict`): The templates of each line edit, a list of tuples `(check, template)` by position.
+    - records (`dict`): The templates of each file format of the record, a list of tuples `(check, template)`.
+    - combos (`dict`): The arguments of each text of the combo boxes.
+    - encoders (`dict`): The template of the encoders listed by the device, by codec.
+    - checks (`dict`): The arguments of each check box.
+    """
+    def __init__(self, version: float, schema: list = OPTION_SCHEMA):
+        self.version = version
+        self.sliders = {}
+        self.texts = {}
+        self.records = {}
+        self.combos = {}
+        self.encoders = {}
+        self.checks = {}
+        for _option_id, widget, key, check, template, since, before in schema:
+            if not supported(since, before, version):
+                continue
+            if widget == "slider":
+                self.sliders.setdefault(key, []).append((check, template))
+            elif widget == "text":
+                self.texts.setdefault(key, []).append((check, template))
+            elif widget == "record":
+                for file_format in key:
+                    self.records.setdefault(file_format, []).append((check, template))
+            elif widget == "combo":
+                self.combos[key] = self.combos.get(key, "") + template
+            elif widget == "encoder":
+                for codec in key:
+                    self.encoders[codec] = self.encoders.get(codec, "") + template
+            elif widget == "check":
+                self.checks[key] = self.checks.get(key, "") + template
+            else:
+                raise ValueError(f"unknown widget '{widget}' in the option schema")
+
+    def __repr__(self) -> str:
+        return f"CompiledOptions({self.version})"
+
+class CommandBuilder():
+    """
+    This class builds the command line of `scrcpy` from the state of the widgets of the Start tab.
+
+    The schema is compiled when a version is selected (the builder is subscribed to the selected version in
+    `settings_store`), and each compiled version is kept.
+
+    Parameters
+    ----------
+    - schema (`list`, optional): The options, see `OPTION_SCHEMA`. Defaults to `OPTION_SCHEMA`.
+    """
+    def __init__(self, schema: list = OPTION_SCHEMA):
+        self.schema = schema
+        self.compiled_versions = {}
+        self.options = None
+        self.parts = {}
+        self.state = None
+        self.command_line = ""
+
+    def select_version(self, version: float) -> CompiledOptions:
+        """
+        Selects the version of `scrcpy` used to build the commands (compiled only the first time).
+
+        Parameters
+        ----------
+        - version (`float`): The version (`None` or `""` if unknown, used as `0.0`).
+
+        Returns
+        -------
+        - `CompiledOptions`: The options of the version.
+        """
+        version = float(version or 0.0)
+        if self.options is None or self.options.version != version:
+            if version not in self.compiled_versions:
+                self.compiled_versions[version] = CompiledOptions(version, self.schema)
+            self.options = self.compiled_versions[version]
+            self.parts.clear()
+            self.state = None
+        return self.options
+
+    def build(self, version: float, slider_values: list, active_checks: list, combo_texts: list, texts: list) -> str:
+        """
+        Builds the command line of `scrcpy` (without the executable) from the state of the widgets.
+
+        Parameters
+        ----------
+        - version (`float`): The version of `scrcpy`.
+        - slider_values (`list`): The value of each slider.
+        - active_checks (`list`): The texts (lowercase) of the checked check boxes.
+        - combo_texts (`list`): The texts of the combo boxes, the file format of the record first and the 2 input
+        combo boxes (type and mode) last.
+        - texts (`list`): The texts of the line edits, the name of the record file first.
+
+        Returns
+        -------
+        - `str`: The command line (e.g. `" --max-fps 60 -m 1920 --video-bit-rate 8M --no-audio"`).
+        """
+        self.select_version(version)
+        state = (tuple(slider_values), tuple(active_checks), tuple(combo_texts), tuple(texts))
+        if state == self.state:
+            return self.command_line
+
+        checked = frozenset(active_checks)
+        parts = []
+        for index, value in enumerate(slider_values):
+            parts.append(self.part(("slider", index), (value, checked), self.slider_part))
+        record_format = combo_texts[0] if combo_texts else ""
+        record_name = texts[0] if texts else ""
+        parts.append(self.part(("record",), (record_name, record_format, checked), self.record_part))
+        for index, text in enumerate(texts):
+            parts.append(self.part(("text", index), (text, checked), self.text_part))
+        parts.append(self.part(("combos",), tuple(combo_texts[1:]), self.combos_part))
+        parts.append(self.part(("checks",), tuple(active_checks), self.checks_part))
+
+        self.state = state
+        self.command_line = "".join(parts)
+        return self.command_line
+
+    def part(self, key: tuple, widget_state: tuple, build_part) -> str:
+        """
+        Returns the part of the command of a group of widgets, built again only if their state changed.
+        """
+        if (cached := self.parts.get(key)) and cached[0] == widget_state:
+            return cached[1]
+        part = build_part(key, *widget_state)
+        self.parts[key] = (widget_state, part)
+        return part
+
+    def slider_part(self, key: tuple, value: int, active_checks: set) -> str:
+        return "".join(
+            template.format(value=value)
+            for check, template in self.options.sliders.get(key[1], []) if check is None or check in active_checks
+        )
+
+    def record_part(self, _key: tuple, name: str, file_format: str, active_checks: set) -> str:
+        return "".join(
+            template.format(name=name or "video", format=file_format)
+            for check, template in self.options.records.get(file_format, []) if check is None or check in active_checks
+        )
+
+    def text_part(self, key: tuple, text: str, active_checks: set) -> str:
+        if key[1] == 0: # the name of the record, see `record_part`
+            return ""
+        return "".join(
+            template.format(value=text)
+            for check, template in self.options.texts.get(key[1], [])
+            if (check is None or check in active_checks) and (text or template.startswith(" "))
+        )
+
+    def combos_part(self, _key: tuple, *combo_texts: str) -> str:
+        input_mode = " ".join(combo_texts[-2:]) # e.g. "AoA" and "Mouse" ↓
+        return "".join(self.combo_args(text) for text in (*combo_texts, input_mode))
+
+    def combo_args(self, text: str) -> str:
+        if (args := self.options.combos.get(text)) is not None:
+            return args
+        if (found := ENCODER_TEXT.match(text)) and (template := self.options.encoders.get(found[1])):
+            return template.format(codec=found[1], encoder=found[2])
+        return ""
+
+    def checks_part(self, _key: tuple, *active_checks: str) -> str:
+        return "".join(self.options.checks.get(check, "") for check in active_checks)
+
+command_builder = CommandBuilder()
+settings_store.subscribe(SCRCPY_VERSION_KEYS, command_builder.select_version)
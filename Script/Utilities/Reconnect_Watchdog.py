@@ -0,0 +1,326 @@
+"""
+This module contains the watchdog that reconnects the Wi-Fi devices when their `ADB` link drops.
+
+While the watchdog is enabled (`Connect.Auto_Reconnect`), every Wi-Fi device that becomes ready is kept in
+the endpoints to watch (`Connect.Connect_Devices`), until it is disconnected from the app. A drop is seen
+through the `device_registry` (the device goes `offline` or disappears), and the endpoints that are missing
+from the registry are also checked every `CHECK_INTERVAL` milliseconds (e.g. the ones dropped while the app
+was closed).
+
+Each dropped endpoint is tried again after a jittered exponential delay (see `backoff_delay`), at most
+`RECONNECT_WORKERS` at the same time. An attempt first tries the port of the device with a plain TCP
+connection (see `Bulk_Connect.endpoint_answers`), so no `adb` process is started while the device is away.
+
+The `scrcpy` sessions that ended with the link of their device are started again with the same arguments
+once the device is back, unless `Connect.Restart_Sessions` is `False`. The drops, the attempts and the time
+each endpoint took to come back are kept by endpoint (see `ReconnectWatchdog.metrics`).
+"""
+from random import uniform
+from functools import partial
+from collections import deque
+from time import monotonic
+from platform import system
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from Script.Utilities.Task_Pool import task_pool
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Scrcpy_Sessions import scrcpy_sessions
+from Script.Utilities.Bulk_Connect import connect_endpoint, endpoint_answers, split_endpoint
+from Script.Utilities.Settings_Store import (
+    settings_store,
+    AUTO_RECONNECT_KEYS,
+    RESTART_SESSIONS_KEYS,
+    RECONNECT_ENDPOINTS_KEYS,
+)
+from Script.Utilities.Utils import check_is_ip
+
+BACKOFF_BASE_DELAY = 1.0
+BACKOFF_MAX_DELAY = 60.0
+RECONNECT_WORKERS = 4
+CHECK_INTERVAL = 15000
+# the time (in milliseconds) the registry can take to report the drop of a session that just ended ↓
+SESSION_DROP_DELAY = 3000
+LATENCY_SAMPLES = 50
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE_DELAY, max_delay: float = BACKOFF_MAX_DELAY) -> float:
+    """
+    Returns the delay (in seconds) before the attempt number `attempt` (from `0`), doubled after each attempt up to
+    `max_delay`, and drawn between half and all of it, so the devices of a wall do not all retry at the same time.
+    """
+    delay = min(max_delay, base * 2 ** min(attempt, 32))
+    return uniform(delay / 2, delay)
+
+def reconnect_endpoint(endpoint: str, path: str, offline: bool) -> tuple:
+    """
+    Tries to connect a dropped endpoint again (run in the `task_pool`).
+
+    Parameters
+    ----------
+    - endpoint (`str`): The endpoint (e.g. `192.168.0.10:5555`).
+    - path (`str`): The path to the `scrcpy`/`adb` folder.
+    - offline (`bool`): If `True`, `ADB` still has the endpoint as `offline`, it is disconnected first
+    (`adb connect` would only answer "already connected").
+
+    Returns
+    -------
+    - `tuple`: `(endpoint, result)`, `result` being the `ConnectResult` or `None` if the port did not answer.
+    """
+    host, port = split_endpoint(endpoint, "")
+    if not endpoint_answers(host, port):
+        return endpoint, None
+    runner = CommandRunner(path)
+    if offline:
+        runner.run(["adb", "disconnect", endpoint])
+    return endpoint, connect_endpoint(endpoint, host, port, runner)
+
+class EndpointMetrics():
+    """
+    This class holds the reconnection metrics of an endpoint.
+
+    Attributes
+    ----------
+    - drops (`int`): The number of drops seen.
+    - attempts (`int`): The number of reconnection attempts (the ones stopped by the TCP probe included).
+    - reconnects (`int`): The number of drops recovered.
+    - latencies (`deque`): The time (in seconds) between each drop and the device being back, the last `LATENCY_SAMPLES`.
+    """
+    def __init__(self):
+        self.drops = 0
+        self.attempts = 0
+        self.reconnects = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def to_dict(self) -> dict:
+        latencies = list(self.latencies)
+        return {
+            "drops": self.drops,
+            "attempts": self.attempts,
+            "reconnects": self.reconnects,
+            "last_latency": round(latencies[-1], 2) if latencies else None,
+            "mean_latency": round(sum(latencies) / len(latencies), 2) if latencies else None,
+        }
+
+class ReconnectWatchdog(QObject):
+    """
+    This class reconnects the watched Wi-Fi endpoints when they drop (see the module docstring).
+
+    All the methods are called in the main thread, the attempts themselves run in the `task_pool`.
+
+    Signals
+    -------
+    - `endpoint_dropped` (`pyqtSignal(str)`): Emitted with a watched endpoint that dropped.
+    - `endpoint_reconnected` (`pyqtSignal(str, float, int)`): Emitted with the endpoint, the time (in seconds) it
+    took to come back and the number of attempts.
+    """
+    endpoint_dropped = pyqtSignal(str)
+    endpoint_reconnected = pyqtSignal(str, float, int)
+
+    def __init__(self):
+        super().__init__()
+        self.pending = {}
+        self.in_flight = {}
+        self.waiting = deque()
+        self.endpoint_metrics = {}
+        self.watched_sessions = {}
+        self.sessions_to_restart = {}
+        self.reconnect_times = {}
+        self.check_timer = QTimer(self)
+        self.check_timer.setInterval(CHECK_INTERVAL)
+        self.check_timer.timeout.connect(self.check_endpoints)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings_store.get(AUTO_RECONNECT_KEYS, False))
+
+    @property
+    def endpoints(self) -> list:
+        """The watched endpoints."""
+        return list(settings_store.get(RECONNECT_ENDPOINTS_KEYS, []) or [])
+
+    def start(self) -> None:
+        """
+        Connects the watchdog to the `device_registry` and the `scrcpy_sessions`, and applies the saved state.
+        """
+        device_registry.device_added.connect(self.device_added)
+        device_registry.device_removed.connect(self.device_removed)
+        device_registry.device_state_changed.connect(self.device_state_changed)
+        scrcpy_sessions.session_started.connect(self.session_started)
+        scrcpy_sessions.session_finished.connect(self.session_finished)
+        settings_store.subscribe(AUTO_RECONNECT_KEYS, self.set_enabled)
+        self.set_enabled(self.enabled)
+
+    @pyqtSlot()
+    def stop(self) -> None:
+        """Stops the checks and the scheduled attempts (used when the app is closed)."""
+        self.check_timer.stop()
+        self.pending.clear()
+        self.waiting.clear()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Starts or stops watching the endpoints (subscribed to `Connect.Auto_Reconnect`)."""
+        if enabled:
+            for device in device_registry.devices("device"):
+                self.watch(device["serial"])
+            self.check_timer.start()
+            self.check_endpoints()
+        else:
+            self.stop()
+
+    def watch(self, serial: str) -> None:
+        """Adds a ready Wi-Fi device to the watched endpoints (only while the watchdog is enabled)."""
+        if self.enabled and check_is_ip(serial) and serial not in (endpoints := self.endpoints):
+            settings_store.set([*endpoints, serial], RECONNECT_ENDPOINTS_KEYS)
+
+    def forget(self, endpoint: str) -> None:
+        """
+        Stops watching an endpoint (e.g. the user disconnected it), its pending attempts are dropped.
+        """
+        self.pending.pop(endpoint, None)
+        self.sessions_to_restart.pop(endpoint, None)
+        if endpoint in (endpoints := self.endpoints):
+            endpoints.remove(endpoint)
+            settings_store.set(endpoints, RECONNECT_ENDPOINTS_KEYS)
+
+    def metrics(self) -> dict:
+        """
+        Returns the reconnection metrics of each endpoint (see `EndpointMetrics.to_dict`).
+        """
+        return {endpoint: metrics.to_dict() for endpoint, metrics in self.endpoint_metrics.items()}
+
+    def endpoint_state(self, endpoint: str) -> str:
+        """Returns the state of an endpoint in the `device_registry` (`"missing"` if it is not known)."""
+        return (device_registry.get(endpoint) or {}).get("state", "missing")
+
+    @pyqtSlot(dict)
+    def device_added(self, device: dict) -> None:
+        self.device_state_changed(device["serial"], device["state"])
+
+    @pyqtSlot(str)
+    def device_removed(self, serial: str) -> None:
+        self.device_state_changed(serial, "missing")
+
+    @pyqtSlot(str, str)
+    def device_state_changed(self, serial: str, state: str) -> None:
+        """Watches a device that is ready, or schedules the reconnection of a watched one that is not."""
+        if state == "device":
+            self.watch(serial)
+            self.reconnected(serial)
+        elif state in ("offline", "missing") and serial in self.endpoints:
+            self.dropped(serial)
+
+    @pyqtSlot()
+    def check_endpoints(self) -> None:
+        """Schedules the reconnection of the watched endpoints that are not ready (every `CHECK_INTERVAL`)."""
+        if not device_registry.tracking: # the registry is still empty, nothing dropped ↓
+            return
+        for endpoint in self.endpoints:
+            if self.endpoint_state(endpoint) != "device":
+                self.dropped(endpoint)
+
+    def dropped(self, endpoint: str) -> None:
+        """Schedules the first attempt of a dropped endpoint (unless it is already scheduled)."""
+        if not self.enabled or endpoint in self.pending:
+            return
+        self.endpoint_metrics.setdefault(endpoint, EndpointMetrics()).drops += 1
+        self.pending[endpoint] = {"since": monotonic(), "attempts": 0}
+        self.endpoint_dropped.emit(endpoint)
+        self.schedule(endpoint)
+
+    def schedule(self, endpoint: str) -> None:
+        """Schedules the next attempt of a pending endpoint, after its backoff delay."""
+        if pending := self.pending.get(endpoint):
+            delay = backoff_delay(pending["attempts"])
+            QTimer.singleShot(int(delay * 1000), partial(self.attempt, endpoint))
+
+    def attempt(self, endpoint: str) -> None:
+        """
+        Tries to connect a pending endpoint in the `task_pool`, or waits for a free slot (`RECONNECT_WORKERS`).
+        """
+        if endpoint not in self.pending or endpoint in self.in_flight or endpoint in self.waiting:
+            return
+        if self.endpoint_state(endpoint) == "device":
+            self.reconnected(endpoint)
+            return
+        if len(self.in_flight) >= RECONNECT_WORKERS:
+            self.waiting.append(endpoint)
+            return
+
+        path = settings_store.scrcpy_path if system() == "Windows" else "."
+        self.pending[endpoint]["attempts"] += 1
+        self.endpoint_metrics[endpoint].attempts += 1
+        offline = self.endpoint_state(endpoint) == "offline"
+        task = task_pool.submit(reconnect_endpoint, endpoint, path, offline, name=f"reconnect {endpoint}")
+        self.in_flight[endpoint] = task
+        # both slots are methods of this object, so they are called in the main thread ↓
+        task.result_ready.connect(self.attempt_finished)
+        task.finished.connect(self.attempt_task_finished)
+
+    @pyqtSlot(object)
+    def attempt_finished(self, result: tuple) -> None:
+        """Handles the result of an attempt (slot of the `result_ready` signal of the task)."""
+        endpoint, connect_result = result
+        self.in_flight.pop(endpoint, None)
+        if connect_result is not None and connect_result.ok:
+            self.reconnected(endpoint)
+        else:
+            self.schedule(endpoint)
+
+    @pyqtSlot()
+    def attempt_task_finished(self) -> None:
+        """Schedules again an attempt that gave no result (rejected or failed task), then starts the waiting ones."""
+        task = self.sender()
+        for endpoint in [endpoint for endpoint, in_flight in self.in_flight.items() if in_flight is task]:
+            del self.in_flight[endpoint]
+            self.schedule(endpoint)
+        while self.waiting and len(self.in_flight) < RECONNECT_WORKERS:
+            self.attempt(self.waiting.popleft())
+
+    def reconnected(self, endpoint: str) -> None:
+        """Records the recovery of a pending endpoint and starts its sessions again."""
+        if (pending := self.pending.pop(endpoint, None)) is None:
+            return
+        latency = monotonic() - pending["since"]
+        self.reconnect_times[endpoint] = monotonic()
+        metrics = self.endpoint_metrics[endpoint]
+        metrics.reconnects += 1
+        metrics.latencies.append(latency)
+        self.endpoint_reconnected.emit(endpoint, latency, pending["attempts"])
+
+        for args, path in self.sessions_to_restart.pop(endpoint, []):
+            scrcpy_sessions.start(endpoint, args, path)
+
+    @pyqtSlot(int, str)
+    def session_started(self, session_id: int, serial: str) -> None:
+        """Keeps the handle of the sessions of the watched endpoints, to start them again after a drop."""
+        if serial in self.endpoints:
+            for session in scrcpy_sessions.sessions(serial):
+                if session.session_id == session_id:
+                    self.watched_sessions[session_id] = session
+
+    @pyqtSlot(int, str, int)
+    def session_finished(self, session_id: int, serial: str, exit_code: int) -> None:
+        """Keeps the arguments of a session that ended with an error, restarted if its device dropped."""
+        session = self.watched_sessions.pop(session_id, None)
+        if session is None or session.stopping or exit_code == 0:
+            return
+        if self.enabled and settings_store.get(RESTART_SESSIONS_KEYS, True):
+            if serial in self.pending:
+                self.restart_after_drop(serial, session.args, session.path, monotonic())
+            else:
+                QTimer.singleShot(
+                    SESSION_DROP_DELAY,
+                    partial(self.restart_after_drop, serial, session.args, session.path, monotonic()),
+                )
+
+    def restart_after_drop(self, serial: str, args: list, path: str, ended_at: float) -> None:
+        """
+        Starts a session again once its device is back, only if the device dropped (the session did not fail alone).
+        """
+        if serial in self.pending:
+            self.sessions_to_restart.setdefault(serial, []).append((args, path))
+        elif self.reconnect_times.get(serial, 0.0) >= ended_at - SESSION_DROP_DELAY / 1000:
+            scrcpy_sessions.start(serial, args, path) # the device was already back
+
+reconnect_watchdog = ReconnectWatchdog()
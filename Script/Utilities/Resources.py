@@ -0,0 +1,44 @@
+"""
+This module contains the access to the icons of the app.
+
+The icons are compiled into a binary resource bundle (`Theme/resources.rcc`, see `Theme/Build_Resources.py`),
+registered with `QResource.registerResource` the first time an icon is needed. Qt maps the file instead of
+the app importing the icons as Python modules of byte literals, and the icons keep their paths (e.g. `:icon.ico`).
+"""
+from os.path import join
+from pathlib import Path
+
+from PyQt5.QtCore import QResource
+from PyQt5.QtGui import QIcon
+
+RESOURCES_FILE = str(Path(__file__).resolve().parent.parent.parent / "Theme" / "resources.rcc")
+
+resources_registered = False
+
+def register_resources() -> bool:
+    """
+    Registers the resource bundle (only the first time it is called).
+
+    Returns
+    -------
+    - `bool`: `True` if the bundle is registered, `False` if it could not be read (the icons are then empty).
+    """
+    global resources_registered
+    if not resources_registered:
+        resources_registered = QResource.registerResource(RESOURCES_FILE)
+    return resources_registered
+
+def resource_icon(name: str) -> QIcon:
+    """
+    Returns an icon of the resource bundle.
+
+    Parameters
+    ----------
+    - name (`str`): The name of the icon in the bundle (e.g. `icon.ico`).
+
+    Returns
+    -------
+    - `QIcon`: The icon, found at the path `:<name>`.
+    """
+    register_resources()
+    return QIcon(join(":", name))
@@ -0,0 +1,209 @@
+"""
+This module contains the capabilities of a `scrcpy` binary: the options it supports and their values.
+
+The options are read once for each binary from `scrcpy --help` (the option lines, e.g. `-b, --video-bit-rate=value`,
+and the values listed in their descriptions, e.g. `Possible values are "disabled", "sdk", "uhid" and "aoa"`),
+and cached in the user data (`Versions.Capability_Cache`) with the identity of the binary, like its version
+(see `Scrcpy_Version`), so the probe is only run again when the binary changes.
+
+Before `scrcpy` is started, its arguments are checked against the capabilities (see `ScrcpyCapabilities.check_args`):
+the options the binary does not know are removed, and the values it does not accept are reported, instead of
+finding out after a launch that failed with "unknown option".
+"""
+from re import compile as compile_pattern, IGNORECASE
+
+from Script.Utilities.Command_Runner import CommandRunner
+from Script.Utilities.Settings_Store import CAPABILITY_CACHE_KEYS
+from Script.Utilities.Scrcpy_Version import binary_identity, cached_probe, save_probe
+
+HELP_TIMEOUT = 10.0
+
+# e.g. "    -b, --video-bit-rate=value", "    --new-display[=[<width>x<height>][/<dpi>]]" or "    -G" ↓
+OPTION_LINE = compile_pattern(r"^ {2,6}(?:(-\w)(?:, )?)?(--[\w-]+)?(\[?=\S*| [^\s-]\S*)?\s*$")
+# the list of values ends with its sentence (a point outside the quotes) ↓
+POSSIBLE_VALUES = compile_pattern(r"possible values are:?((?:[^.\"]|\"[^\"]*\")*?)(?:\.|default is|$)", IGNORECASE)
+QUOTED_VALUE = compile_pattern(r"\"([\w.-]+)\"")
+# e.g. `"sdk", "uhid" and "aoa"`, not `"unlocked", "initial" (locked to the initial orientation), 0, 90` ↓
+QUOTED_LIST = compile_pattern(r"\s*\"[\w.-]+\"(?:\s*,?\s*(?:and |or )?\s*\"[\w.-]+\")*\s*")
+SELECT_VALUES = compile_pattern(r"\(((?:[\w.-]+, )*[\w.-]+ or [\w.-]+)\)")
+VALUE_SEPARATORS = compile_pattern(r"[,+]")
+
+class ScrcpyCapabilities():
+    """
+    This class holds the options supported by a `scrcpy` binary.
+
+    Parameters
+    ----------
+    - options (`dict`): The value of each option, `"none"`, `"required"` or `"optional"` (e.g. `{"--video-bit-rate": "required"}`),
+    the options without a long name are stored with their short name (e.g. `-G`).
+    - aliases (`dict`): The long name of each short option (e.g. `{"-b": "--video-bit-rate"}`).
+    - choices (`dict`): The values accepted by the options that have a fixed list of values (e.g. `{"--keyboard": ["disabled", "sdk", "uhid", "aoa"]}`).
+    """
+    def __init__(self, options: dict, aliases: dict, choices: dict):
+        self.options = options
+        self.aliases = aliases
+        self.choices = choices
+
+    def option(self, name: str) -> str:
+        """Returns the name under which the option `name` is stored (the long name of a short option)."""
+        return self.aliases.get(name, name)
+
+    def supports(self, name: str) -> bool:
+        """Returns `True` if the option `name` (e.g. `--no-audio` or `-b`) is supported."""
+        return self.option(name) in self.options
+
+    def valid_value(self, name: str, value: str) -> bool:
+        """
+        Returns `True` if `value` is accepted by the option `name` (always `True` if its values are not listed), each
+        part of a list (e.g. `lctrl,ralt` or `lalt+lsuper`) is checked, an orientation can start with `@`.
+        """
+        if not (choices := self.choices.get(self.option(name))):
+            return True
+        return all(part.lstrip("@") in choices for part in VALUE_SEPARATORS.split(value.lower()) if part)
+
+    def check_args(self, args: list) -> tuple:
+        """
+        Checks the arguments of a `scrcpy` command against the capabilities.
+
+        Parameters
+        ----------
+        - args (`list`): The arguments, without the executable (e.g. `["--no-audio", "-b", "8M"]`).
+
+        Returns
+        -------
+        - `tuple`: A tuple containing:
+          - `kept_args` (`list`): The arguments without the unsupported options.
+          - `unsupported` (`list`): The unsupported options that were removed (with their value).
+          - `invalid` (`list`): The options kept with a value that is not accepted, in the format `option=value`.
+        """
+        kept_args = []
+        unsupported = []
+        invalid = []
+        index = 0
+        while index < len(args):
+            arg = args[index]
+            index += 1
+            if not arg.startswith("-") or arg == "-":
+                kept_args.append(arg)
+                continue
+
+            name, has_value, value = arg.partition("=")
+            if not arg.startswith("--") and len(name) > 2: # e.g. "-b8M" or "-Sw"
+                if self.options.get(self.option(name[:2])) == "required":
+                    name, has_value, value = name[:2], "=", arg[2:]
+                elif all(self.supports(f"-{char}") for char in name[1:]):
+                    kept_args.append(arg)
+                    continue
+
+            if not self.supports(name):
+                # scrcpy has no positional arguments, so a word after an unknown option is its value ↓
+                if not has_value and index < len(args) and not args[index].startswith("-"):
+                    arg = f"{arg} {args[index]}"
+                    index += 1
+                unsupported.append(arg)
+                continue
+
+            kept_args.append(arg)
+            if self.options[self.option(name)] == "required" and not has_value and index < len(args):
+                has_value, value = "=", args[index]
+                kept_args.append(value)
+                index += 1
+            if has_value and not self.valid_value(name, value):
+                invalid.append(f"{name}={value}")
+        return kept_args, unsupported, invalid
+
+    def to_json(self) -> dict:
+        """Returns the capabilities as a `JSON` dictionary (see `from_json`)."""
+        return {"Options": self.options, "Aliases": self.aliases, "Choices": self.choices}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ScrcpyCapabilities":
+        """Returns the capabilities saved by `to_json`."""
+        return cls(data.get("Options", {}), data.get("Aliases", {}), data.get("Choices", {}))
+
+    def __repr__(self) -> str:
+        return f"ScrcpyCapabilities({len(self.options)} options)"
+
+def option_choices(description: str) -> list:
+    """
+    Returns the values listed in the description of an option, e.g. `Possible values are "sdk" and "uhid"`
+    or `Select a video codec (h264, h265 or av1)`, or an empty list.
+
+    The possible values are only a closed list when they are all quoted, a list that also has other values (e.g.
+    `"unlocked", "initial", 0, 90, 180, and 270`) gives an empty list, so its values are not checked.
+    """
+    description = " ".join(description.split())
+    if found := POSSIBLE_VALUES.search(description):
+        if QUOTED_LIST.fullmatch(found[1]):
+            return [choice.lower() for choice in QUOTED_VALUE.findall(found[1])]
+        if QUOTED_VALUE.search(found[1]):
+            return []
+    if description.lower().startswith("select") and (found := SELECT_VALUES.search(description)):
+        return [choice.lower() for choice in found[1].replace(" or ", ", ").split(", ")]
+    return []
+
+def parse_scrcpy_help(output: str) -> ScrcpyCapabilities:
+    """
+    Parses the output of `scrcpy --help` into a `ScrcpyCapabilities` record.
+
+    Parameters
+    ----------
+    - output (`str`): The output of `scrcpy --help`.
+
+    Returns
+    -------
+    - `ScrcpyCapabilities`: The options found (the lines that are not an option or its description are ignored).
+    """
+    options = {}
+    aliases = {}
+    choices = {}
+    option = None
+    description = []
+
+    def end_option() -> None:
+        if option and (values := option_choices(" ".join(description))):
+            choices[option] = values
+
+    for line in output.splitlines():
+        found = OPTION_LINE.match(line)
+        if found and (found[1] or found[2]):
+            end_option()
+            short_name, long_name, value = found[1], found[2], found[3] or ""
+            option = long_name or short_name
+            options[option] = "optional" if value.startswith("[") else "required" if value else "none"
+            if short_name and long_name:
+                aliases[short_name] = long_name
+            description = []
+        elif option and line.startswith(" " * 8):
+            description.append(line.strip())
+        elif line.strip() and not line.startswith(" "): # a new section (e.g. "Shortcuts:")
+            end_option()
+            option = None
+    end_option()
+    return ScrcpyCapabilities(options, aliases, choices)
+
+def get_scrcpy_capabilities(path: str, runner: CommandRunner = None) -> ScrcpyCapabilities:
+    """
+    Returns the capabilities of the `scrcpy` binary used from `path`, running `scrcpy --help` only if the binary
+    is not in the cache or changed since it was probed.
+
+    Parameters
+    ----------
+    - path (`str`): The folder of the scrcpy version.
+    - runner (`CommandRunner`, optional): The runner of the command. Defaults to a new runner in `path`.
+
+    Returns
+    -------
+    - `ScrcpyCapabilities`: The capabilities, or `None` if `scrcpy --help` could not be read.
+    """
+    identity = binary_identity(path)
+    if entry := cached_probe(CAPABILITY_CACHE_KEYS, identity):
+        return ScrcpyCapabilities.from_json(entry)
+
+    runner = runner or CommandRunner(path)
+    capabilities = parse_scrcpy_help(runner.run(["scrcpy", "--help"], timeout=HELP_TIMEOUT).stdout)
+    if not capabilities.options:
+        return None
+    if identity is not None:
+        save_probe(CAPABILITY_CACHE_KEYS, identity, capabilities.to_json())
+    return capabilities
@@ -0,0 +1,237 @@
+"""
+This module contains the supervisor of the `scrcpy` sessions started by the app.
+
+Each session is a `QProcess` watched by the Qt event loop, so a running mirror does not hold a
+thread (20 mirrors are 20 processes, not 20 parked threads). The supervisor keeps a handle of every
+session (id, PID, device serial, arguments and start time), so a single session or all of them can
+be stopped without scanning the processes of the whole machine.
+
+The errors (`stderr`) of a session are read line by line as soon as `scrcpy` prints them, so they
+can be classified while the session runs, and only the last `STDERR_BUFFER_LINES` lines are kept.
+
+Every change is announced through Qt signals:
+
+- `session_started` (`pyqtSignal(int, str)`): Emitted with the id and the serial of a new session.
+- `session_finished` (`pyqtSignal(int, str, int)`): Emitted with the id, the serial and the exit code of a session
+(`-1` if `scrcpy` could not be started or crashed).
+- `session_output` (`pyqtSignal(int, str, str)`): Emitted with the id, the serial and each line printed to `stderr`.
+"""
+from time import time
+from itertools import count
+from collections import deque
+
+from PyQt5.QtCore import QObject, QProcess, QTimer, pyqtSignal, pyqtSlot
+
+from Script.Utilities.Command_Runner import resolve_binary
+
+STOP_TIMEOUT = 3000
+STDERR_BUFFER_LINES = 200
+
+class ScrcpySession(QObject):
+    """
+    This class is the handle of a running `scrcpy` session.
+
+    Parameters
+    ----------
+    - session_id (`int`): The id given by the supervisor.
+    - serial (`str`): The serial of the mirrored device.
+    - args (`list`): The arguments of the command (the first one is the `scrcpy` executable).
+    - path (`str`): The folder the command is executed in.
+
+    Attributes
+    ----------
+    - stderr (`deque`): The last `STDERR_BUFFER_LINES` lines printed to `stderr`.
+    - error_detected (`bool`): Set by the classifier of the caller once an error line was reported, so the same
+    session is not reported twice.
+
+    Signals
+    -------
+    - `stderr_line` (`pyqtSignal(str)`): Emitted with each line printed to `stderr`, as soon as it is complete.
+    - `finished` (`pyqtSignal(int, str)`): Emitted with the exit code and the last lines of `stderr`.
+    """
+    stderr_line = pyqtSignal(str)
+    finished = pyqtSignal(int, str)
+
+    def __init__(self, session_id: int, serial: str, args: list, path: str, parent: QObject = None):
+        super().__init__(parent)
+        self.session_id = session_id
+        self.serial = serial
+        self.args = args
+        self.path = path
+        self.start_time = None
+        self.stderr = deque(maxlen=STDERR_BUFFER_LINES)
+        self.partial_line = b""
+        self.error_detected = False
+        self.stopping = False
+        self.process = QProcess(self)
+        self.process.setProgram(args[0])
+        self.process.setArguments(args[1:])
+        self.process.setWorkingDirectory(path)
+        self.process.setStandardOutputFile(QProcess.nullDevice())
+        self.process.readyReadStandardError.connect(self.read_stderr)
+        self.process.finished.connect(self.process_finished)
+        self.process.errorOccurred.connect(self.process_error)
+
+    @property
+    def pid(self) -> int:
+        """The PID of the `scrcpy` process (`0` if it is not running)."""
+        return self.process.processId()
+
+    def start(self) -> None:
+        """Starts the `scrcpy` process."""
+        self.start_time = time()
+        self.process.start()
+
+    def is_running(self) -> bool:
+        """Returns `True` while the `scrcpy` process is starting or running."""
+        return self.process.state() != QProcess.NotRunning
+
+    def stop(self) -> None:
+        """
+        Asks `scrcpy` to close (so a recording is finished properly) and kills it after `STOP_TIMEOUT` milliseconds.
+        """
+        if self.is_running():
+            self.stopping = True
+            self.process.terminate()
+            QTimer.singleShot(STOP_TIMEOUT, self.kill)
+
+    @pyqtSlot()
+    def kill(self) -> None:
+        """Kills the `scrcpy` process if it is still running."""
+        if self.is_running():
+            self.process.kill()
+
+    @pyqtSlot()
+    def read_stderr(self, flush: bool = False) -> None:
+        """
+        Reads the available `stderr` and emits every complete line (the last partial line is kept for the next read).
+
+        Parameters
+        ----------
+        - flush (`bool`, optional): If `True`, the partial line is emitted too (the process is finished). Defaults to `False`.
+        """
+        *lines, self.partial_line = (self.partial_line + bytes(self.process.readAllStandardError())).split(b"\n")
+        if flush and self.partial_line:
+            lines.append(self.partial_line)
+            self.partial_line = b""
+
+        for line in lines:
+            if line := line.decode("utf-8", "replace").rstrip("\r"):
+                self.stderr.append(line)
+                self.stderr_line.emit(line)
+
+    @pyqtSlot(int, QProcess.ExitStatus)
+    def process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        self.read_stderr(flush=True)
+        if exit_status == QProcess.CrashExit and not self.stopping:
+            exit_code = -1
+        self.finished.emit(exit_code, "\n".join(self.stderr))
+
+    @pyqtSlot(QProcess.ProcessError)
+    def process_error(self, error: QProcess.ProcessError) -> None:
+        # a crash or a kill is also reported by `finished` ↓
+        if error == QProcess.FailedToStart:
+            self.finished.emit(-1, f"{self.process.errorString()}: {self.args[0]}")
+
+    def __repr__(self) -> str:
+        return f"ScrcpySession({self.session_id}, {self.serial!r}, pid={self.pid})"
+
+class ScrcpySupervisor(QObject):
+    """
+    This class starts the `scrcpy` sessions and keeps their handles until they finish.
+    """
+    session_started = pyqtSignal(int, str)
+    session_finished = pyqtSignal(int, str, int)
+    session_output = pyqtSignal(int, str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.session_ids = count(1)
+        self.running_sessions = {}
+
+    def start(self, serial: str, args: list, path: str = ".") -> ScrcpySession:
+        """
+        Starts a `scrcpy` session.
+
+        Parameters
+        ----------
+        - serial (`str`): The serial of the device to mirror.
+        - args (`list`): The arguments of the command, e.g. `["scrcpy", "-s", serial, "--no-audio"]`,
+        the executable is looked up in `path` first on Windows (see `Command_Runner.resolve_binary`).
+        - path (`str`, optional): The path to the `scrcpy` folder. Defaults to `"."`.
+
+        Returns
+        -------
+        - `ScrcpySession`: The handle of the session, connect to its `finished` signal before returning to the event loop.
+        """
+        args = [resolve_binary(args[0], path), *args[1:]]
+        session = ScrcpySession(next(self.session_ids), serial, args, path, self)
+        session.finished.connect(self.session_ended)
+        session.stderr_line.connect(
+            lambda line, session=session: self.session_output.emit(session.session_id, session.serial, line)
+        )
+        self.running_sessions[session.session_id] = session
+        session.start()
+        self.session_started.emit(session.session_id, serial)
+        return session
+
+    @pyqtSlot(int, str)
+    def session_ended(self, exit_code: int, _stderr: str) -> None:
+        if session := self.running_sessions.pop(self.sender().session_id, None):
+            self.session_finished.emit(session.session_id, session.serial, exit_code)
+            session.deleteLater()
+
+    def sessions(self, serial: str = None) -> list:
+        """
+        Returns the running sessions.
+
+        Parameters
+        ----------
+        - serial (`str`, optional): If given, only the sessions of this device are returned.
+
+        Returns
+        -------
+        - `list`: A list of `ScrcpySession`.
+        """
+        return [
+            session for session in self.running_sessions.values() if serial is None or session.serial == serial
+        ]
+
+    def stop(self, session_id: int) -> bool:
+        """
+        Stops a session.
+
+        Returns
+        -------
+        - `bool`: `True` if the session was running.
+        """
+        if session := self.running_sessions.get(session_id):
+            session.stop()
+        return session is not None
+
+    def stop_all(self, serial: str = None) -> int:
+        """
+        Stops the running sessions (only the ones of `serial`, if given).
+
+        Returns
+        -------
+        - `int`: The number of sessions asked to stop.
+        """
+        sessions = self.sessions(serial)
+        for session in sessions:
+            session.stop()
+        return len(sessions)
+
+    @pyqtSlot()
+    def shutdown(self) -> None:
+        """
+        Stops every session and waits for them (used when the app is closed).
+        """
+        sessions = self.sessions()
+        for session in sessions:
+            session.stop()
+        for session in sessions:
+            if not session.process.waitForFinished(STOP_TIMEOUT):
+                session.kill()
+
+scrcpy_sessions = ScrcpySupervisor()
@@ -0,0 +1,128 @@
+"""
+This module contains the detection of the version of `scrcpy`, and the cache of the probes of its binaries.
+
+Running `scrcpy -v` is slow (`scrcpy` initialises SDL and its libraries before printing anything), so the
+version found for each binary is cached in the user data (`Versions.Version_Cache`), with the identity of
+the binary: its resolved path, size, modification time and inode. `scrcpy -v` is only run again when the
+binary changes (updated, replaced or moved), so the check made on every launch on Linux and the versions
+added on Windows (`Saved_Versions`) usually cost no process launch at all.
+
+The same cache is used for the other probes of a binary (see `cached_probe` and `save_probe`), e.g. the
+options listed by `scrcpy --help` (see `Scrcpy_Capabilities`).
+"""
+from os import stat
+from os.path import realpath
+
+from Script.Utilities.Command_Runner import CommandRunner, resolve_binary
+from Script.Utilities.Settings_Store import settings_store, VERSION_CACHE_KEYS
+
+def parse_scrcpy_version(output: str) -> float:
+    """
+    Returns the version printed by `scrcpy -v` (e.g. `scrcpy 2.4 <https://...>` gives `2.4`), or `None` if the
+    output is empty. The digits after the first point are kept together (`2.4.1` gives `2.41`).
+    """
+    words = output.lower().strip().split()
+    if len(words) < 2:
+        return None
+
+    find_version_point = False
+    version = ""
+    for char in words[1]:
+        if char == "." and find_version_point is False:
+            find_version_point = True
+            version += char
+        elif char != "." and char.isdigit():
+            version += char
+
+    try:
+        return float(version)
+    except ValueError:
+        return None
+
+def binary_identity(path: str) -> dict:
+    """
+    Returns the identity of the `scrcpy` binary used from `path`, or `None` if it does not exist.
+
+    Parameters
+    ----------
+    - path (`str`): The folder of the scrcpy version (searched before the `PATH` on Windows, see `resolve_binary`).
+
+    Returns
+    -------
+    - `dict`: A dictionary with the keys `Binary` (the resolved path, links followed), `Size`, `Mtime` (in nanoseconds) and `Inode`.
+    """
+    binary = realpath(resolve_binary("scrcpy", path))
+    try:
+        binary_stat = stat(binary)
+    except OSError:
+        return None
+    return {
+        "Binary": binary,
+        "Size": binary_stat.st_size,
+        "Mtime": binary_stat.st_mtime_ns,
+        "Inode": binary_stat.st_ino,
+    }
+
+def cached_probe(cache_keys: tuple, identity: dict) -> dict:
+    """
+    Returns the result of a probe cached for the binary `identity` (see `binary_identity`), or `None` if the
+    binary changed or was never probed.
+
+    Parameters
+    ----------
+    - cache_keys (`tuple`): The path of the cache in the user data (e.g. `VERSION_CACHE_KEYS`).
+    - identity (`dict`): The identity of the binary, `None` if it does not exist.
+    """
+    if identity is None:
+        return None
+
+    entry = (settings_store.get(cache_keys) or {}).get(identity["Binary"])
+    if entry and all(entry.get(key) == value for key, value in identity.items()):
+        return entry
+    return None
+
+def save_probe(cache_keys: tuple, identity: dict, result: dict) -> None:
+    """
+    Caches the result of a probe of the binary `identity`, in place of the result of the previous binary with the same path.
+
+    Parameters
+    ----------
+    - cache_keys (`tuple`): The path of the cache in the user data (its parent must exist).
+    - identity (`dict`): The identity of the binary (see `binary_identity`).
+    - result (`dict`): The result of the probe (JSON values only).
+    """
+    cache = dict(settings_store.get(cache_keys) or {})
+    cache[identity["Binary"]] = {**identity, **result}
+    settings_store.set(cache, cache_keys)
+
+def cached_scrcpy_version(identity: dict) -> float:
+    """
+    Returns the version cached for the binary `identity` (see `binary_identity`), or `None` if it changed or was never probed.
+    """
+    if entry := cached_probe(VERSION_CACHE_KEYS, identity):
+        return entry.get("Version")
+    return None
+
+def get_scrcpy_version(path: str, runner: CommandRunner = None) -> float:
+    """
+    Returns the version of the `scrcpy` binary used from `path`, running `scrcpy -v` only if the binary
+    is not in the cache or changed since it was probed.
+
+    Parameters
+    ----------
+    - path (`str`): The folder of the scrcpy version.
+    - runner (`CommandRunner`, optional): The runner of the command. Defaults to a new runner in `path`.
+
+    Returns
+    -------
+    - `float`: The version (e.g. `2.4`), or `None` if it could not be read.
+    """
+    identity = binary_identity(path)
+    if (version := cached_scrcpy_version(identity)) is not None:
+        return version
+
+    runner = runner or CommandRunner(path)
+    version = parse_scrcpy_version(runner.run(["scrcpy", "-v"]).stdout)
+    if version is not None and identity is not None:
+        save_probe(VERSION_CACHE_KEYS, identity, {"Version": version})
+    return version
@@ -0,0 +1,258 @@
+"""
+This module contains the store of the user data (`Data/UserData.json`).
+
+The document is read once and kept in memory, the `userdata` dictionary given to the tabs is the
+document of the store itself, so every tab reads the current values without opening the file.
+A change (see `set` and `delete`, used by `Utils.update_data_file`) only marks its path as dirty,
+the file is written `FLUSH_DELAY` milliseconds after the last change (so dragging a slider writes
+the file once, not once per value) and when the app is closed.
+
+The file is written atomically: the document is saved to a temporary file next to it, which then
+replaces the old file, so a crash while saving never leaves a truncated `UserData.json`.
+
+The values read all over the app have typed accessors (`theme`, `scrcpy_path`, `scrcpy_version`,
+`auto_port`, `record_path` and `last_tab`), and a widget that shows a value can `subscribe` to its path to be
+called with the new value after every change, instead of reading the file again.
+"""
+from copy import deepcopy
+from contextlib import suppress
+from json import dumps, load
+from os import makedirs, replace
+from os.path import dirname, join
+from threading import Lock
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from Script.Utilities.Static_Datas import PATH_DATA_DIR, USERDATA
+
+FLUSH_DELAY = 250
+USERDATA_PATH = join(PATH_DATA_DIR, "UserData.json")
+
+THEME_KEYS = ("Theme_Active",)
+SCRCPY_PATH_KEYS = ("Versions", "Selected_Version", "Path")
+SCRCPY_VERSION_KEYS = ("Versions", "Selected_Version", "Version")
+VERSION_CACHE_KEYS = ("Versions", "Version_Cache")
+CAPABILITY_CACHE_KEYS = ("Versions", "Capability_Cache")
+DEVICE_CACHE_KEYS = ("Connect", "Device_Cache")
+ENCODER_BENCHMARK_KEYS = ("Connect", "Encoder_Benchmarks")
+AUTO_RECONNECT_KEYS = ("Connect", "Auto_Reconnect")
+RESTART_SESSIONS_KEYS = ("Connect", "Restart_Sessions")
+RECONNECT_ENDPOINTS_KEYS = ("Connect", "Connect_Devices")
+AUTO_PORT_KEYS = ("Connect", "Port_Auto")
+SAVED_ENDPOINTS_KEYS = ("Connect", "Custom_Ip_Saved")
+SWEEP_NETWORK_KEYS = ("Connect", "Sweep_Network")
+SWEEP_PORTS_KEYS = ("Connect", "Sweep_Ports")
+RECORD_PATH_KEYS = ("File_Path_Config", "Path_selected")
+LAST_TAB_KEYS = ("Last_Session_Config", "Tab_Index")
+
+class SettingsStore(QObject):
+    """
+    This class keeps the user data in memory and writes it to the file behind the changes.
+
+    Parameters
+    ----------
+    - path (`str`, optional): The path of the `JSON` file. Defaults to `USERDATA_PATH`.
+    - defaults (`dict`, optional): The data used when the file does not exist. Defaults to `USERDATA`.
+    - delay (`int`, optional): The time (in milliseconds) waited after the last change before writing
+    the file. Defaults to `FLUSH_DELAY`.
+
+    Signals
+    -------
+    - `setting_changed` (`pyqtSignal(tuple)`): Emitted with the path of every change (from any thread, `()` when 
+    the whole document is replaced), schedules the next write and calls the subscribers in the main thread.
+    """
+    setting_changed = pyqtSignal(tuple)
+
+    def __init__(self, path: str = USERDATA_PATH, defaults: dict = USERDATA, delay: int = FLUSH_DELAY):
+        super().__init__()
+        self.path = path
+        self.defaults = defaults
+        self.lock = Lock()
+        self.data = {}
+        self.dirty_paths = set()
+        self.subscriptions = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(delay)
+        self.flush_timer.timeout.connect(self.flush)
+        # the changes made by the threads are handled in the main thread, where the timer lives ↓
+        self.setting_changed.connect(self.schedule_flush)
+        self.setting_changed.connect(self.notify_subscribers)
+
+    def load(self) -> dict:
+        """
+        Reads the file (or creates it with the default data) and returns the document.
+
+        Returns
+        -------
+        - `dict`: The document of the store, changed in place by `set`, `delete` and `reset`.
+        """
+        try:
+            with open(self.path, "r") as json_data:
+                data = load(json_data)
+        except FileNotFoundError:
+            data = deepcopy(self.defaults)
+            self.dirty_paths.add(())
+
+        with self.lock:
+            self.data.clear()
+            self.data.update(data)
+        if self.dirty_paths:
+            self.flush()
+        return self.data
+
+    def get(self, keys: list, default: any = None) -> any:
+        """
+        Returns the value at the path `keys` (e.g. `["Versions", "Selected_Version"]`), or `default` if it is missing.
+        """
+        value = self.data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    def set(self, value: any, keys: list) -> None:
+        """
+        Sets the value at the path `keys` and schedules the write.
+
+        Raises
+        ------
+        - `KeyError`: If a parent of the last key does not exist.
+        """
+        with self.lock:
+            self.parent(keys)[keys[-1]] = value
+            self.dirty_paths.add(tuple(keys))
+        self.setting_changed.emit(tuple(keys))
+
+    def delete(self, keys: list) -> None:
+        """
+        Deletes the value at the path `keys` and schedules the write.
+
+        Raises
+        ------
+        - `KeyError`: If the value does not exist.
+        """
+        with self.lock:
+            del self.parent(keys)[keys[-1]]
+            self.dirty_paths.add(tuple(keys))
+        self.setting_changed.emit(tuple(keys))
+
+    def reset(self, data: dict) -> None:
+        """
+        Replaces the whole document by a copy of `data` (e.g. `USERDATA`) and writes it right away.
+        """
+        with self.lock:
+            self.data.clear()
+            self.data.update(deepcopy(data))
+            self.dirty_paths.add(())
+        self.flush()
+        self.setting_changed.emit(())
+
+    def parent(self, keys: list) -> dict:
+        """Returns the dictionary holding the last key of `keys`."""
+        sub_dict = self.data
+        for key in keys[:-1]:
+            sub_dict = sub_dict[key]
+        return sub_dict
+
+    def subscribe(self, keys: list, callback) -> None:
+        """
+        Calls `callback(value)` with the value at the path `keys` every time it (or a value inside it) changes.
+
+        Parameters
+        ----------
+        - keys (`list`): The path of the value (e.g. `SCRCPY_PATH_KEYS`).
+        - callback (`callable`): The function called in the main thread, if it is a method of a `QObject`
+        it is unsubscribed when the object is destroyed.
+        """
+        self.subscriptions.append((tuple(keys), callback))
+        if isinstance(owner := getattr(callback, "__self__", None), QObject):
+            owner.destroyed.connect(lambda *_: self.unsubscribe(keys, callback))
+
+    def unsubscribe(self, keys: list, callback) -> None:
+        """Stops calling `callback` for the changes of `keys` (see `subscribe`)."""
+        with suppress(ValueError):
+            self.subscriptions.remove((tuple(keys), callback))
+
+    @pyqtSlot(tuple)
+    def notify_subscribers(self, changed_keys: tuple) -> None:
+        """Calls the subscribers of the changed path, of its parents and of the values inside it."""
+        for keys, callback in list(self.subscriptions):
+            if keys[:len(changed_keys)] == changed_keys or changed_keys[:len(keys)] == keys:
+                callback(self.get(keys))
+
+    @property
+    def theme(self) -> int:
+        """The active theme, `0` for the dark theme and `1` for the light theme."""
+        return int(self.get(THEME_KEYS, 0) or 0)
+
+    @theme.setter
+    def theme(self, theme: int) -> None:
+        self.set(int(theme), THEME_KEYS)
+
+    @property
+    def scrcpy_path(self) -> str:
+        """The folder of the selected scrcpy version (empty if none was selected)."""
+        return self.get(SCRCPY_PATH_KEYS, "") or ""
+
+    @property
+    def scrcpy_version(self) -> float:
+        """The selected scrcpy version (e.g. `2.4`, `0.0` if unknown)."""
+        return float(self.get(SCRCPY_VERSION_KEYS, 0.0) or 0.0)
+
+    @property
+    def auto_port(self) -> str:
+        """The port used to connect the devices automatically (empty if not set)."""
+        return self.get(AUTO_PORT_KEYS, "") or ""
+
+    @auto_port.setter
+    def auto_port(self, port: str) -> None:
+        self.set(port, AUTO_PORT_KEYS)
+
+    @property
+    def record_path(self) -> str:
+        """The folder where the recordings are moved (empty if not set)."""
+        return self.get(RECORD_PATH_KEYS, "") or ""
+
+    @property
+    def last_tab(self) -> int:
+        """The index of the tab shown when the app was closed."""
+        return int(self.get(LAST_TAB_KEYS, 0) or 0)
+
+    @last_tab.setter
+    def last_tab(self, index: int) -> None:
+        self.set(int(index), LAST_TAB_KEYS)
+
+    @pyqtSlot(tuple)
+    def schedule_flush(self, *_) -> None:
+        """(Re)starts the timer of the next write, so only the last of a burst of changes writes the file."""
+        self.flush_timer.start()
+
+    @pyqtSlot()
+    def flush(self) -> None:
+        """
+        Writes the document to the file if it has unsaved changes (used by the timer and when the app is closed).
+        """
+        self.flush_timer.stop()
+        with self.lock:
+            if not self.dirty_paths:
+                return
+            try:
+                content = dumps(self.data)
+            except RuntimeError: # changed by a thread while it was serialized, retried after the next delay
+                self.flush_timer.start()
+                return
+            self.dirty_paths.clear()
+
+        temp_path = f"{self.path}.tmp"
+        try:
+            makedirs(dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w") as json_data:
+                json_data.write(content)
+            replace(temp_path, self.path)
+        except OSError: # kept dirty, so the next change (or the exit) tries again
+            with self.lock:
+                self.dirty_paths.add(())
+
+settings_store = SettingsStore()
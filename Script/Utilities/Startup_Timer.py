@@ -0,0 +1,199 @@
+"""
+This module contains the timer of the startup of the app.
+
+Each step of the startup (imports, user data, first tab, window shown...) is marked with
+`startup_timer.mark`, and `startup_timer.report` returns the time of each step and the total
+time from the start of the app to the first paint of the window, e.g.:
+
+    startup: imports 412ms | user data 3ms | tab Start 58ms | window 95ms | first paint 12ms | total 522ms
+
+Profiling mode
+--------------
+Started with `python start.py --profile-startup` (or the environment variable `SCRCPY_CLIENT_PROFILE_STARTUP=1`),
+the report is printed, also as a table (start and duration of each step, the steps measured inside another one
+are indented) and saved to `Data/Startup_Profile.json`. The steps that end after the first paint (e.g. the
+thread reading the version of scrcpy) are added to the file when they end.
+
+With `--profile-startup=cprofile`, the startup is also run under `cProfile`, the statistics are saved
+to `Data/Startup_Profile.prof` (see `python -m pstats`) and the slowest functions are printed. The time of
+each import can be printed with the option of Python itself: `python -X importtime start.py --profile-startup`.
+"""
+from os import environ
+from os.path import join
+from sys import version
+from json import dumps
+from platform import platform
+from datetime import datetime
+from contextlib import contextmanager
+from time import perf_counter
+
+PROFILE_OPTION = "--profile-startup"
+PROFILE_ENV = "SCRCPY_CLIENT_PROFILE_STARTUP"
+PROFILE_REPORT_FILE = "Startup_Profile.json"
+PROFILE_STATS_FILE = "Startup_Profile.prof"
+PROFILE_TOP_FUNCTIONS = 15
+
+class StartupTimer():
+    """
+    This class measures the steps of the startup, from its creation (the start of the app).
+
+    Attributes
+    ----------
+    - steps (`list`): A list of tuples `(step, start, duration)`, the start is the time (in seconds) since the start of the app.
+    - profiling (`bool`): `True` in profiling mode (see `configure`).
+    """
+    def __init__(self):
+        self.start_time = perf_counter()
+        self.last_time = self.start_time
+        self.steps = []
+        self.reported = False
+        self.profiling = False
+        self.profiler = None
+
+    def configure(self, argv: list) -> list:
+        """
+        Enables the profiling mode if it is asked by the arguments of the app or by the `PROFILE_ENV` variable.
+
+        Parameters
+        ----------
+        - argv (`list`): The arguments of the app, e.g. `["start.py", "--profile-startup=cprofile"]`.
+
+        Returns
+        -------
+        - `list`: The arguments without the profiling option (given to `QApplication`).
+        """
+        mode = environ.get(PROFILE_ENV, "")
+        arguments = []
+        for argument in argv:
+            if argument == PROFILE_OPTION or argument.startswith(f"{PROFILE_OPTION}="):
+                mode = argument.partition("=")[2] or "1"
+            else:
+                arguments.append(argument)
+
+        if mode and mode != "0":
+            self.profiling = True
+            if mode.lower() == "cprofile":
+                from cProfile import Profile # only loaded when it is asked
+                self.profiler = Profile()
+                self.profiler.enable()
+        return arguments
+
+    def mark(self, step: str) -> float:
+        """
+        Ends a step of the startup.
+
+        Parameters
+        ----------
+        - step (`str`): The name of the step (e.g. `imports`).
+
+        Returns
+        -------
+        - `float`: The duration (in seconds) of the step, since the previous mark.
+        """
+        now = perf_counter()
+        duration = now - self.last_time
+        self.steps.append((step, self.last_time - self.start_time, duration))
+        self.last_time = now
+        return duration
+
+    def add(self, step: str, duration: float) -> None:
+        """
+        Adds a step measured elsewhere (e.g. the build of a tab), its time is also part of the next mark.
+
+        In profiling mode, a step added after the report (e.g. a thread that ends after the first paint, or a tab
+        built when it is first shown) is printed and saved to the report file.
+        """
+        self.steps.append((step, self.total() - duration, duration))
+        if self.reported and self.profiling:
+            print(f"startup: {step} {duration * 1000:.0f}ms (after the first paint)")
+            self.save_report()
+
+    @contextmanager
+    def phase(self, step: str):
+        """
+        Measures the code of a `with` block as a step (see `add`), e.g. `with startup_timer.phase("stylesheet"): ...`.
+        """
+        start = self.total()
+        try:
+            yield
+        finally:
+            self.add(step, self.total() - start)
+
+    def total(self) -> float:
+        """Returns the time (in seconds) since the start of the app."""
+        return perf_counter() - self.start_time
+
+    def report(self) -> str:
+        """
+        Returns the report of the startup, in profiling mode it is printed (only once) with the table of
+        the steps, and saved (see `save_report`).
+        """
+        steps = " | ".join(f"{step} {duration * 1000:.0f}ms" for step, _start, duration in self.steps)
+        report = f"startup: {steps} | total {(self.last_time - self.start_time) * 1000:.0f}ms"
+        if not self.reported:
+            self.reported = True
+            if self.profiling:
+                print(report)
+                self.stop_profiler()
+                print(self.table())
+                self.save_report()
+        return report
+
+    def table(self) -> str:
+        """
+        Returns the steps as a table, the steps that start and end inside the previous ones are indented.
+        """
+        lines = [f"{'step':<36}{'start':>10}{'duration':>10}"]
+        open_steps = []
+        for step, start, duration in sorted(self.steps, key=lambda step: (step[1], -step[2])):
+            # the steps still running at this start are the parents of this step ↓
+            open_steps = [end for end in open_steps if end - start > 1e-6]
+            name = "  " * len(open_steps) + step
+            lines.append(f"{name:<36}{start * 1000:>8.0f}ms{duration * 1000:>8.0f}ms")
+            open_steps.append(start + duration)
+        lines.append(f"{'total (first paint)':<36}{'':>10}{(self.last_time - self.start_time) * 1000:>8.0f}ms")
+        return "\n".join(lines)
+
+    def save_report(self) -> None:
+        """
+        Writes the report to `Data/Startup_Profile.json` (times in milliseconds).
+        """
+        # imported here, so the data of the app are not loaded before the start of the timer ↓
+        from Script.Utilities.Static_Datas import PATH_DATA_DIR
+
+        report = {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform(),
+            "python": version.split()[0],
+            "total_ms": round((self.last_time - self.start_time) * 1000, 3),
+            "steps": [
+                {"step": step, "start_ms": round(start * 1000, 3), "duration_ms": round(duration * 1000, 3)}
+                for step, start, duration in self.steps
+            ],
+        }
+        try:
+            with open(join(PATH_DATA_DIR, PROFILE_REPORT_FILE), "w") as report_file:
+                report_file.write(dumps(report, indent=4))
+        except OSError as error:
+            print(f"could not save the startup report: {error}")
+
+    def stop_profiler(self) -> None:
+        """
+        Stops `cProfile` (if it runs), saves its statistics to `Data/Startup_Profile.prof` and prints the slowest functions.
+        """
+        if self.profiler is None:
+            return
+
+        from pstats import Stats
+        from Script.Utilities.Static_Datas import PATH_DATA_DIR
+
+        self.profiler.disable()
+        stats = Stats(self.profiler)
+        self.profiler = None
+        try:
+            stats.dump_stats(join(PATH_DATA_DIR, PROFILE_STATS_FILE))
+        except OSError as error:
+            print(f"could not save the startup profile: {error}")
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+
+startup_timer = StartupTimer()
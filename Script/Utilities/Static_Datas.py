@@ -5,8 +5,10 @@ this includes the keys and other informations that are used in other parts of th
 The static datas are divided into 4 categories:
 
 - `USERDATA`: Stores user data, such as theme, saved IPs/ports, and connected devices.
-- `ARGS_LIST` and `EXTRA_ARGS_LIST`: These are lists of arguments that can be passed to Scrcpy.
+- `OPTION_SCHEMA`: The arguments that can be passed to Scrcpy from the Start tab, with the versions that support them.
 - `ERRORS_LIST`: This is a list of some errors codes that can be returned by Scrcpy.
+- `ERROR_CATALOGUE` and `ERROR_MESSAGES`: The errors recognized in the output of Scrcpy/ADB and the alert shown for each one.
+- `ARGS_RULES`: The combinations of arguments rejected before Scrcpy is started, with the code of the same error.
 - `LAYOUT_POSITIONS`: Positions of UI elements in layout.
 
 
@@ -29,6 +31,12 @@ USERDATA = {
                 "Custom_Ip_Saved": {},
                 "Port_Auto": None,
                 "Connect_Devices": [],
+                "Device_Cache": {},
+                "Encoder_Benchmarks": {},
+                "Auto_Reconnect": False,
+                "Restart_Sessions": True,
+                "Sweep_Network": "",
+                "Sweep_Ports": ["5555"],
             },
     
     "Custom_Config_Set": {},
@@ -43,6 +51,8 @@ USERDATA = {
                     "Version": 0.0,
                 }, 
                 "Saved_Versions": {},
+                "Version_Cache": {},
+                "Capability_Cache": {},
             },
     
     "File_Path_Config": {
@@ -52,6 +62,8 @@ USERDATA = {
             },
     
     "Last_Session_Config": {
+        "Tab_Index": 0,
+        
         "ConnectTAB": {
                 "Ip_Index": 0,
                 "LineEdit_Texts": [None,
@@ -84,143 +96,118 @@ USERDATA = {
         },
     }
 
-ARGS_LIST = {
-    "scrcpy_2.0": {
-        "Version": 2.0,
-        "no audio": " --no-audio",
-        "no video": " --no-video",
-    },
-    
-    "scrcpy_2.1": {
-        "Version": 2.1,
-        "no playback": " --no-playback",
+# the encoder choice resolved when a session is started, to the fastest encoder measured for the device (see `Encoder_Benchmark`) ↓
+AUTO_ENCODER_TEXT = "Auto (fastest measured)"
+AUTO_ENCODER_ARG = "--video-encoder=auto"
 
-    },
-    
-    "scrcpy_2.5": {
-        "Version": 2.5,
-        "no mouse hover": " --no-mouse-hover",
-    },
-    "scrcpy_2.7": {
-        "Version": 2.7,
-        
-        "gamepad": " -G",
-        "gamepad otg": " -G --otg",
-    },
-    
-    "scrcpy_3.1": {
-        "Version": 3.1,
-        
-        "no vd destroy": " --no-vd-destroy-content"
-    },
-    "all_version": {
-        "prefer text": " --prefer-text",
-        "no k repeat": " --no-key-repeat",
-        "raw k events": " --raw-key-events",
-        "crop": " --crop ",
-        "ctrl sct": " --shortcut-mod=lctrl,rctrl",
-        "alt-ctrl sct": " --shortcut-mod=lalt,ralt,lctrl,rctrl",
-        "show touches": " --show-touches",
-        "no control": " --no-control",
-        "fullscreen": " -f",
-        "always on top": " --always-on-top",
-        "stay awake": " --stay-awake",
-        "screen off": " --turn-screen-off",
-        "borderless": " --window-borderless",
-        "max fps": " --max-fps ",
-        "max size": " -m ",
-        "orientation": " --lock-video-orientation",
-        "otg": " --otg ",
-        "bit-rate": " -b ",
-    }
-}
+# (option id, widget, key, check, template, since, before), the options of scrcpy built from the widgets of the 
+# Start tab (see `Option_Schema`). An option is used from the version `since` (included) to the version `before` 
+# (excluded), `None` for no limit, and only when the check box `check` is checked (if given).
+#
+# - `slider`: The slider `key` (by position), `{value}` is its value.
+# - `text`: The line edit `key` (by position, after the custom line), `{value}` is its text, a template that 
+# continues the previous option (without a leading space, e.g. the DPI of the virtual display) is skipped if it is empty.
+# - `record`: The file format `key` (a tuple of formats), `{name}` is the file name (`video` if empty) and `{format}` the format.
+# - `combo`: The text `key` of a combo box, or of the 2 input combo boxes together (e.g. `AoA Mouse`).
+# - `encoder`: An encoder listed by the device (see `Device_Capabilities`), in the format `(codec) encoder`, for the 
+# codecs `key`, `{codec}` is its codec and `{encoder}` its name.
+# - `check`: The text `key` of a check box (lowercase).
+OPTION_SCHEMA = [
+    ("max_fps", "slider", 0, None, " --max-fps {value}", None, None),
+    ("max_size", "slider", 1, None, " -m {value}", None, None),
+    ("video_bit_rate", "slider", 2, None, " --bit-rate {value}M", None, 2.0),
+    ("video_bit_rate", "slider", 2, None, " --video-bit-rate {value}M", 2.0, None),
+    ("video_buffer", "slider", 3, "video buffer", " --display-buffer {value}", None, 3.0),
+    ("video_buffer", "slider", 3, "video buffer", " --video-buffer {value}", 3.0, None),
+    ("audio_buffer", "slider", 4, "audio buffer", " --audio-buffer {value}", 2.0, None),
+    ("angle", "slider", 5, "angle", " --angle {value}", 3.0, None),
+    ("time_limit", "slider", 6, "time limit", " --time-limit {value}", 2.1, None),
+    ("screen_off_timeout", "slider", 7, "screen off to", " --screen-off-timeout {value}", 3.0, None),
 
-EXTRA_ARGS_LIST = {
-    "scrcpy_2.2": {
-        "Version": 2.2,
-        
-        "Screen": " --video-source=display",
-        "Back Camera": " --video-source=camera --camera-facing=back",
-        "Front Camera": " --video-source=camera --camera-facing=front",
-        "External Camera": " --video-source=camera --camera-facing=external",
-            
-        "Microphone": " --audio-source=mic",
-    },
-    
-    "scrcpy_2.3": {
-        "Version": 2.3,
-        
-        "(flac) C2 Android Flac Encoder": " --audio-codec=flac --audio-encoder=c2.android.flac.encoder",
-        "(flac) OMX Google Flac Encoder": " --audio-codec=flac --audio-encoder=OMX.google.flac.encoder",
-    },
-    "scrcpy_2.6": {
-        "Version": 2.6,
-        
-        "Playback" : " --audio-source=playback",
-        "Audio Dup": " --audio-dup",
-        "Audio Dup + Playback": " --audio-dup --audio-source=playback",
-    },
-    
-    "scrcpy_3.0": {
-        "Version": 3.0,
-        
-        "0° Degrees": " --capture-orientation=@0",
-        "90° Degrees": " --capture-orientation=@90",
-        "180° Degrees": " --capture-orientation=@180",
-        "270° Degrees": " --capture-orientation=@270",
-        "Flip 0° Degrees": " --capture-orientation=@flip0",
-        "Flip 90° Degrees": " --capture-orientation=@flip90",
-        "Flip 180° Degrees": " --capture-orientation=@flip180",
-        "Flip 270° Degrees": " --capture-orientation=@flip270",
-    },
-    "scrcpy_3.1": {
-        "Version": 3.1,
-        
-        "(av1) C2 Android Av1 Encoder" : " --video-encoder=c2.android.av1.encoder --video-codec=av1",
-    },
-    "all_version": {
-        "AoA Mouse": " --otg --mouse=aoa",
-        "SDK Mouse": " --mouse=sdk",
-        "uHid Mouse": " --mouse=uhid",
-        "AoA Keyboard": " --otg --keyboard=aoa",
-        "SDK Keyboard": " --keyboard=sdk",
-        "uHid Keyboard": " --keyboard=uhid",
-        "AoA Mouse + Keyboard": " --otg --mouse=aoa --keyboard=aoa",
-        "SDK Mouse + Keyboard": " --mouse=sdk --keyboard=sdk",
-        "uHid Mouse + Keyboard": " --mouse=uhid --keyboard=uhid",
-        
-        "(h264) C2 Mtk Avc Encoder" : " --video-encoder=c2.mtk.avc.encoder --video-codec=h264",
-        "(h264) C2 Android Avc Encoder" : " --video-encoder=c2.android.avc.encoder --video-codec=h264",
-        "(h264) OMX Google H264 Encoder" : " --video-encoder=OMX.google.h264.encoder --video-codec=h264",
-        "(h264) OMX MTK VIDEO ENCODER AVC": " --video-encoder=OMX.MTK.VIDEO.ENCODER.AVC --video-codec=h264",
-        "(h265) C2 Mtk Hevc Encoder" : " --video-encoder=c2.mtk.hevc.encoder --video-codec=h265",
-        "(h265) OMX MTK VIDEO ENCODER HEVC" : " --video-encoder=OMX.MTK.VIDEO.ENCODER.HEVC --video-codec=h265",
-        "(opus) C2 Android Opus Encoder": " --audio-codec=opus --audio-encoder=c2.android.opus.encoder",   
-        "(aac) C2 Android Aac Encoder": " --audio-codec=aac --audio-encoder=c2.android.aac.encoder",
-        "(aac) OMX Google Aac Encoder": " --audio-codec=aac --audio-encoder=OMX.google.aac.encoder",
-    },
-    "deprecated_args": {
-        "limit_2.2": {
-            "Version": 2.2,
-            
-            "0° Degrees": " --lock-video-orientation=0",
-            "90° Degrees": " --lock-video-orientation=1",
-            "180° Degrees": " --lock-video-orientation=2",
-            "270° Degrees": " --lock-video-orientation=3",
-        },
-        "limit_2.7": {
-            "Version": 2.7,
+    ("record_audio_codec", "record", ("opus", "aac"), "record", " --audio-codec={format}", 2.1, None),
+    ("record", "record", ("opus", "aac"), "record", " --record {name}.mp4", None, 2.1),
+    ("record", "record", ("opus", "aac"), "record", " --record {name}.{format}", 2.1, None),
+    ("record", "record", ("mp4", "mkv"), "record", " --record {name}.{format}", None, None),
+    ("mouse_bind", "text", 1, "mouse binding", " --mouse-bind={value}", 2.5, None),
+    ("new_display", "text", 2, "virtual display", " --new-display={value}", 3.0, None),
+    ("new_display_dpi", "text", 3, "virtual display", "/{value}", 3.0, None),
+    ("start_app", "text", 4, "virtual display", " --start-app={value}", 3.0, None),
+    ("crop", "text", 5, "crop", " --crop {value}", None, None),
+
+    ("encoder_mtk_avc", "combo", "(h264) C2 Mtk Avc Encoder", None, " --video-encoder=c2.mtk.avc.encoder --video-codec=h264", None, None),
+    ("encoder_android_avc", "combo", "(h264) C2 Android Avc Encoder", None, " --video-encoder=c2.android.avc.encoder --video-codec=h264", None, None),
+    ("encoder_google_h264", "combo", "(h264) OMX Google H264 Encoder", None, " --video-encoder=OMX.google.h264.encoder --video-codec=h264", None, None),
+    ("encoder_omx_mtk_avc", "combo", "(h264) OMX MTK VIDEO ENCODER AVC", None, " --video-encoder=OMX.MTK.VIDEO.ENCODER.AVC --video-codec=h264", None, None),
+    ("encoder_mtk_hevc", "combo", "(h265) C2 Mtk Hevc Encoder", None, " --video-encoder=c2.mtk.hevc.encoder --video-codec=h265", None, None),
+    ("encoder_omx_mtk_hevc", "combo", "(h265) OMX MTK VIDEO ENCODER HEVC", None, " --video-encoder=OMX.MTK.VIDEO.ENCODER.HEVC --video-codec=h265", None, None),
+    ("encoder_android_av1", "combo", "(av1) C2 Android Av1 Encoder", None, " --video-encoder=c2.android.av1.encoder --video-codec=av1", 3.1, None),
+    ("encoder_android_opus", "combo", "(opus) C2 Android Opus Encoder", None, " --audio-codec=opus --audio-encoder=c2.android.opus.encoder", None, None),
+    ("encoder_android_aac", "combo", "(aac) C2 Android Aac Encoder", None, " --audio-codec=aac --audio-encoder=c2.android.aac.encoder", None, None),
+    ("encoder_google_aac", "combo", "(aac) OMX Google Aac Encoder", None, " --audio-codec=aac --audio-encoder=OMX.google.aac.encoder", None, None),
+    ("encoder_android_flac", "combo", "(flac) C2 Android Flac Encoder", None, " --audio-codec=flac --audio-encoder=c2.android.flac.encoder", 2.3, None),
+    ("encoder_google_flac", "combo", "(flac) OMX Google Flac Encoder", None, " --audio-codec=flac --audio-encoder=OMX.google.flac.encoder", 2.3, None),
+    ("auto_encoder", "combo", AUTO_ENCODER_TEXT, None, f" {AUTO_ENCODER_ARG}", 2.0, None),
+    ("video_encoder", "encoder", ("h264", "h265", "av1"), None, " --video-encoder={encoder} --video-codec={codec}", 2.0, None),
+    ("audio_encoder", "encoder", ("opus", "aac", "flac", "raw"), None, " --audio-codec={codec} --audio-encoder={encoder}", 2.0, None),
+
+    ("lock_orientation", "combo", "0° Degrees", None, " --lock-video-orientation=0", None, 2.3),
+    ("lock_orientation", "combo", "90° Degrees", None, " --lock-video-orientation=1", None, 2.3),
+    ("lock_orientation", "combo", "180° Degrees", None, " --lock-video-orientation=2", None, 2.3),
+    ("lock_orientation", "combo", "270° Degrees", None, " --lock-video-orientation=3", None, 2.3),
+    ("lock_orientation", "combo", "0° Degrees", None, " --lock-video-orientation=0", None, 2.8),
+    ("lock_orientation", "combo", "90° Degrees", None, " --lock-video-orientation=90", None, 2.8),
+    ("lock_orientation", "combo", "180° Degrees", None, " --lock-video-orientation=180", None, 2.8),
+    ("lock_orientation", "combo", "270° Degrees", None, " --lock-video-orientation=270", None, 2.8),
+    ("capture_orientation", "combo", "0° Degrees", None, " --capture-orientation=@0", 3.0, None),
+    ("capture_orientation", "combo", "90° Degrees", None, " --capture-orientation=@90", 3.0, None),
+    ("capture_orientation", "combo", "180° Degrees", None, " --capture-orientation=@180", 3.0, None),
+    ("capture_orientation", "combo", "270° Degrees", None, " --capture-orientation=@270", 3.0, None),
+    ("capture_orientation", "combo", "Flip 0° Degrees", None, " --capture-orientation=@flip0", 3.0, None),
+    ("capture_orientation", "combo", "Flip 90° Degrees", None, " --capture-orientation=@flip90", 3.0, None),
+    ("capture_orientation", "combo", "Flip 180° Degrees", None, " --capture-orientation=@flip180", 3.0, None),
+    ("capture_orientation", "combo", "Flip 270° Degrees", None, " --capture-orientation=@flip270", 3.0, None),
+
+    ("video_source", "combo", "Screen", None, " --video-source=display", 2.2, None),
+    ("video_source", "combo", "Back Camera", None, " --video-source=camera --camera-facing=back", 2.2, None),
+    ("video_source", "combo", "Front Camera", None, " --video-source=camera --camera-facing=front", 2.2, None),
+    ("video_source", "combo", "External Camera", None, " --video-source=camera --camera-facing=external", 2.2, None),
+    ("audio_source", "combo", "Microphone", None, " --audio-source=mic", 2.2, None),
+    ("audio_source", "combo", "Playback", None, " --audio-source=playback", 2.6, None),
+    ("audio_source", "combo", "Audio Dup", None, " --audio-dup", 2.6, None),
+    ("audio_source", "combo", "Audio Dup + Playback", None, " --audio-dup --audio-source=playback", 2.6, None),
+
+    ("input_mode", "combo", "AoA Mouse", None, " --otg --mouse=aoa", None, None),
+    ("input_mode", "combo", "SDK Mouse", None, " --mouse=sdk", None, None),
+    ("input_mode", "combo", "uHid Mouse", None, " --mouse=uhid", None, None),
+    ("input_mode", "combo", "AoA Keyboard", None, " --otg --keyboard=aoa", None, None),
+    ("input_mode", "combo", "SDK Keyboard", None, " --keyboard=sdk", None, None),
+    ("input_mode", "combo", "uHid Keyboard", None, " --keyboard=uhid", None, None),
+    ("input_mode", "combo", "AoA Mouse + Keyboard", None, " --otg --mouse=aoa --keyboard=aoa", None, None),
+    ("input_mode", "combo", "SDK Mouse + Keyboard", None, " --mouse=sdk --keyboard=sdk", None, None),
+    ("input_mode", "combo", "uHid Mouse + Keyboard", None, " --mouse=uhid --keyboard=uhid", None, None),
+
+    ("no_audio", "check", "no audio", None, " --no-audio", 2.0, None),
+    ("no_video", "check", "no video", None, " --no-video", 2.0, None),
+    ("no_playback", "check", "no playback", None, " --no-playback", 2.1, None),
+    ("no_mouse_hover", "check", "no mouse hover", None, " --no-mouse-hover", 2.5, None),
+    ("gamepad", "check", "gamepad", None, " -G", 2.7, None),
+    ("gamepad_otg", "check", "gamepad otg", None, " -G --otg", 2.7, None),
+    ("no_vd_destroy_content", "check", "no vd destroy", None, " --no-vd-destroy-content", 3.1, None),
+    ("forward_all_clicks", "check", "fwd all clicks", None, " --forward-all-clicks", None, 2.8),
+    ("prefer_text", "check", "prefer text", None, " --prefer-text", None, None),
+    ("no_key_repeat", "check", "no k repeat", None, " --no-key-repeat", None, None),
+    ("raw_key_events", "check", "raw k events", None, " --raw-key-events", None, None),
+    ("shortcut_mod", "check", "ctrl sct", None, " --shortcut-mod=lctrl,rctrl", None, None),
+    ("shortcut_mod", "check", "alt-ctrl sct", None, " --shortcut-mod=lalt,ralt,lctrl,rctrl", None, None),
+    ("show_touches", "check", "show touches", None, " --show-touches", None, None),
+    ("no_control", "check", "no control", None, " --no-control", None, None),
+    ("fullscreen", "check", "fullscreen", None, " -f", None, None),
+    ("always_on_top", "check", "always on top", None, " --always-on-top", None, None),
+    ("stay_awake", "check", "stay awake", None, " --stay-awake", None, None),
+    ("turn_screen_off", "check", "screen off", None, " --turn-screen-off", None, None),
+    ("window_borderless", "check", "borderless", None, " --window-borderless", None, None),
+]
 
-            "fwd all clicks": " --forward-all-clicks",
-            
-            "0° Degrees": " --lock-video-orientation=0",
-            "90° Degrees": " --lock-video-orientation=90",
-            "180° Degrees": " --lock-video-orientation=180",
-            "270° Degrees": " --lock-video-orientation=270", 
-        },
-    }
-}
- 
 ERRORS_LIST = {
             "device_not_found": [
                                  "could not find any adb",
@@ -240,6 +227,279 @@ ERRORS_LIST = {
                         ],
             }
 
+# (group, code, severity, patterns), in order of priority, a pattern is a text or a tuple 
+# of texts found in this order on the same line (the case is ignored) ↓
+ERROR_CATALOGUE = [
+    ("arguments", "args_unexpected", "error", ERRORS_LIST["args_unexpected"]),
+    ("arguments", "value_error", "error", ERRORS_LIST["value_error"]),
+    ("arguments", "nothing_to_do", "error", ["nothing to do"]),
+    ("arguments", "no_record_format", "error", ["no format specified"]),
+    ("arguments", "otg_only", "error", ["only work in otg mode"]),
+    ("arguments", "audio_container", "error", ["audio container does not support video stream"]),
+    ("arguments", "camera_options", "error", ["camera options are only available with --video-source=camera"]),
+    ("arguments", "camera_size", "error", ["could not specify both --camera-size and -m/--max-size"]),
+    ("arguments", "camera_id", "error", ["could not specify both --camera-id and --camera-facing"]),
+    ("arguments", "otg_not_supported", "error", ["otg mode (--otg) is not supported on this platform"]),
+    ("arguments", "otg_disabled", "error", ["otg mode (--otg) is disabled"]),
+    ("arguments", "mouse_bindings", "error", ["invalid mouse bindings"]),
+    ("arguments", "device_information", "error", ["could not retrieve device information"]),
+    ("arguments", "no_mouse_over", "error", ["--no-mouse-over is specific to --mouse=sdk"]),
+    ("arguments", "no_key_repeat", "error", ["--no-key-repeat is specific to --keyboard=sdk"]),
+    ("arguments", "prefer_text", "error", ["--prefer-text is specific to --keyboard=sdk"]),
+    ("arguments", "raw_key_events", "error", ["--raw-key-events is specific to --keyboard=sdk"]),
+    ("arguments", "audio_dup", "error", ["--audio-dup is specific to --audio-source=playback"]),
+    ("arguments", "audio_source", "error", ["unsupported audio source:"]),
+    ("arguments", "otg_no_control", "error", ["--no-control is not allowed in otg mode"]),
+    ("arguments", "otg_screen_off", "warning", ["otg mode: could not turn screen off"]),
+    ("arguments", "otg_stay_awake", "warning", ["otg mode: could not stay awake"]),
+    ("arguments", "otg_show_touches", "warning", ["otg mode: could not request to show touches"]),
+    ("arguments", "sdk_mouse", "error", ["sdk mouse mode requires video playback. try --mouse=uhid"]),
+    ("arguments", "otg_keyboard", "error", ["in otg mode, --keyboard only supports aoa or disabled"]),
+    ("arguments", "otg_mouse", "error", ["in otg mode, --mouse only supports aoa or disabled"]),
+    ("arguments", "number_format", "error", ["numberformatexception"]),
+    ("arguments", "otg_record", "error", ["otg mode: cannot record"]),
+    ("arguments", "nothing_to_record", "error", ["video and audio disabled, nothing to record"]),
+    ("arguments", "new_display", "error", ["--new-display is incompatible with --no-video"]),
+    ("arguments", "app_no_control", "error", ["cannot start an android app if control is disabled"]),
+    ("arguments", "video_packet", "error", ["decoder 'video': could not send video packet"]),
+    ("arguments", "encoder_type", "error", [("encoder type for", "does not match codec type")]),
+    ("arguments", "audio_codec", "error", ["unsupported audio codec"]),
+    ("arguments", "demuxer", "error", ["error: demuxer error"]),
+
+    ("device", "device_not_found", "error", ERRORS_LIST["device_not_found"]),
+    ("device", "usb_device", "error", ["not find any usb device"]),
+    ("device", "device_offline", "error", ["state=offline"]),
+    ("device", "encoding_error", "error", ["encoding error"]),
+    ("device", "encoding_0xfffffff4", "error", ["0xfffffff4"]),
+    ("device", "connection_reset", "error", ["connection reset by peersab"]),
+    ("device", "screen_off_no_control", "error", ["turn screen off if control is disabled"]),
+    ("device", "unauthorized", "error", ["unauthorized"]),
+    ("device", "no_camera", "error", ["no matching camera found"]),
+
+    ("combination", "prefer_text_raw_keys", "error", ["--prefer-text is incompatible with --raw-key-events"]),
+    ("combination", "show_touches_no_control", "error", ["not request to show touches if control is disabled"]),
+    ("combination", "stay_awake_no_control", "error", ["not request to stay awake if control is disabled"]),
+
+    ("connect", "already_connected", "info", ["already connected to"]),
+    ("tcpip", "no_devices", "error", ["no devices/emulators found"]),
+    ("tcpip", "invalid_port", "error", ["invalid port"]),
+    ("connect", "not_recognized", "error", ["(11001)"]),
+    ("connect", "no_response", "error", ["(10060)"]),
+    ("connect", "connection_refused", "error", ["(10061)"]),
+    ("connect", "bad_port", "error", ["bad port number"]),
+    ("connect", "connection_failed", "error", ["server connection failed"]),
+    ("connect", "protocol_fault", "error", ["protocol fault"]),
+    ("tcpip", "timed_out", "error", ["timed out"]),
+    ("connect", "timed_out", "error", ["timed out"]),
+]
+
+# code: (title, message) of the alert ↓
+ERROR_MESSAGES = {
+    "args_unexpected": (
+        "Arguments Unexpected",
+        ("You provided an invalid arg, check that the arg used is\n" 
+        "compatible with the version of scrcpy used, and try again"),
+    ),
+    "value_error": (
+        "Values Error",
+        ("Not all values for the required arguments were " 
+        "provided or invalid values were provided\n"
+        "\t\t Check the commands (like --crop) and try again."),
+    ),
+    "nothing_to_do": (
+        "Values Error",
+        ("Nothing is being used <Video | Audio | OTG> "
+        "in other words nothing to do\ncheck everything "
+        "is correct and try again"),
+    ),
+    "no_record_format": (
+        "Nothing To Do",
+        ("The format chosen for '--record' is not valid or "
+        "has not been set\nchoose a valid one (.mp4 | .mkv) "
+        "and try again"),
+    ),
+    "otg_only": (
+        "OTG Arg",
+        ("to use arg (--hid-keyboard | '--hid-mouse')\n" 
+        "you need to use the argument (--otg)"),
+    ),
+    "audio_container": (
+        "Audio Container",
+        ("The selected audio container does not support the video stream\n"
+        "use --no-video and try again"),
+    ),
+    "camera_options": (
+        "Camera Options",
+        ("Camera options are only available with --video-source=camera"
+        "\n(This can also be caused by the '--crop' argument)"),
+    ),
+    "camera_size": ("Camera Size", "Cannot specify --camera-size and -m/--max-size at the same time."),
+    "camera_id": ("Camera ID", "Cannot specify --camera-id and --camera-facing at the same time."),
+    "otg_not_supported": (
+        "Not Supported",
+        ("The otg mode (--otg) is not supported on this platform, this version only allows it on Linux"
+        "try updating the version of Scrcpy "),
+    ),
+    "otg_disabled": (
+        "Otg Mode Disabled",
+        "OTG mode (--otg) has been disabled, to fix this problem try updating the version of scrcpy",
+    ),
+    "mouse_bindings": (
+        "Mouse Bindings",
+        ("Mouse bindings are invalid, mouse binding can have a maximum of 4 characters"
+        "\nand using any of these characters: '+', '-', 'b', 'h', 's', 'n'."),
+    ),
+    "device_information": ("Args Error", "Could not retrieve device information, try changing the arguments"),
+    "no_mouse_over": ("No Mouse Over", "The --no-mouse-over option is specific to --mouse=sdk"),
+    "no_key_repeat": ("No Key Repeat", "The --no-key-repeat option is specific to --keyboard=sdk"),
+    "prefer_text": ("Prefer Text", "The --prefer-text option is specific to --keyboard=sdk"),
+    "raw_key_events": ("Raw Key Events", "The --raw-key-events option is specific to --keyboard=sdk"),
+    "audio_dup": ("Audio Dup", "The --audio-dup option is specific to --audio-source=playback"),
+    "audio_source": (
+        "Unsupported Audio Source",
+        ("This audio source is not supported (expected output or mic)"
+        "\nor playback if scrcpy version is greater or equal than 2.6"),
+    ),
+    "otg_no_control": ("No Control", "The --no-control option is not allowed in otg mode"),
+    "otg_screen_off": ("Screen Off", "Could not turn screen off using otg mode"),
+    "otg_stay_awake": ("Stay Awake", "Could not stay awake using otg mode"),
+    "otg_show_touches": ("Show Touches", "Could not request to show touches using otg mode"),
+    "sdk_mouse": ("Mouse Mode", "SDK mouse mode requires video playback. try --mouse=uhid"),
+    "otg_keyboard": ("Keyboard", "In otg mode, --keyboard only supports aoa or disabled"),
+    "otg_mouse": ("Mouse", "In otg mode, --mouse only supports aoa or disabled"),
+    "number_format": ("Unexpected Value", "An unexpected value was received, try changing the arguments"),
+    "otg_record": ("Record", "Cannot record using otg mode, try changing the arguments"),
+    "nothing_to_record": ("Record", "Cannot record with video and audio disabled, try changing the arguments"),
+    "new_display": ("New Display", "The --new-display option is incompatible with --no-video or --no-playback"),
+    "app_no_control": ("Control", "Cannot start an android app if control is disabled"),
+    "video_packet": (
+        "Video Packet",
+        "Could not send video packet, try changing the arguments (probably an encoding error)",
+    ),
+    "encoder_type": ("Encoder Type", "Encoder type does not match codec type, try changing the arguments"),
+    "audio_codec": ("Unsupported Audio Codec", "This audio codec is not supported, try changing the arguments"),
+    "demuxer": ("Demuxer Error", "Demuxer error, try changing the arguments"),
+
+    "device_not_found": (
+        "Nothing Detected",
+        ("No device was detected connect a device (Wi-Fi | USB)\n" 
+        "and try again"),
+    ),
+    "usb_device": (
+        "USB Device",
+        ("You need to connect the device via USB to use OTG " 
+        "via Wi-Fi will not work"),
+    ),
+    "device_offline": (
+        "Offline Device",
+        ("The selected device is offline try, disconnecting and connecting it "
+        "and try again"),
+    ),
+    "encoding_error": (
+        "Encoding Error",
+        ("An encoding error occurred, check that the arguments " 
+        "and their values are correct\ncheck that the device "
+        "is correctly configured and try again"),
+    ),
+    "encoding_0xfffffff4": (
+        "Encoding Error",
+        ("An 'Encoding' error was detected try changing the video-rate (--video-rate)\n"
+        "or the maximum size (-m | --max-size) and try again."),
+    ),
+    "connection_reset": (
+        "Connection Reset",
+        ("The adb connection has been restarted by Peersab\n" 
+        "make sure everything is set up correctly."),
+    ),
+    "screen_off_no_control": ("No Control", "Cannot use turn screen off without device control."),
+    "unauthorized": (
+        "Unauthorized",
+        ("The device has not yet authorized this computer\n"
+        "to establish an adb connection."),
+    ),
+    "no_camera": ("No Camera Was Found", "Make sure the camera is properly connected."),
+
+    "prefer_text_raw_keys": (
+        "Incompatible Args",
+        ("The args '--prefer-text' and '--raw-key-events' are not compatible\n"
+        "remove one of them and try again."),
+    ),
+    "show_touches_no_control": (
+        "Incompatible Args",
+        ("The args '--show-touches' and '--no-control' (or camera) are not compatible\n" 
+        "remove one of them and try again"),
+    ),
+    "stay_awake_no_control": (
+        "Incompatible Args",
+        ("The args '--stay-awake' and '--no-control' (or camera) are not compatible\n" 
+        "remove one of them and try again"),
+    ),
+
+    "already_connected": ("Already Connected", "This IP is already connected"),
+    "no_devices": ("Device Not Found", "No device found, check if it is properly connected (USB)"),
+    "invalid_port": ("Invalid Port", "Invalid PORT, make sure the PORT you entered is valid"),
+    "not_recognized": (
+        "Not Recognized",
+        ("The IP and Port was not recognized check the Port Ip\n" 
+        "are correct and try again (11001)"),
+    ),
+    "no_response": (
+        "No Response",
+        ("Did not get a response from the connected device to the host\n"
+        "check the IP and try again (10060)"),
+    ),
+    "connection_refused": (
+        "Connection Refused",
+        ("The connection was refused by the destination device, "
+        "check if it is not already connected to some host\n"
+        "\t\tand make sure that the IP and Port are valid (10061)"),
+    ),
+    "bad_port": ("Bad Port", "One poorly chosen door, please choose another"),
+    "connection_failed": (
+        "Connection Failed",
+        ("The connection was refused by the destination device,\n"
+        "or the device is offline"),
+    ),
+    "protocol_fault": ("Protocol Fault", "The protocol faulted, make sure the IP/PORT is valid"),
+    "timed_out": (
+        "Timed Out",
+        ("The device did not answer in time,\n"
+        "check if it is connected and the IP/PORT are valid"),
+    ),
+}
+
+# (code, conditions), the arguments are rejected with the error `code` of `ERROR_CATALOGUE` when all the
+# conditions are true. A condition is an option (`--no-control`), an option with its value (`--keyboard=uhid`, 
+# the default value is used when the option is not given), a tuple of conditions where one is enough, and 
+# starts with "!" when it must be false ↓
+ARGS_RULES = [
+    ("nothing_to_do", ["--no-video", "--no-audio", "!--otg"]),
+    ("otg_only", ["--hid-mouse", "!--otg"]),
+    ("camera_options", [
+        ("--camera-id", "--camera-size", "--camera-facing", "--camera-ar", "--camera-fps", "--camera-high-speed"),
+        "!--video-source=camera",
+    ]),
+    ("camera_size", ["--camera-size", "--max-size"]),
+    ("camera_id", ["--camera-id", "--camera-facing"]),
+    ("no_mouse_over", ["--no-mouse-hover", "!--mouse=sdk"]),
+    ("no_key_repeat", ["--no-key-repeat", "!--keyboard=sdk"]),
+    ("prefer_text", ["--prefer-text", "!--keyboard=sdk"]),
+    ("raw_key_events", ["--raw-key-events", "!--keyboard=sdk"]),
+    ("audio_dup", ["--audio-dup", "!--audio-source=playback"]),
+    ("otg_no_control", ["--otg", "--no-control"]),
+    ("sdk_mouse", ["--mouse=sdk", ("--no-playback", "--no-video-playback", "--no-video"), "!--otg"]),
+    ("otg_keyboard", ["--otg", "!--keyboard=aoa", "!--keyboard=disabled"]),
+    ("otg_mouse", ["--otg", "!--mouse=aoa", "!--mouse=disabled"]),
+    ("otg_record", ["--otg", "--record"]),
+    ("nothing_to_record", ["--record", "--no-video", "--no-audio"]),
+    ("new_display", ["--new-display", "--no-video"]),
+    ("app_no_control", ["--start-app", ("--no-control", "--video-source=camera")]),
+    ("screen_off_no_control", ["--turn-screen-off", ("--no-control", "--video-source=camera"), "!--otg"]),
+    ("prefer_text_raw_keys", ["--prefer-text", "--raw-key-events"]),
+    ("show_touches_no_control", ["--show-touches", ("--no-control", "--video-source=camera"), "!--otg"]),
+    ("stay_awake_no_control", ["--stay-awake", ("--no-control", "--video-source=camera"), "!--otg"]),
+]
+
 LAYOUT_POSITIONS = {
     "connect_tab": {
         "upper":[
@@ -253,13 +513,19 @@ LAYOUT_POSITIONS = {
             (3, 0),
             (3, 2, 1, 2),
             (3, 1),
+            (4, 0),
+            (4, 1),
+            (4, 2),
+            (4, 3),
             (5, 0),
-            (6, 0, 1, 4)
+            (6, 0, 1, 2),
+            (6, 2, 1, 2),
         ],
         
         "lower":[
             (0, 0, 1, 2),
             (1, 0),
+            (1, 1),
         ],
     },
     
@@ -275,6 +541,7 @@ LAYOUT_POSITIONS = {
             (3, 2),
             (1, 2),
             (2, 2),
+            (3, 3),
         ],
             
         "middle":[
@@ -0,0 +1,271 @@
+"""
+This module contains the shared pool that runs the background tasks of the app.
+
+Instead of creating a new `QThread` on every click (kept only in `self.terminal`, so a second click
+could destroy a thread that is still running), the tasks (`PoolTask` subclasses) are queued in
+`task_pool`, a `QThreadPool` with a fixed number of threads. The pool keeps every task alive until
+it finishes, gives it a task id and announces it through Qt signals:
+
+- `task_started` (`pyqtSignal(int, str)`): Emitted with the id and the name of a task when it starts.
+- `task_finished` (`pyqtSignal(int, str, float)`): Emitted with the id, the name and the duration (in seconds) of a task.
+- `task_rejected` (`pyqtSignal(int, str)`): Emitted with the id and the name of a task refused because the queue is full.
+
+Identical requests made at the same time (e.g. two "list devices") are run only once with
+`single_flight`, the other callers wait for the same result.
+"""
+from time import monotonic
+from itertools import count
+from threading import Lock
+from traceback import print_exc
+from concurrent.futures import Future
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+POOL_THREADS = 6
+MAX_QUEUED_TASKS = 32
+
+IN_FLIGHT = {}
+IN_FLIGHT_LOCK = Lock()
+
+class PoolTask(QObject):
+    """
+    This class is the base of the background tasks, a drop-in replacement for `QThread`.
+
+    A subclass implements `run`, and the caller uses `start` and the `finished` signal like with
+    a `QThread`. The task is only sent to the pool once the caller returns to the event loop, so
+    signals connected right after `start` are never missed.
+
+    Attributes
+    ----------
+    - task_id (`int`): The id given by the pool (`None` until the task is queued).
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self.task_id = None
+        self.running = False
+        self.done = False
+
+    def start(self) -> None:
+        """Queues the task in the `task_pool` (the pool keeps it alive even if the caller drops it)."""
+        task_pool.starting_tasks.add(self)
+        QTimer.singleShot(0, self.submit)
+
+    def submit(self) -> None:
+        task_pool.submit_task(self)
+
+    def isRunning(self) -> bool:
+        """Returns `True` while the task is queued or running."""
+        return self.task_id is not None and task_pool.is_active(self.task_id)
+
+    @property
+    def name(self) -> str:
+        """The name of the task, in the format `Class.command`."""
+        if command := getattr(self, "command", ""):
+            return f"{type(self).__name__}.{command}"
+        return type(self).__name__
+
+    def run(self) -> None:
+        raise NotImplementedError
+
+class FunctionTask(PoolTask):
+    """
+    This class runs a single function in the `task_pool` (see `TaskPool.submit`).
+
+    Signals
+    -------
+    - `result_ready` (`pyqtSignal(object)`): Emitted with the value returned by the function.
+    - `task_error` (`pyqtSignal(str)`): Emitted with the error raised by the function.
+    """
+    result_ready = pyqtSignal(object)
+    task_error = pyqtSignal(str)
+
+    def __init__(self, function, *args, name: str = None):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.task_name = name or getattr(function, "__name__", "function")
+
+    @property
+    def name(self) -> str:
+        return self.task_name
+
+    def run(self) -> None:
+        try:
+            result = self.function(*self.args)
+        except Exception as error:
+            print_exc()
+            self.task_error.emit(str(error))
+        else:
+            self.result_ready.emit(result)
+
+class TaskRunnable(QRunnable):
+    """This class wraps a `PoolTask` so it can be started by the `QThreadPool`."""
+    def __init__(self, task: PoolTask):
+        super().__init__()
+        self.task = task
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        task_pool.execute(self.task)
+
+class TaskPool(QObject):
+    """
+    This class runs the `PoolTask`s in a bounded `QThreadPool`.
+
+    Parameters
+    ----------
+    - max_threads (`int`, optional): The number of threads of the pool. Defaults to `POOL_THREADS`.
+    - max_queued (`int`, optional): The maximum number of tasks waiting for a thread, the next tasks are
+    rejected (see `task_rejected`). Defaults to `MAX_QUEUED_TASKS`.
+    """
+    task_started = pyqtSignal(int, str)
+    task_finished = pyqtSignal(int, str, float)
+    task_rejected = pyqtSignal(int, str)
+    task_released = pyqtSignal(int)
+
+    def __init__(self, max_threads: int = POOL_THREADS, max_queued: int = MAX_QUEUED_TASKS):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self.max_queued = max_queued
+        self.lock = Lock()
+        self.task_ids = count(1)
+        self.tasks = {}
+        self.starting_tasks = set()
+        # the tasks are released in the main thread, where they live ↓
+        self.task_released.connect(self.release_task)
+
+    def submit_task(self, task: PoolTask) -> int:
+        """
+        Queues a task.
+
+        Parameters
+        ----------
+        - task (`PoolTask`): The task to run.
+
+        Returns
+        -------
+        - `int`: The id of the task, or `None` if the queue is full (the task `finished` signal is still emitted,
+        so the buttons disabled by the caller are restored).
+        """
+        self.starting_tasks.discard(task)
+        with self.lock:
+            task_id = next(self.task_ids)
+            queued_tasks = sum(
+                1 for queued_task in self.tasks.values() if not queued_task.running and not queued_task.done
+            )
+            rejected = queued_tasks >= self.max_queued
+            if not rejected:
+                task.task_id = task_id
+                self.tasks[task_id] = task
+
+        if rejected:
+            self.task_rejected.emit(task_id, task.name)
+            task.finished.emit()
+            return None
+
+        self.pool.start(TaskRunnable(task))
+        return task_id
+
+    def execute(self, task: PoolTask) -> None:
+        """
+        Runs a task in the current (worker) thread and emits its signals.
+        """
+        start_time = monotonic()
+        task.running = True
+        self.task_started.emit(task.task_id, task.name)
+        try:
+            task.run()
+        except Exception:
+            print_exc()
+        finally:
+            task.running = False
+            task.done = True
+            task.finished.emit()
+            self.task_finished.emit(task.task_id, task.name, monotonic() - start_time)
+            self.task_released.emit(task.task_id)
+
+    @pyqtSlot(int)
+    def release_task(self, task_id: int) -> None:
+        """Drops the reference kept on a finished task (slot of `task_released`)."""
+        with self.lock:
+            self.tasks.pop(task_id, None)
+
+    def submit(self, function, *args, name: str = None) -> FunctionTask:
+        """
+        Runs `function(*args)` in the pool.
+
+        Parameters
+        ----------
+        - function (`callable`): The function to run.
+        - *args: The arguments of the function.
+        - name (`str`, optional): The name of the task. Defaults to the name of the function.
+
+        Returns
+        -------
+        - `FunctionTask`: The task, its `result_ready` and `task_error` signals give the outcome.
+        """
+        task = FunctionTask(function, *args, name=name)
+        task.start()
+        return task
+
+    @pyqtSlot()
+    def shutdown(self, msecs: int = 3000) -> None:
+        """
+        Drops the queued tasks and waits (up to `msecs` milliseconds) for the running ones (used when the app is closed).
+        """
+        self.pool.clear()
+        self.pool.waitForDone(msecs)
+
+    def is_active(self, task_id: int) -> bool:
+        """Returns `True` if the task `task_id` is queued or running."""
+        with self.lock:
+            return task_id in self.tasks and not self.tasks[task_id].done
+
+    def active_tasks(self) -> list:
+        """Returns a list of tuples `(task_id, name, running)` of the queued and running tasks."""
+        with self.lock:
+            return [(task_id, task.name, task.running) for task_id, task in self.tasks.items() if not task.done]
+
+task_pool = TaskPool()
+
+def single_flight(key, function, *args):
+    """
+    Runs `function(*args)`, unless the same `key` is already running, in that case waits for its result.
+
+    Parameters
+    ----------
+    - key (`hashable`): The identity of the request (e.g. `("list_devices", path)`).
+    - function (`callable`): The function to run.
+    - *args: The arguments of the function.
+
+    Returns
+    -------
+    - The value returned by the function (the same object for every caller of the same flight).
+
+    Raises
+    ------
+    - The error raised by the function, for every caller of the same flight.
+    """
+    with IN_FLIGHT_LOCK:
+        if running := key in IN_FLIGHT:
+            future = IN_FLIGHT[key]
+        else:
+            future = IN_FLIGHT[key] = Future()
+
+    if running:
+        return future.result()
+
+    try:
+        result = function(*args)
+    except BaseException as error:
+        future.set_exception(error)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with IN_FLIGHT_LOCK:
+            IN_FLIGHT.pop(key, None)
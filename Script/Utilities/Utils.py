@@ -1,15 +1,14 @@
 from posixpath import splitext
 from functools import partial
 from os import listdir
-from os.path import join
 from re import findall
 from json import load, dump
 from platform import system
 from typing import Callable
 
-from PyQt5.QtWidgets import QGridLayout
+from PyQt5.QtWidgets import QGridLayout, QComboBox
 from Theme.Style_UI import black_theme_Alerts, white_theme_Alerts
-from Script.Utilities.Static_Datas import PATH_DATA_DIR
+from Script.Utilities.Settings_Store import settings_store
 
 running_on_windows = system() == "Windows"
 def open_or_save_data_json(json_url: str, open_mode: str, data_to_save: dict = None) -> dict:
@@ -228,7 +227,7 @@ def valid_maxsize_value(cmd: str) -> bool:
 
 def update_data_file(value: any, keys: list, delete_value: bool = False) -> None:
     """
-    This function updates a nested key-value pair in a data file (JSON) based on the provided `keys`.
+    This function updates a nested key-value pair in the user data based on the provided `keys`.
     If `delete_value` is True, it deletes the key instead of updating the value.
     
     Parameters
@@ -243,26 +242,18 @@ def update_data_file(value: any, keys: list, delete_value: bool = False) -> None
     - This function is useful for updating or deleting nested data in a JSON file where each key is represented 
     as a list of keys in the `keys` parameter.
     - If `delete_value` is set to `True`, the function removes the specified key from the nested structure.
+    - The change is made in memory by the `settings_store`, which writes the file shortly after 
+    the last change (see `Settings_Store`), so it can be called on every `valueChanged`.
     """
-    path = join(PATH_DATA_DIR, "UserData.json")
-    data = open_or_save_data_json(path, "r")
-    sub_dict = data
-    for index, key in enumerate(keys):
-        index += 1
-        if index < len(keys):
-            sub_dict = data[key] if index == 1 else sub_dict[key]
-        else: 
-            if delete_value:
-                del sub_dict[key]
-            else:
-                sub_dict[key] = value
-    
-    open_or_save_data_json(path, "w", data)           
+    if delete_value:
+        settings_store.delete(keys)
+    else:
+        settings_store.set(value, keys)
                
 def get_current_alert_theme() -> dict:
     """
     This function returns the current alert theme based on the user's selected theme.
-    The selected theme is retrieved from the `UserData.json` file, and depending on the theme value,
+    The selected theme is retrieved from the user data (`settings_store`), and depending on the theme value,
     it returns either the `black_theme_Alerts` or `white_theme_Alerts`.
 
     Returns
@@ -271,10 +262,7 @@ def get_current_alert_theme() -> dict:
       - `black_theme_Alerts` if the selected theme is dark (represented by 0).
       - `white_theme_Alerts` if the selected theme is light (represented by 1).
     """
-    select_theme = open_or_save_data_json(
-        join(PATH_DATA_DIR, "UserData.json"), "r"
-    )["Theme_Active"]
-    return black_theme_Alerts if select_theme == 0 else white_theme_Alerts   
+    return black_theme_Alerts if settings_store.theme == 0 else white_theme_Alerts   
 
 def add_widget_set(widgets: list, positions: list[tuple]) -> QGridLayout:
     """
@@ -312,3 +300,26 @@ def add_widget_set(widgets: list, positions: list[tuple]) -> QGridLayout:
         else: 
             raise ValueError("The number of positions is invalid, it must have 2 or 4 positions")
     return layout
+
+def replace_combo_items(combo_box: QComboBox, items: list) -> None:
+    """
+    This function replaces the items of a `QComboBox`, keeping the selected text when it is still an item.
+
+    The `currentIndexChanged` signal is emitted once at the end (not for every item added), so the index 
+    saved in the user data follows the new items.
+
+    Parameters
+    ----------
+    - combo_box (`QComboBox`): The combo box to update.
+    - items (`list`): The new items, the first one is selected if the selected text is not in the list.
+    """
+    if [combo_box.itemText(index) for index in range(combo_box.count())] == items:
+        return
+
+    selected_text = combo_box.currentText()
+    combo_box.blockSignals(True)
+    combo_box.clear()
+    combo_box.addItems(items)
+    combo_box.setCurrentIndex(max(0, combo_box.findText(selected_text)))
+    combo_box.blockSignals(False)
+    combo_box.currentIndexChanged.emit(combo_box.currentIndex())
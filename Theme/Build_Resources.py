@@ -0,0 +1,73 @@
+"""
+This script compiles `Theme/resources.qrc` into the binary resource bundle `Theme/resources.rcc`.
+
+The bundle is registered by `Script.Utilities.Resources` the first time an icon is needed
+(`QResource.registerResource` maps the file instead of keeping the icons in Python modules),
+and the icons keep their paths (e.g. `:icon.ico`).
+
+It writes the same format as `rcc -binary resources.qrc -o resources.rcc` (format version 2, not
+compressed), so the bundle can be rebuilt without the Qt tools, only the files at the root of the
+`qresource` (with an optional `alias`) are supported.
+
+Usage
+-----
+python Theme/Build_Resources.py
+"""
+from struct import pack
+from pathlib import Path
+from xml.etree.ElementTree import parse
+
+THEME_DIR = Path(__file__).resolve().parent
+QRC_FILE = THEME_DIR / "resources.qrc"
+RCC_FILE = THEME_DIR / "resources.rcc"
+
+RCC_VERSION = 2
+DIRECTORY_FLAG = 0x02
+LANGUAGE_C = 1
+
+def qt_hash(name: str) -> int:
+    """Returns the hash used by Qt to sort and find the names of a resource tree (`qt_hash`)."""
+    value = 0
+    units = name.encode("utf-16-be")
+    for index in range(0, len(units), 2): # the UTF-16 code units of the name
+        value = ((value << 4) + int.from_bytes(units[index:index + 2], "big")) & 0xffffffff
+        value ^= (value & 0xf0000000) >> 23
+        value &= 0x0fffffff
+    return value
+
+def read_qrc(qrc_file: Path) -> list:
+    """
+    Returns the files of a `.qrc` file, as a list of tuples `(name, content)`.
+    """
+    files = []
+    for file in parse(qrc_file).getroot().iter("file"):
+        name = file.get("alias") or file.text.strip()
+        if "/" in name.strip("/"):
+            raise ValueError(f"only the files at the root are supported: {name!r}")
+        files.append((name.strip("/"), (qrc_file.parent / file.text.strip()).read_bytes()))
+    return files
+
+def build_rcc(files: list) -> bytes:
+    """
+    Returns the binary resource bundle of `files` (a list of tuples `(name, content)`).
+    """
+    files = sorted(files, key=lambda file: qt_hash(file[0]))
+    names = b""
+    data = b""
+    # the root directory, then its files (sorted by the hash of their names) ↓
+    tree = pack(">IHII", 0, DIRECTORY_FLAG, len(files), 1) + pack(">Q", 0)
+    for name, content in files:
+        tree += pack(">IHHHI", len(names), 0, 0, LANGUAGE_C, len(data)) + pack(">Q", 0)
+        names += pack(">HI", len(name), qt_hash(name)) + name.encode("utf-16-be")
+        data += pack(">I", len(content)) + content
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    header = b"qres" + pack(">IIII", RCC_VERSION, tree_offset, data_offset, names_offset)
+    return header + tree + data + names
+
+if __name__ == "__main__":
+    RCC_FILE.write_bytes(build_rcc(read_qrc(QRC_FILE)))
+    print(f"{RCC_FILE.name} written ({RCC_FILE.stat().st_size} bytes)")
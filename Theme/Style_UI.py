@@ -52,14 +52,14 @@ QPushButton:disabled {
     background-color: #6f6f6f;
     color: #e6e6e6;
 }
-#Shell_Button {
+#Shell_Button, #Benchmark_Button {
     border-radius: 2px;
     font-size: 13px;
 }
-#Shell_Button:hover {
+#Shell_Button:hover, #Benchmark_Button:hover {
     background-color: #b10c43;
 }
-#Shell_Button:pressed {
+#Shell_Button:pressed, #Benchmark_Button:pressed {
     background-color: #ff0841;
 }
 
@@ -413,14 +413,14 @@ QPushButton:disabled {
     background-color: #6f6f6f;
     color: #e6e6e6;
 }
-#Shell_Button {
+#Shell_Button, #Benchmark_Button {
     border-radius: 2px;
     font-size: 13px;
 }
-#Shell_Button:hover {
+#Shell_Button:hover, #Benchmark_Button:hover {
     background-color: #0e90ff;
 }
-#Shell_Button:pressed {
+#Shell_Button:pressed, #Benchmark_Button:pressed {
     background-color: #85c6ff;
 }
 
@@ -1,869 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x33\x40\
-\x00\
-\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x20\x00\x2a\x33\x00\
-\x00\x16\x00\x00\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
-\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
-\x00\x00\x5c\x72\xa8\x66\x00\x00\x00\x01\x6f\x72\x4e\x54\x01\xcf\
-\xa2\x77\x9a\x00\x00\x32\xe4\x49\x44\x41\x54\x78\xda\xed\x7d\x09\
-\x98\x54\xd5\xd1\xf6\x30\xf7\xde\xee\x9e\x7d\xdf\xf7\x7d\x5f\x7a\
-\xa6\x67\x33\x51\x63\xfe\x24\x66\xf9\x4c\xf2\x99\x68\x34\x31\x31\
-\xd1\x6c\x26\x46\x76\x11\x65\x5f\x14\x41\x10\x05\x41\x05\x45\x70\
-\x17\x37\x54\x88\xa0\x41\x64\x99\x61\x13\x50\x50\x36\x05\x93\x3f\
-\xeb\x97\xc4\x7c\xc6\xc4\x68\x8c\xd6\x57\x75\xbb\xef\x74\x4f\xd3\
-\xa7\x67\xb9\xa7\xb7\xe9\xaa\xe7\x79\x9f\x21\xc6\x47\xb0\xed\xaa\
-\x53\xe7\xbc\x55\xef\x1b\x13\xc3\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\
-\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\
-\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\
-\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\
-\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\x11\xd8\x18\xaf\
-\x74\xc7\x4c\x44\x8c\x43\x8c\xf7\xc2\x38\xa5\x27\x66\xa6\xda\x1a\
-\xb3\xd1\x92\x1a\xd3\x6b\xb1\x0c\x8a\x5d\x2e\xd0\xaf\x39\x38\x38\
-\xc2\x38\xe9\xc7\x7b\x25\xfd\xcf\x94\xee\x31\xf8\xbf\x13\xf0\xd7\
-\x19\x88\xdc\xb1\x4a\x4f\xee\x8f\x95\x73\xb2\xae\x51\xce\x4a\xdb\
-\x60\x49\xcf\xc0\xa4\x6e\x45\x5c\x8c\x18\x8b\x98\x86\xb8\xc1\xf5\
-\xeb\x8b\x7b\xad\x56\x3b\xfe\x4c\x3d\x6c\xb5\xba\x0b\x42\x72\x32\
-\x17\x02\x0e\x8e\x70\x4e\xfc\x9f\x39\x7f\xe6\x21\xbe\x82\x98\x8b\
-\x78\x12\xb1\x07\x4f\xfe\xa3\x13\x94\xae\xe3\x73\xd5\xa6\x83\x0f\
-\x6a\xf9\xdb\xb6\x59\xe2\x7b\x31\x99\x7f\x8d\xf8\x07\xe2\x63\x04\
-\xb8\xf0\xb1\xeb\xaf\xfd\x06\xb1\x19\x71\x9d\xab\x50\x68\xde\xdd\
-\x01\x07\x07\x47\x18\x24\x3f\xe1\x2a\xb5\x87\x7e\x56\x23\xa6\x22\
-\x76\x23\xde\x45\x80\x81\x59\x4a\x0b\xac\x51\x0b\x61\x8b\x25\x09\
-\x76\x5a\xac\xe0\x91\xf0\x83\x81\x0a\xc2\x29\xc4\x52\x44\x0b\x62\
-\x0c\x25\xff\x76\xd7\xd5\x80\x83\x83\x23\xc8\x71\xf5\x99\x77\xfb\
-\x4c\xc4\x58\xc4\x61\xc4\xc7\x46\xd2\x63\x57\x00\xd7\x2a\x1d\x70\
-\x87\x5a\x01\x9b\xb5\x64\x3d\xa1\xfb\x86\x9e\xf8\xbe\x70\x0c\x71\
-\x0d\x5d\x0d\xb8\x13\xe0\xe0\x08\xf1\xa9\x3f\xd1\xf9\xb3\x03\xf1\
-\x14\xe2\x03\xcf\x13\x9f\x92\x7f\xba\x62\x87\x87\xb4\x3c\xd8\x61\
-\xb1\x99\x4d\x7c\x4f\xbc\x8f\x58\x8b\xa8\xe6\x22\xc0\xc1\x11\xa2\
-\xe4\xc7\x04\x57\xf1\xe7\x85\x88\x23\x9e\x89\x6f\x60\x8e\xd2\x0c\
-\x4f\x6b\x19\xb2\x92\xde\x17\x5e\x42\x74\x70\x11\xe0\xe0\x08\x72\
-\xf2\x23\x2c\x88\x1f\x22\x7e\xe7\x2b\xf9\xe7\x29\x4d\xb0\x51\x4b\
-\x95\x79\xea\x8b\xb0\x0f\x71\x96\x5e\x00\x88\x2d\x40\x70\x70\x70\
-\x04\xb6\x00\x68\x88\x1f\x21\xfe\xe4\x9d\xf8\xd4\xf6\xcf\x51\x9b\
-\x5d\xc9\xaf\x05\x3a\xf9\x0d\xec\xd1\x3b\x01\x55\xd5\x0b\x00\x3f\
-\x0c\x72\x70\x04\x2e\xf9\xc7\x20\x2e\xf1\x75\xf2\x53\xf2\x4f\xc3\
-\x3b\x3f\xb5\xfd\x7d\xc1\x49\x7c\x4f\x6c\x41\x54\xf6\xb9\xd8\x01\
-\xbe\x0e\x70\x70\x04\xa6\xf5\x3f\x17\x71\xd4\x57\xdb\x4f\xaf\xfd\
-\xf4\xe0\xd7\x1b\xfc\xe4\x37\xa8\xc2\xd5\x88\x34\x7e\x0f\xe0\xe0\
-\x08\x4c\xf2\x97\x23\x5e\xf4\x95\xfc\x13\x10\x2b\xd5\x32\xfd\xb5\
-\x3f\x44\x05\x00\x5c\xc3\x43\xe3\xf0\x0a\xa0\x72\x11\xe0\xe0\x90\
-\x5b\x00\x68\x9c\x77\x09\xe2\x3f\x67\xb6\xfe\x3d\x70\xa3\xda\x08\
-\x2f\x5a\x12\x43\xd1\xfa\x7b\xe3\x2d\xc4\xb9\xcc\x0c\x70\x70\x98\
-\x4d\x7e\xe7\x64\x9f\xf1\xf3\x22\xc4\x9f\x7d\xdd\xfb\xa7\x60\xeb\
-\xff\xb8\x96\x15\x0e\xc9\x6f\xe0\x09\x44\x16\x17\x00\x0e\x0e\x33\
-\x05\x20\xb6\xcb\x38\xfd\x4b\x11\xdb\x7c\xb5\xfe\x54\x00\x96\x6b\
-\x95\xa1\x6e\xfd\x7d\x5d\x05\x7e\x6a\x8c\x0c\x73\x11\xe0\xe0\x18\
-\x49\xeb\x4f\x27\xbf\xda\xa3\xb8\x66\xfb\xff\xed\xab\xf5\x9f\xae\
-\xda\x61\x93\x25\x35\x9c\x4e\x7f\x03\xaf\x20\x6a\xb9\x00\x70\x70\
-\x98\xbb\xfb\x3b\x10\xc7\x7c\x3f\xfc\x75\xc1\xbd\x5a\x11\xec\x0a\
-\xbf\xe4\x37\x58\x81\x9b\x10\x16\x63\x48\x88\x83\x83\x63\xf8\x0f\
-\x7f\x2b\x7d\xb7\xfe\x3d\x30\x5f\x6d\x84\x5f\x85\xc7\xc3\x9f\x08\
-\xb4\x6a\xfc\x69\xa3\x00\x6c\xe7\x4e\x80\x83\x63\xc8\xc9\x4f\xf8\
-\xb2\xaf\x69\x3f\xc2\x64\xa5\x13\x1e\xd1\x72\xc3\x35\xf1\x3d\x71\
-\x3f\x22\x89\x8a\x40\x1f\x17\x00\x0e\x8e\x21\x17\x00\x5a\xef\xdd\
-\x20\x3a\xfd\x17\xab\xb5\xf0\xb2\x25\x2e\x12\x0a\xc0\xdf\x10\x17\
-\x31\x2d\xc8\xc1\x31\xbc\xd3\xff\x4a\xc4\x3f\x7c\xbd\xfa\x4f\x55\
-\xda\xa5\x8d\xfb\xd2\xbe\x00\x61\xbb\xc5\xa6\x17\x14\x7a\x4f\xd8\
-\x2d\x7f\x87\x60\x2b\x22\x9f\x0b\x00\x07\x87\xbf\x02\x60\xf0\xfe\
-\x4a\x77\x05\x62\xaf\xaf\xd3\x9f\xb0\x42\x2d\x1f\xae\xa2\x8f\x4f\
-\xd0\x3f\x83\x0a\xc9\x6a\xb5\x04\x16\xa8\x0d\xfa\x12\x11\x09\x87\
-\xd0\x38\xf1\x4b\x96\x78\x99\xcb\x44\x1f\x22\x26\x18\xb4\x20\x2f\
-\x0b\x71\x70\xf8\x3a\xfd\x9d\xb4\x1f\xed\xf8\xcf\x16\x4d\xfc\xcd\
-\x54\x5a\xe1\x79\x4b\xb2\xe9\xe4\xdc\x19\x97\x08\x6b\xe3\xca\xf4\
-\xfd\x01\xfa\xe7\x7a\x82\xd8\x05\x9a\x2c\x5c\xaf\x65\x4b\x29\x34\
-\x2e\xbc\x81\x68\xa4\x02\xb0\x9f\x19\x01\x0e\x0e\x77\x8c\xd3\xce\
-\xf2\x6c\xfd\x3b\x11\xa7\x7d\x9d\xfc\x13\x31\x31\xef\xd3\x0a\x4d\
-\x27\xe3\xee\xf8\x78\x78\xbd\xaa\x1a\x76\xd5\x39\x60\x49\x6a\x97\
-\xbe\x47\xe0\xab\xd8\x50\x71\x58\xad\x15\xeb\xd7\x03\x49\x45\xe0\
-\x56\x83\x16\xe4\x2e\x80\x83\xa3\xff\xf4\xef\xf2\xa4\xfd\xee\x15\
-\x3d\xfc\xdd\xa4\xd3\x7e\x09\xe6\xee\xfe\x56\x2b\xbc\x5a\x58\x08\
-\x6f\xb5\xb7\xc3\x29\x47\x3b\xbc\xda\xec\x80\x15\x99\x9d\x82\x22\
-\xd0\x0d\x93\xb0\xe8\xac\xc2\x2b\x82\xa4\x49\xc3\x3f\x20\xce\xa3\
-\x02\xb0\x93\x0b\x00\x07\x47\x8c\xb7\x71\xc7\xd7\x10\xef\x88\x56\
-\x7d\x1f\xd5\x72\x4c\xb5\xfe\x7d\x94\xfc\x05\x05\xf0\xa6\xdd\xae\
-\x17\x00\xa3\x08\x1c\x6c\x72\xc0\xa2\xe4\x2e\x18\x17\xeb\xbb\x08\
-\x4c\x51\x1c\xf0\x38\x5e\x07\xfa\xe4\xed\x09\xa4\x70\x17\xc0\xc1\
-\x11\x33\xe0\xe5\x3f\x1b\xb1\x45\x34\xef\x7f\xab\x5a\x6d\xba\x15\
-\x3f\x98\x93\x33\x20\xf9\x3d\x8b\xc0\x96\xca\x0e\xb8\xce\xe2\xfc\
-\xbd\x7c\x77\x1f\x0d\xae\x87\x41\x29\x7b\x02\xdf\xdb\x6d\xb8\x0d\
-\xd9\x6c\xfc\x25\xe0\x88\xde\xe4\xa7\x0e\xe0\x32\x67\x01\xf8\x85\
-\xb7\xaa\xaf\x91\xfc\x37\x28\x6d\xf0\x8c\x96\x6e\xea\xf4\xdf\x9b\
-\x9c\x0c\x27\x1a\x1b\xe1\x2d\x87\xe3\xcc\x02\x80\x38\x66\x6f\xc7\
-\xab\x40\x97\xcf\x02\x30\x5e\xbf\x0a\x74\xc2\x03\x5a\xbe\xac\xb7\
-\x80\x3e\x44\x31\xd3\x82\x1c\x7c\xfa\x3b\x51\x8b\x78\x4d\x24\xf4\
-\x71\x97\x56\x06\xbb\x4c\xbe\xc6\xbf\x56\x5c\x7c\x46\xe2\x7b\x77\
-\x01\x3b\x6a\x1d\x30\xdd\xd6\x25\xe8\x02\xba\x61\xb6\xda\xa2\x9b\
-\x8a\x48\xa0\x07\x3f\x22\x1b\xb2\x5d\x36\x5b\x6c\xaf\xcb\x76\x8c\
-\x83\x23\x5a\x93\x9f\x04\x3e\x6f\x41\x7c\xe2\x53\xe0\x53\x69\x86\
-\x2d\x9a\xb9\xa4\xdb\x97\x96\x06\x27\x9b\x9b\xfd\x16\x00\xc2\xc9\
-\xb6\x76\x58\x9b\xd7\x09\xa2\xf9\x83\x09\xae\x07\x41\x49\x5d\xc0\
-\x9b\x08\x07\x77\x01\x1c\xd1\xfe\xf8\x77\x1e\xe2\xf7\xa2\xb6\xfb\
-\x7e\x35\xdf\xd4\xbd\xbb\x2f\x2e\x0e\xde\xa8\xaa\xf2\xd9\xfa\xfb\
-\xea\x02\xf6\x35\x38\x60\x4e\x82\xb8\x0b\x20\xd1\xd1\x4d\xf2\x14\
-\x87\xef\x46\xc4\x73\x11\xe0\x88\xd6\xd3\x3f\x05\xf1\x98\xe8\xe1\
-\xef\x66\xb5\xde\xf4\xc3\xdb\x81\xec\x6c\x78\xb3\xad\x6d\xd0\xe4\
-\xf7\xc4\xfa\xa2\x4e\x98\xa8\x76\x0b\x3b\x81\xdb\xd5\x2a\x59\xb4\
-\xe0\x9f\x11\x17\xf4\x6a\x1a\xaf\x0b\x73\x44\x5d\xf2\x13\x2e\x43\
-\xfc\x5d\x4c\xbd\x65\x99\x3a\x69\x69\xe0\xe7\x68\x6d\xed\x90\x4e\
-\x7f\xcf\x07\xc1\xd7\x9a\x1d\x70\x73\xb2\xb8\x0b\xb8\x0e\xff\x6c\
-\x4f\x6a\x99\xb2\xba\x80\x4d\x2c\x1f\xc6\x11\x8d\x05\xa0\x18\xb1\
-\x33\x90\xa7\xec\xa1\xbc\x3c\x78\x6b\x98\xa7\xbf\x51\x04\x36\x96\
-\x75\xc0\x64\xcd\xf7\x9f\x8d\x68\xc1\x45\x6a\x9d\xbe\x3c\x24\x81\
-\x16\xfc\xa7\x2e\x1f\x46\xa6\x22\x5c\x04\x38\xa2\x24\xf9\x63\xc5\
-\x32\x5f\x4e\x43\x4f\xb3\xce\x3e\x7b\x93\x92\xe0\x38\xd1\x7e\xc3\
-\x4c\x7e\xa3\x00\x1c\x6d\x6d\x87\xdb\xd3\xc5\xb4\x20\xe9\x11\x3c\
-\xac\xe5\xc9\x1a\x0e\xda\xef\x69\x34\xca\xc1\x31\xda\x0b\x40\x9b\
-\x3f\x99\x2f\xda\xce\xdb\x65\x72\xdc\xf7\x70\x49\xc9\x88\x92\xdf\
-\xf3\x41\x70\x5b\xb5\x03\xae\xb7\x8a\x87\x83\xe6\x2b\x4d\xae\xd1\
-\x64\x29\xb4\xe0\x7c\x84\xc6\x45\x80\x63\x74\x26\xbf\x7b\xd5\x37\
-\x0e\xb1\x42\x44\xfb\xcd\x55\x9b\xe0\x45\xcd\x84\xcc\x97\xa6\xc1\
-\x7e\xa2\xfd\x5a\x5a\x4c\x15\x00\xc2\x09\x7b\x3b\xac\xce\x16\xd3\
-\x82\x13\x5d\x9a\x84\x92\x68\xc1\xd3\x88\x4f\x71\x01\xe0\x18\x9d\
-\x05\x80\x36\xfe\x9c\x32\xdf\x5f\x42\xfc\x51\x44\xfb\x3d\x64\xb2\
-\xad\xee\xb3\xd9\x9c\xb4\x9f\xc9\xe4\x37\xae\x02\xbb\xeb\x1d\x30\
-\x23\xae\x4b\xd8\x05\xc8\x5a\x4f\x76\xe1\x5e\x43\x3e\x8c\x8b\x00\
-\xc7\x68\x6c\xfd\x49\xe6\xeb\x69\x11\xed\x77\x8b\x5a\x0b\xdb\xcc\
-\xc8\x7c\xe1\xe9\xaf\xd3\x7e\x3e\xe6\xfd\x47\x8a\x37\x11\x0f\x17\
-\xf8\xde\x16\x34\xb0\x52\x2d\x37\x3d\xa9\xe8\x41\x0b\x5e\xc8\xf2\
-\x61\x1c\xa3\x2f\xf9\x63\x1c\xf4\xf3\x87\x88\xf7\x44\xd4\xda\x53\
-\xba\xcc\x97\x04\xda\x4f\x52\xf2\x1b\x5d\xc0\x81\x46\x07\xcc\x4f\
-\x14\xd3\x82\xd7\x2b\xed\xb0\xc1\xe4\xae\x82\x07\x9e\x47\xe4\x71\
-\x01\xe0\x18\x6d\xa7\x3f\xc9\x7c\xed\x16\x9d\xa2\x24\xc5\x65\x56\
-\x7d\x67\xa4\xb4\xdf\x50\xb0\xa1\xb4\x03\x26\xa9\x22\x5a\x50\xce\
-\xb6\xa2\x0b\xef\x23\xae\x66\x57\x21\x8e\xd1\x94\xfc\x24\xf3\x35\
-\x53\x44\xfb\xcd\xc0\x7b\xf4\x2f\x2d\x29\xa6\xee\xfe\x7b\x12\x13\
-\xe1\x78\x43\x43\x40\x92\x9f\xba\x80\x23\x2d\xed\xb0\x24\xb5\xd3\
-\xa7\x66\x80\xa1\x57\xb0\x5e\xd7\x0c\x90\xd2\x05\x1c\x40\xd4\x73\
-\x01\xe0\x18\x2d\x05\x80\x64\xbe\x4e\x8a\x68\xbf\x35\x12\x5e\xd2\
-\x07\xdb\xf6\x93\x51\x04\x5e\xa8\x74\xc0\xb5\x9a\x98\x16\x5c\x20\
-\x61\x74\xd9\x85\xff\x20\x6e\xee\x77\x15\xe2\x22\xc0\x11\xc1\xc9\
-\x4f\x32\x5f\x77\xfb\x77\xf7\x49\x30\x45\xfb\xed\x4b\x4d\x85\x13\
-\x43\xd8\xf6\x33\x0b\xd2\x0c\xb8\x33\xb3\x53\x38\x1c\x44\xb4\xe0\
-\x3a\xad\x40\xa6\xab\xd0\x39\x86\xab\x10\x17\x01\x8e\x48\x4c\x7e\
-\xc2\x05\x81\x74\xf7\x21\xda\xef\x48\x79\x79\xc0\x93\xdf\xe8\x02\
-\x76\xd6\x3a\x60\x9a\x4d\x4c\x0b\xd2\xfa\xf2\x0b\xba\x66\x80\x34\
-\x57\xa1\x14\xee\x02\x38\x22\xb5\x00\x90\xcc\xd7\xb3\xa2\x87\xb3\
-\x25\x6a\x8d\x39\x77\x1f\x3c\xfd\x5f\xc9\xcc\x84\x37\x5b\x5b\x83\
-\x52\x00\xfa\x35\x03\x72\xc5\x5d\x00\xd1\x85\xab\xb5\x12\x59\x86\
-\xa5\xef\x20\x2e\xe9\x63\x5a\x90\x23\x62\x92\xdf\x35\xf1\x87\x09\
-\x32\x06\x7f\xfe\x14\xf1\x4f\xff\xd4\x99\x39\x79\xef\x37\xaa\xab\
-\x83\x96\xfc\x46\x17\xd0\xaf\x19\x10\xeb\xbb\x0b\x98\xa6\xda\xe1\
-\x39\x4d\x9a\x65\xf9\x4b\x88\x22\x76\x18\xe6\x88\x8c\x02\x90\xf0\
-\x19\xe3\xf4\xaf\x41\xec\x13\xd1\x7e\x77\x6a\x65\x52\x68\xbf\x37\
-\x03\x44\xfb\x0d\x86\x27\x8a\x3a\x60\x82\x1f\x5a\x70\x99\x04\x5a\
-\xd3\x85\x0f\x10\x93\x30\xf9\x15\xee\x02\x38\x22\xa5\xf5\xb7\x20\
-\xe6\x21\x3e\xf2\x75\x42\xce\x52\x5a\x60\xb3\x3e\x3e\x3b\xf2\xd6\
-\x5f\xa7\xfd\xea\xeb\x43\x92\xfc\xd4\x05\x90\x9f\xc0\x42\x3f\x52\
-\xe2\x6e\xcd\x00\x29\x5d\xc0\x11\x44\x0b\x17\x00\x8e\xb0\x8d\xab\
-\x07\x3e\xfc\x9d\x85\x38\x25\x7a\x29\x5f\x2b\xc1\xdd\xe7\xb5\xa2\
-\xa2\x90\x24\xbf\x67\x11\xd8\x54\xde\xe1\x97\x16\x5c\x24\xcf\xc1\
-\xf8\x13\xc4\x52\x84\x8d\xaf\x02\x1c\x61\x19\x13\xdd\xc9\x9f\x84\
-\x58\x33\xde\x8f\xbe\xfe\xd6\x08\xa1\xfd\x06\x2b\x00\x6f\xb4\xb6\
-\xc3\xf2\x74\xf1\x70\xd0\x24\x17\xcb\x21\xa9\x0b\xf8\x3d\xe2\x73\
-\x24\x1f\xb6\x8b\x69\x41\x8e\x70\x6b\xfd\x49\xe4\xd3\x55\x04\x2e\
-\x44\xfc\x45\x34\x2d\xf7\x98\x49\x87\x9d\x60\xd2\x7e\x43\xd1\x0c\
-\x78\xa9\xaa\x03\xa6\xfa\xd3\x0c\x90\x61\x67\xe6\xc6\x7a\x44\x1a\
-\x5f\x05\x38\xc2\xf5\xee\x9f\x87\xd8\x2c\x7a\x18\x5b\xaa\x56\x99\
-\x9b\x97\x27\xda\x2f\x23\x23\xa8\xb4\xdf\xa0\x9a\x01\x6d\xed\x70\
-\x4f\x8e\x3f\x5a\x50\xce\xa4\xa3\x0b\xef\x91\xab\xd0\x2e\x57\x01\
-\x60\x6b\x31\x8e\x70\x4a\xfe\x31\x2e\x77\x9f\x7f\xf9\x3a\x09\xc9\
-\xdd\xe7\x59\x2d\xcd\xfc\xb6\x1f\xd1\x7e\xc3\x10\xf9\x0c\x46\x17\
-\xb0\xbb\xce\x01\x33\xe3\xfd\x68\x06\xa8\x52\x35\x03\x7a\x11\x25\
-\x54\x00\xf6\x72\x01\xe0\x08\xa3\x02\x50\x87\x38\x24\xa2\xfd\xee\
-\x56\x4b\xcd\xed\xcc\xe3\xe9\x7f\x30\x37\x57\xea\xae\xbf\x4c\xcd\
-\x80\x87\x0a\x3a\x84\x7a\x01\x3a\xed\xa9\x96\xc9\xd2\x0c\x20\xf9\
-\xb0\x1b\x10\x0a\x3f\x08\x72\x84\x4b\xf2\x13\xed\xb7\x08\xf1\xb1\
-\xaf\x13\x70\xb6\xda\xec\xb2\xd4\x32\x47\xfb\x1d\x23\xda\x2f\x8c\
-\x4e\x7f\x6f\xcd\x80\x9b\x12\xc5\xb4\xe0\x54\xb9\x9a\x01\x27\x11\
-\x6d\x7a\x01\x88\x8b\xe3\x2f\x22\x47\xf0\xc3\xcb\xd6\xfb\x5c\xc4\
-\x6f\x45\xb4\xdf\xfd\x66\x4d\x35\xad\xd6\x90\xd3\x7e\x43\x29\x02\
-\x1b\x4a\x82\xa6\x19\x40\xb8\x8b\x69\x41\x8e\x70\x38\xfd\x93\x11\
-\x0f\x8b\x68\xbf\x9b\xd5\x3a\x73\x2b\xb2\x06\xed\xd7\xd4\x14\xf6\
-\x05\xc0\xd0\x0c\x18\xeb\x47\x33\xc0\xac\xd9\x89\x07\xfe\x82\xf8\
-\x32\xd1\x82\x7d\xdc\x05\x70\x04\x35\xf9\xdd\x0a\xbf\x84\x4b\x45\
-\xee\x3e\x34\x0d\xf7\x84\xc9\x2f\x7c\x1f\x9e\xfe\x47\xca\xca\xc2\
-\x3a\xf9\x3d\x1f\x04\xb7\x54\x76\xc0\x14\x4b\xb7\x50\x3e\x8c\xe6\
-\x20\x24\x69\x06\x10\x36\xe2\xe9\x9f\xc1\xb4\x20\x47\x70\x0b\x80\
-\x53\xdd\x97\x50\x88\xd8\x2e\x9e\x87\xaf\x34\xed\xee\x43\xb4\xdf\
-\xc9\x30\xa2\xfd\x06\xeb\x02\x06\xd7\x0c\xe8\xc4\x2b\x91\x34\xcd\
-\x80\x7f\x21\x7e\xb2\x1b\xaf\x00\xbb\xb8\x08\x70\x04\xf9\xf4\x27\
-\xda\x6f\x8a\x68\xde\x7f\xba\x6a\x87\x8d\x96\x54\xd3\xb4\x5f\xb0\
-\xb7\xfd\x64\x74\x01\x3b\x6a\xfc\x69\x06\x74\xc3\x6c\x5d\x33\x20\
-\x51\xa6\x7c\x58\x05\x77\x01\x1c\x41\x89\xcb\xdc\xf7\xff\x16\xc4\
-\x09\xd1\xf0\xcb\x3d\x5a\xb1\xe9\x2f\xb7\x4e\xfb\x85\x68\xdb\x4f\
-\x86\x66\xc0\x78\x3f\x9a\x01\xab\x74\x5a\x54\x4a\x17\xf0\xb1\xcb\
-\x55\x48\xe5\xe1\x20\x8e\x60\x3d\xfc\xd9\x10\x2b\x45\x0f\x7f\xf3\
-\xc8\xdd\xc7\x92\x68\x4e\xe4\x33\x21\x21\x6c\x69\xbf\xa1\x74\x01\
-\xa4\x19\x30\x37\x41\xdc\x05\x4c\x53\xda\x4c\xfb\x1f\x7a\xe0\x37\
-\x86\xab\xd0\x0e\x2e\x00\x1c\x81\x88\x6b\x06\xd2\x7e\xe4\xee\xf3\
-\x67\xb1\x69\xa6\xc9\x05\x18\xab\x15\x5e\x2d\x2c\x8c\xb8\xc4\xf7\
-\xc6\xfa\xc2\x0e\x98\xa8\x8a\x87\x83\xe8\x8d\x64\xa7\x3c\x5a\xf0\
-\x01\x3c\xfd\x13\xf9\x2a\xc0\x11\xe8\xd3\x3f\xc3\x9f\xcc\xd7\x2d\
-\xae\x15\x58\x33\x05\x60\x6f\x4a\x4a\xd8\xd3\x7e\x43\x79\x10\x7c\
-\x6d\xc8\x9a\x01\x52\xba\x80\xff\x45\x7c\x93\x5d\x85\x38\x02\xf2\
-\xf0\x47\x83\x3f\x93\x9d\x05\xe0\xc7\x88\xf7\x45\xd3\x6e\x4f\x9b\
-\x74\xf7\x89\x24\xda\x6f\x28\x57\x81\x4d\x65\x4e\xcd\x00\x51\xc1\
-\x5c\xa4\xd6\xc9\xd2\x0c\x20\xbc\xc8\xae\x42\x1c\x81\x3c\xfd\x2b\
-\x11\xfb\x45\x2d\xed\x0a\x09\x32\x58\x3a\xed\x27\xc1\xd9\x37\x5c\
-\xba\x00\xd2\x0c\xb8\x2d\xad\x4b\x48\x0b\x4e\xee\xd7\x0c\xd0\x64\
-\xd1\x82\xe3\xfa\x5d\x85\x78\x42\x90\x43\x4a\xf2\x13\xf5\xa7\xf6\
-\x90\xbb\xcf\x1c\xc4\x7f\x84\xee\x3e\x5a\x8a\x39\xda\x2f\x2e\xce\
-\xe9\xec\x1b\x81\x0f\x7f\xfe\xba\x80\xad\xd5\x1d\x70\xbd\x55\x3c\
-\x1c\x34\x4f\xae\x66\xc0\x6b\x88\x06\x9d\x11\x18\x33\x86\xbf\xc0\
-\x1c\xd2\x4e\xff\x1e\x7f\x32\x5f\x6b\x54\xf3\x3b\xef\x07\x73\x72\
-\xc2\x72\xdb\x4f\x86\x66\xc0\xea\x6c\x31\x2d\x38\x51\xae\x66\x00\
-\xd1\x82\xb7\xec\xb2\x58\xac\x7c\x15\xe0\x90\x95\xfc\x89\x62\x99\
-\xaf\x6e\x98\xaf\x98\x3f\xc1\x74\xda\xaf\xae\x6e\x54\x9d\xfe\xde\
-\x9a\x01\x33\xe2\xfc\x6b\x06\x6c\x96\xa7\x19\xf0\xff\x11\xe7\x71\
-\x01\xe0\x18\x71\x7c\xdb\x25\xf3\x35\xc1\x59\x00\xfe\x5b\x24\xf3\
-\x35\x59\xe9\x80\x47\xb5\x1c\xd3\x5f\xdc\x57\x0b\x0a\x46\x5d\xe2\
-\x9f\xa1\x19\x90\xdf\xa9\x0f\x01\x89\x3a\x81\x95\x5a\xb9\x2c\x29\
-\x71\xc2\x23\x88\x54\x2e\x02\x1c\x23\x0a\x0f\x91\xcf\x1c\xc4\x2f\
-\x45\xa7\xff\x62\xb5\x06\xb6\x9b\x7c\xc5\xde\x9b\x9c\x0c\x27\x1a\
-\x1b\x47\x75\x01\x30\x34\x03\xe6\xfb\xd1\x0c\x20\xb3\x94\x67\xe4\
-\x69\x06\xfc\x0d\xf1\x6d\x76\x15\xe2\x18\x11\xed\x47\xc9\x3f\xd6\
-\x39\xef\xff\x73\x7f\xb4\x9f\x59\x91\x0b\x9d\xf6\x2b\x2d\x1d\xd5\
-\xc9\xef\x89\xa7\x87\xa0\x19\xb0\x43\xde\x70\xd0\x36\x44\x31\x17\
-\x00\x8e\xe1\x15\x80\x98\x78\x4f\x99\xaf\x03\xfe\xdc\x7d\xcc\xca\
-\x7c\xed\x4f\x4f\x1f\x35\xb4\xdf\x50\x35\x03\x16\xa7\x8a\xbb\x00\
-\xd2\x0c\x58\xaf\x2b\x27\x6b\xb2\x5c\x85\xae\xed\x97\x0f\xe3\x22\
-\xc0\x31\xd4\xd3\xdf\x25\xf3\xb5\xc0\x37\xed\xd7\x03\xb3\xfa\x1f\
-\xad\x4c\x48\x7c\x1b\xb4\x5f\x94\x9c\xfe\x46\x11\x78\xa1\xd2\xe1\
-\x47\x33\xa0\x07\x16\x28\x52\x35\x03\x5e\x47\xd8\xb9\x00\x70\x0c\
-\xad\x00\x58\x3e\x65\xec\xfb\x9f\x8d\x78\x5b\x44\x5b\xad\x33\xeb\
-\xee\x83\xa7\xff\x81\xec\xec\x51\x49\xfb\x0d\x06\xd2\x0c\x58\xe1\
-\x47\x33\x80\x0c\x45\x1e\xd0\xf2\x65\x15\x00\xa2\x05\x6f\x47\xc4\
-\x71\x11\xe0\x18\x2a\xed\x97\x82\xb8\x5f\xb4\xed\xb7\x40\x82\xaa\
-\x8d\x4e\xfb\xd5\xd6\x46\x5d\xf2\x1b\x5d\xc0\xce\x5a\x7f\x9a\x01\
-\x3d\x30\x47\xd7\x0c\x48\x92\x75\x15\x20\x57\xa1\xf3\xfb\xf7\x04\
-\x92\x92\xf8\xcb\xce\x21\x4c\x7e\xc2\xb7\x10\xef\x88\x74\xed\xd6\
-\x9b\x74\xf7\xe9\xa7\xfd\x22\x70\xd7\x5f\xa6\x66\xc0\xba\x3c\xff\
-\x52\xe2\xab\xd4\x12\x59\x9a\x01\x84\x27\x10\x99\x7a\x01\x50\x55\
-\xfe\xc2\x73\x08\xef\xfe\x24\xf3\xf5\xa2\xe8\xf4\xbf\x4d\x82\xbb\
-\x0f\xd1\x7e\xc7\x47\x39\xed\x37\x94\x2e\x80\x34\x03\xe6\xc4\x8b\
-\x1f\x04\xa7\x2b\x76\x99\x9a\x01\x7f\x47\x5c\xf1\x72\x5c\x5c\x0c\
-\xef\x09\x70\xf8\x3e\xfd\xd5\x9e\x58\xfc\x39\xc1\xb7\xbb\x8f\x53\
-\xc4\xe2\x39\x4b\x9a\xb9\x87\x3f\xab\x15\x0e\x47\x11\xed\x37\xd8\
-\x70\xd0\xe3\x45\x1d\x30\x61\x10\xcd\x80\x1d\xf2\x86\x83\xfa\xfa\
-\xe5\xc3\x1a\x1b\xf9\x8b\xcf\x71\x46\xfb\xdf\x8c\x38\x2c\x94\xb1\
-\xd2\x4a\x98\xf6\x93\xdc\x05\xbc\xda\xdc\x1e\x4c\xcd\x00\x72\x15\
-\x9a\x61\xc8\x87\xf1\x83\x20\x87\xb7\xcc\xd7\x12\x91\xbb\xcf\x1c\
-\xd5\x78\x94\xb2\x98\xdb\xf6\xab\xac\x0c\x9b\xe4\x23\x9c\xd6\xe1\
-\x80\xb7\x1d\x6e\x9c\x26\x78\xfc\x3d\x81\xfe\x73\x6c\x2a\xef\x80\
-\x49\x42\xcd\x80\x1e\x58\xec\x12\x59\x91\xd4\x05\x90\xab\x50\xa7\
-\xa1\x1f\xc8\x1a\x82\x51\x9e\xfc\x1e\xf3\xfe\xff\x4f\xe4\xee\x43\
-\xb4\xd4\x83\x66\xdd\x7d\x42\x4c\xfb\x9d\x1a\x90\xd0\x0e\x38\x6a\
-\xc7\x3b\x78\x73\x0b\xec\x68\x6a\x84\xe7\xea\xea\xe0\x9e\x8a\x0a\
-\xb8\xb1\xa8\x08\x16\x96\x14\xc3\xba\xaa\x4a\xd8\x5c\x5f\x0f\xbd\
-\x4d\x4d\xf0\x06\xfe\x79\x8d\x82\x10\x48\xcd\x80\x65\xe9\x9d\x3e\
-\xbb\x00\x69\x32\x6b\x03\x71\x37\x22\x81\xbb\x00\x2e\x00\x06\xd2\
-\x11\x8f\x8a\x4e\x20\x52\xad\xd9\x66\x89\x37\xf5\xa5\xdb\x9d\x90\
-\x00\x47\x43\x40\xfb\x9d\x72\xbd\xb8\x53\xab\xbd\xa3\xd6\x01\x1b\
-\xca\xed\xb0\xb4\xb0\x1a\xae\xc8\xc8\x85\xb3\x13\x12\xa1\xd1\x66\
-\x85\x1a\xab\x05\x4a\x35\x15\xf2\x94\x58\xc8\x47\x94\xe3\xaf\xeb\
-\xf0\xaf\xb5\xe2\xff\x77\x69\x46\x3a\x16\x85\x12\x78\xb9\xb1\x11\
-\xff\x39\x6d\x01\x29\x04\xb4\x2d\xb8\xad\xda\xe1\x47\x33\xa0\x07\
-\xe6\xcb\xd5\x0c\xf8\x33\xe2\x02\xa3\x0b\xe0\x22\xc0\xb4\xdf\x65\
-\x88\x77\xc5\xee\x3e\x99\xe6\x69\xbf\xfc\xfc\xa0\xd2\x7e\xa7\x5c\
-\x7b\xf8\x7b\x1a\xda\x61\x43\x69\x07\xdc\x9d\xdb\x0e\x13\xd3\xaa\
-\xe1\x1c\x5b\x3a\x94\x28\x1a\x64\xc7\x8e\x81\x1c\x65\x0c\xe4\x62\
-\xc2\x1b\xc8\x73\xc1\xf8\xdf\x39\x08\xfa\xfb\xa8\x28\xb4\xc5\xd9\
-\x60\x42\x5e\x2e\xfc\xaa\xa1\x21\x20\x57\x83\xe3\x76\xa7\x66\xc0\
-\x38\xa1\x94\x78\x17\xdc\x67\x76\xf8\xca\xdb\x55\xc8\x62\xc9\xd2\
-\xbb\x00\x9b\x8d\x13\x22\x8a\x0b\x40\x89\x3f\x77\x9f\xe5\x12\xdc\
-\x7d\x42\x41\xfb\x1d\x68\x6a\x87\xa7\x4b\x1d\xb0\x2a\xa7\x03\xe6\
-\xa6\x37\xc1\x57\xe2\xb3\xa1\x54\xd5\xfa\x93\x3e\x6f\x98\xc8\x71\
-\xa1\x23\x3e\x0e\x6e\x2d\x2d\x81\x23\x74\x35\x90\xdc\x05\xf4\xd5\
-\x39\x60\xe6\x20\x9a\x01\xcf\x9b\x1c\xbf\xf6\xc0\xfb\xe4\x2a\x44\
-\x43\x41\xbd\x2e\x67\x21\x8e\xe8\xe3\xfc\x15\xc4\x75\x88\x0f\x7d\
-\xba\xfb\xf4\xf3\xd0\x26\x69\x3f\x6c\xa1\x83\x79\xea\x6f\xab\x71\
-\xc0\x9a\xbc\x0e\xb8\x23\xb3\x03\x26\xa7\xd6\x82\xc3\x9a\x74\xc6\
-\x29\x3f\x52\xe4\x60\x47\x50\xac\x2a\xf0\xe3\xec\x2c\xd8\xd7\xd2\
-\x2c\xb5\x08\x10\x2d\xf8\x48\x41\xa7\xdf\xe1\xa0\x95\x66\x17\xb0\
-\x06\x62\x3f\xa2\x8a\xba\x80\x83\x3c\x17\x10\x45\x27\xbf\xbb\x00\
-\xd8\x11\x47\x45\xb4\xdf\x3d\x6a\xb1\xe9\x87\xbf\xfd\x69\x69\x70\
-\xb2\xb9\x39\x68\xbe\x7c\x9b\xca\x1d\x70\x57\x76\x07\x2c\xc7\xe4\
-\xbf\x2a\xa5\x02\x6a\x35\x9b\x7e\xea\xe7\x49\x48\xfe\x01\x57\x84\
-\xd8\x58\xb8\x28\x3d\x0d\x76\x36\x35\xe9\x8f\x84\xb2\xba\x80\x41\
-\x35\x03\xd4\x76\x78\xc6\x92\x2e\x73\x4f\x60\x1e\x9e\xfe\x2a\xbf\
-\x05\x44\x5b\x01\x50\x7b\xe2\xf0\xd7\xcb\x85\xee\x3e\x8a\xe1\xee\
-\x63\x62\xd7\xdf\x66\x83\xd7\x83\x44\xfb\x51\xf2\x6f\xc0\x96\x7f\
-\x65\x56\x87\x8e\xf1\xa9\xd5\x50\xa9\x59\xa4\x27\xbf\x77\x37\x70\
-\x49\x46\x3a\xbc\xd2\xd2\x22\xad\x08\x0c\xae\x19\xd0\x03\x4b\xd5\
-\x6a\x73\xd3\x98\x03\xf1\x36\xa2\x87\x19\x81\xe8\x7b\xf8\x3b\x1f\
-\xf1\xc7\x80\xd1\x4e\x44\xfb\x65\x65\x05\x8d\xf6\xdb\x52\x89\xc9\
-\x9f\xed\x4c\x7e\xba\xf3\xb7\x59\x13\x03\x9a\xfc\x9e\x8f\x85\x3f\
-\xc9\xce\xd6\xdf\x04\x4e\x49\xd4\x0c\x58\x92\xda\x05\x63\x05\xb4\
-\xa0\x64\xcd\x00\xc2\x7d\xbd\xec\x2a\x14\x55\x05\x80\xdc\x7d\x36\
-\x0c\x36\x78\x62\x6a\xe8\x27\x3e\xde\x49\xfb\x05\x58\xe4\x93\x12\
-\xa6\xb7\xce\xf9\xd8\xb7\x02\x93\xff\xd6\xcc\x36\xf8\x5c\x5c\x86\
-\x94\xfb\xfe\x50\x8b\x00\xbd\x09\x2c\x2e\x29\x91\xc6\x0c\xd0\x55\
-\x60\x4b\x45\x07\x4c\xd1\xfc\x68\x06\xa8\xf5\x32\x35\x03\x48\x3e\
-\xec\x42\x36\x17\x1d\xc5\x31\x61\xe0\xe9\x7f\x25\xe2\x9f\x81\x72\
-\xf7\x21\x1c\x0a\x02\xed\x47\x09\x77\x18\x4f\xcb\xfb\x0b\x3a\xe0\
-\x0e\xbd\xf5\xef\x84\x1f\x25\x97\x41\xa1\xa2\x04\x25\xf9\x0d\x10\
-\x55\xd8\x85\x05\x6f\x6b\x43\xa3\x3e\x49\x28\xeb\x3d\x63\xa5\x1f\
-\xcd\x00\xd2\x64\xb8\xdf\xec\x70\xd6\x40\xfc\x0a\x91\xcb\x5d\xc0\
-\x28\x8d\xb1\xee\xe4\x2f\x47\xec\x15\xbb\xfb\x98\x57\xa6\xed\xa7\
-\xfd\x82\x20\xf1\xfd\xcb\x0a\x87\x7e\xf2\x53\xeb\xbf\x20\xa3\x05\
-\xda\xb1\xf5\xcf\x0d\x70\xeb\x2f\xa2\x09\x7f\x96\x93\x0d\x47\xb1\
-\xe8\xc9\xe8\x04\x4e\x3b\x9c\x83\x4b\x62\xcd\x80\x6e\x98\x2d\x61\
-\x3c\xdb\x03\x1f\xba\x5c\x85\x58\x44\x74\xb4\xc5\x38\xd7\xc8\xef\
-\x38\x27\xed\x37\x5b\x24\xf3\x45\x3c\xb3\x59\x77\x9f\xde\x20\xd1\
-\x7e\xd4\x26\x1f\x6c\x72\xc0\x9a\x5c\xf7\xe9\xff\x83\xe4\x52\x28\
-\x08\xf2\xe9\xef\x59\x00\x68\xa2\x70\x7d\x4d\x8d\x94\x2e\xc0\xd0\
-\x0c\x58\x9b\x2b\xee\x02\x08\xab\xd5\x12\x99\x5d\xc0\x11\x44\x1d\
-\xaf\x0b\x8f\xb2\xf0\xb0\xf6\xee\x46\x9c\x16\xb5\x94\xf7\x49\x90\
-\xf9\x0a\x16\xed\xa7\x9f\xfe\x95\xee\xd3\x9f\xee\xfe\x5d\xb6\xe4\
-\x90\x9c\xfe\x9e\x57\x81\xab\xc9\xdd\x48\x62\x91\xdb\xdb\xe0\x80\
-\xb9\x09\xe2\x2e\x80\x56\xb4\x25\x6a\x06\x7c\x82\x58\x82\xb0\x70\
-\x17\x30\xfa\x1e\xfe\xc8\xdd\x67\x9d\xe8\xe1\xef\x26\xb5\x01\xb6\
-\x9a\x9c\x35\xd7\x69\xbf\x8a\x8a\xa0\xb4\xfe\x74\x47\x7e\xb0\xc0\
-\xd1\x7f\xfa\xcf\x4e\x6f\x84\x6a\xcd\x1a\xb4\xc7\x3f\x5f\xc8\xc2\
-\x02\xf0\x05\xbc\xfe\x10\x2d\x28\x73\x54\x98\x34\x03\x26\x0e\xa2\
-\x19\x20\xd1\x50\x84\xe4\xc3\x3e\x4b\xc9\xbf\x93\x0b\xc0\xa8\x2a\
-\x00\xdf\x40\xfc\x4d\x24\x45\xfd\x98\x04\x77\x1f\x9d\xf6\x6b\x6d\
-\x0d\xca\xd0\xcf\x6b\xcd\x0e\xb8\x2f\xcf\xd9\xfe\xdf\x89\x05\xe0\
-\xfa\xb4\x3a\xa8\xd0\x2c\x21\x2d\x00\xd4\x01\xf4\x24\xc4\xc3\xf6\
-\xc6\x46\x79\xc3\x41\xba\x66\x80\x03\x6e\x16\x68\x06\x8c\x77\xed\
-\x6b\x3c\x25\xe1\xe1\xd6\x03\xeb\xd9\x55\x68\x74\x25\x7f\xae\x58\
-\xe6\xab\x5b\xca\x60\x89\x4e\xfb\xe1\xfd\x37\x18\xa7\xbf\xf1\xfa\
-\x7f\x5f\xbe\xfb\xfe\x3f\x27\xbd\x09\x6a\x34\x5b\xc8\x0b\xc0\x67\
-\x12\x13\x61\x77\x73\xb3\xf4\x3d\x81\x8d\x65\x1d\x30\x59\x13\x1b\
-\x8a\xd0\xc6\xa6\x59\xea\xd6\x4b\x3e\xec\xbb\x46\x01\xd8\xc8\x45\
-\x20\x02\x93\x5f\x3b\x4b\x4f\xfe\x6b\x62\x3a\xe8\xe7\x38\xc4\x07\
-\xbe\xbe\x38\x37\xe0\x1d\x52\x86\x1d\xd5\xa1\xbc\xbc\xa0\x6e\xfb\
-\xd1\x3e\xff\x83\x85\xc6\x15\xa0\x03\x16\x66\xb6\x42\x33\x5e\x61\
-\x42\x7d\x05\xf8\x5a\x6a\x0a\xbc\x86\x5d\xd0\x29\xc9\x05\xef\xa8\
-\xa1\x19\xa0\x0c\xa6\x19\x20\xad\x0b\xd8\x69\xb8\x0a\xf5\x71\x01\
-\x88\xc0\x02\x30\xa6\xd3\x38\xfd\x6b\x45\x32\x5f\xba\xbb\x8f\x6a\
-\x7e\xb9\x64\x4f\x52\x12\x1c\x6f\x68\x08\xba\xe5\xf6\xa3\x45\xee\
-\x02\xb0\x24\xb3\x0d\x3a\xf4\xa5\x9f\x31\x21\x2d\x00\xdf\xcd\xcc\
-\x80\xe3\x92\xa8\x40\xef\x2e\xe0\xa5\x2a\x07\x4c\xb5\x8a\x1f\x04\
-\xc9\xa5\x79\xab\x3c\xcd\x80\x7f\x23\xa6\x22\x62\xf9\x2a\x10\xb9\
-\xad\xbf\x86\x58\x88\xf8\xc4\xd7\xc3\xdf\x6c\xa5\xc5\xb4\xbb\x0f\
-\xd1\x7e\xaf\x15\x17\x87\x44\x56\xfb\x89\x12\x67\x01\x20\x26\xe0\
-\xb6\xcc\x76\x38\xdb\x96\x16\x72\x16\xe0\xaa\x9c\x6c\x69\x2c\x80\
-\xaf\xa2\xb7\x6a\x10\xcd\x80\x35\x5a\x91\x4c\x5a\xf0\x38\xa2\x8d\
-\x0b\x40\xe4\x16\x80\x73\xc5\x32\x5f\x5d\xb0\x4e\x2d\x30\xfd\x25\
-\xd9\x97\x9a\x0a\x27\x82\x44\xfb\x79\xaf\xce\x3e\x57\xee\x2e\x00\
-\xcb\xb3\x1c\xf0\xa5\xf8\xec\x80\xcf\xff\x0f\x36\x16\x3c\x95\x26\
-\x20\x03\x38\xfb\xd0\x57\x3f\x88\x66\x80\x62\x68\x06\x48\xa3\x05\
-\x57\xb2\xab\x50\x64\x26\x7f\x32\xe2\x61\xd1\xa3\x91\x0c\x77\x1f\
-\xa2\xfd\x8e\x94\x97\x87\x4c\xd8\x73\x8b\x6b\x0e\xc0\xc0\x37\x13\
-\xf3\x43\x5a\x00\x0a\x10\xb4\x13\x70\x3a\xc0\x85\xef\xa1\xfc\x4e\
-\x7d\x5d\x5b\xa8\x19\xa0\x4a\xd5\x0c\xf8\x13\xe2\x4b\x3c\x21\x18\
-\x41\xc9\xef\x9a\xfb\xbf\x04\xf1\xbf\x81\xdc\x26\x7b\x25\x33\x33\
-\x28\xb4\x9f\xe8\x61\xec\xa5\x1a\x77\x01\x20\x2a\xf0\xbb\x49\x45\
-\x21\x3d\xfd\x69\x29\x68\x4d\x45\x85\xb4\x49\x40\xd1\xbf\x77\xbf\
-\x66\x80\xa0\xb8\x5f\xaf\xb4\x4b\x79\xd8\xf5\xc0\xd3\xfd\xae\x42\
-\x5c\x00\x22\xe2\xf4\x27\x77\x9f\x6d\xa2\x13\x82\xdc\x7d\x76\x44\
-\x10\xed\x27\x6a\x87\x77\xd5\x39\xe0\xce\x6c\x77\x01\xa0\x45\xa0\
-\x50\x8d\x02\x53\x01\xa8\xc4\x84\x7b\xbc\xa6\x3a\xa0\x05\xc0\x28\
-\x02\xfe\x35\x03\xba\xe1\x56\xb9\x9a\x01\xef\x21\x7e\x78\xd8\x55\
-\x00\x78\x63\x30\x0c\x63\x9c\x3b\xf9\xc9\xdd\x67\xb2\x3f\xda\xef\
-\x39\x2d\x4d\x0a\xed\xf7\x66\x08\xbd\xfd\xa8\x00\xec\xc1\xfb\xf0\
-\xdd\x39\xee\x02\xf0\x8b\x94\x4a\x3c\x85\xd5\x90\xed\x02\x34\x58\
-\x2d\xb0\xb1\xae\x2e\x28\x05\xe0\x48\x8b\x03\x16\xa7\x88\x95\x83\
-\xa8\xcb\x7b\x5c\xcb\x92\xd9\x05\xec\x46\x54\x52\x01\xd8\xcd\x05\
-\x20\xfc\xe2\x87\x4e\xbe\xdf\x70\xf7\x79\x5d\xe8\xee\xa3\x96\x9a\
-\x36\x9c\x0c\x05\xed\xe7\x2b\x09\x5e\xc1\x56\xf8\x9e\x5c\xf7\x34\
-\xe0\x75\x69\x75\x50\xae\x86\x66\x1a\x30\x47\x5f\x09\x8e\x83\x6d\
-\x12\xa7\x00\x07\xfb\xf7\xdf\x4c\x9a\x01\x16\x7f\x9a\x01\x0d\x32\
-\x35\x03\xc8\x55\x68\x56\xaf\xd5\xca\xae\x42\x61\xdb\xfa\xab\x3d\
-\xe4\xee\x73\x9b\x6f\x77\x9f\x6e\xa7\xe5\xb4\x66\x7e\x7d\x34\x14\
-\xb4\x9f\x70\x1a\x30\xaf\xc3\x63\x1f\xa0\x29\x64\xfb\x00\x44\x01\
-\x7e\x3e\x39\x09\xf6\x93\x3c\x58\x90\x3e\x03\xda\x87\xb8\xd3\x8f\
-\x66\xc0\x24\x97\x66\x80\x44\x43\x11\x72\x15\xea\xe6\x02\x10\xbe\
-\x77\xff\xcf\x23\x7e\x27\x72\xf7\x79\x40\x82\xbb\x4f\xa8\x68\x3f\
-\xd1\x74\xdc\xfd\xfd\xe3\xc0\x4e\x3d\x80\x06\x4b\x5c\x48\x0a\x00\
-\x0d\x01\x5d\x98\x96\x2a\x4d\x1a\x6c\xa8\x9f\x01\x69\x06\xdc\x60\
-\x15\xd3\x82\x4e\x4b\xb7\x44\x99\x57\x81\xd5\x2c\x1f\x16\x9e\xc9\
-\x4f\xee\x3e\x8f\x8b\x1e\x85\x16\xea\xee\x3e\xe6\xfc\xe5\x42\x4d\
-\xfb\xf9\x32\xd3\x78\xb8\xd0\x5d\x00\x6e\xc9\xb4\xeb\x5a\x80\xa1\
-\x18\x06\xa2\x0e\xe0\xfb\x99\x99\x70\x22\x00\x53\x80\x83\x0d\x44\
-\xdd\x97\x2b\x96\x12\x77\x5e\xfb\x4a\x4c\x5f\xfb\xbc\x5c\x85\xbe\
-\xc6\xb4\x60\x78\x25\x3f\xe1\x72\x91\xbb\xcf\x14\x19\x0e\xb3\x78\
-\xfa\x13\xed\x77\x32\x44\xb4\x9f\xe8\xcb\xbf\xbe\xd8\x3d\x0e\xbc\
-\x34\xb3\x0d\xce\xb2\xa5\x84\x46\x11\x48\xb2\x16\xc0\x70\xba\x80\
-\x7d\x0d\x0e\x98\x93\x20\xee\x02\xa6\xf5\xfb\x3b\x68\x32\x5d\x85\
-\x58\x3e\x2c\x8c\x0a\x00\xc9\x7c\xed\x14\x9d\x02\x77\xa8\x15\xa6\
-\x3d\xe6\xc9\xd9\xf7\x68\x75\x75\x58\xd9\x6b\xbf\x89\x05\x60\x43\
-\x99\x7b\x1a\x70\x59\x96\x03\xbe\x10\x9f\x19\xb2\x71\xe0\x59\x85\
-\x85\x41\x3d\xfd\xbd\x35\x03\x26\xf8\xd1\x0c\x58\x2e\x57\x33\xe0\
-\x9f\x88\xab\x7b\xad\x56\xde\x13\x08\x83\xe4\x57\x11\xd3\x11\xff\
-\xf6\x55\xfd\x67\x90\xcc\x97\x25\xc5\xf4\x43\xd0\xc1\xdc\xdc\x90\
-\xd2\x7e\x22\x3c\x5f\xe1\x2e\x00\x84\xaf\x27\xe4\x85\x64\x1a\xb0\
-\x50\x55\x60\x79\x59\x59\x50\x18\x00\xdf\x9a\x01\xed\xba\x66\xc0\
-\x58\x01\x2d\xe8\xd4\x0c\xc8\x94\xd9\x05\x1c\xe8\x97\x0f\xe3\x02\
-\x10\xfc\xf0\x10\xf9\xec\x40\x1c\x17\x2d\x87\xdc\xab\x15\x99\xbb\
-\xff\x61\xeb\xbf\x27\x31\x11\x8e\xd7\xd7\x87\x5d\xf2\xd3\x17\x7f\
-\x6b\xb5\x7b\x1a\x90\x98\x80\x4b\x93\x0a\x83\xfe\x08\x48\xbf\x1f\
-\xb9\x0b\x3f\x50\x55\x15\xf0\x19\x00\x7f\x9f\xc5\xa6\x72\x7f\x9a\
-\x01\x3d\x70\x8b\x04\xb9\x77\x0f\xfc\x07\x71\x13\xc2\xca\x45\x20\
-\x74\xa7\x3f\xc9\x7c\xdd\x25\xda\xf6\x73\x5a\x4a\x27\x9a\xa7\xfd\
-\x8a\x8a\xc2\x2e\xf9\x8d\x61\x20\x7a\x05\xf7\x9c\x06\xbc\x22\xb9\
-\x54\x77\xf3\x0d\x76\x01\xa8\xc1\x93\xf5\x49\x89\x82\xa0\x23\x29\
-\x00\x6f\xb4\xb6\xc3\xed\xa4\x19\x10\x1b\x34\xcd\x00\x72\x15\x3a\
-\xa7\xff\x41\x30\x2b\x8b\x93\x33\xc8\x0f\x7f\x17\x20\xfe\x24\xfa\
-\x8f\xfd\x08\xfe\xc7\x36\x4d\xfb\xa5\xa4\xc0\x89\xa6\xa6\xb0\x2d\
-\x00\xb4\x1d\x77\x97\xc7\x34\xe0\xcf\x52\x2a\xa0\x28\xc8\xd3\x80\
-\x34\x05\xd8\x62\xb3\xc1\xf3\xd8\x25\x85\xaa\x00\xf4\xef\x47\x54\
-\xfb\xd3\x0c\x30\x0e\x85\x04\x99\xb3\x01\xf7\xf7\x5a\xad\xc9\x7a\
-\x01\x50\x55\x4e\xd0\x20\x16\x80\x6c\xc4\x33\xa2\x76\x6f\x89\x5a\
-\xa3\xb7\x7b\xa3\x89\xf6\xf3\xf5\x85\xdf\xdf\xe8\x80\xd5\x1e\xd3\
-\x80\xe4\x06\x5c\xa6\x6a\x41\xbd\x06\x10\x05\xf8\xe9\xc4\x04\xd8\
-\x45\x46\xa1\x61\x40\x8d\xde\x13\x5c\xcd\x00\x72\x15\xba\x08\x0f\
-\x0b\xa6\x05\x83\x98\xfc\x63\x10\x3f\x46\xfc\x43\xe4\xee\xb3\x41\
-\x4b\x37\xed\xed\x17\x6e\xb4\x9f\x6f\x71\xd0\x76\xa7\x15\xb8\x8b\
-\x0a\x9c\x99\xde\x08\x95\x41\x9e\x06\xa4\x21\xa0\x2f\xa6\x24\xc3\
-\x21\xc9\x52\x60\x23\xee\x8a\xea\x1c\x30\xc3\x8f\x66\xc0\xac\x7e\
-\x21\x18\x4d\xa6\xab\x50\x01\x17\x80\x40\x17\x80\xf2\x6f\x19\x05\
-\xa0\xca\x9f\xbb\xcf\x4a\xcd\xbc\xbb\x0f\xd1\x7e\x6f\x10\xed\x17\
-\xc2\x96\x76\xa8\xf7\xde\x75\x1e\xd3\x80\x37\x65\xb4\x40\x9d\x16\
-\x17\xf4\x0e\xe0\x9b\xe9\x69\x70\xb4\xcd\x1e\xf2\x02\x60\xcc\x47\
-\x3c\x54\xd0\x21\xa4\x04\x9d\xdf\x11\xa9\x9a\x01\x1f\x20\xc6\x23\
-\xc6\x70\x11\x08\xfc\xe9\x4f\x32\x5f\x73\x44\xee\x3e\xb3\xd4\x16\
-\x29\x8a\x30\x3a\xed\x17\x24\x67\x5f\xb3\x2d\xef\x43\x1e\xd3\x80\
-\x8b\x32\x5a\xa1\xd5\x92\x18\xf4\x02\xf0\xfd\xac\x4c\x5d\xb2\x2b\
-\x5c\xde\x46\x48\x33\xe0\xc6\x44\xf1\xb6\xa0\x5b\x33\x40\xda\x55\
-\xe0\x30\xa2\x81\x0b\x40\xe0\x1f\xfe\x7a\x10\xa7\x44\xee\x3e\x6b\
-\x25\xb8\xfb\x84\x2b\xed\x27\xd2\xc9\x7b\xac\x78\xa0\x38\x68\xb7\
-\x35\xb8\xd3\x80\x54\x6c\xc6\x51\xc1\x0c\xb3\xee\x68\x83\x5f\xcd\
-\x80\x1e\x5d\x0e\x7e\x87\x3c\xcd\x00\x92\x0f\x5b\xdc\x4f\x0b\xb2\
-\xb5\x98\xfc\x02\x80\x95\x3b\x09\x7f\xae\x09\xa4\xbb\x0f\xe1\xd5\
-\x30\xa5\xfd\x44\xed\xee\x53\xa5\x03\xc5\x41\x3f\x1b\x97\x11\xd4\
-\x61\x20\xa2\x1d\xe7\x17\x17\x85\x45\xfb\x3f\x60\x5b\xb2\xd9\x01\
-\x8b\x53\xfd\x6b\x06\x38\x95\xa1\xa4\x75\x01\xbf\x43\x7c\x46\x7f\
-\x10\xc4\x02\xc0\x9d\x80\x8c\xe4\x57\x7b\x3c\x4f\xff\xff\x46\xbc\
-\x23\x76\xf7\xc9\x36\xfd\xf0\x17\xce\xb4\x9f\x08\x9b\x3c\xa6\x01\
-\xef\xc8\x72\xc0\x05\xf1\x39\x41\x2d\x00\x34\x05\xb8\xb2\xbc\x2c\
-\xa4\x14\xa0\xa8\x08\xbc\x50\x39\x98\x66\x40\xbd\xae\x19\x20\x91\
-\x15\x78\x14\x91\xc2\x57\x01\x59\x05\xc0\xad\xef\x4f\xee\x3e\x5b\
-\x02\xe9\xee\x13\xee\xb4\x9f\xf0\x4b\x5e\xe5\x39\x0d\xd8\x01\x17\
-\x27\x16\x04\xed\x0a\x40\xed\x7f\x99\x6b\x0a\xf0\xd7\x61\x58\x00\
-\x48\x33\x60\xa5\x1f\xcd\x00\xba\x36\x3e\x20\x57\x33\x80\x5c\x85\
-\x2e\xed\x65\xf9\x30\x89\x77\xff\xd8\x2e\xa2\xfd\x7e\xe1\x4f\xe6\
-\xeb\x59\xb3\x32\x5f\x44\xfb\x65\x64\x84\x35\xed\x27\x7a\xf0\x7a\
-\xb9\xc6\xa1\x27\xbe\x31\x0c\x74\x79\x52\x71\xd0\xa6\x01\x3d\xa7\
-\x00\x7f\x1d\x86\x8c\x89\x3e\x2d\x89\x9f\xcf\x0d\xb6\xee\x41\x34\
-\x03\x92\x64\x16\x81\x1d\x88\x42\xee\x02\x4c\xc6\xb5\x86\xcc\x97\
-\xda\x53\x87\x3f\x5f\x13\x51\x3a\x77\xeb\x32\x5f\x12\x68\x3f\x3c\
-\xc5\xc2\x99\xf6\x13\x7d\xc1\x7b\xeb\x1c\x70\x97\xc7\x38\xf0\x4f\
-\x93\xcb\xa1\x30\x48\xe2\xa0\x34\x05\x68\x8f\xb3\xc1\x96\x10\x4f\
-\x01\x0e\xf6\x4e\xb2\x2e\xaf\xd3\x2f\x2d\xb8\x4a\x93\xaa\x19\x40\
-\xf2\x61\x53\x76\x58\x2c\x63\x76\x71\x11\x90\x42\xfb\x2d\xf2\xe7\
-\xee\xb3\x45\xaf\xde\xda\xa8\xdc\xf6\x1b\x4a\x9b\xbb\xb7\xc1\x01\
-\xab\x3c\xc6\x81\x27\xa4\x56\x43\x89\xaa\x05\x8d\x02\x3c\x27\x31\
-\x41\xba\x21\xa8\x4c\x9c\xc6\x22\xb9\xb7\xde\x01\x73\xe2\xc5\x0f\
-\x82\xd3\x15\x3b\x6c\xb2\x48\xd5\x0c\x20\x57\xa1\x16\x4a\xfe\x63\
-\x5c\x00\x4c\x3d\xfe\x9d\x23\x76\xf7\xe9\x84\xfb\xd5\x7c\xd3\xff\
-\xb1\x88\xf6\x3b\x56\x57\x17\x71\xa7\xbf\x51\x00\x0e\x35\x3b\xe0\
-\xde\x5c\xb7\x36\xe0\xf4\xb4\x06\xa8\x08\x92\x38\x28\x15\x80\x2f\
-\xa5\x24\x4b\x37\x04\x0d\x04\xd6\x07\x57\x33\x00\x5c\xae\x42\x36\
-\xbe\x0a\x8c\xfc\xf4\x27\x77\x9f\x47\x44\x0f\x7f\x37\xbb\x5e\x70\
-\x4d\xd3\x7e\x85\x85\x11\x97\xf8\x9e\x05\xe0\xf5\xd6\x76\x58\xeb\
-\x31\x0d\x38\x2f\xa3\x39\x68\x56\xe1\x54\x00\x2e\x4e\x4f\x83\x63\
-\x76\x7b\x58\x17\x00\xba\x2a\xbd\x8a\x85\x72\x61\xb2\xb8\x0b\x08\
-\x80\x66\xc0\xff\x78\xba\x0a\x71\x0c\x25\xf9\xf1\xde\x3f\xce\xed\
-\xee\x73\x29\xe2\xef\x22\x99\x2f\x19\xba\xef\x7b\x0d\xda\x2f\x02\
-\x4f\x7f\x4f\x75\xdc\x07\x0a\xdc\x05\xe0\xe6\x8c\xe0\x59\x85\x93\
-\x14\xd8\x95\x59\x59\x78\xcf\x6e\x8b\x88\xf7\x92\x8d\x65\xfe\x34\
-\x03\xba\xfb\x35\x03\x24\x76\x01\xcf\xb2\xab\xd0\xc8\x5a\x7f\x72\
-\xf7\xd9\x21\x6a\xd7\x6e\xc7\x76\xcd\xec\x14\x57\x9f\xd5\x0a\x47\
-\xca\xca\x22\x36\xf1\x45\x56\xe1\x8b\x33\xed\xd0\x69\x4d\x0e\x0a\
-\x15\x48\x45\x66\x4a\x7e\x5e\x44\x75\x4b\x41\xd6\x0c\x20\xf9\xb0\
-\x1f\xb3\x88\xe8\x50\x5b\x7f\x2a\x00\xda\x59\x44\xfb\x4d\x41\x7c\
-\xe4\xab\x4a\x4f\x53\xed\xf0\x9c\xd9\x07\x1b\x4d\x83\xfd\xe9\xe9\
-\x70\xb2\xa5\x25\xe2\x0b\x00\xbd\x72\x3f\xe9\x65\x15\xfe\x99\xb8\
-\xf4\xa0\x0c\x03\x11\xdd\x78\x4b\x49\x71\x48\xa4\xc0\x46\xfa\x20\
-\xb8\xb5\xaa\x03\xa6\x5a\xbb\x85\xde\x82\x01\xd0\x0c\xd8\x67\xb8\
-\x0a\x71\x01\x18\xda\xdd\xbf\x05\x71\x4c\xb4\xcf\x2d\x83\xb2\x89\
-\x54\xda\x4f\xe4\x98\xbb\xd1\xcb\x2a\xfc\x2b\x41\xb0\x0a\xa7\xd3\
-\xbf\x48\x55\x60\x55\x45\x45\x58\xce\x00\xf8\xeb\x98\x56\x67\x8b\
-\xbb\x00\xfa\x8e\xdd\xa7\x4a\xd5\x0c\x20\xf9\xb0\x79\x08\x76\x15\
-\x1a\x42\xf2\x93\xbb\xcf\x1d\xa2\x3b\xda\x5c\x49\x46\x0f\x07\x49\
-\xc2\x3a\x02\x69\x3f\x51\x6b\xbb\xa5\xca\x5d\x00\x56\x06\xc9\x2a\
-\xdc\x30\x04\x7d\xb4\xba\x3a\xa2\x0a\x80\x31\x3b\x31\x33\x4e\xec\
-\x30\x3c\x53\x69\x85\xe7\xb5\x14\x99\x57\x81\xd3\x88\x1e\x2e\x00\
-\x83\x17\x80\xf3\x45\x32\x5f\x44\xfb\x3d\xa8\xe5\x99\x6e\xcd\xf6\
-\x24\x24\x44\x2c\xed\x27\xfa\x42\x6f\xf3\xb2\x0a\xbf\x3c\xb9\x24\
-\x28\x43\x40\x4d\x36\x2b\x6c\xac\xaf\x0b\xdb\x21\x20\x7f\x5d\xd3\
-\x43\xf9\x9d\xba\x71\x88\x50\x33\x40\x2d\x97\xa9\x19\x40\xb8\x8f\
-\x5d\x85\xfc\x27\x3f\xb9\xfb\x3c\x2d\x3a\xfd\x17\xb9\xdc\x7d\xa2\
-\x99\xf6\x13\x15\x80\xdd\x1e\xda\x80\x2b\xfb\x87\x81\xd4\x80\x32\
-\x01\x44\x01\x7e\x26\x29\x31\xa8\x7e\x80\x32\xbb\x26\xd2\x0c\x98\
-\x9f\x28\xee\x02\x48\x33\xe0\x59\x5d\x33\x40\x5a\x17\xf0\x57\xc4\
-\x37\xb8\x00\x78\x26\x7f\xdc\x39\x9e\x05\xe0\x4a\xc4\x7b\xbe\x0a\
-\x80\x2c\x8e\x76\x6f\x04\x6e\xfb\x0d\xcd\x2e\x7b\xa0\x32\x10\xd9\
-\x84\x75\xdb\x52\x02\x7a\x0d\x20\x0a\xf0\x9a\x30\xd3\x01\x18\xee\
-\xe7\xf6\x94\x1f\xcd\x00\xc2\xad\x12\x96\xcc\xbc\xb0\x05\x91\xc7\
-\x45\xe0\xcc\x6d\x3f\x72\xf7\xd9\x2d\x9e\xd2\xaa\x30\x3d\xa5\xa5\
-\xd3\x7e\xa5\xa5\xa3\x2a\xf9\x3d\xb1\xa5\x72\xe0\x56\xe0\xd5\xa9\
-\x95\xfa\x48\x70\x6e\x80\x4e\xff\x8e\xf8\x38\x5d\x09\xf8\x74\x84\
-\x5e\xa5\x8c\xc2\xb9\x44\xa0\x19\x30\x7e\x80\x66\x80\xb4\x2e\xe0\
-\x7d\xc4\x35\xbb\x58\x3e\x6c\x40\xeb\xaf\x20\x66\x88\x68\x3f\x7d\
-\x4e\x5b\xc2\x83\xcc\x68\xa1\xfd\x44\x20\xb7\x60\x63\x1e\xc0\x60\
-\x03\xbe\x9a\x90\x2b\xbd\x0b\xa0\xbb\x7f\xad\xd5\x02\xeb\xaa\x2a\
-\xb1\xf5\x77\x44\xfc\xf5\x69\x73\x45\x07\x4c\xf1\x63\x28\xb2\x40\
-\xd2\xc4\xa9\x07\x0e\x21\xea\xb9\x00\xb8\x0b\x40\x27\xe2\xa4\x3f\
-\x77\x1f\xb3\x1f\x7a\x9f\x41\xfb\x8d\xd2\xe4\xf7\x5c\x0c\x5a\x9d\
-\x3b\xd0\x32\xfc\x53\x71\xa9\xd2\x8a\x80\xd1\x4d\x4c\xcc\xcf\x83\
-\x93\xae\xdf\x33\xd2\x3f\x37\x9a\xa4\x5c\xe1\x47\x33\x60\x12\x7e\
-\x07\xef\xd7\x0a\x64\x16\x00\xa2\x05\x17\x45\xb5\xab\x90\x47\xf2\
-\xc7\x23\x56\x8d\x0f\xf0\x50\xc6\x01\xa2\xfd\x22\x40\xe4\x53\x06\
-\x76\xd5\x61\x11\xc8\x71\x2f\x07\xdd\x88\x45\xe0\x2c\x9b\xf9\x22\
-\x90\xeb\x1a\xfc\xb9\x2a\x27\x1b\x0e\xdb\x5b\x47\x45\xf2\x7b\x3a\
-\x2c\x4d\xb3\x89\xa5\xc4\x67\xab\xcd\x52\xb6\x4e\x3d\xf0\x1b\xc4\
-\xb9\xfd\x13\x82\x71\x71\x51\x94\xfc\xda\x59\x9e\xf3\xfe\x5f\x45\
-\xfc\x8f\x3f\x77\x1f\x69\xb4\x5f\x14\x24\xff\x80\x22\x90\x3b\xb0\
-\x08\x9c\x17\x97\xa1\xcb\x77\xe5\x8e\xf0\xc1\xaf\x0a\xbf\xfc\xe3\
-\xf2\x72\x31\xf9\xed\x11\xf7\xea\x3f\x94\x69\xca\xfb\x72\xc5\x9a\
-\x01\x44\x17\xae\x96\xab\x19\x40\x78\x30\x2a\xe5\xc3\x3c\x4e\xff\
-\x1c\xc4\x46\xd1\xe9\xbf\x58\x82\xbb\x8f\x4e\xfb\x15\x14\xc0\x5b\
-\xa3\x64\xe8\x67\x38\xa0\xeb\xc0\x63\x45\xee\x87\xc1\x5b\x33\xdb\
-\xe0\x07\xc9\xa5\x50\x87\x9f\xa9\xf3\x2e\x3f\x46\xbf\xcf\xe7\x78\
-\xff\x3a\x36\x76\xc0\x5f\xa7\xa2\x71\x5e\x52\x22\xac\xc5\x3b\xff\
-\x71\xfc\x1c\x4f\x8d\xd2\xeb\xd3\x3e\xfc\xbc\xe6\x24\x88\xbb\x80\
-\x69\x8a\x1d\x36\xca\xd5\x0c\x78\x07\x71\x49\x6f\x6c\xac\x2e\x22\
-\x1a\x15\xf2\x61\xfd\xf3\xfe\xd6\x4f\xd3\xbc\xff\x55\x88\x7f\x8a\
-\x38\xd8\x0d\x66\x39\x58\x4d\x83\xbd\xc9\xc9\x70\xbc\xb1\x31\xea\
-\x92\xdf\xf8\x52\xd3\xc3\x20\x69\x06\xd2\xb6\xe0\x3d\xd8\x11\x50\
-\x57\x70\x63\x56\x13\x5c\x99\x52\x02\x17\x24\x66\xc3\x17\x13\x32\
-\xe1\x0b\x09\x19\xf0\xd9\xf8\x34\x38\x37\x3e\x15\x3e\x9b\x90\x0a\
-\xff\x95\x9c\x06\x97\xa6\x67\xc0\xe5\x99\x19\x70\x75\x6e\x0e\x2c\
-\x2b\x2b\x73\x09\x7e\x38\x46\x65\xf2\x7b\xe2\xf1\xa2\x0e\x98\xa8\
-\x8a\xb7\x05\x97\x49\x58\x42\xf3\xc2\x56\x44\x51\xd4\x74\x01\x1e\
-\xa7\x7f\x2d\xe2\x15\x51\xcb\x75\xa7\x5a\x66\x5e\x9c\xc1\x6a\x85\
-\xc3\xa3\x98\xf6\x1b\xee\x43\xd7\x81\x26\x07\xec\x6b\x74\xe8\x27\
-\x1d\x75\x07\x3b\xeb\xf0\xee\x5b\xd7\x06\x3b\xeb\xdb\x60\x17\xa1\
-\xc1\x0e\x7b\x9a\xec\x70\xb8\xd5\x0e\x47\xed\x6d\x70\x0c\x4f\x7b\
-\xe2\xf8\x69\xcc\xf7\x54\x94\x14\x4c\xd2\x0c\xb8\x79\x50\xcd\x80\
-\x0c\x99\x5d\x00\xb9\x0a\x4d\xda\x69\xb1\x28\xa3\x5e\x3e\xcc\x23\
-\xf9\x2d\x88\x9b\x84\xee\x3e\xfd\xde\x6d\x16\xde\xf6\x93\xfc\x05\
-\xef\x87\xc3\xb9\x19\xe7\x8d\x53\x5e\x7f\x5f\x34\x7e\x46\xfe\x35\
-\x03\x7a\x74\xcd\x00\x19\x13\xa9\x1e\x38\x82\x68\x1d\xd5\x5d\x80\
-\x97\xbb\xcf\xd9\x88\xd3\x22\x99\xe6\x75\x5a\x81\x79\xda\xcf\x66\
-\x83\xd7\x2b\x2b\x39\xf1\x19\x23\xf2\x5b\x5c\xe6\x47\x33\x60\x92\
-\x7c\xcd\x80\x8f\x11\x4b\x11\x71\xa3\xb6\x08\x78\x24\x7f\x0a\x62\
-\x9d\x78\xe8\x42\x82\xbb\x0f\x9e\xfe\x07\xb2\xb3\xa3\x86\xf6\x63\
-\xc8\x2f\x02\x2f\x55\x3b\xe0\x3a\x3f\x86\x22\x37\xaa\x8d\x52\x5c\
-\xa8\xbc\x5c\x85\x3e\x67\x78\x09\x8c\xaa\x22\x60\x24\xff\x44\xe7\
-\xcf\x8b\x11\x7f\x15\xb9\xfb\x3c\x2e\xc1\xaa\x29\x1a\x69\x3f\x86\
-\x64\xcd\x00\x7b\x3b\xac\xca\x16\x0f\x07\xe9\x9a\x01\x66\x7d\x28\
-\xcf\xc4\x63\x88\xf4\xde\xd1\x5a\x00\x5c\x32\x5f\x2f\x88\x5e\x58\
-\x6f\x53\xab\xa4\x2c\x5e\x44\x2b\xed\xc7\x90\xdb\x05\xd0\x86\xa5\
-\x58\x33\xa0\x07\x66\xaa\xd2\x35\x03\xc8\x55\xe8\x7b\xa3\x4a\x3e\
-\xcc\x23\xf9\x63\x11\xe3\x11\xff\xf2\xf5\x61\xca\x72\xf7\x89\x66\
-\xda\x8f\x21\x59\x33\xa0\xad\x1d\x1e\x2e\xf0\x6f\x28\x42\x6c\x95\
-\x64\xcd\x00\x72\x15\x2a\x19\x35\x05\x60\x9c\xbb\x00\x34\x22\x5e\
-\x15\x4d\x59\x39\x65\xbe\xcc\x6f\xfb\x31\xed\xc7\x90\xaa\x19\xd0\
-\xe4\xd4\x0c\x18\x1b\x1b\x34\xcd\x80\x7f\x23\xae\x43\x28\x11\x5f\
-\x04\x5c\x96\xde\x04\x92\xf9\xba\x05\xf1\xb1\xc8\x9b\x6d\x8b\x59\
-\x6f\x36\xa6\xfd\x18\x01\xc2\x06\x3f\x9a\x01\xf4\xfd\x0d\x80\x66\
-\xc0\x31\x84\x3d\xa2\x0b\x40\xff\xc4\x9f\xf3\xf4\x3f\x4f\xec\xee\
-\xd3\x05\x0f\x6a\xf9\x4c\xfb\x31\xc2\x5e\x33\x60\xac\x5f\xcd\x80\
-\x2c\x99\x5d\x00\xe1\x8e\x88\xa6\x05\x8d\xbb\x3f\x9e\xfe\xa9\x62\
-\x77\x9f\x1e\x58\xa8\xd6\x99\xdf\xb5\x26\xda\x2f\x2b\x0b\xde\x8c\
-\x30\x67\x5f\x46\x04\x89\xae\x56\x3a\x60\x8a\x1f\x5a\xf0\x66\xf9\
-\x9a\x01\x7f\x42\x9c\x1f\x91\x0f\x82\x5e\x43\x3f\xe4\xee\xf3\xae\
-\xc8\xdd\xe7\x09\x09\x32\x5f\xbb\x89\xf6\xab\xad\xe5\x2f\xab\x8c\
-\x09\xc1\x28\x9e\x02\xf4\xf7\xf9\x1c\x6b\x6d\x87\x3b\x33\xc5\xc3\
-\x41\x13\x75\xcd\x80\x7c\xd9\xb4\xe0\x06\x44\x46\xe4\x15\x80\x81\
-\xee\x3e\x2f\x8b\x68\xbf\xdb\x25\x2d\x56\x1c\xca\xcf\x67\xda\x6f\
-\x38\xc9\xee\x1a\xfb\xa5\x19\x7f\x9a\xf5\x7f\xdd\x6e\xd7\xcd\x3d\
-\x0f\xb9\x40\xeb\xbe\x6f\xb8\xbc\xfe\xde\x8e\x92\x3d\x80\xa1\x7c\
-\x6e\x3b\x6a\xfc\x6b\x06\xcc\xe9\x97\xac\xb7\xc8\x74\x15\xba\x32\
-\xa2\xba\x00\x0f\x77\x1f\xa2\xfd\x26\x23\xfe\x1d\xb0\xd5\x4a\xa2\
-\xfd\x92\x92\xe0\x78\x43\xc3\xa8\x91\xf8\x0e\xe4\x17\x98\x0c\x31\
-\x5e\x6d\x6e\x87\x3d\xf5\x0e\x78\xa1\xc6\x0e\x2b\xcb\x2a\x61\x6c\
-\x6e\x2e\x7c\x23\x3d\x0d\xce\x4f\x49\x86\x4f\x27\x26\xe8\x56\xdf\
-\x5f\xc6\x5f\x7f\x2b\x23\x1d\xa6\x16\xe4\xc3\xfa\x9a\x1a\x38\x4a\
-\xfb\xff\xfc\xf9\xea\x9f\xdf\xd0\x34\x03\xa4\xd2\x82\xe4\x2a\x54\
-\x6e\x4c\x08\x86\xff\xc9\x1f\x53\x67\x9c\xfe\xcd\x88\xa3\x01\x15\
-\x57\x20\xda\xaf\xa4\x84\x13\x7c\x90\xc4\x3f\xde\x46\x46\x18\xed\
-\xf0\x44\x31\xad\x03\x3b\x60\x5c\x5a\x25\x7c\x2a\x2e\x05\x8a\x54\
-\xd5\x63\xef\xdf\x03\xb1\x6e\x6d\x80\x1a\xab\x05\x2e\xcb\xcc\x80\
-\xa7\xf0\x8a\x15\x0d\xeb\xc0\x83\x29\x07\xf5\x6b\x06\x08\x68\x41\
-\xfd\x60\xd3\x52\x65\x76\x01\xb4\x27\x30\x3b\x22\xb6\x05\xc7\xc7\
-\x76\x39\x8b\x80\xda\x63\xc5\x0f\xe4\x76\xd1\xc3\xdf\x3c\xb5\x09\
-\x5e\x94\xd0\x2a\xed\x4f\x4b\x83\x93\xcd\xcd\x9c\xe8\xfe\xcc\x30\
-\x5b\x9c\xbe\x81\x77\x65\x93\x69\x68\x1b\x7c\x27\xa9\x48\x57\x0a\
-\x26\xa1\x8f\xdc\x21\xca\x80\x91\x02\x70\x6b\x9c\x4d\xb7\x00\x3b\
-\x36\x4a\x05\x41\x86\x83\xf5\x45\x1d\x30\xc1\x8f\x66\x80\x0c\x05\
-\x6b\x2f\xbc\x8d\xe8\x0a\xeb\x6b\x80\xd7\xc3\x9f\xd0\xdd\x87\x64\
-\xbe\x1e\x92\xe0\xee\xa3\xd3\x7e\xf8\x85\xe4\x44\x17\x83\x5a\xfd\
-\x87\x0b\x9d\x8a\x40\x8b\x32\xec\xf0\xd9\xf8\x0c\x28\x50\x46\x28\
-\x09\x86\x28\xb7\xa8\x30\x29\x3f\x6f\xd4\xaa\x02\x0d\xb5\x0b\x38\
-\xd4\xe4\x80\x05\x49\x43\xd1\x0c\x90\xfa\x20\xb8\x16\x91\x10\xb6\
-\x45\xc0\xcb\xdd\x67\xc3\x60\xfe\xeb\xa6\x45\x3e\x89\xf6\xe3\x6d\
-\x3f\xe1\xc9\x7f\x08\xef\xfa\x6b\xf2\x9c\x9a\x80\x24\x0f\xfe\x6d\
-\x3c\xf9\x3d\x55\x7d\x47\x2a\x07\x4e\xba\x80\xf7\x56\x56\x8c\x3a\
-\x4d\xc0\x91\x68\x06\x5c\xab\x89\xbb\x00\xe3\x7b\x2e\xb1\x00\xfc\
-\x0d\x71\x61\xff\x83\xa0\xcd\x16\x3e\xc9\x3f\x76\xe0\xe9\x7f\x05\
-\xe2\x7d\x5f\x1f\xca\x54\xa5\x5d\x8a\x9a\xca\xee\xf8\x78\x38\x5a\
-\x53\xc3\x0f\x7f\x02\xd0\x3e\xfb\x63\xc5\x8e\x7e\x69\xf0\xab\x52\
-\x2a\xa0\x58\x92\x41\x08\x5d\x1d\xec\x78\x1d\x78\xb6\x2e\xf2\xfc\
-\x00\x65\x6b\x06\xdc\x9e\x2e\x36\x14\x91\x25\x68\xeb\x85\x17\x11\
-\xb9\x61\xd7\x05\x78\x24\x7f\x19\x62\xaf\xe8\x95\x74\x85\xa4\xbb\
-\xd1\xa1\xbc\xbc\x51\xe3\xec\x1b\x08\x3c\x5f\xe1\x4e\xfe\x85\x99\
-\xad\xd0\x61\x4b\x92\x6a\x0e\x42\x6f\x02\x57\x66\x67\x45\xf5\x55\
-\x80\x68\xd4\x5f\x55\x75\x04\x5b\x33\xe0\x43\xc4\xb8\xde\xa4\x24\
-\x5d\x44\xb4\x0f\x11\x36\xf3\xfe\x63\x9d\xee\x3e\xb3\x7c\xcf\xfb\
-\x77\xc3\x0c\xa5\x15\x7e\x29\x61\x75\x72\x0f\xd3\x7e\x83\x68\xda\
-\xb9\x5b\x7f\x92\x03\xff\x49\x4a\xb9\x7e\xef\x97\xed\x0c\xd4\x60\
-\xb3\xc2\x33\x75\xb5\x51\xdb\x05\x10\x8e\xdb\xdb\x61\xf5\xa0\x9a\
-\x01\x45\xb2\x87\x83\x0e\x1b\xae\x42\x3b\x55\x35\xac\x4e\xff\x0e\
-\xc4\x29\xd1\x94\xd4\x1a\x55\xc2\x07\x61\xb5\xc2\x6b\xc5\xc5\x9c\
-\xec\x7e\x0a\xc0\xaf\xaa\xdd\x32\xe0\xcb\xf0\xee\x7f\x7e\x7c\x16\
-\x64\x07\xc0\x20\x94\xae\x13\xf3\x8a\x8a\xf4\x93\xf0\xad\x28\xee\
-\x02\x7a\xeb\x1c\x30\x23\x4e\xec\x30\x3c\x13\x0f\xbe\xe7\x75\x7d\
-\x4b\x69\x7b\x02\x9f\x20\x16\x23\x2c\xfa\x55\x20\x94\x5d\x80\x97\
-\xbb\xcf\xbd\x83\xbb\xfb\x98\xfb\x10\xf6\xa5\xa6\xc2\x09\xa6\xfd\
-\xfc\x9a\x5b\x10\xe5\xe7\xe9\x10\xec\xb0\x26\x05\xc4\x21\x98\x66\
-\x05\xae\xc8\xca\x84\x13\x51\x7e\x15\xa3\x49\xca\x07\xf3\x83\xae\
-\x19\x40\xf2\x61\xe7\xf5\x6a\x5a\x68\x1d\x85\x3c\x0a\xc0\xd7\x7d\
-\xc9\x7c\x19\x9b\x52\x8f\x68\x39\xa6\x93\xbf\x9f\xf6\xe3\xd6\xdf\
-\x6f\x4b\x4a\xb4\x9f\xa7\x2f\x60\xa3\x25\x1e\x4f\xeb\x31\x01\x71\
-\x07\xbe\x28\x3d\x2d\xea\xe7\x02\x88\x16\x3c\xd0\xe8\xd4\x0c\x18\
-\xe7\x47\x33\xe0\x19\xb9\x9a\x01\x84\x47\x11\xa9\x21\x7b\x10\xf4\
-\x72\xf7\xd9\x2c\x3a\xfd\x97\xa8\x35\x52\x76\xa5\x5f\x61\xda\x6f\
-\x48\xda\xff\xf7\x17\xb8\x8d\x41\xe7\x67\x34\x43\xb5\x66\x0d\x98\
-\x3d\xf8\x97\x53\x52\xfa\x77\x06\xde\x8a\xf2\x22\xf0\xb4\x5f\xcd\
-\x80\x6e\x58\xaa\x56\xcb\x36\x14\x79\x17\xf1\x9d\x90\xec\x09\x78\
-\x0d\xfd\xfc\xdc\xb7\xcc\x97\x24\x77\x1f\xa6\xfd\x86\x6e\x0f\x8e\
-\x05\x60\x6d\xbe\xbb\x00\xdc\x88\x05\xa0\x4e\xb3\x05\xac\x00\x7c\
-\x35\x35\x45\x37\x10\x39\xc5\x6f\x2f\x70\xb8\xa5\x1d\x16\xa7\x88\
-\x69\x41\xa7\x66\x40\xb6\xec\x2e\x60\x3b\xa2\x38\xf8\x05\xc0\xbd\
-\xed\x47\xee\x3e\x07\x45\x77\x9f\x95\x92\xee\x3e\x4c\xfb\x0d\xbd\
-\x03\x78\xb0\xc0\x83\x02\xcc\x68\x85\x16\x6b\x42\x40\xae\x00\xf4\
-\x06\xf0\x9d\x8c\xf4\xa8\xa6\x02\xbd\xbb\x80\xcd\x15\xfe\x35\x03\
-\x16\xa8\xf5\xb0\x4d\xae\x66\xc0\x87\x03\xe4\xc3\x82\xf1\x20\x38\
-\x6e\xa0\xbb\xcf\xcd\xbe\xdd\x7d\xba\x61\x96\xda\x02\x9b\x35\xf3\
-\xaf\x9f\x7b\x12\x13\x99\xf6\x1b\xea\x1b\x40\x5b\x3b\x3c\x5a\xe4\
-\x2e\x00\x4b\x32\xdb\xe0\x53\x12\x6c\xc1\x45\x54\xe0\x35\xb9\xb9\
-\xfa\x23\x18\x7f\xf6\xee\x02\xbc\x22\xb3\x4b\x48\x0b\x92\xfa\xd5\
-\x03\x5a\xbe\xec\x2e\xe0\x28\xa2\x4d\x2f\x00\xf1\xf1\x81\x2f\x00\
-\xd7\xb8\x6d\xbd\xcf\x41\xfc\x26\x90\xee\x3e\x04\xa6\xfd\x86\x87\
-\x8d\xe5\xce\x02\x60\x50\x81\xdf\x48\xcc\x97\x5e\x00\xe8\x4a\x51\
-\xa4\x2a\xb0\xb2\xbc\x5c\xd7\x14\xe0\xcf\xdd\xdd\x05\x6c\xaf\xe9\
-\x80\x1b\x6c\xdd\x42\x5a\x70\x8e\xd2\x0c\x5b\xb4\x24\xd9\xb4\xe0\
-\x72\x3c\xfd\x03\x2f\x1f\xe6\xe5\xee\xf3\xa0\xe8\xc1\x83\xdc\x7d\
-\x64\xc8\x7c\x31\xed\x37\xfc\xbb\x68\x6f\x7d\xbb\xbe\xf9\xb7\xc2\
-\x35\x08\x34\x35\xad\x0e\x2a\x34\x8b\xd4\x77\x00\x6a\xff\xcf\x4d\
-\x4a\x84\x3e\xdd\x31\x98\x3f\x77\x6f\x2a\x76\x6d\xae\x7f\x5a\x70\
-\x95\x5a\x22\x7b\x38\xe8\xf7\x88\x2f\x06\xb4\x00\xf8\x90\xf9\xfa\
-\x9b\xaf\x7f\xb9\x29\xba\xbb\x4f\x96\x1c\xda\x0f\x4f\x18\xfe\x52\
-\x0d\xbf\x0d\x35\xae\x01\xc6\x30\xd0\x97\xe2\xb3\xa5\x75\x01\x54\
-\x48\xf2\x11\x37\x62\x67\xc6\x22\x21\xbe\x8b\xb0\xae\x19\x10\x2f\
-\x1e\x0e\x72\x6b\x06\x48\xbd\x0a\x3c\x89\xc8\x0c\x58\x11\xf0\x72\
-\xf7\x79\x49\x54\xdd\xa4\xb8\xfb\xe0\xe9\xff\x4a\x66\x26\x8b\x7c\
-\x8e\xf0\x0b\xd8\x87\x5d\xc0\xdd\x39\x6e\x36\x60\x6e\x7a\x13\xb4\
-\x5b\x93\xf5\x7b\xbb\x8c\x02\xf0\xdd\xcc\x0c\x5d\x3a\x8c\x1f\xff\
-\xc4\x78\xac\xb0\x43\x17\xbe\x11\xe5\x49\x00\x34\x03\xc8\x55\xe8\
-\x0a\x7a\x08\x94\xbe\x2d\xe8\xe5\xee\x33\x09\xf1\x81\xa8\xb2\x3d\
-\x27\x41\x0d\xa5\x9f\xf6\xe3\x2f\xd2\x88\xb1\xb5\xda\x01\x2b\x5d\
-\x57\x81\x3b\xf1\x2a\x70\x6d\x5a\x2d\x94\xe3\x55\xc0\x4c\x27\x90\
-\x85\xad\xff\xd9\x89\x09\xb0\xb3\xa9\x29\xaa\x77\x00\x86\xb6\x93\
-\xe1\x80\x85\xc9\xfe\x35\x03\x9e\x94\x20\x88\xeb\x85\x3e\x44\xa5\
-\x5e\x00\x02\x74\xfa\xb7\x22\x5e\x17\x2d\x3e\x48\x91\xf9\x72\xd1\
-\x7e\x2c\xf2\x69\x7e\x2a\xf0\xe9\x52\x77\x11\x20\x4d\x00\x5a\x0b\
-\x6e\xb6\x26\x0c\xbb\x08\xe4\xba\x70\x41\x6a\x0a\x3c\x8e\x85\x99\
-\x4f\xfe\xa1\x6b\x06\x4c\xd6\xc4\x86\x22\xb2\xb4\x31\xbc\x5c\x85\
-\x66\x22\x54\x69\x57\x01\x8f\xe4\x27\x77\x9f\xdb\x44\xee\x3e\x73\
-\x25\x29\xa2\xf6\xd3\x7e\xfc\x25\x92\x52\x04\xa8\x13\x70\x5f\x07\
-\x3a\x61\x56\x7a\x23\x9c\x65\x4b\x85\x02\x55\xf1\x2b\x0b\x96\xeb\
-\x21\x07\x46\x4a\x40\xb4\xfe\xbb\xbf\xa5\x85\xef\xfd\xc3\xd6\x0c\
-\xe8\x0c\xb6\x66\xc0\x09\x44\x87\xbe\x2d\x68\xb6\x08\x8c\x33\x14\
-\x7e\x49\xeb\x4f\xe9\xfe\x02\xe2\x77\xbe\xf9\x4d\xa7\xcc\x97\x14\
-\xda\xaf\xa8\x88\xbf\x40\x92\xd1\x57\xef\xd0\x1f\x06\x0d\x76\x80\
-\xe4\xc1\x7e\x98\x5c\x06\xdd\xb6\x14\x28\x57\x2d\x50\xa8\xa8\x90\
-\xaf\x60\x41\x88\x75\x26\x7d\x21\x16\x87\x32\x4d\x85\x26\x9b\x15\
-\x2e\xc9\x48\x87\xb5\x55\x95\xba\x74\x38\xbf\xf8\x0f\xbf\x08\xbc\
-\x84\x05\x78\xaa\x55\x3c\x1c\xe4\x5c\x94\x4b\x94\x5d\x04\xee\x94\
-\x22\x1f\xe6\x71\xfa\x67\x20\xd6\x8b\x5a\x99\x45\x6a\x9d\x3e\xe1\
-\xd4\xcb\xb4\x5f\xf8\x1a\x5b\xd8\x9d\xca\xc0\x34\x27\x40\xa2\x96\
-\x0f\x17\x76\xc0\xdd\x79\x6d\x70\x53\x4e\x3d\xdc\x90\x5d\x01\xd7\
-\x65\x97\xc2\xb4\xfc\x22\x98\x5f\x5c\x04\x4b\xcb\x4a\xe1\x9e\x8a\
-\x0a\x78\x11\x3b\xb1\x37\x5c\x92\xe0\xdc\xf6\x8f\x5c\x4a\xdc\x9f\
-\x66\x00\xcd\xcc\xac\xd5\x0a\x65\xd3\x82\xe4\x2a\xf4\x5f\xa6\xe4\
-\xc3\x8c\xe4\xff\x99\xf3\xe7\x0f\x44\xee\x3e\xee\xc7\x0c\xf3\x22\
-\x9f\x47\x98\xf6\x0b\x78\x21\x30\x26\x06\xa9\x20\x10\x8e\xdb\x1d\
-\xf8\x25\x75\xc0\x9b\x08\x92\xfd\xa6\xc1\x9e\xb7\x5d\x38\xcd\x0e\
-\x41\x72\x58\x19\xbf\x9a\x01\x3d\x81\xd0\x0c\x20\x3c\x83\xc8\xd6\
-\x0b\x80\xa6\x99\x7e\xf8\x3b\xec\x8f\xce\xd8\x21\x83\xf6\xcb\xc8\
-\x80\x93\x4c\xfb\x31\x46\xa3\x66\x00\x16\xdc\x87\x0a\x06\xd7\x0c\
-\x90\x4c\x0b\x92\xab\xd0\x8f\x7a\xad\xd6\x31\xc3\xbe\x0a\x4c\x18\
-\xf8\xf0\xb7\x42\x34\xf1\x37\x5d\xb1\xc3\x26\x8b\x24\xda\xaf\xba\
-\x9a\xbf\x2c\x8c\x51\xdb\x05\x90\x66\xc0\x8d\x89\xbe\x1d\x86\x8d\
-\xcd\xd9\x67\xb5\x34\xd9\x5d\xc0\x1e\x44\xd5\xb0\x0b\xc0\x15\xca\
-\x79\x31\x37\x28\x6d\x7e\xf5\xfd\x89\xf6\xbb\x47\x2d\x96\x42\xfb\
-\x1d\xa4\xa5\x12\xa6\xfd\x18\xa3\x1c\xa4\x19\x30\x71\x10\xcd\x80\
-\xed\x72\xa5\xc4\xff\x43\xae\x42\x08\x6d\xc8\x45\x60\xa5\x5a\x1e\
-\x33\x4f\x69\x8a\x59\xa4\xd6\xa7\x4f\x52\x3a\x9f\x0a\xa8\xbb\x0f\
-\xb6\xfe\x44\xfb\x1d\xab\xaf\xe7\x2f\x08\x63\xd4\x77\x01\x47\x5a\
-\xda\x61\x49\xaa\xb8\x0b\xb8\x56\xd2\x18\xbd\x17\x4e\x21\xba\x87\
-\x24\x1c\xb2\x4a\x2d\x89\x59\x8d\x68\x1e\xf3\xfd\x98\x05\x6a\xc3\
-\xe5\x93\x95\xce\x7f\xf8\xa3\xfd\xfa\x98\xf6\x63\x30\x86\x55\x04\
-\xb6\x54\x74\xc0\xb5\x7e\x34\x03\x6e\x96\xaf\x19\x40\xb8\x1b\x11\
-\x3f\x68\x01\xb8\xcd\x52\x13\xb3\x58\xad\x8d\x59\xae\x56\x16\x4e\
-\x53\xec\x3b\xc6\x07\xf2\x0f\x49\xb4\x5f\x4a\x0a\x9c\x68\x6a\xe2\
-\x2f\x07\x23\xaa\xe8\xd8\x15\x99\xe2\xe1\x20\xd2\x0c\x78\x50\xcb\
-\x0f\x04\x2d\xf8\x79\xbf\x5d\xc0\x2a\x4b\x59\xcc\x2a\xad\x14\x7f\
-\x05\x31\xf3\xd5\xc6\x9f\xe3\x29\xff\xa1\xe8\xf4\x7f\x54\x92\xc8\
-\x27\xd3\x7e\x8c\x68\xd4\x0c\xd8\x51\xeb\x80\x69\x36\x31\x2d\x38\
-\x5b\x6d\x81\x2d\x96\x24\xd9\x5d\xc0\x3a\xbf\xc3\x41\x77\x2a\xa5\
-\xfa\xe9\xbf\x4c\xab\xcc\xbf\x41\x69\xdb\x29\x3a\xfd\x6f\x92\xb4\
-\xeb\xbf\x3f\x3d\x9d\x69\x3f\x46\xd4\x6a\x06\xac\xcb\x1b\x44\x33\
-\x40\x2b\x95\xf2\xc0\xee\x81\x3f\x22\xce\x11\x16\x80\x7b\xf0\xee\
-\xff\x23\xe5\xdc\x18\x4c\xf0\xcb\xf0\xee\xff\xbe\xe8\xe5\x9f\x94\
-\x7e\x64\x54\xa6\xc3\xa5\xa5\x2c\xf3\xc5\x88\xda\x2e\x80\x34\x03\
-\x66\xc7\x8b\xb6\x05\x7b\x60\xba\x6a\x0f\x44\x17\xb0\xd4\x27\x23\
-\x40\x8f\x7f\x78\xf2\xc7\xac\xd1\x8a\x12\xa7\x2b\xf6\xf5\x13\x04\
-\xa7\x3f\xf1\xfe\x32\x26\x96\xa8\xfd\x67\x95\x5f\x46\xb4\x0f\x07\
-\xdd\x9b\x23\x7e\x0b\xa0\x11\xe1\x87\xf5\x45\x21\xa9\x8c\xc0\xeb\
-\x88\x0a\x63\x51\xa8\x3f\x56\xab\xc5\x31\x73\xd5\xe6\x98\x5b\xd4\
-\xda\xf6\x29\x8a\xe3\xb7\xa2\xf6\x9f\xc4\x3e\x64\x4c\x2b\xd1\xe0\
-\xcf\xb1\xba\x3a\x2e\x00\x8c\xa8\xee\x02\x68\x5d\x58\x24\x1a\x32\
-\x4e\xbf\x06\x94\xc8\x2e\x00\xff\x42\x7c\x8f\x0a\xc0\x2e\xef\x0e\
-\xe0\xdc\xd8\x8b\x63\xe6\xa9\x4d\x13\xb0\xf2\x7c\x2c\xaa\x48\x4e\
-\xea\xcf\xfc\x1f\x88\x3b\x00\x46\xb4\x83\x7c\x05\x5f\xa8\xf4\x3f\
-\x18\x74\x8f\x56\x2c\xfb\x0a\x40\xb8\x07\x61\xd5\xaf\x01\x86\xad\
-\xd8\x72\xb5\x22\xe6\x7e\x35\x3f\x61\x1a\xb6\xff\xa2\xd3\xff\x06\
-\xa5\x0d\x36\x59\x52\xa4\x55\xa4\xc3\x25\x25\xfc\x45\x60\x44\x35\
-\x25\xb8\xa1\x04\x3b\x00\x55\x44\x07\x76\xba\x8c\x44\xa4\x17\x80\
-\x83\x88\x02\xbd\x00\x24\x24\x38\x0b\xc0\x02\xb5\x21\x66\x89\x5a\
-\x53\x3a\x55\x69\x3f\x36\x5e\xe8\x75\xde\x20\x75\x40\x61\x5f\x5a\
-\x1a\x9c\xa4\xd5\x5f\xee\x02\x18\xd1\xb8\x26\xec\x9a\x07\x18\x2b\
-\x78\x04\x9c\xa3\x36\xbb\x0c\x75\xa5\x17\x80\xbf\x22\xce\x1e\x60\
-\x24\x32\x5b\x69\xa1\x22\x70\xf6\x64\xa5\xf3\x1d\x51\x01\xb8\x1d\
-\xef\xff\x52\x1d\x4e\xad\x56\x78\xb5\xb0\x90\x77\x00\x18\x51\xd9\
-\xfe\x6f\xaf\xa1\x59\x80\x33\x27\x02\xc7\xb9\x94\x82\x1e\x94\x24\
-\xb0\x23\x70\x13\xba\x7c\xc0\x9a\xf0\x34\xa5\x2d\x66\x96\xd2\xf2\
-\x23\xbc\xe7\x7f\x24\xe2\x25\xe9\x3e\x22\xfb\x0f\xb3\x3b\x2e\x4e\
-\x1f\x05\x3e\xd9\xd2\xc2\x5f\x0c\x46\xd4\x3c\xfe\x1d\x6c\x72\xc0\
-\xad\xa9\x5d\x3e\x92\xbf\x47\x4f\x7e\x7a\xfc\x93\x6c\x24\xea\x8d\
-\x99\xbd\x8a\xe2\xee\x00\xf0\xbe\x11\x83\xbf\xf1\x74\xd1\x8b\x24\
-\xfd\x75\x59\x0f\x80\x67\x3c\x08\x62\x27\x40\x5a\x00\x34\x15\x48\
-\x5a\x80\x54\x0c\xe8\x6a\x30\xa4\x9f\xc1\x46\x6b\x6b\x40\xf0\xa6\
-\x19\xd8\xed\xee\x9f\xe1\x0c\xec\xf4\x64\xe1\x2d\x1f\x3f\x83\x8a\
-\x91\x0f\x00\x7d\xd2\x57\xe7\xf8\xe4\xf6\xb4\xce\x33\x5e\xff\x69\
-\x11\x68\x9e\xda\xa8\x53\x7f\x01\x4e\x7e\xc2\x7d\x98\xfc\xd6\xfe\
-\x02\xe0\xda\xfd\x9f\x39\x5e\x58\x00\xba\xf4\x07\x89\xdd\x01\x28\
-\x00\x9e\x85\x80\xe8\xc1\x3d\x49\x49\xfa\x86\xe0\xde\x21\xfc\x1c\
-\x80\xe4\x64\xf1\xcf\xa1\x20\x25\xe5\x0c\xec\x1b\x0c\xa9\xa9\xc3\
-\x43\x5a\x9a\x4f\xec\xf7\x46\x7a\xfa\xc8\x81\xc5\xd4\x13\xaf\x0c\
-\x86\xcc\x4c\xf7\xcf\xe1\x22\x2b\x4b\xc7\x81\xa1\x22\x3b\x7b\x44\
-\x38\x98\x93\x13\x18\xe4\xe6\x0a\x71\x68\x30\xe4\xe5\x0d\x1b\x7b\
-\xb2\xf3\xe0\xa9\xf8\x02\x58\xab\x16\xea\x32\x60\xf4\x73\x8d\x5a\
-\xa4\x0f\xd7\x91\xaa\xd6\x4b\x66\x65\xf5\x86\x8e\x4d\x98\xfc\xc9\
-\xde\x05\x60\x96\xbf\x02\x40\x6b\x8a\x81\x2c\x00\x51\x01\x4d\x63\
-\x44\x39\xa8\x8b\xf6\xc4\x6e\x8f\x5f\x07\xf1\xbb\xf8\xfc\xb0\x0b\
-\xc0\x23\xf2\xa7\x92\x18\x0c\x46\x68\xf0\xc8\x2e\x97\x99\xa8\x1e\
-\x13\x95\x2e\x7a\x07\x98\xe1\x6f\x39\x61\x8d\x56\x14\x08\x4a\x82\
-\xc1\x60\x04\x1f\x37\xbd\x68\xb1\x8c\xe9\x9f\x06\xbc\x4e\x71\xc4\
-\x5c\xaf\xb4\x8f\xa7\x93\x5e\x44\x03\x2e\x53\x2b\xe4\xd2\x80\x0c\
-\x06\x23\x14\x20\xf7\xa0\x2b\x07\x8c\x03\x63\xf2\xc7\xcc\x54\x5b\
-\xbf\x82\x05\xe0\x3d\xf1\x20\x50\xa3\xf9\x35\x60\x06\x83\x11\x6a\
-\xfc\xc5\x18\x04\xea\x2f\x00\xd3\x95\x36\x1a\x06\xaa\x9c\xac\x74\
-\xbe\x25\x2a\x00\x53\x95\x76\x78\xce\x92\xc6\xef\x00\x0c\x46\x64\
-\xa3\xd7\xf0\x0b\xd8\x66\x14\x80\x1b\xd5\x86\x98\xdb\xd4\xaa\x78\
-\xbc\x0a\x3c\xe4\xef\x1d\xe0\xde\x00\x0c\x03\x31\x18\x8c\xa0\x62\
-\x6e\x5f\x5c\x5c\x2c\x31\x00\xdb\x8d\x02\x70\xab\x5a\x1d\x73\x8d\
-\x72\x16\x76\x02\xf6\x6f\x4f\x54\xba\xde\x17\x75\x01\x73\xd5\x26\
-\x97\x8f\x19\x77\x01\x0c\x46\x04\xe2\xd7\x08\x07\x9d\xfe\x7d\x9e\
-\xeb\xc0\xb7\xa8\xb5\x78\x05\x68\xc6\x4e\xa0\x31\x6b\x8a\xd2\xb1\
-\x75\xbc\x1f\x1f\xb3\xfb\xe4\xfb\x98\x31\x18\x8c\xc0\xe3\x13\xc4\
-\x42\x43\x11\xa8\xcf\x98\x01\x30\x62\x29\x76\x01\x3f\x89\x3d\x87\
-\xba\x80\x8b\x26\x29\x5d\xef\x8a\xba\x80\x19\x8a\x1d\x36\x6a\xa9\
-\xdc\x05\x30\x18\x91\x85\x3e\x44\xa5\x9e\xfc\x29\x29\x67\x6a\x02\
-\x2e\x54\xeb\x62\xe6\xab\x4d\x24\x0c\x1a\x77\xbd\xd2\xbe\x6c\x82\
-\xd2\xf5\x89\x48\xa8\x80\xdc\x80\xb7\x06\x66\x55\x91\xc1\x60\x04\
-\xa6\xf5\xff\x4a\xbf\x2c\xb8\xf7\xe9\x6f\x04\xb6\xff\x31\x33\x95\
-\x56\x72\x06\x2a\xc2\x22\xf0\xac\x68\x2e\x80\x16\x19\x96\xa9\x95\
-\x2e\x5a\x90\x3b\x01\x06\x23\x8c\xf1\x07\xc4\x15\x08\x65\x50\x63\
-\x90\xc5\x6a\x4d\xcc\x63\x96\x6c\x7d\x2e\x60\x91\x5a\x5f\x35\x49\
-\xe9\xdc\xec\xef\x3d\x80\x34\x02\x5e\xd4\x3b\x01\x2e\x02\x0c\x46\
-\x18\xe2\x34\xe2\xfb\x08\xcb\x90\xbd\x01\xb1\xbd\xd7\x05\x42\x66\
-\xa8\x76\xda\x0f\xa8\x42\x3c\x86\xf8\x48\xd4\x09\xdc\x8c\xd7\x01\
-\x72\x35\xd5\x37\xfa\xf8\x03\x67\x30\xc2\x01\x64\x0a\xfa\x32\xe2\
-\x8b\x9e\x27\xff\x90\x1d\x82\x5d\xa3\xc1\x86\x4d\x78\x16\x62\x0a\
-\xe2\xa4\x3f\x9b\xf0\x7b\xb5\x22\x57\x37\x60\xe1\x8e\x80\xc1\x08\
-\x1d\xde\x46\xcc\x47\x94\x79\x26\xfe\xb0\xec\xc1\x3d\x36\x04\x0d\
-\x8c\x41\xd8\x11\x77\x20\x7e\xeb\xab\x08\xd0\x95\x60\xae\xd2\xa4\
-\xef\x39\x6f\xb6\x24\xe9\x7b\x03\xce\x35\x47\xfe\x8f\xc2\x60\x04\
-\x61\xbe\xff\x38\xe2\x56\x44\x97\xa7\xf9\xc7\xb0\x13\xdf\x4f\x11\
-\x20\x58\x11\x5d\x88\x05\x88\x03\x88\xf7\x7c\x15\x82\x99\x4a\x2b\
-\x2c\x57\x2b\xe1\x31\x2d\x07\xb6\x68\xc9\xb0\xdd\xa5\x70\x32\x70\
-\x17\xda\xc2\x60\x30\x46\x76\x75\xfe\x18\xf1\x77\x57\xd2\x3f\x8a\
-\xb8\x0a\x51\x37\x20\xf1\x6d\x36\x73\xc9\x3f\x48\x21\x88\x45\x14\
-\x22\xbe\x86\xb8\x11\xb1\xd9\x75\x45\xf8\x03\xe2\x5d\x2c\x04\x1f\
-\xe0\xcf\x8f\x49\xdf\x8c\xae\x07\xe4\x26\xbc\x42\x2d\xd7\x95\x4f\
-\x48\x59\x68\x83\x96\x0e\x9b\xb4\x14\xec\x14\x92\xe1\x05\xec\x16\
-\x5e\xb4\x24\x32\x18\x51\x0b\x52\xff\xdd\x6a\x49\xf8\x68\x9b\x25\
-\xee\x1f\x3b\x2c\xb6\xbf\xee\xb2\x58\x7e\x8f\xc9\xfb\x5b\xc4\x6f\
-\x10\x6f\x21\x0e\x23\x76\x21\x36\x20\x56\x20\x26\xb8\x68\xbd\xaa\
-\x5e\x0f\xdb\x6f\x29\xa7\xfe\x30\x0b\x81\x81\x64\x44\x09\xa2\x15\
-\xf1\x45\xc4\x77\x11\x3f\xc7\x42\x70\xed\x38\xa5\x67\xda\x58\xa5\
-\x67\x26\x62\x16\x76\x07\xb3\xa6\x2a\xed\xb3\x66\x28\xad\xb3\x66\
-\xab\xcd\xb3\xe6\xa9\x4d\x3a\xe6\xab\x8d\x0c\x46\xb4\x61\x26\x62\
-\xfa\x8d\x6a\xe3\xd4\x05\x6a\xc3\xb8\x85\x6a\xdd\x95\x4b\xd5\xaa\
-\xaf\xdf\xab\x16\x77\x3f\x6f\x49\xa6\x81\x9d\x62\x44\x91\x4b\xc3\
-\x3f\x17\x91\x81\x85\x21\x71\xa7\xc5\xa2\xfa\x4a\xf8\x80\x26\xfe\
-\x30\x0a\x81\x10\x24\x3a\x82\xc9\x1f\x33\x47\x69\x8e\x59\xa0\xd6\
-\xeb\x94\xe3\x6d\x6a\x75\xcc\xed\x6a\x55\xcc\x32\xb5\x92\xc1\x88\
-\x4a\x90\x29\x0f\x76\xc7\x31\x77\xab\xa5\x31\x6b\xb5\xc2\x98\x27\
-\xb4\xac\x98\x97\x2c\xf1\xc2\x04\xdf\x15\xaa\xa4\xe7\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\x08\x44\xfc\x1f\x54\x25\x8f\x98\x77\
-\xd7\x32\x2d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x0e\
-\x08\x5f\xf4\x3f\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x61\x00\x6c\x00\x65\x00\x72\x00\x74\x00\x2e\x00\x69\x00\x63\x00\x6f\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8d\xa3\x14\x84\x45\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -1,1101 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x41\xa4\
-\x00\
-\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x20\x00\x8e\x41\x00\
-\x00\x16\x00\x00\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
-\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
-\x00\x00\x5c\x72\xa8\x66\x00\x00\x00\x01\x6f\x72\x4e\x54\x01\xcf\
-\xa2\x77\x9a\x00\x00\x41\x48\x49\x44\x41\x54\x78\xda\xed\x9d\x07\
-\x7c\x5b\xd5\xf5\xc7\xdf\x7b\xda\x1e\xda\x5b\xf2\x88\xf7\xb6\x63\
-\x3b\x4e\xec\xc4\x8e\x47\x12\x20\x09\x84\x04\x42\x80\x26\x61\x97\
-\x59\x76\xd9\x24\x81\x32\x4a\xff\x50\x0a\x6d\x69\x69\x69\x29\x84\
-\xd1\x12\xa0\x14\x4a\x29\x04\x4a\x29\xa3\x8c\x40\xca\x0a\xa1\xac\
-\x0c\x02\x24\x21\x40\x98\x85\x8c\xf3\x3f\xe7\xbd\x27\xfb\x59\x96\
-\x64\x59\xd2\xb3\x25\xeb\xde\xcf\xe7\x17\x39\x1e\xf2\xb3\xf4\x7e\
-\xdf\x7b\xee\xbd\xe7\x9e\xcb\x71\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\
-\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\
-\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\x96\x74\x03\x80\x7e\xdd\x74\xd3\
-\x4d\xdc\xaa\xbb\xee\xe2\x2e\x5a\xb5\x8a\x5b\x81\x8f\x57\xdf\x7f\
-\x7f\xff\xd7\x9e\x7c\xf2\x49\xee\xb1\xc7\x1e\xeb\xff\xff\x5d\xf8\
-\xf5\x0b\x2e\xb8\x80\x5b\xb1\x62\xc5\xa0\xe7\x20\xb1\xc6\x1a\x6b\
-\x99\x09\x00\x3e\x15\x00\x60\x10\x60\x8d\xb5\xcc\x04\x80\x80\x00\
-\xe0\x2f\x96\x00\xc0\xff\xf6\xd1\x47\x95\x00\xe0\x19\x00\x58\x63\
-\x2d\x43\x9b\xd2\xa8\xd1\x00\x10\x6a\xbf\x58\xbd\x9a\x23\xf3\xef\
-\x55\x7c\x2d\x5a\x04\xf0\xf0\xc3\x0f\xf7\x7f\x6e\xf7\xee\xdd\xdc\
-\xfc\xf9\xf3\xb9\xcb\x2f\xbf\x9c\xfb\xc9\x4f\x7e\xc2\x5e\x74\xd6\
-\x52\xdb\x0e\x38\xe8\x08\xee\xd0\xc3\x4f\xe7\x66\xce\x99\xc7\x95\
-\x4d\x9c\xca\x79\xab\x26\x71\x85\xf5\x53\xb8\x22\x94\xb7\x6c\x22\
-\xe7\x2e\x6e\xe0\x5c\xc5\x8d\xa2\xdc\x13\x1a\x39\x7f\x65\x2b\x57\
-\xd4\x38\x95\x2b\x6e\xca\x6e\x15\xa1\x6c\xe5\xcd\x1c\xe7\xad\xe6\
-\x84\x40\x6d\x44\x71\xee\x0a\xe9\x45\xb6\x14\x73\xbc\xbf\x86\xe3\
-\x5c\xe5\x92\x7c\xd1\x7f\xa6\xff\x67\x1d\xa5\x1c\x67\x2f\xe5\xb4\
-\xc1\x7a\xf1\x29\xec\xe5\x13\xe5\xdf\xdd\x21\x0b\xaf\xa1\xa1\x5d\
-\x7c\xbf\x7c\x55\xad\x5c\xcb\xb4\x19\xdc\xa1\x4b\x16\x73\xbd\x87\
-\x2e\xe5\x16\x2e\x5c\xc8\x6e\x6c\xd6\x62\xb7\xa6\x8e\x3e\x6e\x5a\
-\xdf\x6c\x34\x73\x07\xa7\x0d\x54\x70\x67\x9e\x72\x82\xa1\xb1\xa3\
-\xb7\xa8\xbc\x79\x5a\x73\xdd\x94\xee\xee\xba\xb6\xe9\x73\x8b\x2a\
-\x5b\x4e\x0e\x96\x34\x5d\x1c\x28\x69\x5a\x4e\x0a\x96\x36\x9d\x5f\
-\x5a\x37\xf9\x88\x86\x8e\xde\x7d\x1a\xa7\xf6\xcd\xca\x66\xd5\x77\
-\xf4\xce\x28\x6d\x99\xd6\xc2\xf9\x6b\x02\x68\xd8\x60\x34\x69\x82\
-\x75\x11\x3f\x1e\x4e\xda\x82\xfa\x20\x9a\x3f\xc8\xfb\x6a\x02\x9e\
-\x9a\xc9\x65\xe2\xef\xed\x08\xbb\x86\xf6\x9e\xbe\xf2\xe6\xa9\xad\
-\x65\x4d\x1d\x65\xb3\x66\x1f\x90\x4f\xef\x6b\x29\x42\x7c\xe6\xdc\
-\x03\xc5\xf7\x78\xfe\xd2\xa5\xec\x46\x67\x6d\x70\xdb\x77\xde\x7c\
-\xee\x84\x93\x8e\xe5\xd0\xec\xdc\xaa\xeb\xaf\x12\x6a\xdb\x7b\xca\
-\xfd\xb5\x93\x8f\xb6\x57\xb4\xdc\x6e\x2e\x69\x7a\x53\x5f\x50\xb7\
-\xdd\x50\x50\xf7\xa9\xa1\xa0\xfe\x0b\x7d\xb0\x6e\x8f\x3e\x58\x0b\
-\x03\xaa\x03\xfc\xfa\xb7\xfa\xc2\xfa\x9d\x4c\xf5\x9f\x69\xf1\xb5\
-\x42\xb3\x6e\x56\x5b\x9a\x40\xed\x16\xe5\xef\x36\x84\x54\x50\xff\
-\x19\xbe\x27\x1f\x9b\x0a\xeb\x37\x5a\xcb\x26\x3e\xe8\xaa\x68\x59\
-\x56\x3f\xa5\xbb\xf9\xe2\xf3\xce\xd0\x55\x34\x4f\xe3\x0e\x5f\xfc\
-\x3d\x6e\xf6\x01\xf3\xd9\x4d\xcf\x9a\xd4\x66\xcc\x99\xcb\x2d\x38\
-\xe4\x60\xce\x54\x50\xcf\x4d\x9f\x39\xc7\x8b\xc6\x3f\xcf\x54\xd4\
-\xf0\x96\xae\xa0\xee\x3b\xbc\xd1\x80\x29\xb3\xa5\x45\x48\xe7\x16\
-\x37\x6e\xc2\xf7\xf5\xe7\x2d\x9d\x33\xc4\xb1\x43\xc7\x8c\x7d\xb9\
-\xca\xb6\x2e\x76\xf3\x67\x7b\xdb\x67\xee\x3c\xee\x80\x05\x0b\xa4\
-\xf0\x7f\x5a\xdf\x34\xec\xf1\x1f\xd7\x15\xd4\xef\x66\xc6\x19\x8f\
-\x20\xa8\x03\x4b\xd9\xc4\x75\x65\xcd\xd3\x96\x2e\x3c\xec\x50\x7d\
-\x4b\xd7\x4c\x0e\x23\x3d\x66\x82\xac\x9d\xe8\x5b\xb0\x90\x3b\x78\
-\xd1\x22\x0e\x60\x23\x3f\x69\xfa\xcc\xf9\xb6\x8a\x96\xb7\x98\x51\
-\xc6\xbf\x68\xb8\xe0\xa9\x69\x3b\xef\x88\x23\x16\x1b\x9b\x11\x02\
-\x25\x38\x2c\x60\x2d\xcb\xda\x7c\x34\xfe\x09\xdf\x3f\x46\xfc\xb8\
-\xb5\x6b\xc6\x1c\xec\xf9\x37\x30\x73\x64\x8f\x30\xca\xfb\xd2\x55\
-\x35\xe9\xac\xc5\x4b\x16\x6b\xdb\x7a\xf6\xe5\xe6\x1e\xc4\x56\x08\
-\xb2\xaa\xd1\x5a\xb2\xad\xac\x99\x42\xc0\x89\xd6\xf2\xe6\xd7\x98\
-\x29\xb2\x11\x02\x75\x9f\x16\x36\xb4\x8b\xce\x3f\xe9\x94\xe3\x99\
-\x29\xb2\xa5\xcd\x3d\xf0\x20\xae\xa2\xb9\x93\x6b\x99\xda\x97\x9f\
-\x5f\xd2\x74\x2f\x33\x43\xf6\x2a\xaf\x64\xe2\x9a\xca\xd6\xe9\x13\
-\x26\x34\x4d\xe5\x1a\x26\x77\x33\x73\x64\x43\x3b\xf2\x88\x23\x39\
-\xce\x51\xce\xf9\xaa\xdb\x0e\xc6\x5e\xe0\x2b\x66\x84\xec\x95\x06\
-\xe5\x28\x6f\xb9\x62\xfd\xdd\xbf\xe2\x3b\xba\xf7\x61\xe6\xc8\x86\
-\x36\x7d\xd6\x1c\x6e\xe9\xe2\xc5\x39\x8e\xca\xd6\xbb\x99\x09\x98\
-\x8c\x45\xf5\x6f\x56\x4d\xea\x2c\x09\xd6\x4d\xe6\x16\x2d\x59\xc2\
-\x0c\x32\x9e\xdb\x81\x07\x2f\xe2\xc4\x70\xaf\xbd\xa7\x21\xa7\xb8\
-\x71\x0b\x33\x00\x13\x46\x81\xbb\x02\x75\x93\x8f\x35\x16\xd4\x71\
-\x4b\x8e\x39\x9a\x99\x64\x3c\xb7\x83\x16\x1d\xce\x71\xce\x72\xca\
-\xeb\x3f\x09\xdf\x78\xb6\xde\x1f\x8f\xfc\x11\xe4\x93\xe5\x8d\x20\
-\x8f\x24\xde\x33\xf0\x71\x24\xf5\x7f\xdd\x1b\x45\x3e\x85\x94\xbf\
-\x5b\x85\xbf\xd1\x5a\xd6\xfc\xeb\x67\xef\xbd\x51\x33\xef\xe0\x43\
-\x98\x49\xc6\x73\x5b\x78\xe8\x61\xb4\x02\xc0\x5b\x4a\x26\x5e\x37\
-\x26\xe6\x49\x37\x33\x2b\x8d\x1c\x32\xa5\x5b\x96\x0b\xe5\xc4\xcf\
-\x91\x1c\xb2\xec\x11\x64\x4b\x91\xec\x71\xc8\x21\x5d\x17\xef\x96\
-\xaf\x39\x45\xaf\xa9\xbd\xa2\xe5\xb1\x99\xfb\xee\x6f\x99\xd4\x39\
-\x83\x99\x64\xbc\x36\x41\xe3\xe6\x1c\x25\x8d\x5c\x61\x53\x87\x3d\
-\xb7\xb8\xf1\x19\x55\xcc\x15\x32\x52\xc8\x3c\x8e\x01\xd1\xff\x45\
-\xb9\x24\x83\x0d\xea\x01\x7d\x31\x7a\xbc\x58\x8a\xd4\x13\x87\x1b\
-\x59\x69\x66\x47\x14\x33\xdb\x32\x54\x76\xf9\xb5\xf6\x24\x07\x83\
-\x9c\xa2\x86\x77\x3c\x15\xad\x7e\x67\x59\x33\x33\xca\x78\x35\xbf\
-\xa0\x71\x49\x1f\xe7\x14\x1c\x2b\xf8\xaa\xbf\x4e\xc6\xe4\xbc\x42\
-\x1c\xde\x7c\x1c\xde\x84\x1c\x9a\x8a\xc3\x1b\x92\xb3\x8d\x50\xf6\
-\x38\xe4\x08\x93\x53\xf1\xfb\x94\xb2\x65\xa7\x44\x18\x38\x12\x07\
-\x81\x36\x50\xbb\x59\x1f\xa8\x0d\xea\x69\xcb\x31\x6b\xe3\xd6\xfc\
-\xbc\x20\x78\x96\x08\xfa\xc0\x76\xc1\x5b\x3d\x22\xd3\x53\x8f\x2a\
-\x9a\x4e\x36\x59\x8e\xad\x0e\x72\x51\x76\x5b\x3d\x78\xad\x23\x90\
-\xad\x01\x3c\xf6\x46\xf0\xd8\x1a\xf1\xe3\x46\xf1\xff\x5e\x6b\xb8\
-\xea\xc7\xa9\x14\x7f\xa3\xad\x61\xe0\x6f\x57\x7e\x1c\xfe\x75\x5b\
-\x84\xaf\xcb\x1f\x7b\x50\x4e\x7c\x5e\x3d\xbe\x0f\x83\x80\xe0\x1a\
-\x39\x04\x34\x08\x00\x9d\xbf\x26\xa8\xa5\xfa\x04\xac\x8d\x53\xf3\
-\x6b\xbc\x4b\x05\x8d\x6f\xbb\xa0\x0f\x42\xdc\x00\xc0\x1b\x89\xc3\
-\x10\x5a\x8f\x37\x56\x9d\xb9\x09\x16\xe5\xb5\xc2\x69\xb9\x6d\x70\
-\x9d\xa9\x03\x7e\x69\x9a\x0a\x7f\x32\x74\xc2\xa3\xfa\xe9\xb0\x3a\
-\x2e\x75\xc1\x23\xa6\x5e\x78\x24\x6f\x06\x3c\x92\xdb\x07\x8f\xe4\
-\xf4\xc1\xea\x9c\x5e\x58\x6d\xea\x81\xd5\xc6\x6e\x58\x6d\x20\xc5\
-\xfb\x5c\x19\x28\xfa\xdb\xe8\x6f\xa4\xbf\x95\xfe\xe6\xd0\xdf\x2e\
-\xaa\x57\xfa\x7c\xe8\x6b\x26\xe5\xd7\x7a\xe0\x51\x92\x91\xd4\xdd\
-\xff\xf1\x23\xf8\xf1\x7d\xc6\x2e\xb8\x22\xa7\x03\x4e\xce\x9b\x0c\
-\x27\xa1\x8e\xc9\x6b\x83\x5a\x4b\xa3\x38\x6f\x21\x0e\x8d\x46\x00\
-\x00\x34\x7f\x50\xc3\x00\x30\x6e\xcd\xbf\x44\x34\xbf\xc6\x0f\x71\
-\x03\xc0\x2f\x8d\x9d\x2d\xd6\x3a\x38\x19\x4d\xff\x4f\xbc\x89\xff\
-\xa3\xeb\x81\x75\xa8\xd7\x65\xbd\xc6\x34\xe6\x7a\x5d\x7e\x4f\xd6\
-\xe9\x7a\xc5\xff\x13\x6c\x66\x99\x9b\xc5\x21\x92\x38\x17\x12\x1f\
-\x04\x36\x6b\x18\x00\xb2\xc0\xfc\x23\x00\x00\x85\x92\x56\x0c\x31\
-\x97\xe5\x4c\x81\x17\x74\xdd\xe2\xcd\xf5\x0a\x53\xda\x8b\x80\xf0\
-\x04\x41\xc0\x22\x41\x40\x9c\x18\x65\x00\x60\xe6\x1f\x09\x00\x78\
-\x0c\x1f\xf5\x38\xde\x3f\x0c\x43\xfe\x67\xf4\xdd\xf0\x2a\x33\x56\
-\x46\x89\x60\xfd\x04\x0e\x39\xba\xad\xcd\xe2\xdc\x4d\x1c\x73\x02\
-\x9b\x05\x04\x80\xc0\x00\x30\x0e\xc7\xfc\x4a\xf3\xc7\x0b\x00\x1c\
-\xf7\xe7\x62\xe8\x7f\x3d\x8e\xf5\x59\xcf\x9f\x99\xa2\x61\xc1\x4d\
-\xb9\xd3\x20\xdf\x51\x17\xcf\x50\x80\x01\x60\xbc\x98\xdf\xed\x79\
-\x15\x1f\xbd\x8b\x23\x9a\x3f\x1e\x00\xf8\xa5\x25\x36\x0f\x86\xff\
-\xab\x0c\x9d\x0c\x00\x19\x1c\x05\xac\x36\x75\x83\xd7\xdd\x20\x4e\
-\xe4\x32\x00\x64\x81\xf9\x8d\xa6\x83\xc8\xfc\x87\xa2\xf9\xb7\x46\
-\x34\x7f\x3c\x00\xf0\x49\xcb\x7d\xd3\xcd\xcd\xf0\x9c\xbe\x87\x85\
-\xff\x19\x2a\x7a\xdf\xfe\x69\xe8\x86\x4a\x57\x93\x98\xab\x31\x3c\
-\x00\x6a\x11\x00\x2c\x0f\x20\x63\xcd\xaf\x37\xf4\xe0\xa3\x67\x51\
-\x4c\xf3\xc7\x03\x00\x8f\xb4\x9e\x4c\x4b\x7e\xff\x61\x46\xca\x68\
-\x00\xbc\x80\x00\xdf\xd7\xd6\x0a\x9c\x8f\x01\x60\x5c\x9b\xdf\x60\
-\x9c\x19\xea\xf9\x3f\x8a\x69\xfe\x78\x00\xe0\x92\x00\x70\x52\x6e\
-\x9b\x38\x8e\x64\x66\xca\x5c\xbd\x8c\x3a\xdc\x32\x09\xb8\x78\x26\
-\x01\xa5\xb3\x07\x98\xa9\x32\xd4\xfc\x8b\xe2\x32\xff\x70\x00\xf0\
-\x4b\x29\xa5\x0c\x00\xe3\x47\x4b\x2d\x6d\x0c\x00\xe3\xcf\xfc\x1e\
-\xd9\xfc\xb3\x46\x66\xfe\xe1\x00\xe0\x93\x36\x98\x30\x00\x8c\x9f\
-\x61\xc0\x51\xe6\xb6\xf8\x86\x00\x0c\x00\x99\xd5\xf3\xeb\xf4\xad\
-\x23\x37\xff\x70\x00\xf0\x32\x00\x8c\xaf\x95\x80\x5e\x38\x86\x00\
-\xe0\x65\x00\x18\x67\x13\x7e\xdd\xa1\x09\xbf\x91\x99\x3f\x1e\x00\
-\xd8\x18\x00\xc6\x13\x00\x8e\x65\x43\x80\xf1\x64\x7e\x52\x21\x99\
-\xff\xa0\x84\xcc\xcf\x86\x00\x59\x07\x80\xe3\xac\x93\x81\x0b\x30\
-\x00\x8c\x8b\x9e\x5f\xa3\x2d\xa6\xb0\x7f\x3e\x9a\x7f\x4b\x42\xe6\
-\x67\x93\x80\x59\xb6\x2f\xa0\x17\x4e\xb0\x31\x00\x8c\x13\xf3\x4f\
-\xa0\x9e\x7f\x41\x52\xe6\x8f\x63\x19\x90\xb6\x92\x32\x00\x8c\x97\
-\x74\xe0\x5e\x38\xc5\xce\x00\x30\x4e\xc2\x7e\xb1\xe7\xff\x20\x29\
-\xf3\xc7\x93\x07\xc0\x00\x30\x6e\xb4\x41\xdf\x0b\xe7\x3a\x18\x00\
-\xc6\x43\xd8\x9f\x7c\xcf\xcf\x00\x90\x75\x9b\x81\xbe\x30\xf6\xc2\
-\x79\xee\x29\x0c\x00\x99\xda\xf3\x6b\xb4\x45\xa9\xeb\xf9\x59\x26\
-\x60\x56\xd5\x04\xd8\x61\xe8\x01\x30\x21\x00\x3c\xed\x08\x80\x1a\
-\x06\x80\xcc\xec\xf9\x3d\xa9\xeb\xf9\x19\x00\xb2\x66\x17\xe0\x76\
-\x34\xff\x5e\xa3\x04\x80\xf3\x19\x00\x32\xcf\xfc\x82\x26\x40\x3d\
-\xff\xbc\x94\x9b\x3f\x1e\x00\xb8\x19\x00\x32\xb9\xe7\xdf\x16\x32\
-\xbf\x0c\x80\x0b\xdd\x0c\x00\x19\x66\xfe\x20\xf5\xfc\xfb\xa3\xf9\
-\x37\xa5\xdc\xfc\x2c\x02\x18\xd7\x63\xfe\x8f\x95\xe6\x97\x01\x70\
-\x11\x9b\x03\xc8\x24\xf3\xfb\xc9\xfc\x73\xd1\xfc\x9b\x55\x31\xbf\
-\x08\x80\x00\x9b\x04\x1c\x67\x5a\x8f\xfa\x2c\xdc\xfc\x32\x00\x2e\
-\x76\x31\x00\x64\x50\xd8\xaf\x62\xcf\x2f\xca\x07\xbc\xce\x83\x00\
-\xa8\x1a\x36\x11\xe8\xc4\xfc\x29\xe2\x3a\x32\x33\x58\x7a\xeb\xbf\
-\x34\xdb\x6f\x08\x33\xbe\x02\x00\xcb\x9c\x0c\x00\x99\xd4\xf3\xab\
-\x68\x7e\x2f\xf0\x82\x1d\x01\x60\x8f\x03\x00\x35\x70\xa2\xa5\x03\
-\xd6\xe9\xfb\x98\xc9\xd2\x58\x6f\xe9\x7b\xe0\xab\x68\xe6\x17\xd5\
-\x0b\xcb\x9d\x2c\x0f\x20\xbb\xc7\xfc\xa2\x3c\x68\x7e\x1b\xca\x8c\
-\x00\xb0\xc5\x06\x80\x5d\x06\x80\xb9\x1d\x01\xc0\x22\x80\x74\xd5\
-\xbb\x68\xfe\xaf\x63\x9a\x5f\x02\xc0\x0a\x96\x08\x94\x11\x61\xff\
-\x66\xb5\x42\x7e\x41\xe3\x44\xe3\x5b\x24\xf3\x8b\x00\xb0\xaf\x13\
-\x7c\xd5\x5f\xc4\x06\x00\x1b\x02\xa4\xf3\x1e\xff\xcd\x68\xfe\x6f\
-\x8d\xc3\x99\x5f\x06\x80\xbd\x8d\x01\x20\x3b\xc3\x7e\x45\xaf\x3f\
-\xa0\x27\xf9\x3c\xff\x7e\xf8\x46\x6f\x1a\x16\x00\x79\x93\x19\x00\
-\xd2\x4c\x6f\xc8\x6b\xfc\xbb\xe3\x32\xbf\x24\x06\x80\xf4\x35\xff\
-\x7e\x68\xfe\x0d\x6a\x8c\xf5\x05\x8d\x63\x70\xaf\x2f\xe9\x59\x9e\
-\x37\x37\x0a\x05\x0d\x3e\xf9\x0d\x8f\xb9\x1d\x98\x01\x20\xbd\x92\
-\x7b\x36\x0c\x3b\xde\x8f\xac\x4b\x6c\x0c\x00\xe9\x18\xf6\x93\xf9\
-\xdf\x4b\xbd\xf9\xdd\x68\x74\x6b\xb8\xf1\x49\xcf\x21\x10\x9a\xf9\
-\x7c\xfc\xdd\xd2\x1b\xbd\x99\x15\x04\xc9\x8c\x70\xff\x6d\x34\xfe\
-\x27\x23\xec\xf5\x07\x01\x80\x45\x00\xd9\x60\x7e\x1f\x9a\x3c\x62\
-\xaf\x2f\xf5\xfc\x64\x7e\xc1\xcc\xe1\xd8\x3f\x36\x00\x3c\x0c\x00\
-\xe9\x50\xc9\x37\x64\x7c\xca\xe7\xff\x2e\x41\xe3\x33\x00\x64\x95\
-\xf9\xed\x91\x8c\x1f\x32\xff\x44\x32\x3f\x2f\xd8\xc8\xfc\x31\x01\
-\xc0\x33\x00\x8c\x99\xe9\x43\xd9\x7c\x1b\xd1\xf8\x9f\xa2\xf1\x77\
-\x25\x69\x7c\x06\x80\xac\x09\xfb\x9d\xd1\xcc\x4f\x61\x7f\x4b\xc8\
-\xfc\x38\x34\x18\x16\x00\xb4\x0f\x80\x01\x60\xf4\x4d\x4f\x4b\x7a\
-\x94\xc3\x4f\xcb\x7a\x7b\x52\x64\x7c\x06\x80\xac\x30\xbf\x2b\x5a\
-\xd8\xff\x5c\x28\xec\x0f\x99\x5f\xbc\x26\x06\x80\x31\x35\x7c\x28\
-\xbc\x5f\x2f\x4f\xea\x6d\x57\xc9\xf4\x0c\x00\x63\x6e\x7e\x57\xf8\
-\x6c\xbf\x4a\x13\x7e\x11\xcd\xff\x12\x7e\xbe\x35\xdc\xfc\x71\x01\
-\xc0\xc5\x00\x90\xea\x1e\xfe\x55\x79\xf9\xee\x1d\x34\xfc\x07\x72\
-\x78\xff\xad\xca\xa6\x67\x00\x18\x73\xf3\x3b\x43\x3d\xff\x2c\x34\
-\xff\xbb\xea\xac\xf1\x47\x9c\xed\x5f\x8b\xe6\x6f\x8f\x64\x7e\x06\
-\x00\xf5\x7b\xf7\xd0\x96\xdc\x37\xe5\x1e\xfe\x23\x83\x64\xf8\x6f\
-\x92\x98\xc5\x67\x00\xc8\x58\xf3\xbb\xc9\xfc\x6f\xab\x93\xd3\x1f\
-\xd1\xfc\xcf\x0f\xf4\xfc\x51\x64\xc2\x61\x49\x71\x93\x87\x01\x20\
-\x75\x66\x5f\x2f\x8f\xe1\xa9\x77\xa7\xed\xb8\x5f\xc8\x33\xf7\x7b\
-\xc6\xc8\xf0\x09\x03\x00\xef\x0b\xde\xe4\xc1\xfb\xc4\x12\x26\xba\
-\x9f\xbd\x2a\xcb\xd3\xff\xc8\x0b\x0e\xf1\x77\x32\xf3\x47\x35\xbf\
-\x2d\x92\xf9\x77\xa3\xee\x47\x5d\x8c\x5a\x8e\x5a\x11\x45\xcb\x79\
-\x83\xf3\x1a\xc1\x5f\xbd\x33\xda\x56\x60\x06\x80\xc8\xa1\xfc\x6b\
-\xb2\xd9\x29\x94\xdf\xa2\x30\x3b\xa5\xe4\xee\x4e\x13\xb3\x27\x0c\
-\x00\xbc\x1f\xf0\xbe\xb8\x5a\xba\x7f\x2c\xcb\x06\xcb\x71\x2e\x1a\
-\xf3\x0c\x15\x75\x3a\xfa\xe5\x18\x5e\x70\x77\xe0\xa3\x5b\xf2\x52\
-\x08\x04\x2e\x66\x7e\x29\x9f\x3f\xa6\xf9\x47\xa6\x58\x9b\x81\xb2\
-\x1c\x00\xca\x71\xfb\x3a\x79\xb7\xdd\x66\x79\xb2\xee\xf3\x0c\x30\
-\x7b\xc2\x00\xc0\xfb\x81\xee\x8b\xa1\xf7\x8b\x45\x1c\x6e\xaa\xb7\
-\x49\xad\x5f\xbb\x50\x3b\xf0\x5e\x7f\x09\xef\xf3\x4b\xd1\x43\x55\
-\x5a\x5d\x91\x08\x00\x9a\x4c\x4f\xeb\x46\x17\x29\x85\x49\x6a\xf6\
-\xfc\x31\xd7\xfa\x53\x03\x00\x7f\xf6\x01\x20\x7c\xdc\xfe\x5e\xd8\
-\xb8\x9d\xd6\xe2\xf7\x66\x98\xe1\x53\x0b\x00\xc7\x68\x98\x3f\xd2\
-\xfd\xfe\x06\x82\xe7\x7b\x38\xd4\xd5\xa5\x35\x04\xa8\xe7\x27\xf3\
-\x6b\xb4\x7e\x15\xcd\xef\xc7\x37\xc2\x99\x1a\xf3\x67\x31\x00\x94\
-\xa1\xfc\x1b\x72\xa6\x5d\x28\x94\xff\x32\xcd\xc6\xed\xe9\x01\x80\
-\x51\xeb\xfd\xa3\x41\x60\x27\x46\x03\x67\x86\x20\x90\x76\xc3\x81\
-\x50\xcf\xcf\x0b\x01\x55\xcd\x2f\xf5\xfe\xd6\x41\x6f\xcc\x80\x12\
-\x01\x80\x3d\x2b\x00\x30\x68\xec\xae\x97\x66\xe5\xb7\x1a\xa4\xd2\
-\x59\xff\x93\x43\xf9\xbd\xe3\xd0\xf0\xa9\x03\x80\x4d\x31\xfc\x1c\
-\x4b\x08\x78\x16\x6b\x75\x25\xe2\x9c\x40\x1a\x86\xfd\x7e\x7c\xf4\
-\xf4\xa9\x67\xfe\x10\x00\x6c\x8a\x37\xc5\x2d\xef\xf8\xa3\xa5\x40\
-\x97\x9c\x09\xe8\x90\xbf\xc7\x1a\x41\x36\x71\xf8\x20\xed\x10\x74\
-\x82\xa0\xf3\x45\xaf\x09\x98\xc1\x00\x50\x1a\xfe\x4d\x34\xfb\x26\
-\x79\xec\xfe\xc5\x38\xee\xdd\xd5\x05\x80\x63\x8c\xcd\xdf\x7f\xff\
-\xaf\xa3\x39\x01\x69\x62\xd0\x99\x5e\x63\x7e\x34\x7f\x0f\x5e\xe0\
-\x7a\xf5\x5f\x04\x97\x2c\xdf\x30\x93\x85\xd1\x14\x67\x55\xe0\x0c\
-\x03\x40\x78\x3a\xed\x47\xf2\x64\xdd\x77\x59\xd2\xbb\xab\x09\x00\
-\xe9\x7e\xf3\xa7\x89\xbc\x97\x4a\xde\x73\xa4\x95\xf9\x7b\x47\xc7\
-\xfc\xa3\x58\x16\x3c\x83\x00\xb0\x4e\x9e\xb4\xfb\x78\x14\xd2\x69\
-\x19\x00\xc6\x3c\x0a\x58\xcb\x0b\x6e\x37\x45\x01\xe9\x12\xf6\x67\
-\xa6\xf9\x87\x03\x40\x06\x24\x02\xd1\x6c\xfd\x87\x72\x71\x0c\x66\
-\x7a\xb5\x00\x60\x91\x87\x9a\x69\x73\xdf\x7e\x82\x00\x98\x4a\xc9\
-\x42\x63\x0a\x00\xe9\xd1\x33\x23\x63\xcd\x9f\xc1\x00\xa0\xf2\xd7\
-\x5b\xe5\x09\x3c\x66\xec\xd1\x00\x80\x37\x9d\x22\x80\x5d\x08\xa4\
-\xe3\xc6\x34\x02\xa0\xb5\x48\x8c\x00\xac\xf8\xc2\x3c\x36\x78\xcc\
-\xcd\x00\xa0\xf6\xa1\x17\x5b\x0d\xf1\x16\xc1\x64\x1a\x9f\x00\x10\
-\xf7\xbf\x9c\x3e\xa6\x11\x80\xb4\xbd\x37\x8f\x97\xab\xf8\x6e\x94\
-\x32\xf3\x1c\x63\xbc\x56\x9a\x62\x00\xa4\xd1\x76\x60\x4a\xce\x79\
-\x5f\x2f\x25\xe4\x30\x23\x8f\x05\x00\xd2\xaa\x73\xdb\x8d\xfe\x3b\
-\x7e\xcc\x23\x00\xc5\x16\xdf\x39\x12\x04\x5c\xe2\x52\x5b\x9a\x8d\
-\x97\x12\x06\x00\x9f\x26\x00\xa0\x14\xdc\x9d\x06\x36\x93\xcf\x00\
-\xd0\xaf\xcf\x78\xc1\xdd\x3d\xa6\x11\x40\x84\x22\x1f\x08\x01\xef\
-\xc6\x50\x2d\xbe\xf4\x9a\x35\x4d\x30\x02\x18\xe3\x92\x60\xb4\x86\
-\xbf\x45\xcf\xc2\x7d\x36\x04\x18\x32\x07\xf0\x1a\x7a\xcf\x3b\xa6\
-\x11\x40\x74\x08\x78\x36\x49\x09\x37\x16\x31\x29\x27\xed\xe7\x05\
-\xd2\x14\x00\x34\xd6\xdf\xc1\x66\xf6\xd3\x08\x00\xe9\x34\xb4\xf5\
-\xfe\x1f\xc7\x6b\x84\xb4\xc9\x06\x0c\x1b\x0e\xec\x8f\xc6\x7f\x7f\
-\x20\x35\xd7\x91\xde\x10\x88\x05\x00\xef\xc0\xb9\x00\xa3\x09\x00\
-\xca\xcb\xff\x92\x8d\xf5\x59\x1e\x40\xe4\xde\xff\x5d\xf4\x5b\xa3\
-\x54\x33\x20\x8d\xea\x04\x48\x10\xe8\xd7\x81\xbc\x60\xdb\x32\xf0\
-\x02\xda\xd3\x17\x02\xb1\x00\xe0\x1b\x7d\x00\x50\x15\x5c\xb6\xb4\
-\xc7\x52\x81\xa3\x98\xff\x1b\xec\xfd\x4f\xd4\x68\xe7\xa0\xc7\xd2\
-\x68\x2f\xc0\x00\x04\x3c\xf2\xf2\xa0\x85\x2e\x70\x01\x3e\x7e\x34\
-\x18\x02\xde\xcc\x02\x80\x7f\xf4\x00\xf0\xaa\x3c\xde\xdf\xc5\x4c\
-\x9a\xc5\x9b\x81\x94\xe9\xea\x1e\xb9\xce\xa5\x4b\xda\xb3\xa2\x71\
-\xec\x41\x08\xdd\x80\x3e\xca\xa5\xd0\x9f\x22\xee\xb4\xad\xfe\x2b\
-\x65\x08\xe6\x53\x0d\xbe\x83\xf1\xc5\xdb\x36\xf8\x45\xf4\x66\x16\
-\x00\x1c\xea\x03\xe0\x35\x39\x9b\x8f\x8d\xf7\xc7\xfb\x76\xe0\x90\
-\xb9\xbd\x83\x0c\x2e\xcd\x95\x85\x6f\x60\x1b\xb4\xbb\x75\x9b\x5c\
-\xd9\xca\x2a\xd5\xb6\x4c\xf3\xca\x40\x48\x29\xb9\x08\xa7\x58\x47\
-\xed\x50\xbc\xf0\xed\x03\x7f\x8c\x55\xc5\x09\x15\x5f\xc6\x01\x80\
-\xcc\xbf\x95\x99\x3f\x43\x0a\x82\x58\xfb\x77\x91\x4a\x3d\x73\x48\
-\x6e\x85\x94\x9f\x0f\xed\x4c\x75\xc8\x05\x6c\xc2\x0d\x1e\x73\x0b\
-\xfb\x2e\x14\x0d\xa3\x6f\xc7\xef\xeb\xc6\xe7\x10\xa8\xa8\x2d\x79\
-\x2a\x23\xda\x40\x11\xc5\xdc\x10\x04\x3e\x1e\xfc\x42\xaa\x91\x2b\
-\xe0\x91\x69\xea\xfe\x02\x29\xfb\x2b\x04\xc2\xf9\xf8\x78\x51\x0c\
-\x5d\x28\x18\x83\x3f\x11\xfc\x35\x3b\xc7\x62\x0e\xe0\x35\x39\xab\
-\x8f\xad\xef\xa7\x65\x4d\xc0\x6b\x22\xd4\x93\xc4\xff\x5b\x96\x0f\
-\xfe\xbc\x25\x82\xcc\x89\x4a\x7e\x6e\xb1\xfe\xe0\x31\xa8\x4a\x84\
-\x86\x41\xf2\x51\x06\x99\x7f\x28\x04\x48\xe6\xc3\x07\x43\x40\xad\
-\x5c\x01\xf1\x40\xd0\xbd\xf8\xfc\xf7\xe1\xef\x29\x96\x56\x27\x7c\
-\x91\x95\x53\xc8\x09\x45\x0d\xde\x78\x4e\x07\x4e\x35\x00\x58\xcf\
-\x9f\x09\x55\x81\xdd\x11\xaa\x49\x87\x57\x09\xb6\x46\xd0\xa0\xfb\
-\x3e\x01\x0d\x7d\xfe\x8c\x6d\x03\x7f\x54\x1e\x3d\x1e\x86\xda\x31\
-\x18\x02\x4e\x35\x4b\x86\x3d\x8a\xbf\xa3\x54\xfa\xfd\x43\x09\x3a\
-\xec\xb9\x00\x2a\x2d\x03\xbe\x3a\xe2\x31\x7f\x6f\x0c\xa5\x93\xc1\
-\xd2\xff\x3a\xd9\xb9\x00\x63\x0a\x01\x3d\x3d\x62\x68\x63\xfe\x74\
-\xf0\x1a\x6b\xaa\x13\x86\x42\xa7\x03\x8b\xcf\xff\x30\xaa\x22\x12\
-\x04\x86\x05\x80\x4a\x89\x40\xef\xc7\x34\x7f\xaf\xf8\xb5\x1d\xc6\
-\x2e\x58\x67\x98\x0a\xab\x0d\x6d\x70\x8b\xbe\x19\xae\xd7\x37\xc1\
-\x55\xfa\x46\xb8\x4c\xd7\x00\x3f\xc1\xc7\x9f\xe3\xff\xff\xa0\x6f\
-\x81\x47\xf0\xeb\xaf\xe3\xf7\x6d\xc7\xef\xdf\x65\xec\x1e\x45\xb3\
-\x0d\x5c\xe7\x6b\x86\x0e\x78\x08\xaf\xe3\xf7\x78\x9d\x3f\xc3\xeb\
-\xba\x52\xdf\x00\x57\xa0\xe8\xe3\x1b\xf5\x13\xe1\x4f\xfa\x56\x78\
-\xd6\xd0\x0e\xef\x1b\x3b\xe1\x0b\xe3\x74\x06\x80\xec\x86\x80\x55\
-\x83\x8f\xc7\x85\x43\x20\xf5\x09\x43\xca\xd2\x61\xe6\xc7\x51\x55\
-\xe1\x10\x18\x8b\xd3\x81\x37\xc4\x58\xea\xdb\x8a\x66\xfa\xb3\x7e\
-\x12\x9c\xaa\xab\x85\x4e\x6d\x29\x04\x34\x85\x60\xd5\x04\xc1\xa8\
-\x09\x80\x06\xff\x26\x4e\x94\x4f\x7c\xa4\xff\xd3\xe7\xe9\xeb\x3e\
-\xfc\xbe\x49\xda\x12\xf8\xbe\xae\x06\x7e\x87\x26\x7c\xdb\x30\x0d\
-\x76\x8b\x30\x50\xc7\x44\x1f\xa1\x91\xef\xc5\xeb\xfc\x01\x5e\xe7\
-\x54\xbc\x4e\x3f\xfe\x7e\x0b\x5e\x87\x01\xaf\x47\xe8\xbf\x4e\xe9\
-\x7d\xd0\xa1\x72\xf1\xf3\x4e\x4d\x01\x54\x68\x8b\x60\x7f\x5d\x39\
-\x5c\xa9\x6b\x84\xa7\x0c\x53\xe0\xf3\x31\x80\x01\x03\xc0\x98\x43\
-\x40\x1c\xd7\x08\xf8\xf1\xb1\xea\x43\xc0\xa3\x9c\x69\x7d\x74\x20\
-\x12\x90\x56\x28\x46\xfb\x70\xd0\xb7\xa2\xec\xe6\xfb\xc0\xd0\x09\
-\xd7\x61\x6f\x39\x19\x4d\x9c\x87\x46\x0a\x99\x9c\xc4\xcb\x8a\x38\
-\xd4\x91\xc5\x29\xe0\xa0\x47\xb3\x55\x6a\x8b\xd1\x9c\x35\xf0\x1c\
-\x9a\x2c\x95\x75\xfb\x37\xe3\x75\x5e\x8b\xd7\xd9\x96\xd4\x75\x4a\
-\xef\x2f\x01\x61\x9e\xae\x42\x04\xc9\x68\x82\x80\x01\x20\xfd\x20\
-\xf0\xc9\x60\x08\xa4\x3a\x61\x68\x50\x09\xf1\xc7\x50\xe5\xd2\x35\
-\x38\x47\x15\x00\x54\x7a\xfb\x8b\x30\xf3\x53\x08\xfd\x90\xbe\x4d\
-\xec\xed\x75\x68\x5c\x2e\x86\x89\xe2\x9e\xff\x50\x00\x21\x88\x3d\
-\xf3\xb9\xba\x3a\xd1\xb8\xc9\x98\xe6\x5b\x8c\x26\xee\x36\xb4\xc2\
-\x14\x34\xbe\x4e\x61\xf8\x54\x5c\x67\x3e\x82\x64\xa1\xae\x12\xd6\
-\xe0\x10\x81\x01\x20\xeb\x86\x03\x36\x3e\xd2\x9c\x40\x6a\x21\xe0\
-\x0b\x3f\x41\xe8\x6f\xa8\x42\xfa\xfd\xa3\x05\x00\x9a\xf1\xdf\x1e\
-\x66\x7e\x1a\xaf\xff\x0a\xc7\xc7\x3e\xec\x09\x53\x61\xa8\x48\x0a\
-\x85\xe1\xbd\xda\x32\x78\x3e\x41\x83\xed\xc4\xde\xf9\x62\x5d\x3d\
-\xd8\xc4\x1e\x5f\x85\x33\x1e\xe4\xeb\x2c\xc7\xe1\x01\xcd\x75\xec\
-\x52\x71\xe8\xc2\x00\x90\x9e\x73\x02\x42\xe4\x39\x81\x54\x66\x0d\
-\x0e\x39\x3d\xf8\x41\x5a\x22\xe4\xf3\xfd\xa3\x02\x80\xcd\x61\x93\
-\x7e\xb4\xee\x7f\x13\xde\xec\x76\x95\x4c\x15\x09\x04\x34\x47\xf0\
-\x1f\x43\xc7\x88\xcd\x7f\x0a\x8e\xf3\x0d\x72\x74\xa2\xf6\x35\x3a\
-\xf0\xf5\xf8\x05\x0e\x31\xbe\x53\x11\x02\x0c\x00\x19\x35\x27\x90\
-\x4a\x08\xb8\xc3\x33\xaf\x1e\xe4\xb9\xbc\x02\xa1\xa0\xc1\xa7\x26\
-\x00\xde\x8a\xb0\xb9\x87\x66\xc4\x27\x60\x8f\xc7\x8d\x62\xca\x33\
-\xfd\xae\x05\xda\x0a\xf8\x2c\xce\xf1\x36\x99\x70\x05\xf6\xfc\x64\
-\x7e\x7e\x14\xaf\x91\xa0\x78\xbb\xbe\x85\x01\x20\x0b\x21\x40\xab\
-\x03\xa7\xa2\x3e\x57\x0b\x02\x8a\xa5\xc1\x01\x08\x98\x83\xd3\xf0\
-\x8d\xde\xa4\x06\x00\xa8\x8c\xd7\xce\xb0\xd0\xff\x1b\x34\xd6\x12\
-\x5d\xd5\xa8\x9a\x3f\x14\x6a\xd3\x6c\x3c\x2d\xc9\xc5\x63\x94\xfb\
-\xf5\x93\xb0\x47\x2e\x18\xf5\xeb\xa4\xdf\x57\xa3\x2d\x86\x97\x47\
-\x18\xad\x30\x00\x8c\x0b\x08\x58\x74\xf8\xf1\xe9\xea\x41\x20\xc2\
-\xa1\xa2\x3a\xfb\x0b\x51\x8f\x07\x4f\x12\x00\x1f\xe8\x87\xa6\xf9\
-\xd2\x58\x9c\x96\xed\xb8\x31\xd8\xf8\x44\x33\xf0\x47\x20\x7c\xbe\
-\x1d\x26\xc4\xde\x6a\xec\x84\xe9\xda\xd2\x31\xb9\xc6\x10\x04\x4e\
-\xd5\xd5\xa8\x32\x1f\xc0\x00\x90\xfe\x69\xc3\x04\x81\x33\x51\x5f\
-\xa8\x03\x81\xb0\x63\xc5\x63\x1d\x0f\x9e\x44\x1e\xc0\x5b\x51\x4a\
-\x79\xfd\x58\xdf\x98\x92\x19\x7e\x3e\x89\xde\x75\xcb\x30\xab\x02\
-\xbf\xd5\x37\x27\x1c\xfa\x0f\x5e\x96\x4c\xfc\x3a\x69\x88\xf4\xaa\
-\x0a\x51\x00\x03\x40\x66\x40\x40\x1f\x1d\x02\x9e\xd4\x4e\x0a\xaa\
-\x00\x00\x9a\xf5\xff\x2c\xc2\x7a\x3f\x65\xcd\xd1\xda\x37\x97\x60\
-\xae\x03\x2d\xeb\xcd\xd4\x96\x89\xb3\xfa\x1e\x0c\xcf\x13\x31\x27\
-\xad\xbf\x3f\x1b\x63\x45\x80\x26\xfe\xf6\xd5\x96\x27\x74\x8d\xf4\
-\xfc\x94\x98\x44\xc9\x41\x73\xf0\x39\x28\x5f\x20\x37\x41\x90\xd0\
-\x72\xe3\xaf\xf5\x13\x53\x9e\xd9\xc8\x00\x90\x59\x10\x38\x07\xf5\
-\xe5\xd0\x2d\x99\x29\x84\x80\x0a\x00\xd8\x1c\x21\xd5\x77\x8f\x38\
-\xf9\x37\x05\xca\x12\x98\xfc\x23\x03\x15\xa2\xf9\x2f\xd5\x35\xc0\
-\xad\xfa\x16\xb8\x05\x75\xba\xae\x16\xf2\x46\x68\x2e\xfa\xde\x1c\
-\xfc\x99\x3b\xc5\x79\x80\xc8\xc6\xa2\x0c\x3d\x17\x42\x82\x4f\xe0\
-\x1a\x4d\xf8\xdc\xc7\x63\xe8\x7e\x33\x46\x10\x2b\xf1\x1a\x69\xa5\
-\x63\xbe\xb6\x02\xb4\x09\x0e\x57\x8e\xd1\x55\xa7\x7c\x45\x80\x01\
-\x20\xb3\x20\x60\x40\xd3\x9f\x3b\x34\x12\x48\x11\x04\x04\x84\x80\
-\xce\x91\x52\x00\x50\x31\xcf\xaf\x23\xf4\xfe\x94\xed\x46\xa6\xa0\
-\xa5\xae\x44\x7a\xc4\x83\x75\x95\x70\x1b\xfe\x3c\x01\x80\x9e\xe7\
-\x06\xec\x1d\x4b\x12\x80\x09\xa5\x10\xd3\x3e\x82\x48\x00\xa0\xac\
-\x41\xda\x6f\xa0\x4b\x30\x6c\xa7\xeb\xf9\x25\x5e\xd7\x4a\xf9\x3a\
-\xe9\x7a\x97\xeb\xea\xc5\x64\x1f\x3e\x81\xe7\x6b\xc7\x48\x82\xa2\
-\x26\x06\x00\x16\x09\x9c\xa3\x1a\x04\x74\xfe\xe8\xe7\x02\x8c\x10\
-\x00\xb4\xcb\x6f\x5b\x94\x62\x9e\xef\x19\xa6\xc1\x15\xd8\x83\x8f\
-\xd4\x0c\xa1\x5e\xfb\x4c\x5d\xdd\x20\x00\xfc\x06\x7b\xd7\x46\xed\
-\x84\x11\x03\x80\x7a\x56\x5a\xde\x8b\x04\x00\xda\x8b\x70\x14\xf6\
-\xba\x5c\x82\x00\xa0\x90\x9f\xe6\x0f\x6e\x55\x5c\x27\xa5\x0e\x3b\
-\x13\x88\x28\xe8\xf9\x8a\x10\x28\xef\xe2\xeb\xc6\x00\xc0\x20\x40\
-\x10\xb8\x00\xf5\x75\xca\x21\x90\xc2\xb2\xe0\x54\xcd\xf7\xbb\x08\
-\x37\x1d\xcd\x66\xbf\x84\xe3\xee\x73\xd0\xc4\x39\x09\x84\xed\xb4\
-\xd1\x86\x7a\x66\xda\x28\x74\xbb\x6c\x2e\x0a\xaf\x29\xb9\x27\x11\
-\x00\x9c\x8d\xd7\x11\x69\xdd\x9f\xd2\x71\xe7\x8a\xe3\xff\xc4\x00\
-\x30\x43\x5b\x06\x77\xe3\xf0\x62\x15\x6a\xa5\x0c\x80\xeb\xc5\x6c\
-\xc7\xc2\x84\x86\x14\xb4\x0c\xf9\x24\x0e\x49\x18\x00\x18\x04\x48\
-\x26\x34\xfd\x25\x29\x87\x40\x8a\x00\x40\x13\x7f\x9f\x46\xe9\xfd\
-\xbf\xc2\xf0\xff\x9f\x86\xc9\xe2\xb8\xdd\x94\x00\x00\xc8\x08\x0f\
-\x1b\xda\x60\xab\xa1\x0b\xfe\x8d\x86\xb8\x03\x0d\x46\xbb\xfe\xa6\
-\x26\xb0\x54\x47\x00\xa0\xdd\x86\xe1\xcb\x93\x9f\xe2\x35\x3e\x80\
-\x80\x49\x74\xf9\x8f\x9e\x97\xa2\x87\x8f\x30\x8a\xd8\x80\xbd\xf6\
-\x6a\xfc\x7b\x29\x62\xf9\x39\x02\xa0\x20\x41\x00\xd0\x86\x23\x82\
-\x5e\x2a\x27\x02\x19\x00\x32\x1f\x02\x97\xa2\xbe\x49\x19\x04\x86\
-\x3b\x17\x20\x4e\x00\x6c\x8c\xb1\xc7\x9f\xb2\xef\xfe\x86\x06\x3e\
-\x59\x4e\xab\x1d\xa9\x11\xec\x08\x80\x7f\x89\x3d\x61\x2f\x7c\x8c\
-\x06\x7b\xc0\x30\x49\x04\xc0\xb4\x04\x01\x70\xa2\xae\x66\xc8\x2e\
-\xc1\x8d\x86\x4e\xd1\xb0\x89\x44\x15\xa1\xe7\x3d\x03\xff\xbe\x50\
-\xaa\xf3\x3b\x08\x01\x8a\x04\x68\x4e\x60\x42\x82\x13\x9f\xf4\x5a\
-\xd1\x84\x22\x03\x00\x6b\x4a\x08\xe4\xc8\xf5\xd3\x52\x13\x09\xa4\
-\xe0\x60\x90\xd7\x23\xec\xf4\x53\x6a\x1b\xf6\xdc\x7f\xc1\x9e\xec\
-\x24\x34\x5e\x22\x00\xa0\xa5\xb4\xbb\xe4\x99\x7b\x8a\x26\x1e\xc3\
-\xde\xf5\xf7\x49\x00\xe0\x38\xec\xa9\x95\x49\x36\x64\x58\x2a\x3e\
-\x42\xc3\x8a\x86\x04\xe6\x15\x42\xcf\x7b\x9e\x62\x68\x41\x05\x4a\
-\xe8\x6f\x26\x00\x94\x26\x91\xf6\x7c\x6d\x94\x09\x4b\x06\x00\x16\
-\x09\xfc\x28\x25\x91\x40\x0a\x0e\x06\xd9\xac\x8f\x5d\xd8\xf3\x7d\
-\x83\x54\x40\x83\x42\x6f\x63\x02\xeb\xe2\x64\x9e\xe5\xfa\xfa\xfe\
-\x54\xe2\x27\x64\x00\x74\x88\xbd\xb5\x6f\x50\xe2\xcd\xf0\xf2\xc1\
-\xd1\x61\x00\xa0\xc8\x85\x36\x0a\xd1\xc4\x62\x5d\x12\x00\xb8\x40\
-\x57\x3f\x28\xea\xf9\xab\x21\x39\x00\xd0\x73\x5e\xae\x6f\x60\x00\
-\x60\x2d\x6a\x24\x70\x69\xd2\x91\x40\x92\x00\xa0\x7d\xfe\x5f\x0d\
-\x73\x8c\x17\x8d\x89\xef\xc1\x1e\xfc\x87\x09\x4c\x02\x86\x00\x40\
-\xc5\x42\x08\x24\x64\x5c\x5a\xab\xa7\xd0\x78\xa9\xae\x4a\xfc\xfc\
-\x14\x8c\x04\xe2\xd1\x2c\x6d\xb9\xb8\x9c\x48\x65\xba\x76\x87\x4d\
-\x52\xbe\x60\x68\x17\x13\x6f\xaa\xb5\xc5\x29\x01\xc0\x4e\x79\xd8\
-\x93\x2c\x00\x56\xe8\xeb\x19\x00\x58\x4b\x64\x62\xd0\x9d\x3c\x00\
-\xe2\x38\x19\xe8\x03\xfd\xf0\x65\xbd\xdf\x95\xc7\xc3\x94\xc8\x63\
-\x49\x30\x0f\x80\xd6\xe6\xa9\x04\xd7\x36\x23\x4d\x04\xb6\x8b\x2b\
-\x01\x14\x05\xfc\x2e\x0e\xdd\x24\x3f\xd2\x8c\x3a\xd5\xe4\x0b\x4f\
-\xae\xf9\x1f\xfe\xff\x19\xfc\x1a\xd5\x27\xa8\x4c\x11\x00\x28\xef\
-\xe1\xef\x29\x00\xc0\x45\x8a\xe7\x64\x00\x60\x2d\x1a\x04\x2e\x43\
-\x7d\x3b\xf4\x24\x17\xb7\xaa\x00\xa0\xa4\x9f\x6f\xe2\xb8\xe9\x68\
-\x42\x8c\xc6\xf0\x34\x9e\xf5\x24\xb0\x26\x1e\x9a\x0b\xa0\xe1\xc3\
-\x62\xec\xf5\xef\x94\x93\x6c\x42\x09\x37\xf1\x88\xbe\xf7\x39\x04\
-\x47\xa4\x0d\x36\x5f\xcb\xc3\x0a\x4a\x2e\x2a\x4b\xc2\xac\x4a\x00\
-\x10\x68\x68\xe5\xe2\x86\x24\x01\x70\x5e\x84\x25\x4b\x06\x00\xd6\
-\xc2\x21\x90\x87\xa6\xff\x29\xea\xbb\xa1\x10\x70\xa9\x76\x32\xd0\
-\x87\x71\x9e\xe0\x1b\x02\xc0\x8d\xd8\x0b\xd7\x27\x38\xc6\x16\x14\
-\x1b\x6b\xa8\xb8\x26\x45\x03\xbf\x93\x53\x6e\x43\xe9\xc1\xb1\x44\
-\xdf\x43\x7b\x00\x22\xa5\xd6\xd2\xc4\xe2\xe3\x32\x00\x4a\x53\x08\
-\x80\x47\x52\xf0\x9c\xe7\x30\x00\xb0\x16\x27\x04\xf2\xd1\xf4\xd7\
-\x46\x8e\x04\x5c\x89\x01\x80\xb2\x01\x9d\x91\x01\x20\xf6\xfe\x71\
-\x02\x60\x83\x3c\x04\x20\x23\x26\x9a\x68\x13\x3e\x27\x40\x73\x09\
-\x3d\xda\x32\xf8\x3f\x7d\xa3\x38\xbf\x40\xba\x3b\x8a\x56\xc9\x8f\
-\x2f\xc5\x00\xc0\x3f\xd0\xac\xbf\x4c\x30\xbd\x98\x01\x80\xb5\x74\
-\x82\xc0\x35\x91\x23\x01\x67\x42\x00\x10\x5c\x91\x01\x40\x63\xff\
-\x78\x6f\x3a\xda\x7e\x4b\x06\xa5\xb0\xfd\xec\x04\x27\x02\xa3\x55\
-\xda\x2d\xd2\x14\x89\xe3\xe4\x57\x0c\x1d\x62\x75\xe1\xcd\x31\xf4\
-\x09\x9a\x32\x52\xae\xc2\x97\xf2\xd2\x22\x03\x00\x03\xc0\x78\x81\
-\xc0\x4f\x87\x46\x02\x66\xf9\x98\x65\xdf\xc8\x22\x00\xf7\x50\x00\
-\x8c\xa4\xf7\x0f\x6d\x03\xa6\x35\xf1\x5b\xe5\x4d\x3c\x35\x09\x4e\
-\xb4\x45\x8b\x06\x28\xbb\xf0\x00\x5d\x05\x8e\xe3\xa7\x24\x74\xd4\
-\x18\x01\x60\x75\x9a\x03\x80\xce\x52\x78\xcb\x30\x3d\xae\x39\x17\
-\x06\x00\x06\x81\xfc\xc8\x73\x02\x11\xce\x1e\x18\x2e\x02\xf0\x48\
-\x00\x38\x51\x06\x40\xac\x0d\x3f\x10\x61\x0b\xf0\x1a\x43\x17\x3c\
-\xa0\x9f\x0a\x0f\xea\xdb\xfa\x27\xe3\x8e\xd5\x55\x8b\xf5\xfb\x53\
-\x5d\x59\x97\x0e\x12\xa1\x13\x79\x46\xba\x83\x2e\x64\x56\x35\x00\
-\x30\x90\x09\x38\xf2\x7c\x05\xd2\x59\x8a\x08\xe0\x19\x7d\x17\xdc\
-\x6d\x9a\x09\xdf\xa0\x18\x00\x58\x8b\x77\x38\x10\x21\x12\xb0\x0f\
-\x40\x60\x38\x00\xf8\x10\x00\xf6\x01\x00\xfc\x57\x17\xb9\xd2\xcf\
-\xd0\x5a\xfa\x54\x57\xaf\x13\x8e\xd2\x4c\x81\x3b\x74\x53\xc5\xb5\
-\xfb\xd0\x06\x19\x5a\x6e\x9b\x98\xc4\x64\x60\xac\x68\x80\xc0\x32\
-\x1f\xa3\x81\x17\x47\x50\x06\x5c\x32\x6b\x9b\x2a\x00\xa0\xdd\x81\
-\xdf\xd3\x55\x89\x45\x46\xf6\x1b\x81\x68\xb5\xe3\x34\x5d\xad\xb8\
-\x3f\x21\xf4\x9c\x9f\x18\xba\x61\x85\x71\x06\x3c\x60\x3d\x14\xbe\
-\x35\xf5\x32\x00\xb0\x96\x4c\x24\x20\x9f\x3d\x30\x1c\x00\xfc\x08\
-\x00\xe7\x00\x00\x3e\x8a\xa3\xf7\xff\xda\xd8\x0b\x77\xe2\xcd\xba\
-\x50\x33\x19\xae\xd3\x75\xa0\x19\xba\x61\xbd\x61\xaa\x58\x88\x43\
-\xb9\x4f\x5e\x8d\xda\x80\xa1\x68\x80\xd6\xf3\xff\x80\xe6\xfb\x36\
-\x8e\x82\x1a\x6a\x01\xe0\x61\x04\xc0\xad\x23\x58\xaa\x54\x2e\x59\
-\x12\xc0\x22\x0d\x67\xee\xd5\x4f\x83\xd3\xcc\x0b\xe0\x75\x84\x00\
-\x03\x00\x6b\xf1\x40\xc0\x8c\x86\xbf\x3e\x2a\x04\xf4\x81\xd8\x00\
-\x40\x71\x6e\x09\x00\x6f\x45\x29\xf6\x31\xa8\xa4\x56\xce\x3e\x70\
-\x93\x69\x06\x1c\xa8\x69\x87\x4b\xb5\x1d\xb0\xc3\xd0\xdd\x9f\x1b\
-\x4f\xbd\xd9\x2d\x8a\x1b\xfd\x4c\xec\xe1\xd4\x2a\x10\xca\xc9\xdb\
-\x88\x69\xef\xff\x70\x47\x6f\xa9\x19\x01\xac\x1c\x61\xbe\xc2\x70\
-\x00\xf8\xc8\x30\x1d\x4e\xc7\xa1\xc0\x6f\xdc\x27\xc0\x57\x79\x73\
-\xf1\x73\xdd\x0c\x00\xac\x25\x11\x09\xe8\x9c\xc3\x03\xc0\x2b\x01\
-\x60\xcb\x30\x47\x7a\x6f\xc1\x1b\xf2\xda\xbc\x79\xb0\x3f\x1a\x7f\
-\x99\xb6\x1d\x3e\x30\x4c\x1f\xb4\xdf\x9e\xd2\x6d\x6f\x0b\xbb\xd1\
-\x97\xa1\x69\x68\x52\x50\x50\xe1\x74\x20\x4e\x4e\x1e\x3a\x5e\x57\
-\x0d\x1f\xc6\x28\x04\x9a\x2a\x00\x5c\x18\x06\x80\xfb\x10\x00\xd7\
-\x61\x14\xf2\x6b\xd4\x1f\xe2\xcc\x57\x08\x01\x92\x00\x10\xed\x5c\
-\xc3\x7b\x71\x48\x75\x1c\xbe\xce\x2f\x20\x04\xc0\xd4\x17\xf1\xe4\
-\xe2\xbd\xa6\x1e\xf8\x38\x67\x3a\x7c\x60\xea\x82\xed\xf8\xb8\xc7\
-\x24\x7d\xfe\x52\x06\x00\x06\x81\xc1\x00\x88\x51\x13\x30\x04\x00\
-\x5f\x2d\x9c\x94\xd7\x06\x3b\xa3\x2c\xfd\x51\x2a\xf0\x7a\xcb\x41\
-\x70\x51\xfe\x7c\xd1\xfc\x3f\x46\x7d\x64\xe8\x8e\x78\xaa\xee\x03\
-\xf2\x6a\x40\x08\x00\x54\xe0\xe3\x1a\x7d\x13\x74\x69\x4b\x13\xda\
-\x28\x14\xcf\x90\x80\xca\x80\x2d\xd2\x55\x8a\xcb\x84\xd1\x00\x40\
-\xc7\x90\xff\x2a\xc9\x19\xfb\xd3\xf5\x0d\xf0\x55\xce\x2c\x34\xdc\
-\x3e\xf0\x70\xde\xfe\x70\xbc\x69\x3a\xf4\x68\x1a\x61\x5f\xd4\x99\
-\xba\x89\xe2\x10\xe8\x7e\xc3\x24\xf8\x8b\xac\xfb\xf4\x91\x45\x5f\
-\xa3\x23\xc7\xf7\x44\xdd\x5d\xd9\x0d\xa7\x21\x60\x2f\x77\x1e\x0b\
-\x3b\xec\x8b\x07\x45\x01\x1b\x4d\x9d\xf0\x2b\x53\x33\x9c\x6a\xa8\
-\x85\xf6\x9c\x72\xa8\x30\x4d\x80\xd6\x9c\x32\x38\xc9\x58\x0b\xbf\
-\x34\x36\xc3\xf1\xf6\x66\xe0\x82\x0c\x00\x0c\x02\x23\x01\x00\xea\
-\x0c\x73\x1b\xec\x89\x12\xfe\xbf\x61\x39\x18\x7e\x68\x5e\x08\x0b\
-\xd1\xf8\xb7\x60\xef\xb4\x33\x4a\x58\x4a\x9f\x7f\x11\x6f\x6c\x4a\
-\xcc\xf9\x83\x58\x2c\xa3\x19\xce\xd1\x35\xc1\x51\xda\x46\x38\x44\
-\x5b\x0f\x2d\x9a\x0a\x30\x27\x50\xed\x37\xde\x0c\x42\xda\x05\x38\
-\x78\x38\xd0\x2d\x6a\x07\xea\x56\x71\xb7\x62\x03\x78\x13\x28\xde\
-\x11\x02\x40\xab\xbe\x11\xce\x33\xed\x07\x67\xe5\xcc\x86\x45\xc6\
-\x19\x30\x43\x33\x05\xa6\x0b\xad\xa2\x66\xa1\x2e\xd4\x4e\x86\xc7\
-\xf5\x53\xe1\x0d\x04\xd1\x3b\xa8\x0f\x0c\x5d\xe2\x8a\x05\x89\xea\
-\x1c\x6c\xc1\xff\x6f\x46\xd1\x70\xe9\x9b\x61\x42\xfb\xbf\xeb\xa7\
-\xc1\x22\x7d\x37\xdc\xef\x3d\x15\xf6\x22\x6c\xe8\x67\xae\x34\x35\
-\x41\x95\x7e\x02\x68\xb4\x81\x08\xab\x0e\x3e\xfc\xbc\x1f\xf2\x0c\
-\x85\x20\xd8\x4b\x41\xf0\xd7\x30\x00\x64\x31\x04\xae\xed\x87\x40\
-\x9c\x00\x58\x66\x6b\x8b\x70\x23\x76\xc3\x97\xe6\x05\x70\x8d\xfd\
-\x08\x38\x14\x7b\xa4\x47\xf0\xa6\xdc\x15\xe3\xa6\xdd\x8e\x3d\xd7\
-\xcd\x08\x88\x65\xba\x56\x58\x8a\xa6\xef\xd5\xd4\x43\x07\xaa\x0f\
-\x35\x03\x35\x05\x55\xab\xa9\x06\xa7\xa6\x38\xa1\x4a\xba\xf1\x54\
-\xed\x3d\x1b\x7b\xf9\x27\x73\xf6\x85\xf5\xa8\x4d\x18\xb5\xbc\x62\
-\x5f\x02\xbf\x45\x80\xcd\xd2\xb6\x40\x9d\x50\x03\xb9\x09\x02\x88\
-\x47\x83\x4d\x10\x2a\x61\x86\xd0\x86\x9a\x24\x6a\x26\x7e\xbc\x1f\
-\x6a\x16\x8a\x3e\xde\x07\x75\x88\x66\x32\x1c\x8d\x60\x38\x05\x75\
-\x8d\xae\x03\x9e\xc0\xf1\xfc\xab\x68\xfa\xfb\x74\xd3\xc4\xc8\xe9\
-\x12\x7c\x1d\x6f\xc5\x8f\x69\xc9\x6f\x67\x0c\x08\x7c\x8e\x5f\x5b\
-\xae\x9d\x02\x27\xe4\x1d\x08\x7f\x73\x1e\x0a\xf3\xf5\x15\xc0\x6b\
-\xfd\xc3\x46\x2f\xfd\x70\xcb\x2b\x02\xc1\x57\xc5\x00\x90\xc5\x10\
-\xb8\x1a\xf5\xbf\x78\x01\x40\x93\x47\x91\x00\xf0\xb9\x65\x01\x5c\
-\x6a\xfb\x1e\x1c\x89\x37\xf6\x5b\x86\xd8\x93\x6d\x34\x54\x78\x16\
-\x6f\xec\xab\x74\xed\xf0\x03\x34\xdc\xc9\xda\x26\xf8\x11\x86\xc6\
-\xbf\x96\xc7\xc9\xcb\xf1\xe3\x03\xb5\x0d\x30\x51\x53\x0b\x7e\x4d\
-\x19\xe8\x13\xdc\x39\x18\xeb\xe6\xcf\xd7\x14\xc1\xbe\xd8\x0b\x9f\
-\x88\x63\xe8\x13\x72\xf7\x87\x85\x86\x5e\x98\x85\x50\x6a\x15\x1a\
-\xc5\xdf\x6b\x4e\x30\x02\x20\x00\x94\x6b\xaa\x60\x5f\xd9\xe8\xb4\
-\x02\x72\x19\x1a\xfa\x2f\x08\xc5\xf3\xd1\xd4\xfb\x89\x60\x90\x60\
-\x70\x80\x2c\x82\xc2\x5c\xd4\x02\xfc\xde\x39\xf8\x48\x60\x38\x17\
-\xbf\x97\x1e\xbf\x8f\x7a\x58\xdf\x19\x73\xa7\xe5\x93\xf8\x5a\xee\
-\xab\x6d\x85\x22\x43\x65\x62\xaf\x53\x6e\x61\x34\x08\x30\x00\x64\
-\x01\x04\x68\x03\xd1\xe5\x08\x80\x6f\x92\x01\xc0\xee\xdc\xd9\xf0\
-\xa4\xe7\x64\x38\x52\xd7\x05\x67\x61\x8f\x34\x1c\x04\xa4\x09\x41\
-\xa9\x60\x06\x55\xe1\xa1\x39\x81\x95\x8a\x39\x81\x1b\xe5\x61\x01\
-\x81\xa0\x15\x0d\xe5\x47\xc3\x6a\x53\x3c\x41\x38\x0d\x8d\x7e\x34\
-\x9a\xee\x20\x34\xdd\xc1\x9a\x36\x38\x1e\x75\x8e\xae\x19\x2e\xd4\
-\x35\x8a\x95\x78\x13\x1d\x02\x1c\xae\xad\x15\x97\xe9\xee\xc2\x1e\
-\x7c\x2d\xf6\xea\x5f\x87\xaa\x0d\x63\xe4\xb3\x0a\x3f\xff\x4b\x04\
-\xcd\x9d\xf8\x35\x82\x20\xe9\x77\xf8\xff\xb3\xd1\xf0\x67\xa2\x68\
-\xe8\xb4\x11\x5f\x3b\xfa\x99\x0f\xf1\xfb\x37\xe0\xc7\x9f\xe1\xeb\
-\x1b\x0d\x00\x3b\xf1\x7b\xae\xd6\xb7\x43\x50\x57\x9e\xf0\x41\x2b\
-\x31\x20\xc0\x00\x90\x15\x10\xe0\x72\x73\x78\x83\xeb\x4a\xbc\x01\
-\xbe\x4b\x0c\x00\xd2\xcc\xf2\xff\xcc\x07\xc2\x13\xf8\xf1\x52\x34\
-\xd5\x29\x08\x81\x57\x0c\xf1\x65\xe2\xed\xc6\x1b\x7c\x13\x8e\x85\
-\x1f\x35\x4c\x86\x3b\x14\x10\x90\x0e\xd5\x68\x81\x5f\x20\x0c\xae\
-\x46\x18\xcc\xd3\xd2\xdc\x40\x6a\x8e\x12\x27\xb3\xec\xa3\x2d\x47\
-\x50\x75\xc1\xeb\x68\xb2\xd7\x50\x1b\xf1\xe3\xd0\xd6\xdd\xe4\x57\
-\x01\x7a\x87\x44\x3d\x94\x8b\x40\x1b\x8e\x68\xb2\xf1\x6b\x14\xd5\
-\x1f\x20\x51\x0a\xf2\x56\x83\x24\xfa\x98\xc6\xfd\x5f\xcb\x8f\xa1\
-\x8f\x23\x6d\x5e\xa2\x84\xa0\xeb\x10\x18\xcd\xfa\x7a\x71\xbc\x9f\
-\x34\x14\x87\x42\x80\x01\x20\x1b\x20\x20\xd8\x27\x70\x82\xb7\xb2\
-\x18\xdf\xe8\x2d\x89\x03\x40\x8a\x04\xe8\x46\x7f\x0e\x7b\xb5\xe3\
-\x30\x74\x25\xbd\x10\x27\x04\xf6\x8a\x15\x79\xbb\xc4\x92\xdc\xf7\
-\xc8\x89\x42\xca\x55\x02\x5a\x36\xa4\x09\xc3\xb3\x74\xb5\x50\x8e\
-\xe6\x4c\x76\xb9\x90\xcc\x5d\xa8\x2d\x14\x13\x93\x94\x7b\x01\x52\
-\x9d\x07\xa0\x2c\x0c\x72\xbe\xae\x0e\x0e\x46\x88\x2d\x8c\xa0\x43\
-\xb4\x95\xa2\x22\x7d\x8d\x8e\x33\x5f\x19\x76\x54\xf8\x16\x34\xff\
-\x15\x38\xb4\x98\xa9\x99\x04\x0e\x7d\x49\xea\x22\xa3\xc1\x10\x60\
-\x00\xc8\x86\x46\x6f\x30\x2a\x20\xbf\xe1\x49\x00\x60\x40\xd4\xab\
-\x9e\x81\x51\xc0\xb1\x08\x81\x97\x0d\xf1\xe6\xe4\xf7\x8a\x85\x3a\
-\x68\xdb\x30\x45\x03\x77\xca\x3b\x07\xc3\xf5\x53\x7d\x93\x58\x7b\
-\x3f\x99\xe5\xc2\x50\xb9\xed\xfb\x14\xe5\xb6\xbf\x50\x11\x00\x34\
-\xbb\x3f\xa9\xbf\x76\xe1\xc8\xa5\x3c\xc3\x80\x86\x57\xe7\xe0\x70\
-\x61\x36\x0e\x5d\x0e\xc2\xd7\x23\x4f\x5b\x90\xda\x65\xd3\x01\x08\
-\x30\x00\x64\x11\x00\x82\xa9\x04\x80\x54\x62\x7b\x3a\x5c\x84\x37\
-\x2a\x4d\x68\x6d\x57\xe4\x03\xec\x92\x0f\xdf\x20\x93\x3f\x16\x41\
-\xb4\x23\x8f\x96\x08\x7f\xaa\x6f\x14\xb7\xf8\x52\x35\x9c\x90\xc8\
-\xfc\xb7\xc9\x07\x82\x2c\xd6\x56\x25\x5c\x5a\x2c\x74\x3c\xd8\x75\
-\x8a\x6a\xbb\x6a\x03\x60\x72\x12\xa5\xc6\x43\xbb\x01\x9f\xc7\xe8\
-\xea\x04\x04\xeb\x81\x38\xcc\xba\x01\xc3\xff\xf3\x4c\x4d\x20\x68\
-\x55\x38\x9e\x5c\x82\xc0\x66\xa1\xa0\xde\x2f\x04\xf1\xfe\x28\x2a\
-\x65\x46\x61\x00\x18\x19\x00\x42\x13\x5f\x74\xa3\x3e\xa5\xef\x1a\
-\x74\xf8\xc6\x7e\xba\x72\x71\x3c\x6f\x8b\x21\x32\x37\xf5\xd2\x54\
-\x0e\x9c\x44\xcb\x77\x87\xea\xaa\xc4\xa4\xa1\x95\x72\xb6\x1c\x1d\
-\xc2\x99\x9f\x20\x04\xc8\x58\x3f\x54\xf4\xac\x4a\x00\x94\xa6\x19\
-\x00\x68\xf8\xf0\x34\x0d\xad\xd0\xfc\x34\xc9\xfa\xb8\xbe\x53\xcc\
-\x10\xbc\x54\xdf\x90\xdc\xe4\x5f\x2c\xe5\x14\x7e\x22\xb8\x26\x74\
-\x0b\xba\x02\x4e\xa8\xae\xe0\x84\x62\x06\x01\x06\x80\x11\x02\x40\
-\x1a\x5b\x77\x8b\x20\xe8\x9f\xbc\x42\x33\x74\x8a\xb5\xfc\x7d\xfd\
-\x05\x3d\xe2\x11\x99\xe7\x20\x1c\x27\xdf\xae\x98\x1b\xb8\x19\xd5\
-\x87\xc3\x81\x44\x01\x70\x98\xae\xb2\x3f\xd9\x26\x04\x00\x9a\x04\
-\x2c\x4f\x51\x51\x50\x8a\x76\xa8\x80\xe9\xcb\x86\x8e\x84\x77\x3e\
-\xd2\x73\x2e\xd1\xd6\x8a\xab\x07\x7f\x45\xe3\xef\xe8\x7f\x2d\x7b\
-\x61\x85\x9a\x00\x20\x19\x03\x2f\x0a\xae\xe2\xc9\x02\xe7\xe3\x84\
-\xfa\x4a\x4e\x28\x29\x63\x86\x61\x00\x48\xae\x18\x05\x01\xa0\x2b\
-\xa1\xc3\x3c\xa4\x54\xde\x3b\x14\x93\x84\xb7\xc9\x9b\x89\x4c\x09\
-\x96\x19\xa7\x2d\xb7\xa1\xac\xc0\x10\x00\x28\x15\xb8\x2a\x45\x00\
-\xa0\x89\x45\x2a\x50\x42\x95\x8b\xcb\x93\x88\x2a\x4e\xc6\x08\x60\
-\x67\x84\x39\x93\x4b\x0c\x75\xf8\x75\xaf\x7a\x00\x90\x20\xb0\x06\
-\x21\xd0\x8a\x43\x0d\x4e\x98\x58\xcd\x20\xc0\x00\x90\x98\xf1\xf7\
-\xca\x3d\x22\x9d\x9b\x37\x2d\x41\x00\xd0\xde\x78\x3a\x5f\x50\x19\
-\x05\xfc\x9f\xae\x49\x3c\x36\x2c\x11\x00\x50\x3d\xc1\x4f\xe5\xc2\
-\x21\x21\x00\xd0\xb9\x00\xb5\x29\x3a\x18\x44\x59\x10\x24\x99\x61\
-\xc5\x15\x11\x0f\x06\xe9\x85\x7b\x72\x5a\x21\x47\xeb\xc1\xbf\xdd\
-\xa3\x2e\x04\x0c\x81\xa7\x04\x67\x71\x9d\x18\x09\x34\x31\x08\x30\
-\x00\x24\x20\x5a\xf3\x7e\xdd\x30\x15\xfe\xae\x6f\x83\x96\x04\x4f\
-\xf4\xa5\x31\x2f\x1d\xb6\x41\x67\x04\x86\xe6\x02\xc8\x5c\xc5\x09\
-\x98\x8b\xbe\x7f\x0a\x5e\xc7\xc7\x61\x00\xa0\x93\x81\x26\xa6\x18\
-\x00\x37\xa8\x74\x34\xd8\x16\x53\x27\x54\xea\x03\xc0\x09\xb6\xa1\
-\x65\xde\xd4\x81\x40\xa3\x08\x81\xc9\x78\xcf\x94\x95\x33\xf3\x30\
-\x00\x8c\xac\xe6\x1e\xcd\xfc\xdf\x98\xe0\xd9\x7b\x64\xae\x1f\xc9\
-\x3d\x21\x6d\x9c\x21\xb3\x12\x00\xa4\x1e\xbb\x38\x21\x00\x34\xe1\
-\x75\x6c\x0b\x03\xc0\xef\xc4\xe3\xc6\x4a\x53\x52\xc3\x7f\x68\x49\
-\xb0\x91\x2f\x57\x52\x75\xa3\x9b\xa2\x1c\x0e\x4a\x51\xd5\xb9\x46\
-\x1c\x06\x08\x56\xb9\xd6\xa3\x7f\x14\x20\x50\x54\x27\x0e\x07\xba\
-\x1a\x38\xa1\x94\x41\x80\x01\x60\x84\x00\xa0\x1e\xb6\x39\x49\x00\
-\xec\x11\x73\x0d\xa4\xea\x42\x89\xf6\xd8\xf4\xfd\x13\x15\x00\x08\
-\x15\x05\xa5\x84\x23\xca\x33\x48\xf6\x74\x60\x25\x00\xe8\x78\xf0\
-\x60\x82\xc7\x83\x2b\x0f\x45\x8d\xf4\xba\xae\x33\x4d\x83\x32\x31\
-\x0a\x88\xf3\x10\x98\x64\xa5\x0f\x3c\x26\xd8\x8b\xca\xc5\x48\xa0\
-\xb7\x91\x13\xca\x19\x04\x18\x00\x46\x00\x80\x44\x7b\x58\x32\xd7\
-\x32\x45\x9a\xed\x87\x68\x5c\x3a\x6c\x94\xea\xed\xb5\x26\x34\xa4\
-\x90\xce\x1a\x0c\x0d\x01\xbe\x92\xaf\x8f\xa2\x8a\x03\xb4\x15\x09\
-\x03\xe0\x24\xc5\xb1\xe3\x5f\xc8\x50\xb9\x1e\x43\x78\x6f\x02\xf3\
-\x14\xf4\xfd\x56\x4d\x50\x84\x48\xac\xd7\xf6\x8f\xc6\x16\xb0\x6b\
-\x1c\x62\x24\x20\xa8\x3d\x29\x38\x00\x81\x0a\xfc\x98\x13\x96\x4c\
-\x66\x10\x60\x00\x88\x1f\x00\xb4\x7e\x3f\x2b\x81\x83\x41\xc2\x33\
-\xe2\x68\x23\xd1\x83\x18\xb2\xd3\x21\x9f\x8d\x09\x46\x00\xb4\x1a\
-\xf1\x89\x02\x00\xff\x90\x27\x18\x8f\xd0\x55\x8b\x89\x42\x89\x00\
-\x80\xea\x0d\x7c\xa7\x58\x5a\x24\x00\xfc\x0c\x01\xe0\x4c\x70\xa2\
-\x92\xc0\xf1\xaa\xa1\x63\xd8\x09\xd6\x1b\x8c\x74\xe6\xa2\x6d\x74\
-\xe6\x03\x24\x08\xac\xee\x87\xc0\xce\x13\x38\xa1\x82\x41\x80\x01\
-\x20\x86\xbe\x92\x0f\xde\xa0\xa5\xbb\x83\x74\x15\x09\x01\xe0\x04\
-\xb1\x77\xed\x1e\x04\x14\x0a\xaf\x29\xaf\x9f\x4f\xe0\xf9\xe8\x1c\
-\x81\x2f\xe4\x65\x40\xca\x07\xa0\xc9\x45\x69\x69\xb1\x2e\xc1\xa5\
-\x45\x9f\x58\x8d\xf8\xab\xb0\xa5\xc5\x2b\x74\x8d\x62\x4f\x9e\x08\
-\x00\xe8\xa4\xe2\x0f\x62\x94\x32\x1b\xc8\x39\xe8\x81\x6b\x0c\xb5\
-\x90\xa3\xb1\x22\x04\x1c\xa3\x05\x81\xbf\x0b\x96\x82\x42\x7c\xe4\
-\x04\xb8\x98\x45\x02\x0c\x00\xb1\xaa\x04\x77\x8b\x67\xef\xdd\x2e\
-\x67\xf0\x8d\xf4\x4c\x00\x32\xc3\x2c\xc5\xba\xfd\x37\xf2\x61\x9e\
-\x67\x27\x7c\xdc\xb8\x4f\x3c\x9b\x20\xd4\x5b\xd3\xe3\xbf\x65\x00\
-\x5c\xa1\x6b\x10\xb3\x11\x13\x31\x2c\x4d\x70\x7e\x60\xec\x14\x87\
-\x2a\x21\x00\xd0\x19\x86\xc6\x04\xaf\x51\x99\xab\x10\xcf\x6b\x7c\
-\x96\xa1\x02\x5f\x5b\x2b\xfe\xae\x51\x98\x14\x24\xe9\x02\x7f\x15\
-\xac\x85\x13\x04\xde\xc7\x22\x01\x06\x80\xe8\x52\xf6\xb0\x17\xe3\
-\x58\x7e\xa4\x29\xbc\xf4\xbd\x64\xca\x9b\x71\xcc\x4f\x6b\xf7\x54\
-\xfe\x8a\x4a\x7e\xd3\x0a\x00\x9f\xe0\x8e\xc0\x65\x8a\x25\xbb\xdd\
-\xf2\x1e\x85\xdb\xe4\x93\x8b\x2a\x12\x58\x59\x08\x55\x1c\xba\x4a\
-\xdf\x28\xce\x2d\x10\x08\x6e\x92\x27\x29\x13\xbd\xc6\x91\x9e\x0c\
-\x4c\xb0\x38\x4d\x5f\x2e\x43\xc0\x25\x47\x02\x5e\xb5\x23\x81\x87\
-\x04\x4b\x61\xa1\x20\x20\x04\x38\x03\x27\x54\x32\x08\x30\x00\x0c\
-\x29\x00\xd2\x0d\xcf\xca\x00\xa0\xb0\xbd\x28\xc1\x65\x31\x0a\xa5\
-\x69\xec\x4e\xfb\xf9\x69\x66\x3d\x99\xd2\x60\x77\x8a\xdb\x6c\x7b\
-\xfb\xc7\xd1\x34\xd6\xbe\x5d\xde\x67\x30\x2b\xc1\x95\x80\xd0\x4e\
-\xc3\x76\xbc\x46\x3a\x08\xa4\x08\x87\x27\x9a\x24\x9e\xe7\x5e\xc5\
-\x8e\xc5\x78\x45\xb9\x12\x3f\x40\x08\x68\x45\x08\xb8\x81\x17\x5c\
-\xc3\x9f\x10\x9d\x74\x24\xe0\xff\x8b\x60\x08\xb8\xc5\x25\x42\xce\
-\xc5\x20\xc0\x00\x10\x5e\xf8\xa3\x47\x2c\x73\xbd\x52\xde\xdb\xdf\
-\x97\x84\xc1\x42\x45\x2e\x13\xdd\x09\x48\x3f\x5b\x80\xc6\x0c\x9f\
-\x5c\x7b\xcb\x30\x0d\xfe\x28\x6f\x43\x3e\x23\xc1\x14\xe3\xf0\x6b\
-\xe4\x92\xb8\xc6\xa9\x08\x91\xad\xc6\xce\x84\x5e\xef\xcf\x30\x02\
-\x39\x46\x5f\x0a\x82\x20\x45\x02\x74\xfe\x43\xc4\x73\x21\x53\x29\
-\xad\xff\x1e\xc1\x18\xf0\x88\x13\x83\x9c\x85\x0d\x07\x18\x00\x06\
-\xcf\x54\xd3\xda\xfd\x1d\x72\x0e\x3f\x8d\xdd\x73\x55\x28\x01\x1e\
-\xef\xd8\xfa\x10\x5d\xa5\x38\x66\x8e\x74\x82\xf1\xad\xf2\xd1\x65\
-\xb5\x29\x3c\xc0\x74\xa4\x00\xa1\x39\x03\x4a\x72\x4a\x66\xdf\x05\
-\x25\x4c\x1d\xa9\x2b\x91\x20\x80\xe6\xe7\x05\xdb\xc0\x69\x50\x6a\
-\x42\x40\x8f\x91\x00\xe5\x09\x70\x6e\x66\x30\x06\x80\x01\x51\xb1\
-\x8f\xbb\x64\x83\xfd\x36\x89\x8c\xbb\x64\xcd\x45\x5b\x8d\xff\xac\
-\x38\x6f\x4f\xb9\x55\xf9\xaf\x8a\x03\x4c\x69\xf2\x6e\x2c\x20\x45\
-\xaf\xc9\x7c\x6d\x45\x7f\x8e\x42\xb2\x9b\xaf\x8e\xd6\x13\x04\x6c\
-\xe2\xa1\xb0\x74\x4c\x3c\x2f\x2e\x15\x7a\xd4\x84\xc0\xbd\x82\x3e\
-\xe8\x12\x74\x01\x8e\xc4\x1a\x03\x40\xff\xbe\xf8\xbf\xc8\x47\x83\
-\x91\xc1\xae\xd0\x37\x26\x94\xc7\x9f\xec\xd9\x00\xdf\xd7\x55\x0f\
-\xe9\xfd\x95\x13\x95\xa1\xdd\x86\xb4\x8b\x6f\x36\x8e\xe3\x35\x2a\
-\x9c\x58\x14\xcb\xfc\x75\xda\x09\xe2\x12\x67\xb2\xe6\x57\x42\x60\
-\xa9\x6e\x82\x9c\x32\x6c\x93\x21\x60\x51\x77\x5e\x40\x1b\xb8\x0b\
-\xcd\xef\x64\x10\x18\x4f\x00\xb0\x25\x07\x00\x32\xdd\x3f\x15\x87\
-\x65\x12\x04\x68\x96\x9b\xc6\xe3\xdc\x28\x98\x9f\x8c\xdc\xab\x2d\
-\x8b\x9a\x58\x43\x29\xc6\x74\x1a\x4f\x68\xcb\x71\x68\xb3\x51\x37\
-\x46\x2a\x5a\x95\x21\x10\xaa\x7b\x40\xc3\x0e\x5a\x85\xd8\x96\x82\
-\xde\x7f\x30\x7c\x3b\xe1\x70\x11\x02\x16\x19\x04\x66\x19\x04\x2a\
-\xe6\x0c\x30\x08\x8c\xc7\x08\xa0\x37\xe1\x9b\x70\x4f\xff\x3c\x40\
-\xeb\x20\x08\xd0\xe1\x9d\x75\x78\xe3\xab\xd5\xd3\x72\xe2\x8c\x7a\
-\x00\xe6\x62\x6f\x4e\xe5\xc6\xbe\x88\xb1\xae\xbe\x2d\xec\x00\xd3\
-\x95\xf2\xb2\xe0\x1c\x5d\xb9\x38\x1c\x50\xeb\x10\x53\x03\x3e\x77\
-\x37\xc2\x89\x76\xfe\x3d\x6f\x68\x8f\xeb\x44\xe3\x44\x20\xb0\x18\
-\x21\x10\x8a\x00\x86\x9c\x12\xad\x16\x04\xf4\x08\x01\x4a\x16\xd2\
-\x33\x08\x64\x34\x00\x56\x38\x26\x27\x05\x80\xd0\xc4\xd4\x43\x86\
-\xb6\x21\x95\x7f\x7f\x8e\x37\xfe\x42\x5d\x25\xb8\xe5\x53\x79\xb8\
-\x24\x61\x10\x9a\x89\xa7\x84\x23\x82\xcb\xe9\x38\x9e\x27\x53\xbf\
-\x82\x3d\xfc\xee\x18\xe6\xfa\x4e\x3c\xba\xac\xbd\xbf\xe6\x40\xe8\
-\xfa\x68\x38\x70\x2a\x3e\x47\x05\x0e\x59\x74\x32\x08\x52\x71\x7d\
-\x04\xbd\x62\x4d\x91\x98\x42\x4c\x1b\x9b\xfe\xa6\x6f\x13\x6b\x26\
-\xa4\xda\xfc\xca\xd7\xff\x00\x7d\x31\x46\x01\xe1\xa7\x44\x5b\xd5\
-\xdb\x4c\xa4\x43\x08\x18\x83\x12\x04\x58\x24\x90\xc1\x00\x70\x4e\
-\x49\x1a\x00\xb4\x1c\x48\xe5\xb8\x57\x45\x28\xff\x7d\x8b\x98\x85\
-\xd7\x28\x96\xc2\xa6\xf5\xf3\xd0\x32\x1c\x37\x82\xb2\x61\x21\x53\
-\xd1\x44\x1f\x6d\x12\xa2\xac\x43\x0a\xe3\x69\xe5\x81\xea\xfe\xef\
-\x88\xc3\x5c\xa1\xed\xc6\x91\x8e\xec\xa6\x1c\x06\xca\x20\xa4\x71\
-\x3a\xd5\x35\x14\xc2\x96\x25\xe3\xbd\x46\xca\x5e\xa4\x1a\x01\xb4\
-\x1a\x41\xc5\x4e\xe9\xf9\x69\x05\xe2\xbf\xf8\xda\xec\x56\xc9\xfc\
-\xa1\x42\x22\x97\x5a\x5b\x81\xcb\xf3\xc1\xd0\xa3\xe2\x55\x9c\x17\
-\xd0\xb1\x48\x20\xf3\x01\xe0\x42\x00\x98\x7a\x93\xbe\x09\xbf\x91\
-\x7b\xd9\x3f\x86\x41\x20\x54\xe6\x8b\x1e\xa9\x62\x2f\xe5\xe4\xef\
-\x8f\x30\xa0\x7d\xfb\x41\x04\x82\x55\x2e\x14\x4a\xe6\x31\xca\x85\
-\x42\x29\x2c\xa7\xac\x42\xda\x6c\x43\x86\xa2\x6a\x43\x4b\x74\x55\
-\x38\xac\x68\x10\x57\x1a\x6e\x93\x8d\x7b\x3f\x86\xf5\xb4\x0a\xb1\
-\x27\xce\xa1\xca\x46\xfc\x5e\xe5\x29\xc6\xb7\x86\x1d\x5a\x42\xc7\
-\x98\x51\x26\xe1\xe1\xf8\xbb\x68\x35\x83\xea\x08\xd2\x35\x98\xe5\
-\x42\xa6\x26\xf9\x1a\xe9\x5a\xf3\xe4\x22\xa7\x7e\x4d\xa1\x98\x15\
-\x38\x17\xff\x26\x5a\x06\xfd\x05\xc2\x24\xf4\x9c\x77\xe3\x6b\xf1\
-\x1a\x9a\x5f\x8d\xd0\x3f\x5c\x34\x94\xe3\xfc\xd5\xc0\x47\x85\x80\
-\x4a\xf9\x02\x04\x01\x83\x1c\x09\xe8\x83\xcc\x7c\x19\x19\x01\xa4\
-\x00\x00\xa1\xcd\x3c\x2f\xc9\xa7\x04\x87\x9b\x4c\x79\x20\x08\x7d\
-\x4c\xa1\x31\x0d\x11\x28\x47\x9f\x4e\xde\x21\xf3\x50\x79\x30\x0a\
-\xeb\xa9\x64\x36\x19\xf1\x6a\x7d\xa3\x38\x56\xff\xbd\x6c\xfa\xdb\
-\x14\x40\x79\x10\xc3\xea\x77\xd1\xd0\xbb\x47\x60\xae\xdd\xf2\x19\
-\x05\xf4\xb3\x2b\x63\x5c\x1f\x89\xb6\x38\xd3\xef\xbe\x06\xa3\x97\
-\xe5\x72\x29\x73\xaa\x55\x48\x43\x06\x3a\xcc\x84\xae\xf9\x47\x78\
-\xed\x04\x35\xfa\x5b\x42\xd7\x15\x82\x09\xad\x8c\xbc\x31\x4a\xe6\
-\x27\xad\xb0\xb5\x49\xc7\x83\xfb\xa2\x41\x40\xc5\x79\x81\xd0\x70\
-\xc0\x10\x64\x10\xc8\xd6\x08\x40\x19\x09\x50\xc8\x4b\x73\x02\xb7\
-\x47\x30\x59\x78\xaf\xbb\x32\xc2\x41\x21\xb7\x85\x99\x49\xf9\x73\
-\x94\x73\xf0\xa4\x61\x0a\x8e\xa9\x3b\x13\x0a\xab\xf7\x88\x75\x07\
-\x3a\xc5\xa5\xc1\x3f\x45\x01\x55\xf8\x35\xde\x36\x82\x6b\xa4\x82\
-\x26\xb4\x43\x72\xb3\xa1\x53\xac\x97\x38\x1a\xe6\xef\x8f\x00\x42\
-\xef\x2d\x41\x20\x37\x1a\x04\x6c\xea\x43\xc0\xc0\x20\x90\x21\x00\
-\xa8\x81\x15\xee\xf6\x94\x02\x20\x64\x32\xca\x0f\xa0\x68\xe0\xaf\
-\xd8\x13\x86\x56\x08\x6e\x89\x61\xb6\x48\x52\xce\xda\xaf\x92\x8d\
-\xf5\x16\xc2\xe5\xcb\x38\x77\xd2\xc5\x12\xad\x1a\xd0\xbc\x05\xad\
-\xcd\x13\x08\x56\x86\xfd\xce\x91\x5e\x23\x19\x9f\xa0\x47\x4b\x8e\
-\x94\xb7\xbf\x77\x94\x8c\x1f\x11\x00\xfd\x10\xf0\x46\x81\x80\x55\
-\x9d\xa4\x21\x3d\x42\xc0\x84\x10\x30\x21\x04\x4c\x0c\x02\x99\x01\
-\x00\x0f\x01\xa0\x4f\x95\x9b\x92\x7a\x40\x02\x01\x9d\x16\x4c\xa5\
-\xb4\x69\xcc\x4e\x3d\xf8\xed\x11\x7a\xf6\xf0\x39\x03\x32\x14\x4d\
-\xa0\xfd\x1d\x4d\xf5\x9c\xa1\x5d\x0c\xdd\xc9\xb4\x7b\x52\x0c\x2a\
-\xda\x69\xf7\x0e\x3e\xf7\xb3\xf8\x3b\xc8\xc0\x34\x6e\x0f\x1d\x61\
-\xb6\x32\x46\x64\x70\xbb\x1c\x8d\xd0\xdf\x44\xd1\x04\x85\xfb\x34\
-\xd1\xb8\x7b\x94\x8d\x1f\x15\x00\x71\x41\xc0\xad\x0e\x04\x72\x0b\
-\x10\x02\x05\x1c\x46\x04\xcc\x8c\x69\x0f\x00\x6f\x07\x40\x4e\x9f\
-\xaa\x37\xe7\x1e\x79\x68\x40\x30\x78\x0f\xcd\x46\x79\x03\xb4\x4d\
-\xf7\x19\x34\x0e\x99\x87\x12\x89\x48\x14\xda\xff\x1b\x3f\xbf\x16\
-\x7b\x51\xea\x9d\x29\x8f\x7f\x67\x94\x93\x74\x53\xa9\xbd\xf2\x52\
-\x21\x55\x24\x7a\x1f\x7f\xe7\x9b\xf8\xbb\xe9\x1a\x08\x0a\x4f\xe1\
-\x35\x3d\x21\x5f\x1f\x5d\xeb\xd3\x28\x5a\xd3\xa7\xc4\x23\xfa\x5b\
-\x68\x0b\xf3\x37\x31\x8e\xfb\x1e\x53\x00\x0c\x0b\x01\x15\x56\x08\
-\xe8\x58\x33\x43\xf0\x4f\xfd\x10\x60\x91\x40\x9a\x03\xc0\x37\x55\
-\x75\x00\x44\x3b\x4f\xe0\xdb\xfe\xe3\xb2\x25\x51\x99\x71\x32\xe2\
-\x1e\xf9\x7b\xc6\xca\x4c\x7b\x65\x68\x7d\x27\x5f\x53\xe8\x1a\xbf\
-\x91\xaf\x79\x57\x1a\x18\x3e\x6e\x00\xc4\x05\x01\xa7\x3a\x10\xc8\
-\x43\x08\xe4\x22\x04\x50\xac\xa5\x2b\x00\xfc\xa3\x0f\x00\xa6\x51\
-\x06\x40\x08\x02\x39\xd1\x20\x60\x4e\xfd\xb6\x62\x82\x80\x31\xf8\
-\x47\xc1\x52\xe4\x44\x10\x30\x08\xa4\x2b\x00\x96\xfb\x18\x00\xb2\
-\x02\x00\x12\x04\x3e\xe5\x75\xf6\x27\xa3\x43\xc0\xa1\x12\x04\x0a\
-\x19\x04\xd2\x16\x00\x81\x69\x00\xb9\x0c\x00\x59\x01\x80\x40\xed\
-\x46\xc1\x5a\xd4\x84\x66\xff\xd3\x98\x40\xc0\x5c\xc8\x91\x58\x4b\
-\x27\x00\x14\x74\x22\x00\x66\x30\x13\x65\x07\x00\x36\x0b\x85\x0d\
-\x3e\x9e\xcb\x75\xa0\xd9\x57\x8d\x2a\x04\x4c\xc1\x3b\x04\x67\xb1\
-\x03\x41\xc0\x20\x90\x4e\x00\x58\x56\xd8\x05\x90\xc7\x00\x90\x35\
-\x00\xc0\xfb\x82\xcf\xf3\x73\x68\x74\xe7\xa8\x43\x20\x27\x78\xbb\
-\xe0\x60\x10\x48\xaf\x08\x20\xc8\x22\x80\x6c\x03\x80\x10\xac\x23\
-\x00\xc4\x01\x01\x15\x56\x07\x44\x08\x14\x39\x04\x5b\x11\x47\x62\
-\x8d\x4d\x02\x32\x8d\x36\x00\xf0\xfe\x90\x01\x30\x2c\x04\x54\xc9\
-\x13\xc8\x2d\x58\x29\x78\x4b\xec\x82\xbd\x98\x41\x60\xcc\x87\x00\
-\x6c\x19\x30\x2b\x01\x40\x2d\x3e\x08\x58\x52\x9f\x36\xac\x0d\x80\
-\x90\x57\x70\x8b\xe0\x9d\x80\x10\x60\x91\xc0\x98\x02\xe0\x62\x3f\
-\x5b\x05\xc8\x56\x00\xc4\x0f\x01\x15\xce\x26\x94\x20\x70\xab\x08\
-\x01\x27\x46\x02\x28\xd6\xc6\x00\x00\x17\xb1\x65\xc0\xac\x06\x40\
-\xbc\x10\x50\xa5\xa8\x08\x41\x20\xbf\xe0\x66\xa1\xa0\xd4\x2a\xb8\
-\x27\x30\x08\x30\x00\x30\x8d\x05\x00\xe2\x83\x80\x4d\xad\x82\x22\
-\x7b\x04\x73\xe1\x6f\x84\x42\x06\x01\x06\x00\xa6\x31\x03\xc0\xf0\
-\x10\xb0\xa8\x59\x5f\x50\x82\x00\x45\x02\x1e\x84\x80\x9b\x41\x60\
-\xd4\x00\x70\x21\x03\xc0\xf8\x00\x80\x2d\x79\x00\x0c\x0f\x01\xab\
-\x7a\x95\x86\x25\x08\xdc\x28\x94\x94\x59\x04\x1f\x41\x60\x02\x33\
-\x72\x32\x00\xd0\x04\xe3\x03\xc0\x05\x81\xa9\x0c\x00\x19\xaf\x5e\
-\x58\xee\x9c\x9c\x12\x00\x0c\x85\x80\x75\xd5\xd0\x72\xe3\x3e\xb5\
-\x20\xb0\x4b\xb0\x14\x5e\x27\x94\x95\x9b\x25\x08\xb0\x48\x20\xa1\
-\xe6\x6d\xe8\xe0\x1a\x7b\x66\x97\x68\x0b\xea\xb7\x0c\x07\x80\xf3\
-\x19\x00\x32\x5f\xa6\x5e\x58\xe6\x6e\x4f\x19\x00\x06\x20\x60\xe3\
-\x04\x8d\xcb\xc9\x6b\xac\xab\x54\x9f\x10\x1c\x80\xc0\x77\x08\x81\
-\xeb\x85\xb2\x32\xb3\xe0\x1f\x07\x10\x10\xd3\x1e\x29\xe1\xc1\x18\
-\xe4\x42\x9b\x21\xc4\x9d\x51\x79\x85\xaa\xc9\x12\xac\xe5\x0e\x3e\
-\xea\xb8\x72\x7d\x51\xc3\x87\xc3\xd5\x04\x94\x00\x30\x43\x2e\x0d\
-\xce\x94\x91\x32\xf5\xc1\x0a\x57\xbb\x54\x14\x74\xc8\xfb\x5c\x37\
-\xa0\x60\xdd\x66\xa1\x78\xa2\x87\x37\xb9\x95\xbd\x7c\x6c\x69\xac\
-\x28\x9b\x15\xa3\x80\x3b\xf0\xff\x7b\x07\x97\x14\xf3\xca\xd1\x80\
-\x4f\x8d\x48\xe0\x7a\xa1\xbc\x3c\x5f\xf0\x97\x70\x82\x27\x03\x21\
-\x20\xe4\xcb\x66\xcf\x41\xe3\xfb\x4b\x4c\xf8\x58\x28\x38\x8a\x66\
-\x0b\xb6\xa2\xd3\x04\x4b\xd1\xd9\xea\xaa\xf0\x2c\x93\xa7\xfc\x4a\
-\x8d\xbb\x62\xa7\xe0\x2e\x87\x68\xe2\x50\xdd\xee\x06\xb8\x3a\xbf\
-\x05\xae\xce\x9d\x38\xee\x74\x15\xea\xc7\x19\xad\x26\xb8\x02\x75\
-\xf9\x30\xba\x32\x6f\x22\xf4\x38\xea\x80\x73\xe1\xfb\xea\x44\x39\
-\x4a\x41\xb0\x16\x03\xde\x07\xa8\x02\xe0\xcd\x28\x4b\x10\x1f\x03\
-\x3b\x79\xad\xed\x1a\x34\xf1\x72\xd4\x8a\xb8\xa4\xb1\xac\xe0\x75\
-\xb6\x8b\x05\x83\xf3\x06\x84\xc1\x57\xca\x49\x41\x5e\x3c\x8e\xcc\
-\x2a\xaf\x10\x38\xe5\x49\x42\x5f\xaa\x20\xf0\x2d\x5e\xff\x95\x42\
-\x75\x45\xae\x10\x20\x08\x64\xc8\x9c\x00\x6f\xb0\xa3\x90\x9a\x26\
-\x0f\x27\xb8\x26\xe4\x0b\xb9\x05\x8b\x04\x43\xf0\x6e\xfc\x83\xde\
-\x47\x7d\x8e\xda\x8b\x82\x74\x11\x3f\x8e\xc5\xe9\xfc\xd9\x23\xad\
-\x9c\x66\x1b\x12\x19\x51\xc0\x1e\x5a\x40\x53\x8a\xc7\x88\x3b\xc4\
-\xf1\xbb\x24\x9b\xc2\xbc\x56\xc5\xb1\x62\x51\xa4\xc1\xef\xd1\xd8\
-\xe4\x9f\x33\x0f\xa3\x14\x9e\x52\xac\x0b\xfc\x4f\x84\x40\x55\x86\
-\x40\x80\x37\x39\x51\x0e\x4e\x10\x0a\xf1\xd1\xd5\x21\xe8\xfd\xf7\
-\x0a\x5a\x24\xd9\x18\x9c\x47\xcf\xc4\x14\x5d\x3e\x85\xbc\x0a\x79\
-\xa2\x48\xf9\x75\x67\xd8\x19\x84\x91\x92\x86\x1c\xa9\x1c\x0e\x10\
-\x04\x2e\x17\x6a\x2b\x4d\x69\x0f\x01\x3e\xc7\xc6\x09\x9c\x8f\xe3\
-\x75\xf6\xf9\xbc\xd6\xbd\x99\xdd\x68\x4c\xe3\x53\x6e\xc5\x91\xe4\
-\xa3\x70\xf6\x80\x2e\xf0\x35\x0e\xa9\x2f\x10\x1a\x6b\x0c\x42\x30\
-\x4d\x21\x20\x4e\xac\x60\xd8\xcf\xe7\x7a\x9b\x05\x9d\xf7\x3d\xd5\
-\x96\x4a\x98\x98\xd2\x26\x8a\x70\x8b\x2b\x02\xd2\xb0\xc2\x0a\xaa\
-\x2e\x17\x6a\xfd\x5f\x0a\xe6\xc2\x0b\x85\x86\x2a\x63\x5a\x42\x80\
-\xcf\x41\x00\x98\x9d\x26\x41\xef\xfb\x13\xbb\x39\x98\xb2\x4f\xa1\
-\x21\x82\x5b\x96\x0a\x09\x43\x5a\xff\x57\x82\xb9\xe0\x02\xa1\xa9\
-\xda\x28\x0e\x07\x9c\x69\xb2\x8b\x90\xd7\x59\x51\x2e\x8e\xd7\x3b\
-\x67\x0b\x5a\xdf\x97\xec\x66\x60\x62\x52\x49\x14\x09\xe4\x15\x9c\
-\x25\x74\xd5\x6a\xc5\x3c\x01\x57\x1a\x2c\x11\xf2\x7a\x04\x80\xc1\
-\x6c\xe4\xb5\xf6\xbb\x58\xe8\xcf\xc4\xa4\x3a\x04\x76\x0a\xb9\xc1\
-\x1f\x08\x1d\xb5\xba\xb4\x80\x80\x9c\x34\x11\xc0\x31\xd0\x26\x55\
-\xce\x5c\x63\x62\x62\x1a\x0a\x81\xbc\x82\xd3\x84\xc9\x75\x3a\xc1\
-\x57\xc4\x09\xf6\xe0\x18\x03\x40\x63\x2e\xc4\xc7\xf7\x53\x5e\x47\
-\x8d\x89\x89\x29\x1a\x04\x3e\x17\x72\x82\x27\x0a\x65\x45\x7a\xc1\
-\x3d\x86\x67\x0e\xf0\x5a\x0b\x0d\x03\x1a\x11\x00\xdb\x54\xdd\x31\
-\xc5\xc4\xc4\x34\x78\x25\x42\xe7\xfd\x5c\xb0\x04\x0f\x16\xf2\x02\
-\x63\x08\x00\x8d\x85\x20\x50\x8a\x00\xf8\x40\x4a\x84\x60\x51\x00\
-\x13\x93\xfa\xcb\x90\x38\xdc\xd6\xfa\xee\x15\x2c\x85\x45\x63\x7a\
-\xea\x90\x3c\x07\x10\x94\x86\x00\x2a\x15\x52\x64\x62\x62\x92\x15\
-\xca\x50\xf4\xad\xc2\x61\x80\x93\x4e\x20\xa6\x3d\x37\x63\x3b\x04\
-\xd0\x59\x9d\xbc\xc6\xfc\x82\xea\x25\x94\x98\x98\xb2\x3e\xf9\x48\
-\xac\x4c\x84\xe6\x0f\x38\x11\x00\x1c\x69\x6c\x57\x01\x72\x1d\x1c\
-\xcf\xe5\xd2\x50\xe0\x82\xc1\x29\x91\x76\x06\x01\x26\xa6\x14\x99\
-\x5f\x9a\x60\x77\xd3\xe4\x9f\x6c\xfe\xc0\xd8\x9b\x5f\x4a\x03\xb6\
-\x73\xbc\xde\x46\x9a\xc0\x6b\xac\x6f\xaa\x7a\xc4\x12\x13\x53\x16\
-\x86\xfc\x52\x67\x9a\x86\xe6\xef\x87\x40\x9e\x93\x13\xb8\x7c\x84\
-\x80\x7d\x31\xaf\xb1\x7f\x39\x34\x2f\xda\x9b\x45\x61\x5a\x24\x79\
-\xa3\x28\xd2\xee\x33\xda\x6c\xe2\x56\x84\x7b\xca\xff\x7b\xc2\x8a\
-\x51\xa4\xf2\x3a\xbd\x61\xd7\xe0\x92\xab\xdf\x0c\x96\xf4\x79\x77\
-\x0a\xae\x81\x29\xde\x8d\x47\xe2\x6b\x9f\xae\xe6\x97\xf6\x02\xe0\
-\x30\x20\xdf\xcd\xf1\x6e\xaf\x41\x30\xba\x7f\x26\x68\x9d\xbb\xa5\
-\x0d\x12\xca\x39\x01\x77\x1c\xc6\x88\x64\x04\xe5\x0d\xe8\x8c\x21\
-\x47\x92\x1a\xfc\x7c\x03\x37\x7a\xac\x6b\x52\xfe\x5e\xe5\x7e\x73\
-\x5b\x84\x7d\xe7\x71\xec\x3d\x1f\x66\xab\xe9\xc0\xf7\x58\x65\xb0\
-\x3a\x63\xbc\x3e\xd2\x35\x0d\x28\xd2\x35\x46\xbb\x2e\x73\x9c\xd7\
-\x61\x93\x43\x53\x57\xff\xe6\x98\xc1\xd7\xe1\x08\xbb\x0e\x47\x8a\
-\xde\x2b\x7b\x04\x8d\xf4\x3d\x8e\x04\x33\x5f\x5a\x85\xfc\xd2\xb2\
-\x7a\xc8\xfc\xfe\xf4\x18\xf3\x47\x8f\x02\x5c\x1c\x6f\x46\x08\xd8\
-\x3c\x16\xc1\xe4\xb9\x50\xd0\xb9\xb7\x4b\x46\xb2\x46\xa8\xa2\x92\
-\xac\x11\x46\x53\xe9\x78\x4d\x4c\xa9\x7f\x7f\xad\x32\xd0\x1c\xc3\
-\x54\xf7\x51\x1b\x12\x5e\x19\xd2\x54\x8c\xc4\xa9\xe8\xf9\xd3\xd8\
-\xfc\x03\x10\x40\x00\xe4\x7b\x38\xcd\xfc\x26\x5e\xc8\xf5\xcf\x14\
-\x0c\x81\x7b\x05\xad\xef\xd3\x81\xde\xc1\x29\x93\x0d\x5f\xe4\xfe\
-\x2a\x2d\xd6\x31\x35\x17\x27\xe4\x47\x10\x7d\xde\x32\x8c\xcc\x09\
-\x28\x7f\x98\xff\x0f\xf7\xb3\x23\x91\x59\x25\xe5\x47\xf9\x3b\x46\
-\xf3\x1a\x86\x2a\xf5\xf7\x46\xa4\xea\x3e\x3e\x95\x87\xb3\x5e\x45\
-\xe5\x21\x87\xbc\xd4\x17\x4c\xcf\xb0\x3f\x6a\x3d\xc0\x3c\x24\x95\
-\x0d\x95\xe3\xa7\x82\xa0\x26\xc1\x5a\xd4\x25\x18\x82\x17\x08\x06\
-\xff\x75\x42\x6e\xf0\x41\x21\xaf\xe0\x31\x21\x2f\xf8\xd8\xc0\x63\
-\x00\xe5\x7f\x54\xc8\xf5\x3e\xc6\xe7\xba\xfe\xc1\x9b\x9c\x4f\xf1\
-\x06\xfb\x1a\x5e\x6f\x7b\x85\xd7\x59\x5f\x0b\xd3\xeb\xb2\xd6\xf1\
-\x5a\xeb\x1b\xa8\xf5\xa8\x37\x79\xad\xe5\xbf\xa8\xb7\x50\x6f\xf3\
-\x1a\x94\xd6\xb2\x81\xd7\xdb\x77\xf1\x7a\x84\x8c\x52\x46\x84\x8f\
-\xc9\xd5\x2f\xbd\xc9\x0d\x35\x06\x1f\x4c\x34\xf8\x61\x92\x21\x00\
-\x1d\xa6\x02\xe8\xce\x29\x86\xbe\x9c\x12\x98\x91\x53\x86\x2a\x8f\
-\xa0\xb2\x30\x95\x8a\xea\x13\x55\x12\x45\x13\xfa\xd5\xab\xd0\xc0\
-\xe7\x4b\xa2\x8a\xbe\xaf\x33\x77\x02\x74\xe4\x16\x41\x5b\x4e\x01\
-\x4c\x34\x06\xa0\x0e\xaf\xb9\x5a\xef\x85\x2a\x54\x25\x49\xe7\x19\
-\x25\x79\xc5\xdf\x3d\x09\x5f\xa7\xa9\xb9\xc5\x78\x5d\x25\xfd\xd7\
-\x46\x9f\x6b\xc4\xd7\xb1\x46\xef\x93\xae\x4b\xa7\xee\x75\x95\xa0\
-\x8a\x51\x13\xf0\xf7\xd8\xf4\x6e\xe0\x0c\xf8\xde\xea\x63\x6a\x17\
-\xaf\xb3\x6d\xc0\x7b\xe7\x6d\x51\x5a\xeb\x3b\x78\x9f\xbc\x8b\xf7\
-\xcb\x06\xd4\x46\x5e\x63\x1e\x2a\xad\xfd\x5d\xc1\xe0\x5d\x87\xf7\
-\xea\x0b\xd8\x99\x7d\xa2\xae\xf9\x3d\x0a\xf3\x8b\xf3\x66\x99\xd3\
-\xf3\x47\x04\x41\x6e\x81\x54\x1c\x94\xaa\x00\x1b\x91\x60\x7b\x97\
-\xf1\x42\x4d\x55\xbe\x50\x59\x61\x19\x50\xa5\xac\x2a\x54\xb5\x45\
-\x28\xab\xb4\x0a\xc1\x12\xbb\xe0\xf0\x3b\x79\xb3\xc7\x8d\xc3\x0a\
-\xcf\x10\xe5\xa2\x72\x9c\x5e\x04\x05\xca\xe1\xe5\x8d\x0e\x1f\x02\
-\x63\x40\x5a\x8b\x97\xb7\x16\xb6\x08\xbe\xaa\x0f\x50\x30\x58\xd5\
-\x20\xf8\x25\x71\xa8\x80\xb7\x16\xfe\x93\x33\x15\x3e\x36\x76\xc1\
-\x76\x53\x17\xec\x30\x4d\x87\x4f\x73\xa6\xc3\x67\x39\xdd\x69\xa5\
-\x4f\xf0\x9a\x76\xa0\x3e\x46\x6d\xc3\xeb\xfc\xc8\xd4\x09\x1f\x1a\
-\xc7\x46\xf4\xbb\xb7\xe7\x74\x89\xd7\xf3\x89\x2c\xfa\x98\x3e\xb7\
-\x75\x94\xae\x6d\x33\xea\x69\x7d\x27\xfc\x03\xf5\x2f\x5d\x27\x1c\
-\x95\xdb\x02\x9c\xad\x0a\x78\x6b\x75\x0c\x55\x7d\xc0\xe7\x17\x35\
-\xf3\x26\x3b\xdd\x3b\x3e\xbc\x77\xfc\x78\xbf\xf8\xb1\xa3\x09\x20\
-\x0c\x50\x96\xa1\x32\xd8\x7c\xbc\xdb\xe7\xc7\x68\xf6\x74\x41\xeb\
-\xf9\x5c\xbd\xf0\xdf\xa3\x18\x2a\x8b\x55\x87\xe5\x9e\x3f\x43\xcd\
-\x3f\x04\x06\x13\xca\x38\xa1\xa4\x9c\x13\x8a\xf0\xb1\xb0\x34\xba\
-\x82\x54\x0b\xbd\x80\xe3\xad\x5e\x69\x4e\x21\xc7\x39\x54\x26\x87\
-\x24\xa3\x43\x2e\x42\xda\xbf\x0c\x29\x4a\xb0\x22\x74\x82\xf5\xfe\
-\xe1\x0f\x06\xa9\x85\x42\x5f\x03\x6c\xc1\x9b\x97\xd5\xd7\xcf\x2c\
-\x7d\x6e\xe8\x81\xd7\x75\x3d\xf0\x2a\x6a\xbd\xae\x17\x4e\xc9\x6d\
-\x43\x00\xd4\x02\x1f\x5b\x9b\x79\x7b\xbd\x1f\x21\x20\xdd\x3b\x24\
-\xba\x67\xa8\x9e\x85\xd6\x2a\x25\xb4\x29\x95\xe3\x92\xee\x5d\xa3\
-\xff\x48\x1c\xc2\xee\x50\xaf\xf7\x77\x0f\x9a\x27\xc3\xa1\xb2\x6c\
-\x7e\x1f\x47\x62\x6d\xa4\xb0\x89\xfb\x68\x30\x02\x40\x3d\x6c\x66\
-\x00\xc8\x28\xed\x45\x6d\xd2\xf7\xc0\xcb\x68\xfe\x57\x50\x6f\xa0\
-\x4e\x8e\x17\x00\xb6\xda\x20\x6a\x98\x92\xf6\x18\xb1\x3a\x8a\x38\
-\x61\x72\xa3\x0e\xcd\x7f\x14\xaf\x71\xed\x50\x2f\xb5\xdd\x3d\x78\
-\xfe\x4b\x63\x47\xf3\x7b\x9d\xf8\xfb\xd0\xfc\x5e\x66\x66\xb5\x01\
-\x50\x80\x11\xc0\xe6\x5c\x06\x80\x4c\xd2\xd7\xd8\xfb\xaf\x93\xcd\
-\x4f\x5a\x97\x42\x00\x88\xe6\xa7\xc3\x6c\xbc\x74\x96\x45\xe0\x7c\
-\x34\xff\x4e\xd5\x0e\x05\x0d\x37\xbf\x60\x59\x85\x00\x70\xf2\x1a\
-\x27\x9d\x48\xc4\x8c\x3c\x5a\x00\xd8\xc4\x00\x90\x51\xbd\xff\x16\
-\xfd\x80\xf9\x25\x00\xf4\xc2\x49\xf9\x93\x81\xb3\x27\x07\x80\x7e\
-\xf3\x7b\xd0\xfc\xa6\xc0\x0a\x34\xe1\xd7\x82\xe0\x1a\x25\xf3\xd3\
-\x41\xa4\x56\x3a\x8b\x90\x4e\x22\x62\x26\x66\x00\x60\x8a\x36\xf6\
-\x57\xf6\xfe\xa4\xd7\xf4\xbd\x70\x9c\x7d\x0a\x70\xce\xc4\x01\x30\
-\xa8\xe7\x97\xcd\xaf\x5e\x1a\x7b\x24\xf3\xd3\x41\xa4\x16\x8e\xc4\
-\xda\x28\x03\x60\x63\x1e\x03\x40\x26\xe8\x4b\x34\xff\x7f\xc3\xcc\
-\x4f\x7a\x15\x01\x70\x84\xbd\x3d\xe1\x08\x60\xb0\xf9\x83\x17\x48\
-\xe6\x57\x2b\x7d\x3d\x9a\xf9\xa5\xb3\x08\x59\x1b\x6d\x00\xf8\x1b\
-\x60\x43\x5e\x37\x33\x58\x9a\x6b\x27\x9a\xff\xcd\x08\xe6\x17\x85\
-\x00\x58\x62\x9d\x92\xd0\x1c\xc0\x40\xd8\x3f\x81\xcc\x8f\x3d\xbf\
-\xfb\xeb\x94\x1e\xef\xc5\xcc\x9f\xde\x00\x08\x22\x00\xde\x63\x00\
-\x48\xeb\x31\xff\x0e\x83\x34\xd3\xff\x4a\x14\xbd\x8c\x00\x38\x2c\
-\x01\x00\x88\xf9\x29\xe6\xfe\x9e\x7f\xb9\x64\x7e\xab\x4a\xc7\x7f\
-\x33\xf3\xa7\xed\x10\x60\x03\x9b\x03\x48\x4b\xed\x41\x6d\xd5\x4b\
-\xeb\xfd\xaf\xc4\xd0\x7f\x10\x00\x87\x58\x27\x8f\x08\x00\xa2\xf9\
-\xa9\xf7\xb7\x15\x99\x05\x63\xf0\x1a\xc9\xfc\x16\x95\xb6\xaf\x2b\
-\xd7\xf9\x99\xf9\xd3\x2b\x02\xf0\x51\x04\xc0\x00\x90\x6e\xfa\x16\
-\xb5\x59\x2f\x25\xfa\xbc\x32\x8c\x5e\x42\x00\x2c\x18\x29\x00\xc8\
-\xfc\xf6\xa2\x7c\x34\xff\x75\x18\xee\xef\x0a\x6d\x52\x4b\x7d\xe8\
-\xef\x61\xe6\x4f\x67\x00\xf8\x71\x08\xf0\x86\x99\x01\x20\x9d\xf4\
-\x15\x86\xfc\xef\xe8\x87\x37\x7e\x48\x2f\xe2\xf7\xce\xb3\xc6\x9f\
-\x07\x20\x58\xca\x42\x3d\xff\xf5\x68\xd0\xef\x42\x9b\xd1\x52\xbf\
-\xde\xef\x65\xe6\x4f\x77\x00\x78\x11\x00\xaf\x30\x00\xa4\x4d\xc8\
-\xff\x89\x81\x52\x7b\xe3\x37\x3f\x45\x08\x6b\x10\x00\x73\x2c\x93\
-\xe2\x04\x40\x9d\x5f\x70\x16\xe6\x0c\xee\xf9\xcd\x2a\x8c\xfb\x95\
-\xbb\xfa\x98\xf9\xd3\x16\x00\x1e\x7f\x3d\xfc\x87\x01\x60\xcc\xf5\
-\x1d\xea\x03\x34\xf2\x6b\x23\x30\x7f\x08\x00\xcf\xe1\xcf\xf5\x58\
-\x5b\xe3\x01\xc0\x26\xde\x56\x59\x85\xe6\xff\x89\xa0\xf5\x7c\x3b\
-\xd0\x3b\xa7\x7a\xdc\xef\x93\xb7\xb9\x33\xf3\xa7\x35\x00\x78\x94\
-\x0b\x01\xf0\xbc\xb9\x8b\x99\x70\x8c\xd7\xf7\x47\x12\xf2\x87\x03\
-\xe0\x09\x43\x37\xd4\xda\x9a\xe3\x00\x40\xcd\x76\xc1\x54\xb8\x12\
-\x43\xfd\x6f\x06\xcc\x6f\x53\x61\xbd\xdf\xc9\xcc\x9f\x29\x00\x30\
-\x04\xeb\xe0\x0f\xf6\xa9\xcc\x88\x63\xa0\xdd\x34\xcb\x3f\xcc\x12\
-\x5f\x3c\x00\x78\xcc\xd4\x03\x7e\x5b\xe3\x30\x00\xa8\x01\x21\xaf\
-\x64\x2f\xaf\x71\xed\x19\x58\x8e\x53\x63\xdc\x3f\x68\xb9\x8f\x99\
-\x3f\x9d\x01\x10\x1a\x06\xfc\xc8\xd5\x0e\x60\xea\x65\xa6\x1c\xe5\
-\x5e\xff\xbd\x38\x67\xf9\x63\x89\x86\x0c\xf7\xe5\xf6\x80\xd3\xd6\
-\x10\x03\x00\x68\xfe\xdc\x22\xda\x69\x17\x56\xf1\xc7\xa9\x42\x1d\
-\x3f\x1b\x33\x7f\xa6\x01\x60\x96\xb7\x19\xb6\xe5\xb0\x64\xa0\xd1\
-\x1a\xeb\x7f\xa4\x4f\xae\xd7\x0f\x07\xc0\x49\x79\x93\x41\x88\x61\
-\x7e\x3e\xb7\x10\xcd\x6f\x05\xb5\xcf\xac\x90\x4a\xdd\x31\xf3\x67\
-\x14\x00\x42\xba\xcc\xd6\x26\xae\x3d\x33\x93\xaa\x17\xee\xd3\x0c\
-\xff\xdb\xfa\xd4\x18\xff\x55\xd9\xfc\x57\x9b\x3a\xc0\x6e\xad\x8f\
-\xdc\xfb\x53\x15\x20\x53\x00\xcd\x1f\x5e\x6f\x32\xd5\xeb\xfd\x3e\
-\xb9\xc2\xb0\x85\x99\x3f\x13\x01\x40\x73\x01\x66\x7f\x1d\x1c\xe9\
-\x6c\x81\x8f\xa8\x38\x88\xa9\x8f\x99\x36\x85\xa9\xbc\x94\xc7\xbf\
-\x41\x3f\x50\xc1\xe7\xb5\x24\xf4\xba\xbc\xfd\xf7\x25\x7c\xbe\x2b\
-\x73\x86\x31\xbf\xd1\x1f\xb1\x02\x70\x6a\xc7\xfd\x03\xe5\xbb\x99\
-\xf9\x33\x38\x02\xe0\xe5\xe1\xc0\x0c\x1c\x0e\xac\x70\xb7\xc3\xcf\
-\x1d\x1d\xf0\x88\xb5\x13\xd6\x9a\xbb\xe0\x65\xf3\x74\x78\xcd\xdc\
-\x0d\xeb\x50\xeb\x51\x6f\x9a\x7b\xe0\x2d\xd4\xdb\xa8\x77\x50\xef\
-\xa1\x36\xe5\x4d\x17\x0b\x8b\x84\xb4\x29\xbf\x5b\x94\xf8\xff\x9c\
-\xec\xd3\xfb\xa8\x0d\xa8\x17\x4d\xd3\xe1\x31\xe3\x74\x78\xc4\xd8\
-\x0d\xab\x11\x06\x8f\x98\x48\xbd\xf0\x70\x4e\x2f\xfc\x9d\x94\xdb\
-\x07\x0f\xa1\x1e\xcc\xeb\x83\x07\x50\xf7\xa3\xee\xcb\xeb\x85\x7b\
-\x50\xab\xf2\x7a\xe0\x4e\xd4\x6d\x79\xdd\x70\x33\xbe\xbe\x2b\x73\
-\xba\xe0\x37\x39\xd3\xe0\xb4\xfc\x76\x98\x67\x99\x04\x66\x6b\x5d\
-\x74\xf3\x1b\xbc\x51\x2a\xfd\x3a\x52\xbc\xd6\xef\x90\xc7\xfd\x16\
-\x66\xfe\x4c\x06\x80\x72\x4e\x80\xa4\x09\xd6\x81\x35\x50\x2f\xe6\
-\x09\x50\xb2\x10\xc9\x87\xf2\xcb\x0a\xc8\x0a\xca\xa2\x3d\x05\x83\
-\xe4\x97\x85\x1f\x53\xd9\xb1\x6c\x54\x01\xca\x87\xf2\xba\xf1\xf5\
-\xb3\xa1\xac\xd2\xa3\xa7\x5f\x8d\xa2\xdc\xb2\x5c\x76\x49\x4e\x94\
-\xc3\xde\x00\x76\x94\x0d\x65\x45\x99\xf1\xfb\xad\xb6\x7a\xc8\xb7\
-\x49\x3d\x7e\x48\x23\x33\x7f\x2a\x0f\xac\xf5\x2a\x0e\x58\xb1\xa2\
-\xf9\xf3\x99\xf9\xc7\x03\x00\xc2\xa3\x02\x5e\x01\x05\xa6\x11\xca\
-\x8f\x72\xd7\x8a\xfb\xf4\x95\xa6\x4d\x56\x51\x97\xfa\x62\x9a\x3f\
-\x95\xe3\x7e\x8f\xf2\xf4\x27\x66\xfe\xf1\x0a\x00\xa6\x24\xe4\x43\
-\x43\x0e\x5f\xa1\x27\x75\x8a\x69\x7e\x4b\x0a\x53\x7d\xdd\x8a\x13\
-\x84\xec\x68\x7e\x0b\xab\xe4\xc3\x00\xc0\xd4\x2f\xec\xf5\x05\xec\
-\xf5\x79\x7b\xba\x98\x3f\x95\xe3\x7e\xb7\xe2\x08\x31\x07\x9a\xdf\
-\x86\xe6\xb7\x71\x54\xc7\x8f\x35\x06\x00\xa6\xd1\xee\xf5\xe3\x32\
-\x7f\xaa\xd6\xfb\x5d\x61\xe6\x77\xa0\xf9\xed\x1c\x89\x35\x06\x80\
-\xac\xef\xf5\xf9\xd1\xee\xf5\xe3\x32\x7f\xaa\xf2\xfc\x5d\xfd\x07\
-\x88\x0a\x1a\xc7\x2a\x8c\x04\x9c\x82\xc6\x89\xe6\x77\x30\xb3\x31\
-\x00\x64\xb9\xbc\x68\x44\xc7\x28\x1b\x3f\x2e\xf3\xa7\x66\xd2\x4f\
-\x5a\xe3\x0f\x9d\x1e\x6c\x47\xf3\x7b\x9c\x54\xb3\x9f\xd5\xed\x67\
-\x00\xc8\xfa\x70\x5f\x70\x8d\x81\xf1\xe3\x32\x7f\x2a\x92\x7d\x7c\
-\xca\xd4\x5e\x71\xa9\x0f\x4d\x2f\xf6\xfc\xcc\xfc\x0c\x00\xd9\x6d\
-\xfc\xb1\x08\xf7\xe3\x36\xbf\x59\xdc\x8e\x9b\xbc\xf9\x1d\x83\x4f\
-\xec\x11\x27\xfc\xec\x2c\xec\x67\x00\x18\x3b\xf1\xfe\x1a\xe0\x7c\
-\xd5\xc0\x79\xc3\x55\x15\x5b\x9e\x08\x12\xbf\x26\xff\xbc\x4f\x21\
-\xf9\xd4\x64\xce\x57\x25\xfe\x5f\x9c\xd5\x1f\xab\xd9\xfd\x04\xcc\
-\x9f\x7c\x71\x8f\x70\xf3\x2b\x0f\xed\x60\xb3\xfd\x0c\x00\x63\x24\
-\xce\x57\x03\xe6\xf2\x56\xe8\x5b\x70\xd8\xde\xf9\x4b\x8f\x81\x43\
-\x8e\x3e\x0e\x0e\x3d\xf6\x78\x38\xfc\xb8\x13\x60\xf1\xf1\x27\xc2\
-\xd2\x13\x4f\x86\x23\x4f\x3e\x05\x8e\x39\xe5\x54\x38\xee\xd4\xd3\
-\xe0\xf8\xd3\xcf\x80\x13\xcf\x3c\x13\x4e\x3e\xfb\x6c\xf8\xc1\x0f\
-\x7f\x08\xa7\x9f\x7b\x2e\x9c\x79\xfe\x79\x70\xf6\x85\x17\xc0\x39\
-\x17\x5f\x08\xe7\x2d\xbb\x08\xce\x5f\x7e\x31\x5c\x70\xc9\x32\xb8\
-\xe8\xd2\xe5\x70\xd1\x25\xcb\xe1\xfc\x8b\x56\xc0\x59\xa7\xae\x80\
-\x93\x97\xae\x80\xa3\x0f\xba\x10\xea\x1b\xe7\x01\xe7\xa8\x91\x66\
-\xf6\x1d\x63\x68\xfc\xb8\xcd\x6f\x57\xc9\xfc\x2c\xc9\x87\x01\x60\
-\x8c\xcd\xef\xaa\x9d\x02\xbf\xba\xf1\xe7\xf0\xde\xeb\x4f\xc3\xe6\
-\x37\xff\x0d\x5b\xfe\xfb\x2c\x7c\x40\x7a\xeb\x39\xf8\xf0\xed\xe7\
-\xe0\xa3\xb7\x9f\x87\x8f\xde\x79\x1e\xb6\xbe\xf3\x02\x6c\x7b\x97\
-\xb4\x06\xb6\xbf\xb7\x06\x3e\xde\xf0\xa2\xa8\x1d\x1b\x5f\x82\x4f\
-\x50\x9f\x6e\x5a\x0b\x9f\x6e\x5e\x0b\x9f\xc9\xda\xf1\xde\x5a\xd8\
-\xb2\x76\x2d\xbc\xf9\xd0\x5a\x58\x7b\xeb\x5a\x78\xf6\x86\xb5\xf0\
-\xcc\x75\x6b\xe1\xe9\x6b\xd7\xc2\xaa\x65\x0f\xc3\xd4\xb6\xc5\xc0\
-\x59\x6b\x32\xc0\xfc\xc9\xce\xf8\x33\xf3\x33\x00\xa4\x69\xd8\x9f\
-\x5f\xd6\x82\xe6\xbf\x1e\x4d\xfc\xa2\x6c\xe8\x35\x92\xde\x93\xb4\
-\x7d\x24\xda\x20\x3d\x7e\xb8\x6e\x0d\xbc\xfd\xc4\x1a\x78\xe9\x8e\
-\x35\xf0\xf4\x2f\xd6\xc0\x13\xd7\xa0\xae\x96\x1f\x65\x3d\x85\x10\
-\xf8\xf5\x99\x77\x81\x2d\x30\x65\xec\x20\x10\x97\xf9\x93\x9d\xf1\
-\x67\xe6\x67\x00\x48\xd7\xde\x1f\xc7\xe8\x73\x0e\x5d\x02\x9b\xd6\
-\x3f\x23\x9a\x7f\xfb\x48\x0d\x1f\x66\xfc\x2d\xaf\xae\x81\xf5\x8f\
-\xac\x81\xe7\x6f\x5e\x03\x4f\xfe\x6c\xa8\xe9\x95\xfa\x17\xea\xd1\
-\xab\x9e\x85\x99\x9d\xc7\x01\x67\xa9\x4e\x53\xf3\x27\x3f\xe3\x3f\
-\x78\xb6\x9f\x99\x9f\x01\x20\xcd\x00\x70\xce\x45\x17\xee\xfd\x64\
-\xd3\x4b\x49\x1b\xff\x8d\x87\xd6\xc0\xb3\xbf\x45\x63\xff\x34\xb6\
-\xf1\x95\x7a\xf2\xa7\x2f\xc1\x15\xdf\xbf\x09\x72\x3c\x2d\xc0\xd9\
-\x6a\xd2\xcc\xfc\xa9\x98\xf1\x77\xb2\x1a\x7e\x0c\x00\xe9\x1a\xfe\
-\xd7\x42\xce\x84\xa6\xbd\x37\xdd\xf4\xcb\xdd\x34\x7e\x4f\x04\x00\
-\x14\xea\x53\x8f\xff\x1c\x1a\xff\x89\x11\x18\xbf\x3f\x0a\xf8\xe9\
-\x8b\x70\xc7\x85\x7f\x83\xe0\x84\x9e\xd1\x1d\x06\x98\x82\xc3\x9a\
-\x3f\xf9\x19\x7f\x17\x33\x3f\x03\x40\x7a\x8f\xff\xad\x95\x93\xf6\
-\xde\x77\xcf\xca\xdd\x3b\x46\x02\x00\xec\xf5\xb7\xbe\xbd\x06\xde\
-\x79\x72\x0d\xbc\xf0\x07\x34\xf1\xb5\x23\x37\xbe\x12\x00\x77\x2f\
-\x5f\x0d\x15\x55\xfb\x21\x00\x46\x69\x18\x90\x5f\x1a\xa1\x86\x5f\
-\xaa\x67\xfc\x59\xf5\x5e\x06\x80\x0c\xd1\x8a\xcb\x2e\xdd\x1b\x77\
-\x04\xb0\x41\x0a\xf7\x5f\xb9\x77\x0d\x3c\x75\x7d\xe2\xc6\x57\x02\
-\xe0\xb7\x67\xdf\xbb\xd7\x1e\x68\x1f\x9d\x08\x80\x7e\x87\x81\xf6\
-\xdb\xe7\x0f\x33\xe9\xe7\x4d\xd5\x91\x5d\xcc\xfc\xe3\xad\x61\xe8\
-\x4c\x0a\x0a\xfe\x9a\xf7\xc7\xc3\x1c\xc0\xbc\xc5\x47\xc1\xa6\x37\
-\xe2\x98\x04\x7c\x77\x0d\xbc\xf7\x2c\xf6\xfa\x37\x27\x67\xfa\xf0\
-\x39\x80\xd3\x16\x5d\x09\x1a\x7b\xdd\xe8\xf4\xfe\xe6\x8a\x61\x7a\
-\x7f\x4b\x0a\x66\xfc\xed\xcc\xfc\xe3\xb9\x15\x35\x4d\xe5\xca\x27\
-\x4d\x77\x9b\x4b\x27\xfe\x67\x3c\x2c\x03\xda\xab\xda\xf6\xde\xb3\
-\xea\xd6\x98\x13\x81\xdb\xde\x59\x03\x6f\x3d\xbe\x06\x9e\xb9\x21\
-\xf9\x5e\x7f\x60\x15\xe0\x45\xf8\xcb\xa5\x8f\xc3\x94\xd6\xc3\x46\
-\x69\x15\x00\x21\x93\x53\x30\xcc\xa4\x9f\x8b\x95\xee\x66\x2d\x76\
-\x9b\x7f\xc8\x22\xee\xda\xcb\x2f\xd0\x3b\x2b\x5b\x6f\x19\x1f\x89\
-\x40\xd5\xd0\xb7\xe0\x50\x78\xf5\x85\x47\xc5\x64\x9e\x50\x72\x4f\
-\x48\xdb\xde\x79\x11\xfe\xbb\xfa\x45\x78\xfa\x17\x2f\xa2\x71\x5f\
-\x14\xc3\xf6\x64\x45\x00\xf8\xeb\x65\xff\x82\xc3\xf7\xfb\x21\xe8\
-\x1c\x0d\xa3\x34\xf9\x57\x27\x4f\xfe\xe5\xab\x3d\xee\x67\xe6\x1f\
-\xcf\x6d\xee\xfc\x83\xc4\x47\x6b\xe9\xc4\x2b\x35\xc1\xf1\xb3\x0f\
-\x80\x20\x70\xf7\x5d\xb7\xc0\xfa\xb5\xff\x84\x77\x5f\x7f\x0a\x36\
-\xae\x7b\x1a\x36\xbe\xfe\x34\xbc\xfc\xb7\xa7\x61\xf5\xd5\x4f\xc3\
-\x43\x57\x3c\x25\xea\x6f\x57\x3c\x29\xeb\x5f\xf0\xe0\xe5\xff\x82\
-\xbf\x5e\xfe\x04\x3c\x70\xd9\x3f\x07\xe9\xfe\x1f\x3d\x0e\xf7\x5d\
-\xfa\x0f\xb8\xf7\x92\xc7\xe0\xde\x15\x8f\x8a\xba\x47\xd4\x6a\x58\
-\xb5\xec\x11\xf8\xfd\x39\x7f\x86\xf9\x7d\x3f\x00\x83\xab\x69\x14\
-\x67\xff\x43\x11\x40\xbe\x0a\xa1\xbf\x97\x95\xee\xce\x96\x76\xd8\
-\xd2\x23\x38\x4b\x69\x13\x37\xa1\xa9\x63\xa1\xae\xa0\xee\xeb\xf1\
-\xb4\x1f\xc0\x56\x39\x09\x26\xef\x7b\x20\xcc\x5a\xf8\x3d\xd8\xef\
-\x90\x25\xb0\xdf\x81\x4b\x61\xfa\xb4\x25\xd0\xd1\xf6\x3d\x68\x9f\
-\x74\x38\x4c\xc6\x70\xbd\xad\x65\x11\xb4\x34\x1f\x02\x2d\x13\x17\
-\x42\xf3\xc4\x83\xa1\xa9\x71\x01\x34\x34\xcc\x87\xfa\xfa\x03\xa1\
-\xae\x6e\x1e\xd4\xd4\xee\x0f\x55\x35\x73\xa1\xa2\x7a\x36\x94\x55\
-\xed\x07\xa5\x95\xfb\x42\x49\xc5\x3e\x50\x5c\x3e\x0b\x8a\xca\x66\
-\x42\xb0\xa4\x17\xec\xc1\x0e\x10\x6c\x75\xa3\xbb\xf6\x1f\x33\x02\
-\x48\xa6\xa2\x2f\xfd\x9c\x03\x74\x5a\xc7\x03\x1c\xcf\x0a\x78\x8e\
-\xfb\xb6\xf0\xf0\xc5\xe8\x95\xc9\x5c\x69\xf3\xb4\x42\x63\x51\xc3\
-\x9b\xe3\x6e\x47\x20\xed\xe0\x73\xa1\x6c\xd5\xe2\xd8\x3c\xa2\xac\
-\x23\x55\xcd\x10\x8d\x7e\xea\x6f\xac\x08\x20\xf1\x84\x1f\x1e\x43\
-\x7f\xbd\x31\xf8\x45\x4d\xd1\x3e\xb3\x5d\xb6\x3a\x66\xfe\x6c\x68\
-\xd3\x66\xce\xe5\xee\xfc\xf9\x55\x82\xb3\xb2\xf5\x2a\xaa\xf1\x3f\
-\xae\x2a\xf0\x38\xc7\x78\x67\x9e\xea\x39\x00\x96\x14\xa6\xfb\xfa\
-\x80\x37\x04\xc0\xe2\x6e\xfe\x47\x47\xcb\xf7\x6c\x35\x55\x73\x98\
-\x39\xb2\xa1\xe5\x19\xbc\x5c\xa0\xa6\x8d\xab\x6c\xed\xac\x37\x15\
-\x35\xbc\x37\x2e\xea\xee\xb9\xc6\x78\x3f\xfe\x68\xa5\x00\xeb\x9c\
-\x11\xd6\xfd\x13\x0b\xff\x79\x63\x21\xe8\xed\xf5\x5f\x16\x16\xf5\
-\x2e\xe2\xb8\x0a\xee\xcc\x25\xe7\x30\x73\x64\xc5\x30\xe0\x8c\x33\
-\xb8\xce\x99\x73\xb8\xd5\xbf\xbf\x8e\xf7\xd5\x4e\x3e\x5b\x5f\x50\
-\xff\x3f\x56\x77\x2f\x43\x94\x5b\x9c\x9a\xf1\xbf\xb1\x18\x04\x1c\
-\xca\x78\x03\x5d\x37\x1f\x39\x75\x45\x4e\x4f\xc3\x31\xdc\x81\x33\
-\x8e\x62\xe6\xc8\x96\xd6\xd8\xd1\xc7\x4d\xed\xdb\x8f\x5b\xb8\xf0\
-\x90\xfc\x92\xe6\x69\x37\x1a\x8a\x1a\xf6\xf2\xac\xc6\x7e\x66\x44\
-\x01\x83\x36\x02\x25\x70\xb0\x07\x9a\x9f\xb2\x0a\x73\x7d\x13\x9f\
-\xac\x9d\xd8\x57\x5e\x56\xd6\xc7\xd5\x9a\x0f\x61\xa6\xc8\xbe\xa6\
-\xe1\x26\x75\xf6\x71\x07\xcc\x5f\x10\x28\x6b\x99\xb6\x8a\x20\xc0\
-\xc6\xfa\x99\x0a\x01\x77\x9c\x61\x7f\x91\xf8\xf3\x16\xcf\x94\xd7\
-\x9a\xea\xe7\x4e\x31\x19\x3b\xb8\x3b\x57\x5d\xc2\x75\x2f\x5c\xc8\
-\xec\x90\x6d\x6d\xc1\xe1\x87\x73\x7f\x5e\x75\x2d\xd7\x39\x63\x36\
-\x37\x77\xde\x81\xc1\xd2\xe6\x69\xbf\xd3\x17\xa6\xf1\x70\x20\x74\
-\xb8\x86\x3d\x8b\xcd\x3f\x6c\x24\x10\x65\x38\xa0\x25\xf3\x17\x83\
-\xce\x56\xbf\xd7\xea\x9f\xf4\x8f\xba\x9a\xd9\x93\xb8\x7c\x8e\x3b\
-\x66\xfa\x45\xdc\xec\x79\xf3\x99\x19\xb2\xb5\xcd\x98\x33\x87\x5b\
-\xfb\xc0\x5d\xdc\xa4\xae\x5e\x6e\xd1\xa2\xc3\xf2\x3d\xd5\x6d\xa7\
-\xd2\xc4\x60\x5a\xad\x0e\x78\xe5\x32\xdb\xcc\xf8\x43\x21\x90\x53\
-\x08\xbc\xce\xa1\x58\x1d\xb0\x81\x20\xb8\x07\x36\x04\x69\x03\x20\
-\x18\x0a\x41\xc8\x2f\x87\x1c\x77\xe3\xd6\xa2\xe2\x9e\x1f\x4f\x6f\
-\x5b\x18\x34\x6b\x7b\xb9\x63\x7b\x2e\xe2\x0e\xa8\xfe\x21\x33\x41\
-\xd6\x4f\x0a\x2e\x5c\x8a\xff\xea\xb8\x69\x18\x09\xc0\xfa\x67\xf8\
-\xca\xd6\xae\x06\x47\x45\xcb\x95\xc6\xc2\xfa\xf5\x18\x11\x7c\xa5\
-\x2b\xa8\x1b\x9b\x31\xbe\x87\xf5\xf8\x71\x83\x20\xbf\x44\xca\x13\
-\x40\x20\x08\x39\x13\x50\x25\xa0\xc9\x2d\x05\xbd\xb5\x66\x97\xc9\
-\xd1\xf4\xbe\xc3\xd7\x71\x6b\x75\xfd\x8c\xae\xb3\x8f\x38\x53\x37\
-\xb1\x61\x36\x77\xd9\xf5\xdf\xe7\xe6\x1c\x70\x10\xbb\xf9\x59\x1b\
-\x68\x75\x53\x7a\xb9\xf6\x9e\xd9\x5c\x41\xfd\x14\x0e\x3e\x79\x86\
-\x2f\x6d\x9a\x5a\x54\x37\xa5\x67\xbe\xb3\xbc\xf9\x7c\x5d\xa0\x76\
-\xb9\xd6\x5f\xb3\x42\xa3\x90\x30\x48\xb5\x92\x02\x29\x10\x3d\x8f\
-\xab\x76\x05\x1a\x7f\x05\xde\xe0\x4c\xb1\x64\xaf\x59\xc1\x3b\xf0\
-\xf5\x42\x69\xe8\xd1\x89\x8f\x28\x2d\x2a\xc7\xd3\xb8\xac\xa2\x74\
-\xdf\x63\xea\x2b\x16\xd4\x1e\x3b\xf5\x47\xc6\x82\xe2\xe9\x5c\xdf\
-\xd4\x43\xb8\xe6\xfa\x39\x08\x7d\x36\xe6\x67\x2d\x62\x34\xb0\x90\
-\x2b\x6e\x68\xc7\x21\xc1\x4c\xce\x5b\x3d\x89\x2b\x6a\xec\xa0\x7d\
-\x03\x9c\x36\x50\xcb\x21\x00\x38\x8d\x42\xc2\x20\xd5\x4a\x0a\xa4\
-\x40\xf4\x3c\x9e\x5a\x0e\x6f\x6c\x0e\x6f\x72\xa6\x58\xb2\xd7\x88\
-\x12\x42\x72\x48\x42\x18\x70\x46\x57\x03\x17\x2c\xec\xe6\x8a\x0a\
-\x67\x72\xdd\xb5\xc7\xe0\xbb\xbb\x3f\x37\x7f\xfe\x12\x76\x93\xb3\
-\xc6\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\
-\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\
-\x6b\xac\xb1\xc6\x1a\x6b\xac\xb1\xc6\x1a\x6b\xe3\xa7\xfd\x3f\x0d\
-\xff\x88\x53\x57\xd4\xcb\x1c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x08\
-\x0a\x61\x42\x7f\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8c\xda\x7a\x34\x8f\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
-
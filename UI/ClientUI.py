@@ -1,19 +1,97 @@
-from os.path import join
 from platform import system
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QWidget, 
-                             QGridLayout, QPushButton)
+                             QGridLayout, QPushButton, QApplication)
 
-from Theme.icon_scrcpy import * 
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QTimer, pyqtSignal, pyqtSlot
 from Script.Utilities import Create_Elements as Create
 from Theme.Style_UI import black_theme, white_theme
-from Script.Utilities.Utils import connect_signal, update_data_file
+from Script.Utilities.Utils import connect_signal
+from Script.Utilities.Create_Alerts import create_alert
 from UI.Tabs.ConnectTabUI import ConnectTab
 from UI.Tabs.StartTabUI import StartTab
 from UI.Tabs.ConfigTabUI import ConfigTab
 from Script.Thread_Config_Tab import ConfigTAB_Thread
+from Script.Thread_Device_Tracker import DeviceTracker_Thread
+from Script.Thread_Mdns_Browser import MdnsBrowser_Thread
+from Script.Utilities.Command_Runner import cancel_all_runners
+from Script.Utilities.Task_Pool import task_pool
+from Script.Utilities.Scrcpy_Sessions import scrcpy_sessions
+from Script.Utilities.Reconnect_Watchdog import reconnect_watchdog
+from Script.Utilities.Settings_Store import settings_store, THEME_KEYS
+from Script.Utilities.Startup_Timer import startup_timer
+from Script.Utilities.Resources import resource_icon
 
 TAB_WIDTH = 570
+class LazyTabWidget(QTabWidget):
+    """
+    Represents a `QTabWidget` whose tabs are built the first time they are shown.
+
+    Each tab starts as an empty placeholder (see `add_lazy_tab`), so only the elements of the visible 
+    tab are created before the window is shown. The tabs add themselves with `addTab` when they are 
+    built, which puts them in place of their placeholder.
+
+    Signals
+    -------
+    - `tab_built` (`pyqtSignal(str, float)`): Emitted with the name of a tab and the time (in seconds) it took to build.
+    """
+    tab_built = pyqtSignal(str, float)
+
+    def __init__(self):
+        super().__init__()
+        self.builders = {}
+        self.building = None
+        self.currentChanged.connect(self.build_tab)
+
+    def add_lazy_tab(self, name: str, builder) -> int:
+        """
+        Adds a placeholder tab, built by `builder()` the first time it is shown.
+
+        Parameters
+        ----------
+        - name (`str`): The name of the tab, the built tab must add itself with the same name.
+        - builder (`callable`): The function that builds the tab.
+
+        Returns
+        -------
+        - `int`: The index of the tab.
+        """
+        placeholder = QWidget()
+        self.builders[placeholder] = (name, builder)
+        self.blockSignals(True) # the first tab added becomes the current one, without being shown yet
+        index = super().addTab(placeholder, name)
+        self.blockSignals(False)
+        return index
+
+    @pyqtSlot(int)
+    def build_tab(self, index: int) -> None:
+        """
+        Builds the tab `index` if it is still a placeholder (slot of `currentChanged`).
+        """
+        if (placeholder := self.widget(index)) not in self.builders:
+            return
+
+        name, builder = self.builders.pop(placeholder)
+        self.building = (index, placeholder)
+        build_time = startup_timer.total()
+        try:
+            builder()
+        finally:
+            self.building = None
+        self.tab_built.emit(name, startup_timer.total() - build_time)
+
+    def addTab(self, widget: QWidget, name: str) -> int:
+        if not self.building:
+            return super().addTab(widget, name)
+
+        index, placeholder = self.building
+        self.blockSignals(True)
+        self.removeTab(index)
+        self.insertTab(index, widget, name)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+        placeholder.deleteLater()
+        return index
+
 class Client(QMainWindow):
     """
     Represents the main application window containing all the tabs.
@@ -32,7 +110,7 @@ class Client(QMainWindow):
         self.setMinimumWidth(TAB_WIDTH)
         self.resize(TAB_WIDTH, 700)
         self.non_concurrent_buttons = []
-        self.setWindowIcon(QIcon(join(":", "icon.ico")))
+        self.setWindowIcon(resource_icon("icon.ico"))
         
         self.setWindowTitle("Scrcpy Client")
         self.start_ui()
@@ -41,10 +119,9 @@ class Client(QMainWindow):
         """
         Toggles the application theme between light and dark modes.
 
-        This function changes the application's theme based on the current theme 
-        state stored in the user data. It updates the theme's appearance, changes 
-        the button text to reflect the current theme, and saves the updated theme 
-        state to the configuration file.
+        This function changes the theme stored in the user data (see `Settings_Store`), 
+        the appearance and the button text are updated by `apply_theme`, which is 
+        subscribed to the theme.
 
         Parameters
         ----------
@@ -56,19 +133,18 @@ class Client(QMainWindow):
         - The dark theme is represented by a moon emoji ("\U0001f319") and the light 
         theme by a sun emoji ("\U00002600") on the button text.
         """
-        if self.userdata["Theme_Active"]:
-            charge_theme_button.setText("\U0001f319")
-            self.userdata["Theme_Active"] = 0
-            self.setStyleSheet(black_theme)
-        else:
-            charge_theme_button.setText("\U00002600")
-            self.userdata["Theme_Active"] = 1
-            self.setStyleSheet(white_theme)
-        
-        update_data_file(
-            self.userdata["Theme_Active"],
-            ["Theme_Active"],
-        )
+        settings_store.theme = 0 if settings_store.theme else 1
+
+    def apply_theme(self, theme: int) -> None:
+        """
+        Applies the theme to the window and the theme button (subscribed to the theme in `settings_store`).
+
+        Parameters
+        ----------
+        - theme (`int`): The active theme, `0` for the dark theme and `1` for the light theme.
+        """
+        self.charge_theme_button.setText("\U00002600" if theme else "\U0001f319")
+        self.setStyleSheet(white_theme if theme else black_theme)
     
     def save_scrcpy_version_if_linux(self):
         """
@@ -86,7 +162,29 @@ class Client(QMainWindow):
             self,
             
         )
+        self.terminal.scrcpy_version_error.connect(self.scrcpy_version_error_alert)
+        self.terminal.finished.connect(self.scrcpy_version_read)
+        self.version_start_time = startup_timer.total()
         self.terminal.start()
+
+    @pyqtSlot()
+    def scrcpy_version_read(self) -> None:
+        """
+        Records the time the thread took to read the version of scrcpy (slot of `ConfigTAB_Thread.finished`).
+        """
+        startup_timer.add("scrcpy version (thread)", startup_timer.total() - self.version_start_time)
+
+    @pyqtSlot()
+    def scrcpy_version_error_alert(self) -> None:
+        """
+        Warns the user that the version of scrcpy could not be read and closes the client 
+        (slot of `ConfigTAB_Thread.scrcpy_version_error`).
+        """
+        create_alert(
+            "Error",
+            "Error getting scrcpy version.",
+        )
+        self.close()
     
     def start_ui(self):
         """
@@ -101,22 +199,59 @@ class Client(QMainWindow):
         - `ConnectTab`: Manages all of Scrcpy's connection features. (e.g. connecting to Scrcpy via usb debug or wifi debug)
         - `StartTab`: Manages all Scrcpy and UI initialization functionalities. (e.g. starting Scrcpy with specific arguments) 
         - `ConfigTab`: Manages all Scrcpy settings or variants (e.g. by configuring the directory where Scrcpy is located) 
+        
+        The tabs are built the first time they are shown (see `LazyTabWidget`), starting with the 
+        tab shown when the app was closed, and the startup times are printed once the window is painted.
+
+        It also starts the `DeviceTracker_Thread`, which keeps the live `device_registry` up to date, and the
+        `reconnect_watchdog`, which connects the dropped Wi-Fi devices again (see `Reconnect_Watchdog`), the
+        `MdnsBrowser_Thread`, which keeps the wireless debugging endpoints advertised over mDNS (see `Mdns_Services`), and
+        cancels the running `adb` commands (see `Command_Runner`) and stops the `scrcpy` sessions 
+        (see `Scrcpy_Sessions`) when the app is closed, then writes the unsaved user data (see `Settings_Store`).
         """
         if system() == "Linux":
             self.save_scrcpy_version_if_linux()
         
-        self.tabs = QTabWidget()
+        self.device_tracker = DeviceTracker_Thread()
+        self.device_tracker.start()
+        QApplication.instance().aboutToQuit.connect(self.device_tracker.stop)
+        reconnect_watchdog.start()
+        QApplication.instance().aboutToQuit.connect(reconnect_watchdog.stop)
+        self.mdns_browser = MdnsBrowser_Thread()
+        self.mdns_browser.start()
+        QApplication.instance().aboutToQuit.connect(self.mdns_browser.stop)
+        QApplication.instance().aboutToQuit.connect(cancel_all_runners)
+        QApplication.instance().aboutToQuit.connect(task_pool.shutdown)
+        QApplication.instance().aboutToQuit.connect(scrcpy_sessions.shutdown)
+        QApplication.instance().aboutToQuit.connect(settings_store.flush)
+        task_pool.task_rejected.connect(self.task_rejected_alert)
         
-        # Create all the tabs
-        ConnectTab(self.userdata, self.non_concurrent_buttons, self.tabs)
-        StartTab(self.userdata, self.non_concurrent_buttons, self, self.tabs)
-        ConfigTab(self.userdata, self.non_concurrent_buttons, self, self.tabs)
-        self.setCentralWidget(self.tabs)
+        self.tabs = LazyTabWidget()
+        self.tabs.tab_built.connect(self.tab_built)
         
-        theme_icon = "\U0001f319" if self.userdata["Theme_Active"] == 0 else "\U00002600"
-        self.setStyleSheet(black_theme if self.userdata["Theme_Active"] == 0 else white_theme)
+        # Create all the tabs, each one is built the first time it is shown ↓
+        self.tabs.add_lazy_tab(
+            "Connect",
+            lambda: ConnectTab(self.userdata, self.non_concurrent_buttons, self.tabs),
+        )
+        self.tabs.add_lazy_tab(
+            "Start",
+            lambda: StartTab(self.userdata, self.non_concurrent_buttons, self, self.tabs),
+        )
+        self.tabs.add_lazy_tab(
+            "Config",
+            lambda: ConfigTab(self.userdata, self.non_concurrent_buttons, self, self.tabs),
+        )
+        self.tabs.setCurrentIndex(min(settings_store.last_tab, self.tabs.count() - 1))
+        self.tabs.build_tab(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self.save_last_tab)
+        self.setCentralWidget(self.tabs)
         
-        charge_theme_button = Create.Button(theme_icon, (33, 33), "ThemeButton")
+        charge_theme_button = Create.Button("", (33, 33), "ThemeButton")
+        self.charge_theme_button = charge_theme_button
+        with startup_timer.phase("stylesheet"):
+            self.apply_theme(settings_store.theme)
+        settings_store.subscribe(THEME_KEYS, self.apply_theme)
         corner_container = QWidget()
         layout = QGridLayout(corner_container)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -130,6 +265,30 @@ class Client(QMainWindow):
             charge_theme_button,
         )
         self.show()
+        startup_timer.mark("window")
+        QTimer.singleShot(0, self.report_startup)
+
+    @pyqtSlot()
+    def report_startup(self) -> None:
+        """
+        Reports the startup times, once the window was painted for the first time (see `Startup_Timer`).
+        """
+        startup_timer.mark("first paint")
+        startup_timer.report()
+
+    @pyqtSlot(str, float)
+    def tab_built(self, name: str, build_time: float) -> None:
+        """
+        Records the time a tab took to build (slot of `LazyTabWidget.tab_built`).
+        """
+        startup_timer.add(f"tab {name}", build_time)
+
+    @pyqtSlot(int)
+    def save_last_tab(self, index: int) -> None:
+        """
+        Saves the current tab, so it is the first one shown the next time (slot of `currentChanged`).
+        """
+        settings_store.last_tab = index
     
         
     
@@ -138,5 +297,18 @@ class Client(QMainWindow):
     
 
     
+    
+    @pyqtSlot(int, str)
+    def task_rejected_alert(self, task_id: int, task_name: str) -> None:
+        """
+        Warns the user that a task was not started because too many tasks are waiting (slot of `task_pool.task_rejected`).
 
-
+        Parameters
+        ----------
+        - task_id (`int`): The id of the rejected task.
+        - task_name (`str`): The name of the rejected task.
+        """
+        create_alert(
+            "Too Many Tasks",
+            f"Too many operations are already running, wait and try again ({task_name})",
+        )
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import (
     QScrollArea,
     QWidget,
@@ -8,6 +8,8 @@ from PyQt5.QtWidgets import (
 )
 from Script.Utilities.Utils import connect_signal
 from Script.ConnectTAB_Functions import DeviceList
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Settings_Store import settings_store, SCRCPY_PATH_KEYS
 import Script.Utilities.Create_Elements as Create
 
 class DeviceListUI(QScrollArea):
@@ -25,15 +27,26 @@ class DeviceListUI(QScrollArea):
     """
     def __init__(self, userdata: dict, parent = None):
         super().__init__()
-        self.path = userdata["Versions"]["Selected_Version"]["Path"]
+        self.path = settings_store.scrcpy_path
         self.userdata = userdata
         self.detected_devices = []
+        self.device_boards = {}
         self.parent = parent
         self.find_devices_widget_instance = DeviceList()
         self.terminal = None
         self.setWidgetResizable(True)
         
         self.start_ui()
+        device_registry.device_added.connect(self.device_added_event)
+        device_registry.device_removed.connect(self.device_removed_event)
+        device_registry.device_state_changed.connect(self.set_board_state)
+        settings_store.subscribe(SCRCPY_PATH_KEYS, self.set_path)
+
+    def set_path(self, path: str) -> None:
+        """
+        Keeps the path of the selected scrcpy version (subscribed to it in `settings_store`).
+        """
+        self.path = path or ""
     
     def start_ui(self):
         """
@@ -93,7 +106,7 @@ class DeviceListUI(QScrollArea):
         )
         return self.device_box 
     
-    def add_board(self, device_name: str, device_ip: str) -> None:
+    def add_board(self, device_name: str, device_ip: str, device_serial: str = None) -> None:
         """
         Adds a new device board to the device list UI.
 
@@ -104,6 +117,8 @@ class DeviceListUI(QScrollArea):
         ----------
         - device_name (`str`): The name of the device to add.
         - device_ip (`str`): The IP address of the device to add.
+        - device_serial (`str`, optional): The serial of the device, used to show its state 
+        on the board when it changes. Defaults to `None`.
         """
         self.content_layout.addWidget(
             self.create_device_board(
@@ -111,5 +126,31 @@ class DeviceListUI(QScrollArea):
                 device_ip,
             )
         )
+        if device_serial:
+            self.device_boards[device_serial] = (self.label_device_name, device_name)
         self.content.setLayout(self.content_layout)
     
+    @pyqtSlot(str, str)
+    def set_board_state(self, device_serial: str, state: str = "device") -> None:
+        """
+        Shows the state of a device on its board (slot of `device_registry.device_state_changed`).
+
+        Parameters
+        ----------
+        - device_serial (`str`): The serial of the device.
+        - state (`str`, optional): The new state of the device, nothing is shown for `device`. Defaults to `"device"`.
+        """
+        if device_serial in self.device_boards:
+            label_device_name, device_name = self.device_boards[device_serial]
+            state_text = f" [{state}]" if state != "device" else ""
+            label_device_name.setText(f"Name: {device_name}{state_text}")
+    
+    @pyqtSlot(dict)
+    def device_added_event(self, device: dict) -> None:
+        """Updates the board of a device that came back (slot of `device_registry.device_added`)."""
+        self.set_board_state(device["serial"], device["state"])
+    
+    @pyqtSlot(str)
+    def device_removed_event(self, device_serial: str) -> None:
+        """Marks the board of a device as unplugged (slot of `device_registry.device_removed`)."""
+        self.set_board_state(device_serial, "unplugged")
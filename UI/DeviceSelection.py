@@ -1,9 +1,7 @@
 from functools import partial
-from psutil import process_iter
-from os.path import join
+from contextlib import suppress
 
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt  
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import (
     QScrollArea,
     QGridLayout,
@@ -14,15 +12,32 @@ from PyQt5.QtWidgets import (
     QDialog,
 )
 
-from Theme.icon_scrcpy import * 
 import Script.Utilities.Create_Elements as Create
 from Script.Utilities.Utils import connect_signal
-from Script.Utilities.Utils import toggle_button_state
+from Script.Utilities.Utils import toggle_button_state, get_file_name
 from Script.Thread_Connect_Tab import ConnectTAB_Thread
 from Script.Thread_Start_Tab import StartTAB_Thread
 from Script.Thread_Config_Tab import ConfigTAB_Thread
 from Script.Utilities.Create_Alerts import create_alert
-from Script.Utilities.Utils import get_current_alert_theme
+from Script.Utilities.Utils import get_current_alert_theme, check_is_ip
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Device_Probe import device_label
+from Script.Utilities.Command_Runner import split_arg_line
+from Script.Utilities.Scrcpy_Sessions import scrcpy_sessions
+from Script.Utilities.Reconnect_Watchdog import reconnect_watchdog
+from Script.Utilities.Resources import resource_icon
+from Script.Utilities.Device_Capabilities import cached_device_capabilities
+from Script.Utilities.Encoder_Benchmark import (
+    BENCHMARK_MAX_SIZES,
+    BENCHMARK_TIME_LIMIT,
+    resolve_auto_encoder,
+)
+from Script.Utilities.Auxiliary_Funcs import (
+    device_errors,
+    args_combination_errors,
+    arguments_errors,
+    move_record_file,
+)
 
 
 class DeviceSelectionUI(QDialog):
@@ -49,10 +64,11 @@ class DeviceSelectionUI(QDialog):
         self.args = args
         self.device_last_index = 0
         self.buttons = []
+        self.device_boards = {}
         self.large_device_list = len(self.devices) > 7
         self.setWindowTitle("Device Select")
         self.setFixedWidth(256)
-        self.setWindowIcon(QIcon(join(":", "icon.ico")))
+        self.setWindowIcon(resource_icon("icon.ico"))
         self.start_ui()
     
     def start_ui(self):
@@ -79,10 +95,11 @@ class DeviceSelectionUI(QDialog):
             raise ValueError("Invalid UI type, must be a string")
                 
         self.ui_type = self.ui_type.lower().title().rstrip().lstrip()
-        if self.ui_type not in ["Disconnect Device", "Start Device", "Device Resolution", "Open Shell"]:
+        ui_types = ["Disconnect Device", "Start Device", "Device Resolution", "Open Shell", "Benchmark Encoders"]
+        if self.ui_type not in ui_types:
             raise ValueError(
                 "Invalid UI type, must be one of the following: "
-                "'Disconnect Device', 'Start Device', 'Device Resolution', 'Open Shell'"
+                "'Disconnect Device', 'Start Device', 'Device Resolution', 'Open Shell', 'Benchmark Encoders'"
             )
         
         self.setWindowTitle(self.ui_type)
@@ -112,6 +129,10 @@ class DeviceSelectionUI(QDialog):
             
         self.setLayout(self.layout)
         self.setStyleSheet(get_current_alert_theme())
+        
+        device_registry.device_added.connect(self.device_added_event)
+        device_registry.device_removed.connect(self.device_removed_event)
+        device_registry.device_state_changed.connect(self.device_state_event)
         self.exec()
     
     def create_device_board(self, device_name: str) -> QGroupBox:
@@ -120,7 +141,8 @@ class DeviceSelectionUI(QDialog):
 
         This method generates a `QGroupBox` containing a label with the device name 
         and a button to select the device. The layout and behavior vary depending 
-        on the `ui_type`.
+        on the `ui_type`. When the facts of the device are cached (see `Device_Probe`), 
+        the label shows `"Brand (Model)"` and the serial is moved to the tooltip.
 
         Parameters
         ----------
@@ -136,19 +158,23 @@ class DeviceSelectionUI(QDialog):
         - `Disconnect Device`: Connects the select button to a handler for disconnecting the device.
         - `Start Device`: Connects the select button to a handler for starting the device.
         - `Open Shell`: Connects the select button to a general handler with the device index.
+        - `Benchmark Encoders`: Connects the select button to a handler for measuring the encoders of the device.
         """
         device_board = QGroupBox()
         device_board.setFixedSize(221, 35)
         device_board.setObjectName("DeviceBoxNative")
         
         button_locate = (153, 0) if self.large_device_list else (166, 0)
-        device_text = f"{device_name[:17]}..." if len(device_name) > 20 else device_name
+        device_text = device_label(device_name)
+        device_text = f"{device_text[:17]}..." if len(device_text) > 20 else device_text
         
         label_device_name = Create.Label(device_text, (10, 8), parent=device_board)
+        label_device_name.setToolTip(device_name)
         label_device_name.move(5, 7)
         select_button = Create.Button("Select", (55, 35), "SelectDeviceButton", parent=device_board)
         select_button.move(button_locate[0], 0)
         self.buttons.append(select_button)
+        self.device_boards[device_name] = device_board
         
         if self.ui_type == "Device Resolution":
             self.connect_select_button(select_button, device_name)
@@ -156,7 +182,7 @@ class DeviceSelectionUI(QDialog):
             self.connect_select_button(select_button, device_name, device_board)
         elif self.ui_type == "Start Device":
             self.connect_select_button(select_button, device_name, self.device_last_index)
-        else: # Open Shell
+        else: # Open Shell, Benchmark Encoders
             self.connect_select_button(select_button, device_name, self.device_last_index)
         self.device_last_index+=1
         
@@ -198,6 +224,14 @@ class DeviceSelectionUI(QDialog):
                 def_arg[0],
                 def_arg[1],
             )
+        elif self.ui_type == "Benchmark Encoders":
+            connect_signal(
+                button,
+                "clicked",
+                self.benchmark_device,
+                def_arg[0],
+                def_arg[1],
+            )
         else:
             connect_signal(
                 button,
@@ -261,6 +295,8 @@ class DeviceSelectionUI(QDialog):
             "You are about to disconnect a device",
             "confirm",
         ):
+            # the drop that follows is wanted, it must not be reconnected ↓
+            reconnect_watchdog.forget(device_name)
             self.terminal = ConnectTAB_Thread(
                 "disconnect_device",
                 self.path,
@@ -274,11 +310,12 @@ class DeviceSelectionUI(QDialog):
             
     def start_device(self, device_name: str, device_index: int) -> None:
         """
-        Starts a thread to initiate the `scrcpy` session for the chosen device.
+        Starts the `scrcpy` session for the chosen device.
 
-        This method triggers a background thread to start a `scrcpy` session for the specified device, 
-        using the arguments passed during initialization. Before starting, it disables the select button 
-        for the device to prevent multiple actions.
+        This method starts a `scrcpy` session (see `Scrcpy_Sessions`) for the specified device, using the 
+        arguments passed during initialization. The select button of the device stays disabled until the 
+        session finishes, and every error line is checked as soon as `scrcpy` prints it (see `scrcpy_session_output`).
+        `Auto (fastest measured)` is replaced by the fastest encoder measured for this device (see `Encoder_Benchmark`).
 
         Parameters
         ----------
@@ -291,32 +328,87 @@ class DeviceSelectionUI(QDialog):
             charge_text=False,
         )
 
-        target_file_path = self.args[0]
-        arg_line = f"scrcpy -s {device_name} {self.args[1]}"
-        record_file = self.args[2]
-        custom_dir_enabled = self.args[3]
-        self.terminal = StartTAB_Thread(
-            "start_scrcpy",
-            self.path,
-            target_file_path,
-            arg_line,
-            record_file,
-            custom_dir_enabled,
-            self.buttons[device_index],
-        )
-        self.terminal.start()
-        self.terminal.start_scrcpy_output.connect(
-            self.terminal.check_output_start_scrcpy,
+        arg_line, record_file = get_file_name(f"scrcpy -s {device_name} {self.args[1]}", self.path)
+        args = resolve_auto_encoder(device_name, split_arg_line(arg_line))
+        session = scrcpy_sessions.start(device_name, args, self.path)
+        session.stderr_line.connect(partial(self.scrcpy_session_output, session))
+        session.finished.connect(
+            partial(
+                self.scrcpy_session_finished,
+                self.buttons[device_index],
+                record_file or self.args[2], #record_file
+                session,
+            )
         )
 
+    def scrcpy_session_output(self, session, line: str) -> None:
+        """
+        Checks a line printed to `stderr` by a running session, so the error is shown right away.
+
+        The line is checked using the `arguments_errors`, `device_errors` and `args_combination_errors` 
+        functions, only the first error of a session is shown (see `ScrcpySession.error_detected`).
+        The last lines of the session are shown in the tooltip of the device board.
+
+        Parameters
+        ----------
+        - session (`ScrcpySession`): The session that printed the line.
+        - line (`str`): The line printed to `stderr`.
+        """
+        if device_board := self.device_boards.get(session.serial):
+            with suppress(RuntimeError): # the dialog was closed
+                device_board.setToolTip("\n".join(list(session.stderr)[-5:]))
+
+        if session.error_detected:
+            return
+
+        line = line.rstrip().lower()
+        arg_error = arguments_errors(line)
+        device_error = device_errors(line)      
+        args_combo_error = args_combination_errors(line)  
+
+        detect_error_list = [args_combo_error, device_error, arg_error]
+        session.error_detected = any(detect_error_list)
+
+    def scrcpy_session_finished(self, button, record_file: str, session, exit_code: int, err_out: str) -> None:
+        """
+        Enables the select button of a finished session and moves its recorded file.
+
+        The errors were already checked line by line (see `scrcpy_session_output`), the recorded file (if any) 
+        is only moved to the target folder if no error was detected.
+
+        Parameters
+        ----------
+        - button (`QPushButton`): The select button of the device.
+        - record_file (`str`): The name of the file recorded by the session (empty if not recording).
+        - session (`ScrcpySession`): The finished session.
+        - exit_code (`int`): The exit code of `scrcpy`.
+        - err_out (`str`): The last lines of `stderr` of the session.
+        """
+        with suppress(RuntimeError): # the dialog was closed
+            toggle_button_state(
+                button,
+                True,
+                charge_text=False,
+            )
+
+        if exit_code == -1 and not session.error_detected: # `scrcpy` could not be started
+            self.scrcpy_session_output(session, err_out)
+
+        if record_file and not session.error_detected:
+            move_record_file(
+                record_file,
+                self.path,
+                self.args[0], #target_file_path
+                self.args[3], #custom_dir_enabled
+            )
+
     def stop_scrcpys(self):
         """
-        Stops all instances of `scrcpy` by terminating processes using `psutil`.
+        Stops all the `scrcpy` sessions started by the app.
 
-        This method scans all running processes and stops any instances of `scrcpy` by identifying 
-        processes with names `scrcpy.exe` (on Windows) or `scrcpy` (on other systems). Before terminating 
-        the processes, a confirmation alert is shown to warn the user that recordings will not be saved 
-        and may become corrupted.
+        This method asks every session of the `scrcpy_sessions` supervisor to close, without scanning 
+        the processes of the machine. Before stopping the sessions, a confirmation alert is shown to warn 
+        the user that recordings may not be saved properly.
         """
         if create_alert(
             "Are you sure?",
@@ -324,14 +416,7 @@ class DeviceSelectionUI(QDialog):
             "recordings will not be saved (corrupted)"),
             "confirm",
         ):
-            for process in process_iter(["name"]):
-                if process.info["name"].lower() in ["scrcpy.exe", "scrcpy"]:
-                    process.terminate()
-                    toggle_button_state(
-                        self.buttons,
-                        True,
-                        charge_text=False,
-                    )
+            scrcpy_sessions.stop_all()
     
     def open_device_shell(self, device_name: str, device_index: int)  -> None:
         """
@@ -359,3 +444,84 @@ class DeviceSelectionUI(QDialog):
             self.buttons[device_index],
         )
         self.terminal.start()
+    
+    def benchmark_device(self, device_name: str, device_index: int) -> None:
+        """
+        Starts a thread to measure the video encoders of the chosen device (see `Encoder_Benchmark`).
+
+        The duration of the benchmark is shown in a confirmation alert before it starts, the button of the 
+        device stays disabled until the results are shown.
+
+        Parameters
+        ----------
+        - device_name (`str`): The name of the device to measure.
+        - device_index (`int`): The index of the device in the list of available devices.
+        """
+        capabilities = cached_device_capabilities(device_name)
+        encoders_count = len(capabilities.video_encoders) if capabilities else 0
+        duration = (
+            f"about {encoders_count * len(BENCHMARK_MAX_SIZES) * BENCHMARK_TIME_LIMIT} seconds"
+            if encoders_count else "a few seconds for each encoder"
+        )
+        if not create_alert(
+            "Are You Sure?",
+            (f"Each video encoder of the device will be tried, this takes {duration}\n"
+            "keep the device unlocked until the results are shown"),
+            "confirm",
+        ):
+            return
+        toggle_button_state(
+            self.buttons[device_index],
+            False,
+            charge_text=False,
+        )
+
+        self.terminal = StartTAB_Thread(
+            "benchmark_encoders",
+            self.path,
+            device_name,
+            self.buttons[device_index],
+        )
+        self.terminal.start()
+        self.terminal.benchmark_output.connect(
+            self.terminal.check_emit_benchmark,
+        )
+
+    @pyqtSlot(dict)
+    def device_added_event(self, device: dict) -> None:
+        """
+        Adds (or enables again) the board of a device that appeared while the dialog is open.
+
+        This method is the slot of `device_registry.device_added`. For the `Disconnect Device` UI 
+        only devices connected via Wi-Fi (IP serials) are added.
+
+        Parameters
+        ----------
+        - device (`dict`): The infos of the new device (see `Device_Registry`).
+        """
+        device_name = device["serial"]
+        if device_name in self.device_boards:
+            self.device_state_event(device_name, device["state"])
+        elif self.ui_type != "Disconnect Device" or check_is_ip(device_name):
+            self.layout_content.addWidget(self.create_device_board(device_name))
+            self.content.adjustSize()
+            self.device_state_event(device_name, device["state"])
+    
+    @pyqtSlot(str)
+    def device_removed_event(self, device_name: str) -> None:
+        """Disables the board of a device that is gone (slot of `device_registry.device_removed`)."""
+        self.device_state_event(device_name, "unplugged")
+    
+    @pyqtSlot(str, str)
+    def device_state_event(self, device_name: str, state: str) -> None:
+        """
+        Enables the board of a device only while it is ready (slot of `device_registry.device_state_changed`).
+
+        Parameters
+        ----------
+        - device_name (`str`): The serial of the device.
+        - state (`str`): The new state of the device (`device`, `offline`, `unauthorized`...).
+        """
+        if device_board := self.device_boards.get(device_name):
+            with suppress(RuntimeError): # the board is deleted after a disconnect
+                device_board.setEnabled(state == "device")
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtWidgets import QWidget, QGridLayout, QTabWidget, QScrollArea
 
 from UI.DeviceListUI import DeviceListUI
@@ -6,6 +6,15 @@ from Script.ConnectTAB_Functions import ConnectTAB, DeviceList
 from Script.Utilities.Utils import connect_signal
 from Script.Utilities import Create_Elements as Create
 from Script.Utilities.Auxiliary_Funcs import assemble_grid_layout, get_datas_for_ui
+from Script.Utilities.Reconnect_Watchdog import reconnect_watchdog
+from Script.Utilities.Network_Sweep import local_network
+from Script.Utilities.Mdns_Services import mdns_services
+from Script.Utilities.Settings_Store import (
+    settings_store,
+    AUTO_RECONNECT_KEYS,
+    RESTART_SESSIONS_KEYS,
+    SWEEP_NETWORK_KEYS,
+)
 
 class ConnectTab(QScrollArea):
     """
@@ -60,6 +69,10 @@ class ConnectTab(QScrollArea):
         self.text_ip = Create.LineEdit("Custom IP Address...", initial_text=last_texts[0], input_filter="^[0-9A-Fa-f:.]+$")
         self.text_port = Create.LineEdit("Port...", initial_text=last_texts[1], input_filter="^[0-9]*$")
         self.text_port_auto = Create.LineEdit("Port...", (201, 20), auto_port, "^[0-9]*$")
+        self.text_sweep_network = Create.LineEdit(
+            local_network(), (201, 20), settings_store.get(SWEEP_NETWORK_KEYS, ""), "^[0-9./]*$",
+        )
+        self.text_sweep_network.setToolTip("Network swept by 'Sweep Network' (the network of this computer if empty)")
         
         self.button_connect = Create.Button("Connect", (50, 24))
         self.button_save_custom = Create.Button("Save", (50, 24))
@@ -68,6 +81,18 @@ class ConnectTab(QScrollArea):
         self.button_disconnect = Create.Button("Disconnect", (50, 24))
         self.button_wifi_debug = Create.Button("Wifi Debug", (50, 24))
         self.button_detect_devices = Create.Button("Detect Devices", (200, 24))
+        self.button_sweep_network = Create.Button("Sweep Network", (200, 24))
+        self.button_connect_all = Create.Button("Connect All Saved", (50, 24))
+        self.button_pair_file = Create.Button("Pair From File", (50, 24))
+        self.button_pair_file.setToolTip("Pair and connect the devices of a CSV/JSON file (ip, pairing_port, code, connect_port)")
+        self.check_auto_reconnect = Create.CheckBox(
+            "Auto Reconnect", active=bool(settings_store.get(AUTO_RECONNECT_KEYS, False)),
+        )
+        self.check_auto_reconnect.setToolTip("Connect the Wi-Fi devices again when their link drops")
+        self.check_restart_sessions = Create.CheckBox(
+            "Restart Mirrors", active=bool(settings_store.get(RESTART_SESSIONS_KEYS, True)),
+        )
+        self.check_restart_sessions.setToolTip("Start the mirrors of a reconnected device again")
         
         self.DeviceL = DeviceListUI(self.userdata)
         
@@ -94,14 +119,20 @@ class ConnectTab(QScrollArea):
             self.button_connect_textline,
             self.button_disconnect,
             self.button_wifi_debug,
+            self.button_connect_all,
+            self.button_pair_file,
+            self.check_auto_reconnect,
+            self.check_restart_sessions,
             self.label_auto_connect,
             self.button_detect_devices,
+            self.button_sweep_network,
         )
         lower_layout = assemble_grid_layout(
             "connect_tab",
             "lower",
             self.DeviceL,
             self.text_port_auto,
+            self.text_sweep_network,
         )
         
         upper_content = QWidget()
@@ -141,6 +172,9 @@ class ConnectTab(QScrollArea):
             self.button_wifi_debug,
             self.button_connect_textline,
             self.button_detect_devices,
+            self.button_sweep_network,
+            self.button_connect_all,
+            self.button_pair_file,
             ]
         )     
         connect_tab_instance = ConnectTAB()
@@ -169,6 +203,39 @@ class ConnectTab(QScrollArea):
             self.userdata,
         )
         
+        connect_signal(
+            self.button_connect_all,
+            "clicked",
+            connect_tab_instance.connect_all_saved,
+            self.non_concurrent_buttons,
+            self.userdata,
+        )
+        
+        connect_signal(
+            self.button_pair_file,
+            "clicked",
+            connect_tab_instance.pair_from_file,
+            self.non_concurrent_buttons,
+            self.combox_saved_ips,
+            self.userdata,
+        )
+        
+        for check_box, keys in (
+            (self.check_auto_reconnect, AUTO_RECONNECT_KEYS),
+            (self.check_restart_sessions, RESTART_SESSIONS_KEYS),
+        ):
+            connect_signal(
+                check_box,
+                "stateChanged",
+                connect_tab_instance.save_check_state,
+                check_box,
+                keys,
+            )
+        reconnect_watchdog.endpoint_reconnected.connect(self.show_reconnect_metrics)
+        mdns_services.service_added.connect(self.show_pairing_endpoint)
+        mdns_services.service_removed.connect(self.show_pairing_endpoint)
+        self.show_pairing_endpoint()
+        
         connect_signal(
             self.button_connect_textline,
             "clicked",
@@ -222,6 +289,22 @@ class ConnectTab(QScrollArea):
             self.userdata["Versions"],
         )
         
+        connect_signal(
+            self.button_sweep_network,
+            "clicked",
+            find_devices_instance.sweep_network,
+            self.non_concurrent_buttons,
+            self.DeviceL,
+            self.text_sweep_network,
+        )
+        
+        connect_signal(
+            self.text_sweep_network,
+            "textChanged", 
+            find_devices_instance.save_sweep_network,
+            self.text_sweep_network,
+        )
+        
         connect_signal(
             self.text_port_auto,
             "textChanged", 
@@ -229,3 +312,34 @@ class ConnectTab(QScrollArea):
             self.text_port_auto,
             self.userdata["Connect"],
         )
+        
+    @pyqtSlot()
+    @pyqtSlot(dict)
+    @pyqtSlot(str)
+    def show_pairing_endpoint(self, *_) -> None:
+        """
+        Shows the pairing endpoint advertised over mDNS (see `Mdns_Services`) in the tooltip of the `Wifi Debug` button,
+        the fields are filled with it when the button is clicked.
+        """
+        if endpoint := mdns_services.endpoint("pairing"):
+            self.button_wifi_debug.setToolTip(f"Pairing dialog open on {endpoint[0]}:{endpoint[1]}")
+        else:
+            self.button_wifi_debug.setToolTip("Open 'Pair device with pairing code' on the device to fill the fields")
+    
+    @pyqtSlot(str, float, int)
+    def show_reconnect_metrics(self, endpoint: str, latency: float, attempts: int) -> None:
+        """
+        Shows the last reconnection (see `Reconnect_Watchdog`) in the tooltip of the `Auto Reconnect` check box.
+
+        Parameters
+        ----------
+        - endpoint (`str`): The endpoint that came back.
+        - latency (`float`): The time (in seconds) it took to come back.
+        - attempts (`int`): The number of attempts it took.
+        """
+        metrics = reconnect_watchdog.metrics().get(endpoint, {})
+        self.check_auto_reconnect.setToolTip(
+            "Connect the Wi-Fi devices again when their link drops\n"
+            f"Last: {endpoint} back after {latency:.1f}s ({attempts} attempt(s)), "
+            f"{metrics.get('reconnects', 0)} reconnection(s) of {metrics.get('drops', 0)} drop(s)"
+        )
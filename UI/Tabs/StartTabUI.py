@@ -9,13 +9,19 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QTabWidget,
-    QScrollArea
+    QScrollArea,
+    QCompleter,
 )
 
 from Script.StartTAB_Functions import StartTAB
 from Script.Utilities import Create_Elements as Create
-from Script.Utilities.Utils import connect_signal
+from Script.Utilities.Utils import connect_signal, replace_combo_items
 from Script.Utilities.Auxiliary_Funcs import assemble_grid_layout, get_datas_for_ui
+from Script.Utilities.Device_Registry import device_registry
+from Script.Utilities.Device_Capabilities import device_capabilities
+from Script.Utilities.Encoder_Benchmark import has_benchmarks
+from Script.Utilities.Settings_Store import settings_store, ENCODER_BENCHMARK_KEYS
+from Script.Utilities.Static_Datas import AUTO_ENCODER_TEXT
 
 class StartTab(QScrollArea):
     """
@@ -61,9 +67,14 @@ class StartTab(QScrollArea):
         in the "Start" tab. These include labels, combo boxes, line edits, and buttons, which 
         allow the user to configure various aspects of the application. The method also retrieves 
         necessary data for populating these elements from the `userdata` dictionary.
+
+        The encoders, the video sources and the apps are the ones listed by the devices when they are cached 
+        (see `Device_Capabilities`), the default lists are used otherwise. Once a device was measured, 
+        `Auto (fastest measured)` is offered after `Default` (see `Encoder_Benchmark`).
         """
         config_templates, last_checks, index_combo, last_texts,\
         slider_values = get_datas_for_ui(self.userdata, "start")
+        device_choices = device_capabilities.choices()
         
         orientations = [
             "OFF",
@@ -102,8 +113,7 @@ class StartTab(QScrollArea):
             "AAC",
             "Flac"
         ]
-        encoder_list = [
-            "Default",
+        self.default_encoders = [
             "(h264) C2 Mtk Avc Encoder",
             "(h264) C2 Android Avc Encoder",
             "(h264) OMX Google H264 Encoder",
@@ -117,12 +127,13 @@ class StartTab(QScrollArea):
             "(flac) C2 Android Flac Encoder",
             "(flac) OMX Google Flac Encoder",
         ]
-        video_sources = [
+        encoder_list = self.encoder_choices(device_choices)
+        video_sources = device_choices.get("video_sources", [
             "Screen",
             "Back Camera",
             "Front Camera",
             "External Camera",
-        ]
+        ])
         audio_sources = [
             "Device Sound",
             "Microphone",
@@ -166,6 +177,10 @@ class StartTab(QScrollArea):
         self.text_virtual_display_res = Create.LineEdit("1920x1080", (192, 20), last_texts[3], "^[0-9xX]*$")
         self.text_virtual_display_dpi = Create.LineEdit("DPI", (192, 20), last_texts[4], "^[0-9]*$")
         self.text_app_start = Create.LineEdit("App Package e.g org.videolan.vlc or ?firefox", (192, 20), last_texts[5])
+        self.app_completer = QCompleter(device_choices.get("apps", []), self.text_app_start)
+        self.app_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.app_completer.setFilterMode(Qt.MatchContains)
+        self.text_app_start.setCompleter(self.app_completer)
         self.text_crop_config = Create.LineEdit("width:height:x:y", (192, 20), last_texts[6], "^[0-9:]*$")
 
         self.line_FPS = Create.LineEdit("FPS", (80, 20), slider_values[0], "[0-9]*$", "ValuesLines")
@@ -193,8 +208,11 @@ class StartTab(QScrollArea):
         self.button_start = Create.Button("Start", (510, 27))
         self.button_default_config = Create.Button("\U0001F504", (20, 20), "Default_Config_Button")
         self.button_shell_button = Create.Button("\U0001F4BB", (20, 20), "Shell_Button")
+        self.button_benchmark = Create.Button("\u23F1", (20, 20), "Benchmark_Button")
+        self.button_benchmark.setToolTip("Benchmark the encoders of a device")
         self.button_default_config.setMaximumSize(20, 20)
         self.button_shell_button.setMaximumSize(20, 20)
+        self.button_benchmark.setMaximumSize(20, 20)
 
         self.check_record = Create.CheckBox("Record", (61, 18), last_checks[0])
         self.check_prefer_text = Create.CheckBox("Prefer Text", (81, 20), last_checks[1])
@@ -250,6 +268,7 @@ class StartTab(QScrollArea):
             self.button_shell_button,
             self.text_custom_start,
             self.button_start_custom,
+            self.button_benchmark,
         )
         middle_layout = assemble_grid_layout(
             "start_tab",
@@ -378,7 +397,8 @@ class StartTab(QScrollArea):
         self.non_concurrent_buttons.extend(
             [   
             self.button_start, 
-            self.button_start_custom
+            self.button_start_custom,
+            self.button_benchmark,
             ]
         )     
         line_edit_value = [
@@ -501,6 +521,13 @@ class StartTab(QScrollArea):
             self.userdata,
         )
         
+        connect_signal(
+            self.button_benchmark,
+            "clicked",
+            start_tab_instance.benchmark_encoders,
+            self.userdata,
+        )
+        
         connect_signal(
             self.button_start,
             "clicked",
@@ -513,4 +540,34 @@ class StartTab(QScrollArea):
             self.client,
         )
 
+        # the devices already connected are probed now, the next ones as soon as they are ready ↓
+        device_capabilities.capabilities_changed.connect(self.update_device_choices)
+        device_capabilities.probe_devices(device_registry.devices("device"))
+        settings_store.subscribe(ENCODER_BENCHMARK_KEYS, self.update_device_choices)
+
+    def encoder_choices(self, device_choices: dict) -> list:
+        """
+        Returns the items of the encoders, `Auto (fastest measured)` included once a device was measured.
+
+        Parameters
+        ----------
+        - device_choices (`dict`): The choices listed by the devices (see `DeviceCapabilitiesManager.choices`).
+        """
+        auto_encoder = [AUTO_ENCODER_TEXT] if has_benchmarks() else []
+        return ["Default", *auto_encoder, *device_choices.get("encoders", self.default_encoders)]
+
+    def update_device_choices(self, *_) -> None:
+        """
+        Offers the encoders, video sources and apps listed by the devices (slot of `device_capabilities.capabilities_changed`).
+
+        The selected encoder and video source are kept when the devices still list them. It is also the slot of 
+        the saved benchmarks, to offer `Auto (fastest measured)` (see `Encoder_Benchmark`).
+        """
+        device_choices = device_capabilities.choices()
+        replace_combo_items(self.combox_codec_encoders, self.encoder_choices(device_choices))
+        if "video_sources" in device_choices:
+            replace_combo_items(self.combox_video_source, device_choices["video_sources"])
+        if "apps" in device_choices:
+            self.app_completer.model().setStringList(device_choices["apps"])
+
         
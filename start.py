@@ -1,22 +1,21 @@
 from sys import argv
-from os import mkdir
-from os.path import isdir, join
+from os import makedirs
+from os.path import dirname
 
+from Script.Utilities.Startup_Timer import startup_timer
+argv = startup_timer.configure(argv)
 from PyQt5.QtWidgets import QApplication
-from Script.Utilities.Utils import open_or_save_data_json
-from Script.Utilities.Static_Datas import USERDATA
+startup_timer.mark("PyQt import")
+from Script.Utilities.Settings_Store import settings_store
 from UI.ClientUI import Client 
+startup_timer.mark("app imports")
 
-if not isdir(join(".", "Data")):
-    mkdir("Data")    
-
-userdata_path = join("Data", "UserData.json")
-try:
-    userdata = open_or_save_data_json(userdata_path, "r")
-except FileNotFoundError:
-    open_or_save_data_json(userdata_path, "w", USERDATA)
-    userdata = open_or_save_data_json(userdata_path, "r")
+makedirs(dirname(settings_store.path), exist_ok=True)
+startup_timer.mark("data dir")
+userdata = settings_store.load()
+startup_timer.mark("user data")
 
 app = QApplication(argv)
+startup_timer.mark("QApplication")
 program = Client(userdata)
 app.exec_()
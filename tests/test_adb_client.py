@@ -0,0 +1,111 @@
+import socket
+import socketserver
+from threading import Thread
+
+import pytest
+
+import Script.Utilities.Adb_Client as adb_client
+from Script.Utilities.Adb_Client import AdbClient, AdbServerError, adb_shell, list_devices, parse_devices_l
+from Script.Utilities.Command_Runner import CommandResult
+
+DEVICES_L = (
+    "R5CT3          device usb:1-1 product:a52 model:SM_A525F device:a52 transport_id:1\n"
+    "192.168.0.10:5555 unauthorized transport_id:2\n"
+)
+SHELL_OUTPUTS = {"getprop ro.product.model": "SM-A525F\n", "echo a; echo b": "a\nb\n"}
+
+class FakeAdbServer(socketserver.BaseRequestHandler):
+    """Answers the host requests like the `ADB` server, for the device `R5CT3` only."""
+    def read_request(self) -> str:
+        length = int(self.request.recv(4), 16)
+        return self.request.recv(length).decode()
+
+    def answer(self, payload: str) -> None:
+        self.request.sendall(b"OKAY%04x%s" % (len(payload), payload.encode()))
+
+    def fail(self, message: str) -> None:
+        self.request.sendall(b"FAIL%04x%s" % (len(message), message.encode()))
+
+    def handle(self) -> None:
+        request = self.read_request()
+        self.server.requests.append(request)
+        if request == "host:version":
+            self.answer("0029")
+        elif request == "host:devices-l":
+            self.answer(DEVICES_L)
+        elif request == "host:transport:R5CT3":
+            self.request.sendall(b"OKAY")
+            command = self.read_request().removeprefix("shell:")
+            self.server.requests.append(f"shell:{command}")
+            self.request.sendall(b"OKAY" + SHELL_OUTPUTS.get(command, "").encode())
+        elif request.startswith("host:transport:"):
+            self.fail(f"device '{request.rpartition(':')[2]}' not found")
+        else:
+            self.fail("unknown host service")
+
+@pytest.fixture
+def client():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeAdbServer)
+    server.daemon_threads = True
+    server.requests = []
+    thread = Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    client = AdbClient(*server.server_address)
+    client.requests = server.requests
+    yield client
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def test_version_and_devices(client):
+    assert client.version() == 0x29
+    assert client.devices() == [
+        {"serial": "R5CT3", "state": "device", "model": "SM_A525F", "transport_id": "1"},
+        {"serial": "192.168.0.10:5555", "state": "unauthorized", "model": "", "transport_id": "2"},
+    ]
+    assert client.requests == ["host:version", "host:devices-l"]
+
+def test_fail_raises_the_message_of_the_server(client):
+    with pytest.raises(AdbServerError, match="unknown host service"):
+        client.host_query("host:nothing")
+    with pytest.raises(AdbServerError, match="device 'ABCD' not found"):
+        client.shell("ABCD", "true")
+
+def test_shell(client):
+    assert client.shell("R5CT3", "echo a; echo b") == "a\nb\n"
+    assert client.requests == ["host:transport:R5CT3", "shell:echo a; echo b"]
+    assert adb_shell("R5CT3", "getprop ro.product.model", client=client) == ("SM-A525F\n", "")
+    assert adb_shell("ABCD", "true", client=client) == ("", "device 'ABCD' not found")
+
+def test_parse_devices_l_of_adb():
+    output = (
+        "* daemon not running; starting now at tcp:5037\n"
+        "* daemon started successfully\n"
+        "List of devices attached\n"
+        "R5CT3\tdevice usb:1-1 product:a52 model:SM_A525F device:a52 transport_id:1\n"
+        "emulator-5554\tno permissions (user in plugdev group) usb:1-2 transport_id:3\n"
+        "\n"
+    )
+    assert parse_devices_l(output) == [
+        {"serial": "R5CT3", "state": "device", "model": "SM_A525F", "transport_id": "1"},
+        {"serial": "emulator-5554", "state": "no permissions (user in plugdev group)", "model": "", "transport_id": "3"},
+    ]
+
+def test_list_devices_falls_back_to_adb(monkeypatch, closed_port):
+    calls = []
+    def run_command(args, path=".", timeout=None):
+        calls.append(args)
+        return CommandResult(args, 0, "List of devices attached\n" + DEVICES_L.replace("          ", "\t"), "", 0.1)
+    monkeypatch.setattr(adb_client, "run_command", run_command)
+
+    devices = list_devices(client=AdbClient(port=closed_port))
+    assert calls == [["adb", "devices", "-l"]]
+    assert [(device["serial"], device["state"]) for device in devices] == [
+        ("R5CT3", "device"),
+        ("192.168.0.10:5555", "unauthorized"),
+    ]
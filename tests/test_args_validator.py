@@ -0,0 +1,36 @@
+from Script.Utilities.Args_Validator import args_validator, parse_scrcpy_args
+
+def test_bundled_flags():
+    options = parse_scrcpy_args(["-Sw"])
+    assert options["--turn-screen-off"] == ""
+    assert options["--stay-awake"] == ""
+
+def test_bundled_value_is_the_rest_of_the_word():
+    options = parse_scrcpy_args(["-b8M"])
+    assert options["--video-bit-rate"] == "8M"
+    assert options["--mouse"] == "sdk"
+
+def test_bundled_value_has_no_junk_keys():
+    options = parse_scrcpy_args(["-m1024"])
+    assert options["--max-size"] == "1024"
+    assert not [option for option in options if option in ("-1", "-0", "-2", "-4")]
+
+def test_bundled_value_after_flags():
+    assert parse_scrcpy_args(["-Sm1024"])["--max-size"] == "1024"
+    assert parse_scrcpy_args(["-Sm=1024"])["--max-size"] == "1024"
+
+def test_bundled_value_in_the_next_word():
+    options = parse_scrcpy_args(["-Sb", "8M", "-f"])
+    assert options["--turn-screen-off"] == ""
+    assert options["--video-bit-rate"] == "8M"
+    assert "--fullscreen" in options
+
+def test_bundled_input_modes():
+    options = parse_scrcpy_args(["-KM"])
+    assert (options["--keyboard"], options["--mouse"]) == ("uhid", "uhid")
+    options = parse_scrcpy_args(["--otg", "-KM"])
+    assert (options["--keyboard"], options["--mouse"]) == ("aoa", "aoa")
+
+def test_bundled_forms_are_validated():
+    for args in (["-b8M"], ["-KM"], ["-m1024"], ["-Sb", "8M"], ["--otg", "-KM"]):
+        assert args_validator.validate(args) == []
@@ -0,0 +1,82 @@
+import socket
+import struct
+
+import pytest
+
+from Script.Utilities.Mdns_Services import (
+    MdnsServices,
+    build_query,
+    encode_name,
+    CLASS_IN,
+    CONNECT_SERVICE,
+    PAIRING_SERVICE,
+    TYPE_A,
+    TYPE_PTR,
+    TYPE_SRV,
+)
+
+def record(name: str, rtype: int, ttl: int, data: bytes) -> bytes:
+    return encode_name(name) + struct.pack("!HHIH", rtype, CLASS_IN, ttl, len(data)) + data
+
+def announcement(records: list) -> bytes:
+    return struct.pack("!6H", 0, 0x8400, 0, len(records), 0, 0) + b"".join(records)
+
+def service_records(service: str, ip: str, port: int, ttl: int = 120) -> list:
+    instance = f"adb-R5CT3-AbCdEf.{service}"
+    host = "Android_R5CT3.local"
+    return [
+        record(service, TYPE_PTR, ttl, encode_name(instance)),
+        record(instance, TYPE_SRV, ttl, struct.pack("!HHH", 0, 0, port) + encode_name(host)),
+        record(host, TYPE_A, ttl, socket.inet_aton(ip)),
+    ]
+
+@pytest.fixture
+def services():
+    services = MdnsServices()
+    services.added, services.removed = [], []
+    services.service_added.connect(services.added.append)
+    services.service_removed.connect(services.removed.append)
+    return services
+
+def test_connect_and_pairing_services(services):
+    services.update(announcement(service_records(CONNECT_SERVICE, "192.168.0.10", 37000)))
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000)))
+
+    assert services.endpoint("connect") == ("192.168.0.10", "37000")
+    assert services.endpoint("pairing", "192.168.0.10") == ("192.168.0.10", "41000")
+    assert services.endpoint("pairing", "192.168.0.11") is None
+    assert [service["kind"] for service in services.services()] == ["pairing", "connect"]
+    assert {service["serial"] for service in services.services()} == {"R5CT3"}
+    assert [service["port"] for service in services.added] == ["37000", "41000"]
+
+def test_service_split_in_two_packets(services):
+    ptr, srv, address = service_records(PAIRING_SERVICE, "192.168.0.10", 41000)
+    services.update(announcement([ptr, srv]))
+    assert services.services() == [] and services.added == []
+
+    services.update(announcement([address]))
+    assert services.endpoint("pairing") == ("192.168.0.10", "41000")
+    assert len(services.added) == 1
+
+def test_new_port_is_announced_again(services):
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000)))
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000)))
+    assert len(services.added) == 1
+
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 42000)))
+    assert services.endpoint("pairing") == ("192.168.0.10", "42000")
+    assert [service["port"] for service in services.added] == ["41000", "42000"]
+    assert services.removed == []
+
+def test_goodbye_removes_the_service(services):
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000)))
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000, ttl=0)[:1]))
+
+    assert services.endpoint("pairing") is None
+    assert services.removed == [f"adb-R5CT3-AbCdEf.{PAIRING_SERVICE}"]
+
+def test_queries_and_malformed_packets_are_ignored(services):
+    services.update(build_query())
+    services.update(announcement(service_records(PAIRING_SERVICE, "192.168.0.10", 41000))[:40])
+    services.update(b"not a dns packet")
+    assert services.services() == [] and services.added == [] and services.removed == []
@@ -0,0 +1,76 @@
+import socket
+import asyncio
+from threading import Thread
+
+import pytest
+
+from Script.Utilities.Network_Sweep import A_AUTH, A_CNXN, A_STLS, HEADER, adb_message, sweep_network
+
+# every 127.x.x.x is local on Linux, a /29 gives the hosts 127.3.0.1 to 127.3.0.6 ↓
+NETWORK = "127.3.0.0/29"
+BANNER = b"device::ro.product.name=fake;ro.product.model=Fake_1;ro.product.device=fake;\0"
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def handler(answer: bytes):
+    """Reads the `CNXN` of the host and sends `answer` (if it is empty, waits until the host gives up)."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readexactly(HEADER.size)
+        if answer:
+            writer.write(answer)
+            await writer.drain()
+        else:
+            await reader.read()
+        writer.close()
+    return handle
+
+@pytest.fixture
+def port():
+    """Starts stand-ins of devices (and of other services) on loopback, in their own loop."""
+    port = unused_port()
+    answers = {
+        "127.3.0.1": adb_message(A_CNXN, 0x01000001, 256 * 1024, BANNER),
+        "127.3.0.2": adb_message(A_AUTH, 1, 0, b"\0" * 20),
+        "127.3.0.3": adb_message(A_STLS, 0x01000000, 0),
+        "127.3.0.4": b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n",
+        "127.3.0.5": b"",
+    }
+    loop = asyncio.new_event_loop()
+
+    async def start_servers() -> list:
+        return await asyncio.gather(*(asyncio.start_server(handler(answer), host, port) for host, answer in answers.items()))
+
+    try:
+        servers = loop.run_until_complete(start_servers())
+    except OSError as error:
+        loop.close()
+        pytest.skip(f"no loopback aliases: {error}")
+    thread = Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield port
+
+    for server in servers:
+        server.close()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+def test_adb_endpoints_are_found(port):
+    found = []
+    hits = sweep_network(NETWORK, [port], on_hit=found.append, handshake_timeout=0.3)
+
+    assert [(hit.endpoint, hit.command) for hit in hits] == [
+        (f"127.3.0.1:{port}", "CNXN"),
+        (f"127.3.0.2:{port}", "AUTH"),
+        (f"127.3.0.3:{port}", "STLS"),
+    ]
+    assert [hit.name for hit in hits] == ["Fake_1", "ADB Device (Not Authorized)", "ADB Device (Wireless Debugging)"]
+    assert sorted(hit.endpoint for hit in found) == [hit.endpoint for hit in hits]
+
+def test_invalid_ports_are_rejected():
+    for ports in ([], [0], [65536]):
+        with pytest.raises(ValueError):
+            sweep_network(NETWORK, ports)
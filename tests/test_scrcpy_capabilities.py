@@ -0,0 +1,46 @@
+from Script.Utilities.Scrcpy_Capabilities import parse_scrcpy_help
+
+# excerpt of `scrcpy --help` (scrcpy 2.x) ↓
+HELP_2X = """Usage: scrcpy [options]
+
+Options:
+
+    -b, --video-bit-rate=value
+        Encode the video at the given bit rate, expressed in bits/s. Unit
+        suffixes are supported: 'K' (x1000) and 'M' (x1000000).
+        Default is 8M (8000000).
+
+    --keyboard=mode
+        Select how to send keyboard inputs to the device.
+        Possible values are "disabled", "sdk", "uhid" and "aoa".
+        "disabled" does not send keyboard inputs to the device.
+        "sdk" uses the Android system API to deliver keyboard events to
+        applications.
+        Default is "sdk".
+
+    --lock-video-orientation[=value]
+        Lock capture video orientation to value.
+        Possible values are "unlocked", "initial" (locked to the initial
+        orientation), 0, 90, 180, and 270. The values represent the clockwise
+        rotation from the natural device orientation, in degrees.
+        Default is "unlocked".
+        Passing the option without argument is equivalent to passing
+        "initial".
+
+    --video-codec=name
+        Select a video codec (h264, h265 or av1).
+        Default is h264.
+"""
+
+def test_quoted_values_are_a_closed_list():
+    capabilities = parse_scrcpy_help(HELP_2X)
+    assert capabilities.choices["--keyboard"] == ["disabled", "sdk", "uhid", "aoa"]
+    assert capabilities.choices["--video-codec"] == ["h264", "h265", "av1"]
+    assert capabilities.check_args(["--keyboard=foo"])[2] == ["--keyboard=foo"]
+
+def test_values_that_are_not_all_quoted_are_not_checked():
+    capabilities = parse_scrcpy_help(HELP_2X)
+    assert "--lock-video-orientation" not in capabilities.choices
+    for value in ("90", "initial", "unlocked"):
+        args = [f"--lock-video-orientation={value}"]
+        assert capabilities.check_args(args) == (args, [], [])